@@ -3,8 +3,10 @@ from __future__ import annotations
 import httpx
 import structlog
 
+from agrobr.cache.read_through import read_through
 from agrobr.constants import MIN_XLSX_SIZE, URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -22,31 +24,29 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.ABIOVE)
 async def _fetch_url(url: str) -> bytes:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as client:
-        logger.debug("abiove_request", url=url)
-        response = await retry_on_status(
-            lambda: client.get(url),
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.ABIOVE)
+    logger.debug("abiove_request", url=url)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="abiove",
+    )
+
+    if response.status_code == 404:
+        raise SourceUnavailableError(source="abiove", url=url, last_error="HTTP 404")
+
+    response.raise_for_status()
+
+    content = response.content
+    if len(content) < MIN_XLSX_SIZE:
+        raise SourceUnavailableError(
             source="abiove",
+            url=url,
+            last_error=(f"Downloaded file too small ({len(content)} bytes), expected a valid XLSX"),
         )
-
-        if response.status_code == 404:
-            raise SourceUnavailableError(source="abiove", url=url, last_error="HTTP 404")
-
-        response.raise_for_status()
-
-        content = response.content
-        if len(content) < MIN_XLSX_SIZE:
-            raise SourceUnavailableError(
-                source="abiove",
-                url=url,
-                last_error=(
-                    f"Downloaded file too small ({len(content)} bytes), expected a valid XLSX"
-                ),
-            )
-        return content
+    return content
 
 
 async def fetch_exportacao_excel(ano: int, mes: int | None = None) -> tuple[bytes, str]:
@@ -3,7 +3,9 @@ from __future__ import annotations
 import httpx
 import structlog
 
-from agrobr.constants import MIN_CSV_SIZE, MIN_XLSX_SIZE, HTTPSettings
+from agrobr.cache.read_through import read_through
+from agrobr.constants import MIN_CSV_SIZE, MIN_XLSX_SIZE, Fonte, HTTPSettings
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -19,40 +21,38 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.ANP_DIESEL)
 async def download_xlsx(url: str) -> bytes:
     logger.info("anp_diesel_download", url=url)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="anp_diesel"),
-        follow_redirects=True,
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="anp_diesel",
-        )
-
-        response.raise_for_status()
+    headers = UserAgentRotator.get_headers(source="anp_diesel")
+    client = ClientPool.get(Fonte.ANP_DIESEL)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="anp_diesel",
+    )
 
-        content = response.content
-        if len(content) < MIN_XLSX_SIZE:
-            from agrobr.exceptions import SourceUnavailableError
+    response.raise_for_status()
 
-            raise SourceUnavailableError(
-                source="anp_diesel",
-                url=url,
-                last_error=(
-                    f"Downloaded file too small ({len(content)} bytes), "
-                    f"expected a valid XLSX/XLS spreadsheet"
-                ),
-            )
+    content = response.content
+    if len(content) < MIN_XLSX_SIZE:
+        from agrobr.exceptions import SourceUnavailableError
 
-        logger.info(
-            "anp_diesel_download_ok",
+        raise SourceUnavailableError(
+            source="anp_diesel",
             url=url,
-            size_bytes=len(content),
+            last_error=(
+                f"Downloaded file too small ({len(content)} bytes), "
+                f"expected a valid XLSX/XLS spreadsheet"
+            ),
         )
-        return content
+
+    logger.info(
+        "anp_diesel_download_ok",
+        url=url,
+        size_bytes=len(content),
+    )
+    return content
 
 
 async def fetch_precos_municipios(periodo: str) -> bytes:
@@ -79,39 +79,37 @@ async def fetch_precos_brasil() -> bytes:
     return await download_xlsx(PRECOS_BRASIL_URL)
 
 
+@read_through(Fonte.ANP_DIESEL)
 async def download_csv(url: str) -> bytes:
     logger.info("anp_diesel_download_csv", url=url)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="anp_diesel"),
-        follow_redirects=True,
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="anp_diesel",
-        )
-
-        response.raise_for_status()
+    headers = UserAgentRotator.get_headers(source="anp_diesel")
+    client = ClientPool.get(Fonte.ANP_DIESEL)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="anp_diesel",
+    )
 
-        content = response.content
-        if len(content) < MIN_CSV_SIZE:
-            from agrobr.exceptions import SourceUnavailableError
+    response.raise_for_status()
 
-            raise SourceUnavailableError(
-                source="anp_diesel",
-                url=url,
-                last_error=(
-                    f"Downloaded CSV too small ({len(content)} bytes), expected valid CSV data"
-                ),
-            )
+    content = response.content
+    if len(content) < MIN_CSV_SIZE:
+        from agrobr.exceptions import SourceUnavailableError
 
-        logger.info(
-            "anp_diesel_download_csv_ok",
+        raise SourceUnavailableError(
+            source="anp_diesel",
             url=url,
-            size_bytes=len(content),
+            last_error=(
+                f"Downloaded CSV too small ({len(content)} bytes), expected valid CSV data"
+            ),
         )
-        return content
+
+    logger.info(
+        "anp_diesel_download_csv_ok",
+        url=url,
+        size_bytes=len(content),
+    )
+    return content
 
 
 async def fetch_vendas_m3() -> bytes:
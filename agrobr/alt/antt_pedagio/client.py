@@ -3,7 +3,10 @@ from __future__ import annotations
 import httpx
 import structlog
 
-from agrobr.constants import MIN_CSV_SIZE, HTTPSettings
+from agrobr.cache.read_through import JSON_CODEC, read_through
+from agrobr.constants import MIN_CSV_SIZE, Fonte, HTTPSettings
+from agrobr.http.fanout import fetch_all
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -25,21 +28,19 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.ANTT_PEDAGIO, codec=JSON_CODEC)
 async def _get_ckan_resources(slug: str) -> list[dict[str, str]]:
     url = build_ckan_package_url(slug)
     logger.info("antt_pedagio_ckan_discover", slug=slug)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="antt_pedagio"),
-        follow_redirects=True,
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="antt_pedagio",
-        )
-        response.raise_for_status()
-        data = response.json()
+    headers = UserAgentRotator.get_headers(source="antt_pedagio")
+    client = ClientPool.get(Fonte.ANTT_PEDAGIO)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="antt_pedagio",
+    )
+    response.raise_for_status()
+    data = response.json()
 
     if not isinstance(data, dict) or "result" not in data:
         from agrobr.exceptions import SourceUnavailableError
@@ -93,38 +94,36 @@ def _match_pracas_resource(resources: list[dict[str, str]]) -> str | None:
     return None
 
 
+@read_through(Fonte.ANTT_PEDAGIO)
 async def download_csv(url: str) -> bytes:
     logger.info("antt_pedagio_download", url=url)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="antt_pedagio"),
-        follow_redirects=True,
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
+    headers = UserAgentRotator.get_headers(source="antt_pedagio")
+    client = ClientPool.get(Fonte.ANTT_PEDAGIO)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="antt_pedagio",
+    )
+    response.raise_for_status()
+
+    content = response.content
+    if len(content) < MIN_CSV_SIZE:
+        from agrobr.exceptions import SourceUnavailableError
+
+        raise SourceUnavailableError(
             source="antt_pedagio",
-        )
-        response.raise_for_status()
-
-        content = response.content
-        if len(content) < MIN_CSV_SIZE:
-            from agrobr.exceptions import SourceUnavailableError
-
-            raise SourceUnavailableError(
-                source="antt_pedagio",
-                url=url,
-                last_error=(
-                    f"Downloaded CSV too small ({len(content)} bytes), expected valid CSV data"
-                ),
-            )
-
-        logger.info(
-            "antt_pedagio_download_ok",
             url=url,
-            size_bytes=len(content),
+            last_error=(
+                f"Downloaded CSV too small ({len(content)} bytes), expected valid CSV data"
+            ),
         )
-        return content
+
+    logger.info(
+        "antt_pedagio_download_ok",
+        url=url,
+        size_bytes=len(content),
+    )
+    return content
 
 
 async def fetch_trafego(ano: int) -> bytes:
@@ -140,17 +139,17 @@ async def fetch_trafego(ano: int) -> bytes:
 
 async def fetch_trafego_anos(anos: list[int]) -> list[tuple[int, bytes]]:
     resources = await _get_ckan_resources(DATASET_TRAFEGO_SLUG)
-    results: list[tuple[int, bytes]] = []
+    urls: list[tuple[int, str]] = []
 
     for ano in anos:
         url = _match_trafego_resource(resources, ano)
         if url:
-            content = await download_csv(url)
-            results.append((ano, content))
+            urls.append((ano, url))
         else:
             logger.warning("antt_pedagio_resource_missing", ano=ano)
 
-    return results
+    contents = await fetch_all(Fonte.ANTT_PEDAGIO, [url for _, url in urls], download_csv)
+    return [(ano, content) for (ano, _), content in zip(urls, contents, strict=True)]
 
 
 async def fetch_pracas() -> bytes:
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 import pandas as pd
 import structlog
 
+from agrobr.http.fanout import parse_all
 from agrobr.models import MetaInfo
 
 from . import client, parser
@@ -41,17 +42,15 @@ async def sinistros(
     fetch_ms = int((time.monotonic() - t0) * 1000)
 
     t1 = time.monotonic()
-    dfs: list[pd.DataFrame] = []
-    for content in contents:
-        df = parser.parse_sinistros(
-            content,
-            cultura=cultura,
-            uf=uf,
-            ano=ano,
-            municipio=municipio,
-            evento=evento,
-        )
-        dfs.append(df)
+    dfs = await parse_all(
+        parser.parse_sinistros,
+        contents,
+        cultura=cultura,
+        uf=uf,
+        ano=ano,
+        municipio=municipio,
+        evento=evento,
+    )
 
     if not dfs:
         df_out = pd.DataFrame(columns=COLUNAS_SINISTROS)
@@ -107,16 +106,14 @@ async def apolices(
     fetch_ms = int((time.monotonic() - t0) * 1000)
 
     t1 = time.monotonic()
-    dfs: list[pd.DataFrame] = []
-    for content in contents:
-        df = parser.parse_apolices(
-            content,
-            cultura=cultura,
-            uf=uf,
-            ano=ano,
-            municipio=municipio,
-        )
-        dfs.append(df)
+    dfs = await parse_all(
+        parser.parse_apolices,
+        contents,
+        cultura=cultura,
+        uf=uf,
+        ano=ano,
+        municipio=municipio,
+    )
 
     if not dfs:
         df_out = pd.DataFrame(columns=COLUNAS_APOLICES)
@@ -3,7 +3,10 @@ from __future__ import annotations
 import httpx
 import structlog
 
-from agrobr.constants import MIN_CSV_SIZE, HTTPSettings
+from agrobr.cache.read_through import read_through
+from agrobr.constants import MIN_CSV_SIZE, Fonte, HTTPSettings
+from agrobr.http.fanout import fetch_all
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -19,38 +22,36 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.MAPA_PSR)
 async def download_csv(url: str) -> bytes:
     logger.info("mapa_psr_download", url=url)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="mapa_psr"),
-        follow_redirects=True,
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
+    headers = UserAgentRotator.get_headers(source="mapa_psr")
+    client = ClientPool.get(Fonte.MAPA_PSR)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="mapa_psr",
+    )
+    response.raise_for_status()
+
+    content = response.content
+    if len(content) < MIN_CSV_SIZE:
+        from agrobr.exceptions import SourceUnavailableError
+
+        raise SourceUnavailableError(
             source="mapa_psr",
-        )
-        response.raise_for_status()
-
-        content = response.content
-        if len(content) < MIN_CSV_SIZE:
-            from agrobr.exceptions import SourceUnavailableError
-
-            raise SourceUnavailableError(
-                source="mapa_psr",
-                url=url,
-                last_error=(
-                    f"Downloaded CSV too small ({len(content)} bytes), expected valid CSV data"
-                ),
-            )
-
-        logger.info(
-            "mapa_psr_download_ok",
             url=url,
-            size_bytes=len(content),
+            last_error=(
+                f"Downloaded CSV too small ({len(content)} bytes), expected valid CSV data"
+            ),
         )
-        return content
+
+    logger.info(
+        "mapa_psr_download_ok",
+        url=url,
+        size_bytes=len(content),
+    )
+    return content
 
 
 async def fetch_periodo(periodo: str) -> bytes:
@@ -61,8 +62,4 @@ async def fetch_periodo(periodo: str) -> bytes:
 
 
 async def fetch_periodos(periodos: list[str]) -> list[bytes]:
-    results: list[bytes] = []
-    for periodo in periodos:
-        content = await fetch_periodo(periodo)
-        results.append(content)
-    return results
+    return await fetch_all(Fonte.MAPA_PSR, periodos, fetch_periodo)
@@ -54,6 +54,13 @@ def _build_cql_filter(
     return " AND ".join(parts) if parts else None
 
 
+async def _ler_paginas(uf: str, cql: str | None) -> list[pd.DataFrame]:
+    frames: list[pd.DataFrame] = []
+    async for content in client.iter_imoveis(uf, cql):
+        frames.append(parser.read_imoveis_page(content, len(frames)))
+    return frames
+
+
 @overload
 async def imoveis(
     uf: str,
@@ -138,11 +145,12 @@ async def imoveis(
             logger.warning("sicar_hit_count_check_failed", uf=uf_upper, exc_info=True)
 
     t0 = time.monotonic()
-    pages, source_url = await client.fetch_imoveis(uf_upper, cql)
+    frames = await _ler_paginas(uf_upper, cql)
+    source_url = client._build_wfs_url(uf_upper, cql_filter=cql)
     fetch_ms = int((time.monotonic() - t0) * 1000)
 
     t1 = time.monotonic()
-    df = parser.parse_imoveis_csv(pages)
+    df = parser.parse_imoveis_frames(frames)
     parse_ms = int((time.monotonic() - t1) * 1000)
 
     if not df.empty and "cod_imovel" in df.columns:
@@ -229,11 +237,12 @@ async def resumo(
         escaped = municipio.replace("'", "''")
         cql = f"municipio ILIKE '%{escaped}%'"
 
-        pages, source_url = await client.fetch_imoveis(uf_upper, cql)
+        frames = await _ler_paginas(uf_upper, cql)
+        source_url = client._build_wfs_url(uf_upper, cql_filter=cql)
         fetch_ms = int((time.monotonic() - t0) * 1000)
 
         t1 = time.monotonic()
-        df_raw = parser.parse_imoveis_csv(pages)
+        df_raw = parser.parse_imoveis_frames(frames)
         df = parser.agregar_resumo(df_raw)
         parse_ms = int((time.monotonic() - t1) * 1000)
 
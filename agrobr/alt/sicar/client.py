@@ -3,13 +3,17 @@ from __future__ import annotations
 import math
 import re
 import ssl
+from collections.abc import AsyncIterator
 from urllib.parse import quote
 
 import httpx
 import structlog
 
-from agrobr.constants import MIN_WFS_SIZE, HTTPSettings
+from agrobr.cache.read_through import read_through
+from agrobr.constants import MIN_WFS_SIZE, Fonte, HTTPSettings
 from agrobr.exceptions import ParseError, SourceUnavailableError
+from agrobr.http.fanout import fetch_pages
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -59,35 +63,32 @@ def _build_wfs_url(
     return url
 
 
+@read_through(Fonte.SICAR, exclude=("base_delay",))
 async def _fetch_url(url: str, *, base_delay: float | None = None) -> bytes:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_bot_headers(),
-        follow_redirects=True,
-        verify=_ssl_ctx,
-    ) as client:
-        logger.debug("sicar_request", url=url)
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="sicar",
-            base_delay=base_delay,
-        )
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.SICAR, verify=_ssl_ctx)
+    logger.debug("sicar_request", url=url)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="sicar",
+        base_delay=base_delay,
+    )
 
-        if response.status_code == 404:
-            raise SourceUnavailableError(source="sicar", url=url, last_error="HTTP 404")
+    if response.status_code == 404:
+        raise SourceUnavailableError(source="sicar", url=url, last_error="HTTP 404")
 
-        response.raise_for_status()
+    response.raise_for_status()
 
-        content = response.content
-        if len(content) < MIN_WFS_SIZE:
-            raise SourceUnavailableError(
-                source="sicar",
-                url=url,
-                last_error=(
-                    f"WFS response too small ({len(content)} bytes), expected CSV feature data"
-                ),
-            )
-        return content
+    content = response.content
+    if len(content) < MIN_WFS_SIZE:
+        raise SourceUnavailableError(
+            source="sicar",
+            url=url,
+            last_error=(
+                f"WFS response too small ({len(content)} bytes), expected CSV feature data"
+            ),
+        )
+    return content
 
 
 async def fetch_hits(uf: str, cql_filter: str | None = None) -> int:
@@ -110,29 +111,30 @@ async def fetch_hits(uf: str, cql_filter: str | None = None) -> int:
     )
 
 
-async def fetch_imoveis(uf: str, cql_filter: str | None = None) -> tuple[list[bytes], str]:
+async def iter_imoveis(
+    uf: str, cql_filter: str | None = None, *, start_page: int = 0
+) -> AsyncIterator[bytes]:
     total = await fetch_hits(uf, cql_filter)
     logger.info("sicar_hits", uf=uf, total=total, cql_filter=cql_filter)
 
     if total == 0:
-        url = _build_wfs_url(uf, cql_filter=cql_filter)
-        return [], url
+        return
 
     n_pages = math.ceil(total / PAGE_SIZE)
-    pages: list[bytes] = []
-    base_url = _build_wfs_url(uf, cql_filter=cql_filter)
 
-    for i in range(n_pages):
-        start_index = i * PAGE_SIZE
+    async def _fetch_page(i: int) -> bytes:
         url = _build_wfs_url(
             uf,
             cql_filter=cql_filter,
             count=PAGE_SIZE,
-            start_index=start_index,
+            start_index=i * PAGE_SIZE,
         )
         delay = 2.0 if i >= 5 else None
-        content = await _fetch_url(url, base_delay=delay)
-        pages.append(content)
+        return await _fetch_url(url, base_delay=delay)
+
+    async for i, content in fetch_pages(
+        Fonte.SICAR, _fetch_page, total_pages=n_pages, start=start_page
+    ):
         logger.debug(
             "sicar_page",
             uf=uf,
@@ -140,5 +142,9 @@ async def fetch_imoveis(uf: str, cql_filter: str | None = None) -> tuple[list[by
             total_pages=n_pages,
             size=len(content),
         )
+        yield content
 
-    return pages, base_url
+
+async def fetch_imoveis(uf: str, cql_filter: str | None = None) -> tuple[list[bytes], str]:
+    pages = [content async for content in iter_imoveis(uf, cql_filter)]
+    return pages, _build_wfs_url(uf, cql_filter=cql_filter)
@@ -14,26 +14,25 @@ logger = structlog.get_logger()
 PARSER_VERSION = 1
 
 
+def read_imoveis_page(data: bytes, page: int = 0) -> pd.DataFrame:
+    try:
+        return pd.read_csv(io.BytesIO(data), encoding="utf-8")
+    except UnicodeDecodeError:
+        return pd.read_csv(io.BytesIO(data), encoding="latin-1")
+    except Exception as e:
+        raise ParseError(
+            source="sicar",
+            parser_version=PARSER_VERSION,
+            reason=f"Erro ao ler CSV pagina {page}: {e}",
+        ) from e
+
+
 def parse_imoveis_csv(pages: list[bytes]) -> pd.DataFrame:
-    if not pages:
-        return pd.DataFrame(columns=COLUNAS_IMOVEIS)
+    return parse_imoveis_frames([read_imoveis_page(data, i) for i, data in enumerate(pages)])
 
-    dfs: list[pd.DataFrame] = []
-    for i, data in enumerate(pages):
-        try:
-            df = pd.read_csv(io.BytesIO(data), encoding="utf-8")
-        except UnicodeDecodeError:
-            df = pd.read_csv(io.BytesIO(data), encoding="latin-1")
-        except Exception as e:
-            raise ParseError(
-                source="sicar",
-                parser_version=PARSER_VERSION,
-                reason=f"Erro ao ler CSV pagina {i}: {e}",
-            ) from e
-
-        if not df.empty:
-            dfs.append(df)
 
+def parse_imoveis_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    dfs = [df for df in frames if not df.empty]
     if not dfs:
         return pd.DataFrame(columns=COLUNAS_IMOVEIS)
 
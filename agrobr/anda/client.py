@@ -5,7 +5,9 @@ import re
 import httpx
 import structlog
 
+from agrobr.cache.read_through import TEXT_CODEC, read_through
 from agrobr.constants import MIN_HTML_SIZE, MIN_ZIP_SIZE, URLS, Fonte, HTTPSettings
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -25,19 +27,17 @@ TIMEOUT = httpx.Timeout(
 
 
 async def _get_with_retry(url: str) -> httpx.Response:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        follow_redirects=True,
-        headers=UserAgentRotator.get_bot_headers(),
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="anda",
-        )
-        response.raise_for_status()
-        return response
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.ANDA)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="anda",
+    )
+    response.raise_for_status()
+    return response
 
 
+@read_through(Fonte.ANDA, codec=TEXT_CODEC)
 async def fetch_estatisticas_page() -> str:
     from agrobr.exceptions import SourceUnavailableError
 
@@ -57,6 +57,7 @@ async def fetch_estatisticas_page() -> str:
     return html
 
 
+@read_through(Fonte.ANDA)
 async def download_file(url: str) -> bytes:
     from agrobr.exceptions import SourceUnavailableError
 
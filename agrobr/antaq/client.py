@@ -6,7 +6,9 @@ import zipfile
 import httpx
 import structlog
 
+from agrobr.cache.read_through import read_through
 from agrobr.constants import MIN_ZIP_SIZE, URLS, Fonte, HTTPSettings
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -24,36 +26,36 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.ANTAQ)
 async def _download_zip(url: str) -> bytes:
     logger.info("antaq_download_zip", url=url)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_headers(source="antaq"), follow_redirects=True
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
+    headers = UserAgentRotator.get_headers(source="antaq")
+    client = ClientPool.get(Fonte.ANTAQ)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="antaq",
+    )
+    response.raise_for_status()
+
+    content = response.content
+    if len(content) < MIN_ZIP_SIZE:
+        from agrobr.exceptions import SourceUnavailableError
+
+        raise SourceUnavailableError(
             source="antaq",
-        )
-        response.raise_for_status()
-
-        content = response.content
-        if len(content) < MIN_ZIP_SIZE:
-            from agrobr.exceptions import SourceUnavailableError
-
-            raise SourceUnavailableError(
-                source="antaq",
-                url=url,
-                last_error=(
-                    f"Downloaded ZIP too small ({len(content)} bytes), expected a valid ZIP archive"
-                ),
-            )
-
-        logger.info(
-            "antaq_download_ok",
             url=url,
-            size_bytes=len(content),
+            last_error=(
+                f"Downloaded ZIP too small ({len(content)} bytes), expected a valid ZIP archive"
+            ),
         )
-        return content
+
+    logger.info(
+        "antaq_download_ok",
+        url=url,
+        size_bytes=len(content),
+    )
+    return content
 
 
 def _extract_txt_from_zip(zip_bytes: bytes, filename: str) -> str:
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import asyncio
 import time
 import warnings
-from datetime import UTC, date, datetime, timedelta
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime
 from typing import Any, Literal, overload
 
 import pandas as pd
 import structlog
 
+from agrobr.cache.duckdb_store import AsyncDuckDBStore, get_async_store
+from agrobr.cache.read_through import DATAFRAME_CODEC
+from agrobr.constants import Fonte
+from agrobr.http.fanout import fetch_all
 from agrobr.models import MetaInfo
 
-from . import client, parser
+from . import calendario, client, parser
 from .models import (
     B3_CONTRATOS_AGRO,
     COLUNAS_OI_SAIDA,
@@ -22,9 +26,81 @@ from .models import (
 
 _WARNED = False
 
+HISTORY_KEY_AJUSTES = "b3.ajustes"
+HISTORY_KEY_OI = "b3.posicoes_abertas"
+
 logger = structlog.get_logger()
 
 
+def _filtrar_contrato(df: pd.DataFrame, contrato: str, tickers: set[str]) -> pd.DataFrame:
+    ticker = B3_CONTRATOS_AGRO.get(contrato, contrato.upper())
+    if ticker not in tickers:
+        ticker = contrato.upper()
+    return df[df["ticker"] == ticker].reset_index(drop=True)
+
+
+def _to_date(value: str | date) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date() if isinstance(value, str) else value
+
+
+async def _coletar_pregoes(
+    dias: list[date],
+    key: str,
+    fetch_dia: Callable[[date], Awaitable[pd.DataFrame]],
+    parser_version: int,
+    store: AsyncDuckDBStore | None = None,
+) -> list[pd.DataFrame]:
+    store = store or get_async_store()
+    por_dia: dict[date, pd.DataFrame] = {}
+    faltantes: list[date] = []
+
+    for dia in dias:
+        try:
+            raw = await store.history_get(key, datetime.combine(dia, datetime.min.time()))
+        except Exception as exc:
+            logger.debug("b3_history_get_failed", key=key, data=str(dia), error=str(exc))
+            raw = None
+        if raw is None:
+            faltantes.append(dia)
+        else:
+            por_dia[dia] = DATAFRAME_CODEC.decode(raw)
+
+    logger.info("b3_historico_plan", key=key, dias=len(dias), em_cache=len(por_dia))
+
+    hoje = date.today()
+
+    async def _buscar(dia: date) -> None:
+        try:
+            df_dia = await fetch_dia(dia)
+        except Exception as exc:
+            logger.warning("b3_historico_skip", key=key, data=str(dia), error=str(exc)[:200])
+            return
+
+        if df_dia.empty:
+            logger.debug("b3_historico_empty", key=key, data=str(dia))
+            return
+
+        por_dia[dia] = df_dia
+        if dia >= hoje:
+            logger.debug("b3_historico_pregao_aberto", key=key, data=str(dia))
+            return
+
+        try:
+            await store.history_save(
+                key,
+                DATAFRAME_CODEC.encode(df_dia),
+                Fonte.B3,
+                datetime.combine(dia, datetime.min.time()),
+                parser_version,
+            )
+        except Exception as exc:
+            logger.debug("b3_history_save_failed", key=key, data=str(dia), error=str(exc))
+
+    await fetch_all(Fonte.B3, faltantes, _buscar)
+
+    return [por_dia[dia] for dia in dias if dia in por_dia]
+
+
 @overload
 async def ajustes(
     *,
@@ -74,11 +150,7 @@ async def ajustes(
     parse_ms = int((time.monotonic() - t1) * 1000)
 
     if contrato is not None:
-        ticker = B3_CONTRATOS_AGRO.get(contrato, contrato.upper())
-        if ticker in TICKERS_AGRO:
-            df = df[df["ticker"] == ticker].reset_index(drop=True)
-        else:
-            df = df[df["ticker"] == contrato.upper()].reset_index(drop=True)
+        df = _filtrar_contrato(df, contrato, TICKERS_AGRO)
 
     if return_meta:
         meta = MetaInfo(
@@ -134,31 +206,17 @@ async def historico(
 ) -> pd.DataFrame | tuple[pd.DataFrame, MetaInfo]:
     logger.info("b3_historico", contrato=contrato, inicio=str(inicio), fim=str(fim))
 
-    inicio_dt = datetime.strptime(inicio, "%Y-%m-%d").date() if isinstance(inicio, str) else inicio
-    fim_dt = datetime.strptime(fim, "%Y-%m-%d").date() if isinstance(fim, str) else fim
+    dias = calendario.pregoes(_to_date(inicio), _to_date(fim))
 
     t0 = time.monotonic()
-    frames: list[pd.DataFrame] = []
-    current = inicio_dt
-
-    while current <= fim_dt:
-        if current.weekday() < 5:
-            try:
-                df_dia = await ajustes(data=current, contrato=contrato)
-                if not df_dia.empty:
-                    frames.append(df_dia)
-                else:
-                    logger.debug("b3_historico_empty", data=str(current), contrato=contrato)
-            except Exception as exc:
-                logger.warning(
-                    "b3_historico_skip",
-                    data=str(current),
-                    contrato=contrato,
-                    error=str(exc)[:200],
-                )
-            await asyncio.sleep(1.0)
-        current += timedelta(days=1)
-
+    frames = await _coletar_pregoes(
+        dias,
+        HISTORY_KEY_AJUSTES,
+        lambda dia: ajustes(data=dia),
+        parser.PARSER_VERSION,
+    )
+    frames = [_filtrar_contrato(f, contrato, TICKERS_AGRO) for f in frames]
+    frames = [f for f in frames if not f.empty]
     fetch_ms = int((time.monotonic() - t0) * 1000)
 
     df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=COLUNAS_SAIDA)
@@ -244,11 +302,7 @@ async def posicoes_abertas(
     parse_ms = int((time.monotonic() - t1) * 1000)
 
     if contrato is not None:
-        ticker = B3_CONTRATOS_AGRO.get(contrato, contrato.upper())
-        if ticker in TICKERS_AGRO_OI:
-            df = df[df["ticker"] == ticker].reset_index(drop=True)
-        else:
-            df = df[df["ticker"] == contrato.upper()].reset_index(drop=True)
+        df = _filtrar_contrato(df, contrato, TICKERS_AGRO_OI)
 
     if tipo is not None:
         df = df[df["tipo"] == tipo].reset_index(drop=True)
@@ -310,31 +364,19 @@ async def oi_historico(
 ) -> pd.DataFrame | tuple[pd.DataFrame, MetaInfo]:
     logger.info("b3_oi_historico", contrato=contrato, inicio=str(inicio), fim=str(fim))
 
-    inicio_dt = datetime.strptime(inicio, "%Y-%m-%d").date() if isinstance(inicio, str) else inicio
-    fim_dt = datetime.strptime(fim, "%Y-%m-%d").date() if isinstance(fim, str) else fim
+    dias = calendario.pregoes(_to_date(inicio), _to_date(fim))
 
     t0 = time.monotonic()
-    frames: list[pd.DataFrame] = []
-    current = inicio_dt
-
-    while current <= fim_dt:
-        if current.weekday() < 5:
-            try:
-                df_dia = await posicoes_abertas(data=current, contrato=contrato, tipo=tipo)
-                if not df_dia.empty:
-                    frames.append(df_dia)
-                else:
-                    logger.debug("b3_oi_historico_empty", data=str(current), contrato=contrato)
-            except Exception as exc:
-                logger.warning(
-                    "b3_oi_historico_skip",
-                    data=str(current),
-                    contrato=contrato,
-                    error=str(exc)[:200],
-                )
-            await asyncio.sleep(1.0)
-        current += timedelta(days=1)
-
+    frames = await _coletar_pregoes(
+        dias,
+        HISTORY_KEY_OI,
+        lambda dia: posicoes_abertas(data=dia),
+        parser.PARSER_VERSION_OI,
+    )
+    frames = [_filtrar_contrato(f, contrato, TICKERS_AGRO_OI) for f in frames]
+    if tipo is not None:
+        frames = [f[f["tipo"] == tipo].reset_index(drop=True) for f in frames]
+    frames = [f for f in frames if not f.empty]
     fetch_ms = int((time.monotonic() - t0) * 1000)
 
     df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=COLUNAS_OI_SAIDA)
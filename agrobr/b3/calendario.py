@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+
+_FERIADOS_FIXOS: tuple[tuple[int, int], ...] = (
+    (1, 1),
+    (4, 21),
+    (5, 1),
+    (9, 7),
+    (10, 12),
+    (11, 2),
+    (11, 15),
+    (12, 24),
+    (12, 25),
+    (12, 31),
+)
+
+_FERIADOS_SP_ATE_2021: tuple[tuple[int, int], ...] = (
+    (1, 25),
+    (7, 9),
+    (11, 20),
+)
+
+
+def pascoa(ano: int) -> date:
+    a = ano % 19
+    b, c = divmod(ano, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return date(ano, mes, dia + 1)
+
+
+@lru_cache(maxsize=64)
+def feriados(ano: int) -> frozenset[date]:
+    dias = {date(ano, mes, dia) for mes, dia in _FERIADOS_FIXOS}
+
+    if ano <= 2021:
+        dias.update(date(ano, mes, dia) for mes, dia in _FERIADOS_SP_ATE_2021)
+    if ano >= 2024:
+        dias.add(date(ano, 11, 20))
+
+    p = pascoa(ano)
+    dias.update(
+        {
+            p - timedelta(days=48),
+            p - timedelta(days=47),
+            p - timedelta(days=2),
+            p + timedelta(days=60),
+        }
+    )
+    return frozenset(dias)
+
+
+def is_pregao(dia: date) -> bool:
+    return dia.weekday() < 5 and dia not in feriados(dia.year)
+
+
+def pregoes(inicio: date, fim: date) -> list[date]:
+    dias = []
+    current = inicio
+    while current <= fim:
+        if is_pregao(current):
+            dias.append(current)
+        current += timedelta(days=1)
+    return dias
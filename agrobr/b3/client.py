@@ -3,8 +3,11 @@ from __future__ import annotations
 import httpx
 import structlog
 
+from agrobr.cache.read_through import BYTES_CODEC, TEXT_CODEC, read_through, with_url
 from agrobr.constants import MIN_CSV_SIZE, MIN_HTML_SIZE, URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
+from agrobr.http.rate_limiter import RateLimiter
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -30,90 +33,88 @@ TIMEOUT_DOWNLOAD = httpx.Timeout(
 )
 
 
+@read_through(Fonte.B3, codec=with_url(TEXT_CODEC))
 async def fetch_ajustes(data: str) -> tuple[str, str]:
     url = f"{BASE_URL}?txtData={data}"
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_bot_headers(),
-        follow_redirects=True,
-        verify=False,
-    ) as http:
-        logger.debug("b3_request", url=url)
+    headers = UserAgentRotator.get_bot_headers()
+    http = ClientPool.get(Fonte.B3, verify=False)
+    logger.debug("b3_request", url=url)
+    async with RateLimiter.acquire(Fonte.B3):
         response = await retry_on_status(
-            lambda: http.get(BASE_URL, params={"txtData": data}),
+            lambda: http.get(BASE_URL, params={"txtData": data}, headers=headers, timeout=TIMEOUT),
             source="b3",
         )
 
-        if response.status_code == 404:
-            raise SourceUnavailableError(source="b3", url=url, last_error="HTTP 404")
+    if response.status_code == 404:
+        raise SourceUnavailableError(source="b3", url=url, last_error="HTTP 404")
 
-        response.raise_for_status()
-        html = response.content.decode("iso-8859-1")
+    response.raise_for_status()
+    html = response.content.decode("iso-8859-1")
 
-        if len(html) < MIN_HTML_SIZE or "<table" not in html.lower():
-            raise SourceUnavailableError(
-                source="b3",
-                url=url,
-                last_error=(
-                    f"Ajustes HTML too small or missing table "
-                    f"({len(html)} chars, no '<table' found)"
-                ),
-            )
+    if len(html) < MIN_HTML_SIZE or "<table" not in html.lower():
+        raise SourceUnavailableError(
+            source="b3",
+            url=url,
+            last_error=(
+                f"Ajustes HTML too small or missing table ({len(html)} chars, no '<table' found)"
+            ),
+        )
 
-        logger.info("b3_fetch_ok", url=url, size=len(html))
-        return html, url
+    logger.info("b3_fetch_ok", url=url, size=len(html))
+    return html, url
 
 
+@read_through(Fonte.B3, codec=with_url(BYTES_CODEC))
 async def fetch_posicoes_abertas(data: str) -> tuple[bytes, str]:
     token_url = (
         f"{BASE_URL_ARQUIVOS}/requestname"
         f"?fileName=DerivativesOpenPosition&date={data}&recaptchaToken="
     )
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT_DOWNLOAD, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as http:
-        logger.debug("b3_oi_token_request", url=token_url)
+    headers = UserAgentRotator.get_bot_headers()
+    http = ClientPool.get(Fonte.B3)
+    logger.debug("b3_oi_token_request", url=token_url)
+    async with RateLimiter.acquire(Fonte.B3):
         token_resp = await retry_on_status(
-            lambda: http.get(token_url),
+            lambda: http.get(token_url, headers=headers, timeout=TIMEOUT_DOWNLOAD),
             source="b3",
         )
 
-        if token_resp.status_code in (400, 404):
-            raise SourceUnavailableError(
-                source="b3", url=token_url, last_error=f"HTTP {token_resp.status_code}"
-            )
-        token_resp.raise_for_status()
-
-        token_data = token_resp.json()
-        token = token_data.get("token")
-        if not token:
-            raise SourceUnavailableError(
-                source="b3", url=token_url, last_error="Token vazio na resposta"
-            )
-
-        download_url = f"{BASE_URL_ARQUIVOS}?token={token}"
-        logger.debug("b3_oi_download", url=download_url)
-        csv_resp = await retry_on_status(
-            lambda: http.get(download_url),
+    if token_resp.status_code in (400, 404):
+        raise SourceUnavailableError(
+            source="b3", url=token_url, last_error=f"HTTP {token_resp.status_code}"
+        )
+    token_resp.raise_for_status()
+
+    token_data = token_resp.json()
+    token = token_data.get("token")
+    if not token:
+        raise SourceUnavailableError(
+            source="b3", url=token_url, last_error="Token vazio na resposta"
+        )
+
+    download_url = f"{BASE_URL_ARQUIVOS}?token={token}"
+    logger.debug("b3_oi_download", url=download_url)
+    csv_resp = await retry_on_status(
+        lambda: http.get(download_url, headers=headers, timeout=TIMEOUT_DOWNLOAD),
+        source="b3",
+    )
+
+    if csv_resp.status_code in (400, 404):
+        raise SourceUnavailableError(
+            source="b3", url=download_url, last_error=f"HTTP {csv_resp.status_code}"
+        )
+    csv_resp.raise_for_status()
+
+    csv_bytes = csv_resp.content
+    if len(csv_bytes) < MIN_CSV_SIZE:
+        raise SourceUnavailableError(
             source="b3",
+            url=download_url,
+            last_error=(
+                f"Posicoes abertas CSV too small ({len(csv_bytes)} bytes), "
+                f"expected derivative position data"
+            ),
         )
 
-        if csv_resp.status_code in (400, 404):
-            raise SourceUnavailableError(
-                source="b3", url=download_url, last_error=f"HTTP {csv_resp.status_code}"
-            )
-        csv_resp.raise_for_status()
-
-        csv_bytes = csv_resp.content
-        if len(csv_bytes) < MIN_CSV_SIZE:
-            raise SourceUnavailableError(
-                source="b3",
-                url=download_url,
-                last_error=(
-                    f"Posicoes abertas CSV too small ({len(csv_bytes)} bytes), "
-                    f"expected derivative position data"
-                ),
-            )
-
-        logger.info("b3_oi_fetch_ok", url=download_url, size=len(csv_bytes))
-        return csv_bytes, token_url
+    logger.info("b3_oi_fetch_ok", url=download_url, size=len(csv_bytes))
+    return csv_bytes, token_url
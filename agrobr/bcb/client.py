@@ -5,11 +5,16 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import JSON_CODEC, read_through
 from agrobr.constants import URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.fanout import fetch_pages
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
+from .models import UF_CODES
+
 logger = structlog.get_logger()
 
 BASE_URL = URLS[Fonte.BCB]["base"]
@@ -33,6 +38,7 @@ ENDPOINT_MAP: dict[str, str] = {
 }
 
 
+@read_through(Fonte.BCB, codec=JSON_CODEC)
 async def _fetch_odata(
     endpoint: str,
     filters: list[str] | None = None,
@@ -54,24 +60,78 @@ async def _fetch_odata(
     if select:
         params["$select"] = ",".join(select)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as client:
-        logger.debug(
-            "bcb_odata_request",
-            endpoint=endpoint,
-            skip=skip,
-            top=top,
-        )
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.BCB)
+    logger.debug(
+        "bcb_odata_request",
+        endpoint=endpoint,
+        skip=skip,
+        top=top,
+    )
 
-        response = await retry_on_status(
-            lambda: client.get(url, params=params),
-            source="bcb",
-            max_attempts=BCB_MAX_RETRIES,
-        )
+    response = await retry_on_status(
+        lambda: client.get(url, params=params, headers=headers, timeout=TIMEOUT),
+        source="bcb",
+        max_attempts=BCB_MAX_RETRIES,
+    )
+
+    response.raise_for_status()
+    return response.json()  # type: ignore[no-any-return]
+
+
+_SELECT_COMUM: list[str] = [
+    "nomeProduto",
+    "nomeRegiao",
+    "nomeUF",
+    "cdEstado",
+    "MesEmissao",
+    "AnoEmissao",
+    "cdPrograma",
+    "cdSubPrograma",
+    "cdFonteRecurso",
+    "cdTipoSeguro",
+    "cdModalidade",
+    "Atividade",
+]
+
+SELECT_MAP: dict[str, list[str]] = {
+    "CusteioRegiaoUFProduto": [*_SELECT_COMUM, "VlCusteio", "AreaCusteio", "QtdCusteio"],
+    "InvestRegiaoUFProduto": [
+        *_SELECT_COMUM,
+        "VlInvestimento",
+        "AreaInvestimento",
+        "QtdInvestimento",
+    ],
+}
+
+PUSHDOWN_REJECTED_STATUS = (400, 501)
+
+_UF_SIGLAS: dict[str, str] = {codigo: sigla for sigla, codigo in UF_CODES.items()}
+
+
+def _odata_literal(valor: str) -> str:
+    return "'" + valor.replace("'", "''") + "'"
 
-        response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+
+def _uf_sigla(cd_uf: str) -> str:
+    return _UF_SIGLAS.get(cd_uf, cd_uf).upper()
+
+
+def _build_pushdown_filters(
+    safra_sicor: str | None = None,
+    cd_uf: str | None = None,
+    ano_emissao: str | None = None,
+) -> list[str]:
+    filters: list[str] = []
+
+    ano = ano_emissao or (safra_sicor.split("/")[0] if safra_sicor else None)
+    if ano:
+        filters.append(f"AnoEmissao eq {_odata_literal(ano)}")
+
+    if cd_uf:
+        filters.append(f"nomeUF eq {_odata_literal(_uf_sigla(cd_uf))}")
+
+    return filters
 
 
 async def fetch_credito_rural(
@@ -79,6 +139,7 @@ async def fetch_credito_rural(
     produto_sicor: str | None = None,
     safra_sicor: str | None = None,
     cd_uf: str | None = None,
+    ano_emissao: str | None = None,
 ) -> list[dict[str, Any]]:
     endpoint = ENDPOINT_MAP.get(finalidade.lower())
     if not endpoint:
@@ -86,9 +147,12 @@ async def fetch_credito_rural(
             f"Finalidade inválida: '{finalidade}'. Opções: {list(ENDPOINT_MAP.keys())}"
         )
 
-    server_filter: list[str] | None = None
+    base_filter: list[str] = []
     if produto_sicor:
-        server_filter = [f"contains(nomeProduto,'{produto_sicor}')"]
+        base_filter.append(f"contains(nomeProduto,{_odata_literal(produto_sicor)})")
+
+    pushdown = _build_pushdown_filters(safra_sicor, cd_uf, ano_emissao)
+    select = SELECT_MAP.get(endpoint)
 
     logger.info(
         "bcb_fetch_credito",
@@ -96,68 +160,108 @@ async def fetch_credito_rural(
         produto=produto_sicor,
         safra=safra_sicor,
         uf=cd_uf,
-        server_filter=server_filter,
+        server_filter=base_filter + pushdown,
+        select=bool(select),
     )
 
-    all_records: list[dict[str, Any]] = []
-    skip = 0
+    try:
+        return await _coletar_paginas(
+            endpoint,
+            base_filter + pushdown,
+            select,
+            safra_sicor=safra_sicor,
+            cd_uf=cd_uf,
+            ano_emissao=ano_emissao,
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code not in PUSHDOWN_REJECTED_STATUS or not (pushdown or select):
+            raise
+        logger.warning(
+            "bcb_odata_pushdown_rejected",
+            endpoint=endpoint,
+            status=e.response.status_code,
+            fallback="filtro local",
+        )
 
-    while True:
+    return await _coletar_paginas(
+        endpoint,
+        base_filter,
+        None,
+        safra_sicor=safra_sicor,
+        cd_uf=cd_uf,
+        ano_emissao=ano_emissao,
+    )
+
+
+async def _coletar_paginas(
+    endpoint: str,
+    server_filter: list[str],
+    select: list[str] | None,
+    *,
+    safra_sicor: str | None = None,
+    cd_uf: str | None = None,
+    ano_emissao: str | None = None,
+) -> list[dict[str, Any]]:
+    async def _fetch_page(page: int) -> list[dict[str, Any]]:
         data = await _fetch_odata(
             endpoint=endpoint,
-            filters=server_filter,
+            filters=server_filter or None,
+            select=select,
             top=PAGE_SIZE,
-            skip=skip,
+            skip=page * PAGE_SIZE,
+        )
+        records: list[dict[str, Any]] = data.get("value", [])
+        return records
+
+    filtered: list[dict[str, Any]] = []
+    total_raw = 0
+
+    async for page, records in fetch_pages(
+        Fonte.BCB, _fetch_page, is_last=lambda records: len(records) < PAGE_SIZE
+    ):
+        total_raw += len(records)
+        filtered.extend(
+            _filtrar_registros(
+                records, safra_sicor=safra_sicor, cd_uf=cd_uf, ano_emissao=ano_emissao
+            )
         )
-
-        records = data.get("value", [])
-        if not records:
-            break
-
-        all_records.extend(records)
         logger.debug(
             "bcb_page_fetched",
-            skip=skip,
+            skip=page * PAGE_SIZE,
             records_in_page=len(records),
-            total_so_far=len(all_records),
+            total_so_far=total_raw,
         )
 
-        if len(records) < PAGE_SIZE:
-            break
-
-        skip += PAGE_SIZE
-
     logger.info(
-        "bcb_fetch_credito_raw",
-        total_records=len(all_records),
+        "bcb_fetch_credito_ok",
+        total_raw=total_raw,
+        total_filtered=len(filtered),
         endpoint=endpoint,
     )
 
-    if not all_records:
-        return all_records
+    return filtered
 
-    filtered = all_records
 
-    if safra_sicor:
-        ano_emissao = safra_sicor.split("/")[0]
-        filtered = [r for r in filtered if str(r.get("AnoEmissao", "")) == ano_emissao]
+def _filtrar_registros(
+    records: list[dict[str, Any]],
+    safra_sicor: str | None = None,
+    cd_uf: str | None = None,
+    ano_emissao: str | None = None,
+) -> list[dict[str, Any]]:
+    ano = ano_emissao or (safra_sicor.split("/")[0] if safra_sicor else None)
+    if ano:
+        records = [r for r in records if str(r.get("AnoEmissao", "")) == ano]
 
     if cd_uf:
-        filtered = [
+        sigla = _uf_sigla(cd_uf)
+        records = [
             r
-            for r in filtered
+            for r in records
             if str(r.get("cdEstado", "")) == cd_uf
-            or str(r.get("nomeUF", "")).upper() == cd_uf.upper()
+            or str(r.get("nomeUF", "")).upper() in (cd_uf.upper(), sigla)
         ]
 
-    logger.info(
-        "bcb_fetch_credito_ok",
-        total_raw=len(all_records),
-        total_filtered=len(filtered),
-        endpoint=endpoint,
-    )
-
-    return filtered
+    return records
 
 
 def _match_produto(nome_api: str, produto_upper: str) -> bool:
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from .duckdb_store import DuckDBStore, get_store
+from .duckdb_store import AsyncDuckDBStore, DuckDBStore, get_async_store, get_store
 from .history import HistoryManager, get_history_manager
 from .keys import build_cache_key
+from .maintenance import MaintenanceReport, run_maintenance
 from .policies import (
     TTL,
     CachePolicy,
@@ -15,10 +16,13 @@ from .policies import (
     is_expired,
     is_stale_acceptable,
 )
+from .single_flight import SingleFlight, get_single_flight, single_flight
 
 __all__ = [
     "DuckDBStore",
+    "AsyncDuckDBStore",
     "get_store",
+    "get_async_store",
     "CachePolicy",
     "TTL",
     "get_policy",
@@ -30,4 +34,9 @@ __all__ = [
     "HistoryManager",
     "get_history_manager",
     "build_cache_key",
+    "MaintenanceReport",
+    "run_maintenance",
+    "SingleFlight",
+    "get_single_flight",
+    "single_flight",
 ]
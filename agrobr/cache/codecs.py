@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+import struct
+import tempfile
+import threading
+import zlib
+from collections.abc import Callable
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import duckdb
+import pandas as pd
+import structlog
+
+from agrobr.constants import CacheSettings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover
+    lz4_frame = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+logger = structlog.get_logger()
+
+BLOB_MAGIC = b"\x00AGZ"
+FRAME_MAGIC = b"\x00AGD"
+FRAME_VERSION = 1
+
+_INCOMPRESSIBLE_PREFIXES: tuple[bytes, ...] = (
+    FRAME_MAGIC,
+    b"PK\x03\x04",
+    b"\x1f\x8b",
+    b"PAR1",
+    b"%PDF",
+    b"\x89PNG",
+    b"\xff\xd8\xff",
+)
+
+
+class Compressor(NamedTuple):
+    tag: int
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+_COMPRESSORS: dict[str, Compressor] = {
+    "none": Compressor(0, bytes, bytes),
+    "zlib": Compressor(1, lambda b: zlib.compress(b, 1), zlib.decompress),
+}
+_BY_TAG: dict[int, Compressor] = {c.tag: c for c in _COMPRESSORS.values()}
+
+
+def register_compressor(
+    name: str,
+    tag: int,
+    compress: Callable[[bytes], bytes],
+    decompress: Callable[[bytes], bytes],
+) -> None:
+    if tag in _BY_TAG and _BY_TAG[tag] is not _COMPRESSORS.get(name):
+        raise ValueError(f"Tag de compressao ja registrada: {tag}")
+    compressor = Compressor(tag, compress, decompress)
+    _COMPRESSORS[name] = compressor
+    _BY_TAG[tag] = compressor
+
+
+if zstandard is not None:
+    register_compressor(
+        "zstd",
+        2,
+        zstandard.ZstdCompressor(level=3).compress,
+        lambda b: zstandard.ZstdDecompressor().decompress(b),
+    )
+
+if lz4_frame is not None:
+    register_compressor("lz4", 3, lz4_frame.compress, lz4_frame.decompress)
+
+
+def available_compressors() -> list[str]:
+    return list(_COMPRESSORS)
+
+
+def _resolve(method: str) -> str:
+    if method == "auto":
+        return next(m for m in ("zstd", "lz4", "zlib") if m in _COMPRESSORS)
+    if method not in _COMPRESSORS:
+        raise ValueError(f"Compressao nao disponivel: {method}")
+    return method
+
+
+def compress_blob(data: bytes, settings: CacheSettings | None = None) -> bytes:
+    settings = settings or CacheSettings()
+    method = _resolve(settings.compression)
+
+    if (
+        method != "none"
+        and len(data) >= settings.compression_min_bytes
+        and not data.startswith(_INCOMPRESSIBLE_PREFIXES)
+    ):
+        compressor = _COMPRESSORS[method]
+        compressed = compressor.compress(data)
+        if len(compressed) + len(BLOB_MAGIC) + 1 < len(data):
+            return BLOB_MAGIC + bytes([compressor.tag]) + compressed
+
+    if data.startswith(BLOB_MAGIC):
+        return BLOB_MAGIC + b"\x00" + data
+    return data
+
+
+def decompress_blob(blob: bytes) -> bytes:
+    if not blob.startswith(BLOB_MAGIC):
+        return blob
+
+    tag = blob[len(BLOB_MAGIC)]
+    compressor = _BY_TAG.get(tag)
+    if compressor is None:
+        raise ValueError(f"Compressao desconhecida no cache (tag {tag})")
+    return compressor.decompress(blob[len(BLOB_MAGIC) + 1 :])
+
+
+_PARQUET_ERRORS: tuple[type[Exception], ...] = (
+    (duckdb.Error, pa.ArrowException) if pa is not None else (duckdb.Error,)
+)
+
+_local = threading.local()
+
+
+def _duckdb() -> duckdb.DuckDBPyConnection:
+    conn: duckdb.DuckDBPyConnection | None = getattr(_local, "conn", None)
+    if conn is None:
+        conn = duckdb.connect()
+        _local.conn = conn
+    return conn
+
+
+def _parquet_safe(df: pd.DataFrame) -> bool:
+    if not df.columns.is_unique:
+        return False
+    for col in df.columns:
+        if not isinstance(col, str):
+            return False
+        if df[col].dtype == object:
+            kind = pd.api.types.infer_dtype(df[col], skipna=True)
+            if kind not in ("string", "empty"):
+                return False
+    return True
+
+
+_JSON_OBJECTS: dict[str, tuple[Callable[[Any], str], Callable[[str], Any]]] = {
+    "date": (date.isoformat, date.fromisoformat),
+    "datetime": (datetime.isoformat, datetime.fromisoformat),
+    "decimal": (str, Decimal),
+}
+_JSON_SCALARS = (str, bool, int, float)
+
+
+def _encode_json(df: pd.DataFrame) -> bytes:
+    objects: dict[str, str] = {}
+    converted = df.copy(deep=False)
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        kind = pd.api.types.infer_dtype(df[col], skipna=True)
+        if kind in _JSON_OBJECTS:
+            converted[col] = df[col].map(_JSON_OBJECTS[kind][0], na_action="ignore")
+            objects[str(col)] = kind
+        elif not all(isinstance(v, _JSON_SCALARS) for v in df[col].dropna()):
+            raise TypeError(f"Coluna {col!r} ({kind}) nao pode ser serializada no cache")
+
+    payload = json.loads(converted.to_json(orient="split", index=False, date_unit="us"))
+    payload["dtypes"] = {str(col): str(dtype) for col, dtype in df.dtypes.items()}
+    if objects:
+        payload["objects"] = objects
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _restore_dtypes(df: pd.DataFrame, dtypes: dict[str, str]) -> pd.DataFrame:
+    for col, dtype in dtypes.items():
+        if str(df[col].dtype) == dtype:
+            continue
+        if dtype.startswith("datetime64") and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], unit="us")
+        df[col] = df[col].astype(pd.api.types.pandas_dtype(dtype))
+    return df
+
+
+def _decode_json(raw: bytes) -> pd.DataFrame:
+    payload = json.loads(raw.decode("utf-8"))
+    df = pd.DataFrame(payload["data"], columns=payload["columns"])
+    for col, kind in payload.get("objects", {}).items():
+        restore = _JSON_OBJECTS[kind][1]
+        df[col] = pd.Series(
+            [restore(v) if isinstance(v, str) else None for v in df[col]],
+            index=df.index,
+            dtype=object,
+        )
+    return _restore_dtypes(df, payload.get("dtypes", {}))
+
+
+def _encode_parquet(df: pd.DataFrame) -> bytes:
+    if pq is not None:
+        sink = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink, compression="zstd")
+        return bytes(sink.getvalue())
+
+    conn = _duckdb()
+    with tempfile.TemporaryDirectory(prefix="agrobr_df_") as tmp:
+        path = Path(tmp) / "frame.parquet"
+        conn.register("_agrobr_frame", df)
+        try:
+            conn.execute(
+                f"COPY _agrobr_frame TO '{path.as_posix()}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+            )
+        finally:
+            conn.unregister("_agrobr_frame")
+        return path.read_bytes()
+
+
+def _decode_parquet(raw: memoryview) -> pd.DataFrame:
+    if pq is not None:
+        df: pd.DataFrame = pq.read_table(pa.BufferReader(pa.py_buffer(raw))).to_pandas()
+        return df
+
+    with tempfile.TemporaryDirectory(prefix="agrobr_df_") as tmp:
+        path = Path(tmp) / "frame.parquet"
+        path.write_bytes(raw)
+        return _duckdb().execute(f"SELECT * FROM read_parquet('{path.as_posix()}')").df()
+
+
+def _split_frame(raw: bytes) -> tuple[dict[str, Any], memoryview]:
+    offset = len(FRAME_MAGIC) + 1
+    (header_len,) = struct.unpack_from(">I", raw, offset)
+    offset += 4
+    header = json.loads(raw[offset : offset + header_len].decode("utf-8"))
+    return header, memoryview(raw)[offset + header_len :]
+
+
+def encode_dataframe(df: pd.DataFrame) -> bytes:
+    if len(df.columns) == 0 or not _parquet_safe(df):
+        return _encode_json(df)
+
+    try:
+        body = _encode_parquet(df)
+    except _PARQUET_ERRORS as e:
+        logger.debug("dataframe_codec_parquet_fallback", error=str(e))
+        return _encode_json(df)
+
+    header = json.dumps(
+        {"format": "parquet", "dtypes": {str(c): str(t) for c, t in df.dtypes.items()}}
+    ).encode("utf-8")
+    return FRAME_MAGIC + bytes([FRAME_VERSION]) + struct.pack(">I", len(header)) + header + body
+
+
+def decode_dataframe(raw: bytes) -> pd.DataFrame:
+    if not raw.startswith(FRAME_MAGIC):
+        return _decode_json(raw)
+
+    header, body = _split_frame(raw)
+    df = _decode_parquet(body)
+    return _restore_dtypes(df, header["dtypes"])
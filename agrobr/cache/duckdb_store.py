@@ -1,16 +1,39 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import contextvars
 import threading
-from datetime import UTC, datetime, timedelta
-from typing import Any
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from datetime import UTC, date, datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import duckdb
+import pandas as pd
 import structlog
 
 from agrobr import constants
 
+from . import facts
+from .codecs import compress_blob, decompress_blob
+
+if TYPE_CHECKING:
+    from agrobr.contracts import Contract
+
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
+INDICADOR_COLUMNS = (
+    "produto, praca, data, valor, unidade, fonte, metodologia, "
+    "variacao_percentual, collected_at, parser_version"
+)
+
 
 def _utcnow() -> datetime:
     return datetime.now(UTC).replace(tzinfo=None)
@@ -36,15 +59,23 @@ CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at);
 SCHEMA_HISTORY = """
 CREATE SEQUENCE IF NOT EXISTS seq_history_id START 1;
 
+CREATE TABLE IF NOT EXISTS history_blobs (
+    content_hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size_bytes BIGINT NOT NULL,
+    created_at TIMESTAMP NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS history_entries (
     id INTEGER DEFAULT nextval('seq_history_id') PRIMARY KEY,
     key TEXT NOT NULL,
-    data BLOB NOT NULL,
+    data BLOB,
     source TEXT NOT NULL,
     data_date DATE NOT NULL,
     collected_at TIMESTAMP NOT NULL,
     parser_version INTEGER NOT NULL,
     fingerprint_hash TEXT,
+    content_hash TEXT,
     UNIQUE(key, data_date, collected_at)
 );
 
@@ -76,24 +107,54 @@ CREATE INDEX IF NOT EXISTS idx_ind_data ON indicadores(data);
 CREATE INDEX IF NOT EXISTS idx_ind_produto_data ON indicadores(produto, data);
 """
 
-UPSERT_CHUNK_SIZE = 5000
-
-_STAGING_DDL = """
-CREATE TEMP TABLE IF NOT EXISTS _ind_staging (
-    produto TEXT, praca TEXT, data DATE, valor DECIMAL(18,4),
-    unidade TEXT, fonte TEXT, metodologia TEXT,
-    variacao_percentual DECIMAL(8,4),
-    collected_at TIMESTAMP, parser_version INTEGER
+HISTORY_COLUMNS = (
+    "key, source, data_date, collected_at, parser_version, fingerprint_hash, content_hash"
 )
-"""
 
-_STAGING_INSERT = "INSERT INTO _ind_staging VALUES (?,?,?,?,?,?,?,?,?,?)"
+HISTORY_EXPORT_FORMATS = {
+    "parquet": "FORMAT parquet, COMPRESSION zstd",
+    "csv": "FORMAT csv, HEADER true",
+    "json": "FORMAT json, ARRAY true",
+}
+
+HIT_FLUSH_INTERVAL = 30.0
+HIT_FLUSH_MAX_PENDING = 1000
+
+EVICTION_ORDER = {
+    "lru": "last_accessed_at DESC, key",
+    "lfu": "hit_count DESC, last_accessed_at DESC, key",
+}
+
+_HITS_SQL = """
+UPDATE cache_entries
+SET hit_count = hit_count + ?, last_accessed_at = greatest(last_accessed_at, ?)
+WHERE key = ?
+"""
 
-_MERGE_SQL = """
+_UPSERT_COLUMNS: dict[str, tuple[str, str | None]] = {
+    "produto": ("VARCHAR", None),
+    "praca": ("VARCHAR", None),
+    "data": ("DATE", None),
+    "valor": ("DECIMAL(18,4)", None),
+    "unidade": ("VARCHAR", "'BRL/unidade'"),
+    "fonte": ("VARCHAR", "'unknown'"),
+    "metodologia": ("VARCHAR", None),
+    "variacao_percentual": ("DECIMAL(8,4)", None),
+    "parser_version": ("INTEGER", "1"),
+}
+
+_UPSERT_VALID = "produto IS NOT NULL AND data IS NOT NULL AND valor IS NOT NULL"
+
+_UPSERT_SQL = """
 INSERT INTO indicadores
 (produto, praca, data, valor, unidade, fonte, metodologia,
  variacao_percentual, collected_at, parser_version)
-SELECT * FROM _ind_staging
+SELECT produto, praca, data, valor, unidade, fonte, metodologia,
+       variacao_percentual, ?, parser_version
+FROM ({valid})
+QUALIFY row_number() OVER (
+    PARTITION BY produto, praca, data, fonte ORDER BY _pos DESC
+) = 1
 ON CONFLICT (produto, praca, data, fonte)
 DO UPDATE SET
     valor = EXCLUDED.valor,
@@ -107,116 +168,185 @@ class DuckDBStore:
         self.settings = settings or constants.CacheSettings()
         self.db_path = self.settings.cache_dir / self.settings.db_name
         self._conn: duckdb.DuckDBPyConnection | None = None
-        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cursors: weakref.WeakSet[duckdb.DuckDBPyConnection] = weakref.WeakSet()
+        self._generation = 0
+        self._conn_lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._readers_idle = threading.Condition()
+        self._readers = 0
+        self._draining = False
+        self._hits_lock = threading.Lock()
+        self._pending_hits: dict[str, tuple[int, datetime]] = {}
+        self._pending_total = 0
+        self._last_flush = time.monotonic()
+        self._fact_tables: set[str] = set()
 
     def _get_conn(self) -> duckdb.DuckDBPyConnection:
         if self._conn is None:
-            self.settings.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._conn = duckdb.connect(str(self.db_path))
-            self._init_schema()
+            with self._conn_lock:
+                if self._conn is None:
+                    self.settings.cache_dir.mkdir(parents=True, exist_ok=True)
+                    conn = duckdb.connect(str(self.db_path))
+                    self._init_schema(conn)
+                    self._conn = conn
         return self._conn
 
-    def _init_schema(self) -> None:
+    def _init_schema(self, conn: duckdb.DuckDBPyConnection) -> None:
         from agrobr.cache.migrations import migrate
 
-        conn = self._conn
-        if conn:
-            conn.execute(SCHEMA_CACHE)
-            conn.execute(SCHEMA_HISTORY)
-            conn.execute(SCHEMA_INDICADORES)
-            migrate(conn)
+        conn.execute(SCHEMA_CACHE)
+        conn.execute(SCHEMA_HISTORY)
+        conn.execute(SCHEMA_INDICADORES)
+        conn.execute(facts.SCHEMA_FACTS)
+        migrate(conn)
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        local = self._local
+        cursor: duckdb.DuckDBPyConnection | None = getattr(local, "cursor", None)
+        if cursor is None or local.generation != self._generation:
+            with self._conn_lock:
+                cursor = self._get_conn().cursor()
+                local.cursor = cursor
+                local.generation = self._generation
+                self._cursors.add(cursor)
+        return cursor
+
+    @contextmanager
+    def _reading(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        with self._readers_idle:
+            self._readers_idle.wait_for(lambda: not self._draining)
+            self._readers += 1
+        try:
+            yield self._cursor()
+        finally:
+            with self._readers_idle:
+                self._readers -= 1
+                self._readers_idle.notify_all()
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        with self._write_lock:
+            with self._readers_idle:
+                self._draining = True
+                self._readers_idle.wait_for(lambda: self._readers == 0)
+            try:
+                with self._conn_lock:
+                    yield
+            finally:
+                with self._readers_idle:
+                    self._draining = False
+                    self._readers_idle.notify_all()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        with self._write_lock:
+            conn = self._cursor()
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def cache_get(self, key: str) -> tuple[bytes | None, bool]:
         from agrobr import __version__
-        from agrobr.cache.keys import is_legacy_key, legacy_key_prefix, parse_cache_key
+        from agrobr.cache.keys import is_legacy_key, parse_cache_key
 
-        with self._lock:
-            conn = self._get_conn()
-            now = _utcnow()
+        now = _utcnow()
 
+        with self._reading() as conn:
             result = conn.execute(
                 "SELECT data, expires_at, stale, key FROM cache_entries WHERE key = ?",
                 [key],
             ).fetchone()
 
-            if result is not None:
-                data, expires_at, stale, stored_key = result
-
-                if self.settings.strict_mode and not is_legacy_key(stored_key):
-                    try:
-                        parsed = parse_cache_key(stored_key)
-                        if parsed["lib_version"] != __version__:
-                            logger.debug(
-                                "cache_miss",
-                                key=key,
-                                reason="strict_version_mismatch",
-                                cached_version=parsed["lib_version"],
-                                current_version=__version__,
-                            )
-                            return None, False
-                    except ValueError:
-                        pass
-
-                conn.execute(
-                    "UPDATE cache_entries SET hit_count = hit_count + 1, last_accessed_at = ? WHERE key = ?",
-                    [now, key],
-                )
-
-                if expires_at < now:
-                    logger.debug("cache_hit", key=key, stale=True, reason="expired")
-                    return data, True
+        if result is not None:
+            blob, expires_at, stale, stored_key = result
 
-                if stale:
-                    logger.debug("cache_hit", key=key, stale=True, reason="marked_stale")
-                    return data, True
+            if self.settings.strict_mode and not is_legacy_key(stored_key):
+                try:
+                    parsed = parse_cache_key(stored_key)
+                    if parsed["lib_version"] != __version__:
+                        logger.debug(
+                            "cache_miss",
+                            key=key,
+                            reason="strict_version_mismatch",
+                            cached_version=parsed["lib_version"],
+                            current_version=__version__,
+                        )
+                        return None, False
+                except ValueError:
+                    pass
 
-                logger.debug("cache_hit", key=key, stale=False)
-                return data, False
+            self._record_hit(key, now)
+            data = decompress_blob(blob)
 
-            if not is_legacy_key(key):
-                prefix = legacy_key_prefix(key)
-                legacy_result = conn.execute(
-                    "SELECT key, data, source, expires_at, stale FROM cache_entries WHERE key LIKE ? || '%'",
-                    [prefix],
-                ).fetchone()
+            if expires_at < now:
+                logger.debug("cache_hit", key=key, stale=True, reason="expired")
+                return data, True
 
-                if legacy_result is not None:
-                    legacy_key, data, source, expires_at, stale = legacy_result
-
-                    if is_legacy_key(legacy_key):
-                        remaining_ttl = max(int((expires_at - now).total_seconds()), 0)
-                        conn.execute("DELETE FROM cache_entries WHERE key = ?", [legacy_key])
-                        conn.execute(
-                            """
-                            INSERT OR REPLACE INTO cache_entries
-                            (key, data, source, created_at, expires_at, last_accessed_at, hit_count, version, stale)
-                            VALUES (?, ?, ?, ?, ?, ?, 0, 1, ?)
-                            """,
-                            [
-                                key,
-                                data,
-                                source,
-                                now,
-                                now + timedelta(seconds=remaining_ttl),
-                                now,
-                                stale,
-                            ],
-                        )
-                        logger.info(
-                            "legacy_cache_migrated",
-                            old_key=legacy_key,
-                            new_key=key,
-                        )
+            if stale:
+                logger.debug("cache_hit", key=key, stale=True, reason="marked_stale")
+                return data, True
 
-                        if expires_at < now:
-                            return data, True
-                        if stale:
-                            return data, True
-                        return data, False
+            logger.debug("cache_hit", key=key, stale=False)
+            return data, False
 
         logger.debug("cache_miss", key=key, reason="not_found")
         return None, False
 
+    def _record_hit(self, key: str, now: datetime) -> None:
+        with self._hits_lock:
+            count, _ = self._pending_hits.get(key, (0, now))
+            self._pending_hits[key] = (count + 1, now)
+            self._pending_total += 1
+            due = (
+                self._pending_total >= HIT_FLUSH_MAX_PENDING
+                or time.monotonic() - self._last_flush >= HIT_FLUSH_INTERVAL
+            )
+        if due:
+            self.flush_hits(blocking=False)
+
+    def flush_hits(self, blocking: bool = True) -> int:
+        if not self._write_lock.acquire(blocking=blocking):
+            return 0
+        try:
+            with self._hits_lock:
+                pending, self._pending_hits = self._pending_hits, {}
+                self._pending_total = 0
+                self._last_flush = time.monotonic()
+            if not pending:
+                return 0
+
+            conn = self._cursor()
+            try:
+                conn.execute("BEGIN TRANSACTION")
+                conn.executemany(_HITS_SQL, [(n, ts, key) for key, (n, ts) in pending.items()])
+                conn.execute("COMMIT")
+            except duckdb.Error as e:
+                conn.execute("ROLLBACK")
+                logger.warning("cache_hits_flush_failed", keys=len(pending), error=str(e))
+                return 0
+        finally:
+            self._write_lock.release()
+
+        logger.debug("cache_hits_flushed", keys=len(pending))
+        return len(pending)
+
+    def cache_stats(self) -> dict[str, int]:
+        self.flush_hits()
+        with self._reading() as conn:
+            row = conn.execute(
+                """
+                SELECT count(*), coalesce(sum(hit_count), 0), coalesce(sum(octet_length(data)), 0)
+                FROM cache_entries
+                """
+            ).fetchone()
+        entries, hits, size = row if row else (0, 0, 0)
+        return {"entries": int(entries), "hits": int(hits), "bytes": int(size)}
+
     def cache_set(
         self,
         key: str,
@@ -224,55 +354,59 @@ class DuckDBStore:
         source: constants.Fonte,
         ttl_seconds: int,
     ) -> None:
-        with self._lock:
-            conn = self._get_conn()
-            now = _utcnow()
-            expires_at = now + timedelta(seconds=ttl_seconds)
+        now = _utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
 
-            conn.execute(
+        with self._write_lock:
+            self._cursor().execute(
                 """
                 INSERT OR REPLACE INTO cache_entries
                 (key, data, source, created_at, expires_at, last_accessed_at, hit_count, version, stale)
                 VALUES (?, ?, ?, ?, ?, ?, 0, 1, FALSE)
                 """,
-                [key, data, source.value, now, expires_at, now],
+                [key, compress_blob(data, self.settings), source.value, now, expires_at, now],
             )
 
         logger.debug("cache_write", key=key, ttl_seconds=ttl_seconds)
 
+    def cache_created_at(self, key: str) -> datetime | None:
+        with self._reading() as conn:
+            result = conn.execute(
+                "SELECT created_at FROM cache_entries WHERE key = ?",
+                [key],
+            ).fetchone()
+        return result[0] if result else None
+
     def cache_invalidate(self, key: str) -> None:
-        with self._lock:
-            conn = self._get_conn()
-            conn.execute("UPDATE cache_entries SET stale = TRUE WHERE key = ?", [key])
+        with self._write_lock:
+            self._cursor().execute("UPDATE cache_entries SET stale = TRUE WHERE key = ?", [key])
 
     def cache_delete(self, key: str) -> None:
-        with self._lock:
-            conn = self._get_conn()
-            conn.execute("DELETE FROM cache_entries WHERE key = ?", [key])
+        with self._write_lock:
+            self._cursor().execute("DELETE FROM cache_entries WHERE key = ?", [key])
 
     def cache_clear(
         self,
         source: constants.Fonte | None = None,
         older_than_days: int | None = None,
     ) -> int:
-        with self._lock:
-            conn = self._get_conn()
-
-            conditions = []
-            params: list[Any] = []
-
-            if source:
-                conditions.append("source = ?")
-                params.append(source.value)
-
-            if older_than_days:
-                cutoff = _utcnow() - timedelta(days=older_than_days)
-                conditions.append("created_at < ?")
-                params.append(cutoff)
-
-            where = " AND ".join(conditions) if conditions else "1=1"
-            result = conn.execute(f"DELETE FROM cache_entries WHERE {where} RETURNING *", params)
-
+        conditions = []
+        params: list[Any] = []
+
+        if source:
+            conditions.append("source = ?")
+            params.append(source.value)
+
+        if older_than_days:
+            cutoff = _utcnow() - timedelta(days=older_than_days)
+            conditions.append("created_at < ?")
+            params.append(cutoff)
+
+        where = " AND ".join(conditions) if conditions else "1=1"
+        with self._write_lock:
+            result = self._cursor().execute(
+                f"DELETE FROM cache_entries WHERE {where} RETURNING key", params
+            )
             count = len(result.fetchall()) if result else 0
 
         logger.info("cache_cleared", count=count, source=source, older_than_days=older_than_days)
@@ -286,108 +420,270 @@ class DuckDBStore:
         data_date: datetime,
         parser_version: int,
         fingerprint_hash: str | None = None,
-    ) -> None:
+    ) -> str | None:
         if not self.settings.save_to_history:
-            return
+            return None
 
-        with self._lock:
-            conn = self._get_conn()
-            now = _utcnow()
+        from agrobr.cache.keys import content_hash
 
-            try:
+        digest = content_hash(data)
+        now = _utcnow()
+
+        try:
+            with self._transaction() as conn:
+                known = conn.execute(
+                    "SELECT 1 FROM history_blobs WHERE content_hash = ?", [digest]
+                ).fetchone()
+                if known is None:
+                    conn.execute(
+                        """
+                        INSERT INTO history_blobs (content_hash, data, size_bytes, created_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        [digest, compress_blob(data, self.settings), len(data), now],
+                    )
                 conn.execute(
                     """
                     INSERT INTO history_entries
-                    (key, data, source, data_date, collected_at, parser_version, fingerprint_hash)
+                    (key, source, data_date, collected_at, parser_version,
+                     fingerprint_hash, content_hash)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                     """,
-                    [key, data, source.value, data_date, now, parser_version, fingerprint_hash],
+                    [
+                        key,
+                        source.value,
+                        data_date,
+                        now,
+                        parser_version,
+                        fingerprint_hash,
+                        digest,
+                    ],
                 )
-                logger.debug("history_saved", key=key, data_date=data_date)
-            except duckdb.ConstraintException:
-                logger.debug("history_exists", key=key, data_date=data_date)
+            logger.debug("history_saved", key=key, data_date=data_date, deduped=known is not None)
+        except duckdb.ConstraintException:
+            logger.debug("history_exists", key=key, data_date=data_date)
+
+        return digest
 
     def history_get(
         self,
         key: str,
         data_date: datetime | None = None,
     ) -> bytes | None:
-        with self._lock:
-            conn = self._get_conn()
-
+        with self._reading() as conn:
             if data_date:
                 result = conn.execute(
                     """
-                    SELECT data FROM history_entries
-                    WHERE key = ? AND data_date = ?
-                    ORDER BY collected_at DESC LIMIT 1
+                    SELECT coalesce(e.data, b.data) FROM history_entries e
+                    LEFT JOIN history_blobs b ON b.content_hash = e.content_hash
+                    WHERE e.key = ? AND e.data_date = ?
+                    ORDER BY e.collected_at DESC LIMIT 1
                     """,
                     [key, data_date],
                 ).fetchone()
             else:
                 result = conn.execute(
                     """
-                    SELECT data FROM history_entries
-                    WHERE key = ?
-                    ORDER BY data_date DESC, collected_at DESC LIMIT 1
+                    SELECT coalesce(e.data, b.data) FROM history_entries e
+                    LEFT JOIN history_blobs b ON b.content_hash = e.content_hash
+                    WHERE e.key = ?
+                    ORDER BY e.data_date DESC, e.collected_at DESC LIMIT 1
                     """,
                     [key],
                 ).fetchone()
 
-            return result[0] if result else None
+        return decompress_blob(result[0]) if result and result[0] is not None else None
 
-    def indicadores_query(
+    def history_latest_hash(self, key: str) -> str | None:
+        with self._reading() as conn:
+            result = conn.execute(
+                """
+                SELECT content_hash FROM history_entries
+                WHERE key = ?
+                ORDER BY collected_at DESC LIMIT 1
+                """,
+                [key],
+            ).fetchone()
+        return result[0] if result else None
+
+    @staticmethod
+    def _history_where(
+        source: constants.Fonte | str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        key_prefix: str | None = None,
+    ) -> tuple[str, list[Any]]:
+        conditions = ["TRUE"]
+        params: list[Any] = []
+
+        if source:
+            conditions.append("source = ?")
+            params.append(str(source))
+
+        if start_date:
+            conditions.append("data_date >= CAST(? AS DATE)")
+            params.append(start_date)
+
+        if end_date:
+            conditions.append("data_date <= CAST(? AS DATE)")
+            params.append(end_date)
+
+        if key_prefix:
+            conditions.append("starts_with(key, ?)")
+            params.append(key_prefix)
+
+        return " AND ".join(conditions), params
+
+    def history_query(
         self,
-        produto: str,
-        inicio: datetime | None = None,
-        fim: datetime | None = None,
-        praca: str | None = None,
+        source: constants.Fonte | str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        key_prefix: str | None = None,
     ) -> list[dict[str, Any]]:
-        with self._lock:
-            conn = self._get_conn()
-
-            conditions = ["produto = ?"]
-            params: list[Any] = [produto.lower()]
+        where, params = self._history_where(source, start_date, end_date, key_prefix)
+        with self._reading() as conn:
+            result = conn.execute(
+                f"""
+                SELECT {HISTORY_COLUMNS}
+                FROM history_entries
+                WHERE {where}
+                ORDER BY key, data_date, collected_at
+                """,
+                params,
+            )
+            columns = [col[0] for col in result.description]
+            return [dict(zip(columns, row)) for row in result.fetchall()]
 
-            if inicio:
-                conditions.append("data >= ?")
-                params.append(inicio)
+    def history_count(
+        self,
+        source: constants.Fonte | str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        key_prefix: str | None = None,
+    ) -> int:
+        where, params = self._history_where(source, start_date, end_date, key_prefix)
+        with self._reading() as conn:
+            row = conn.execute(
+                f"SELECT COUNT(*) FROM history_entries WHERE {where}", params
+            ).fetchone()
+        return int(row[0]) if row else 0
 
-            if fim:
-                conditions.append("data <= ?")
-                params.append(fim)
+    def history_dates(
+        self,
+        key: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[date]:
+        where, params = self._history_where(None, start_date, end_date)
+        with self._reading() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT DISTINCT data_date FROM history_entries
+                WHERE key = ? AND {where}
+                ORDER BY data_date
+                """,
+                [key, *params],
+            ).fetchall()
+        return [row[0] for row in rows]
 
-            if praca:
-                conditions.append("praca = ?")
-                params.append(praca)
+    def history_gaps(self, key: str, start_date: datetime, end_date: datetime) -> list[date]:
+        with self._reading() as conn:
+            rows = conn.execute(
+                """
+                SELECT CAST(d AS DATE) AS dia
+                FROM generate_series(CAST(? AS DATE), CAST(? AS DATE), INTERVAL 1 DAY) AS t(d)
+                WHERE isodow(d) < 6
+                  AND CAST(d AS DATE) NOT IN (
+                      SELECT data_date FROM history_entries
+                      WHERE key = ? AND data_date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)
+                  )
+                ORDER BY dia
+                """,
+                [start_date, end_date, key, start_date, end_date],
+            ).fetchall()
+        return [row[0] for row in rows]
 
-            where = " AND ".join(conditions)
+    def history_export(
+        self,
+        path: str,
+        file_format: str = "parquet",
+        source: constants.Fonte | str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> int:
+        if file_format not in HISTORY_EXPORT_FORMATS:
+            raise ValueError(f"Formato não suportado: {file_format}")
 
-            result = conn.execute(
+        where, params = self._history_where(source, start_date, end_date)
+        target = path.replace("'", "''")
+        with self._reading() as conn:
+            row = conn.execute(
                 f"""
-                SELECT produto, praca, data, valor, unidade, fonte, metodologia,
-                       variacao_percentual, collected_at, parser_version
-                FROM indicadores
-                WHERE {where}
-                ORDER BY data DESC
+                COPY (
+                    SELECT {HISTORY_COLUMNS} FROM history_entries
+                    WHERE {where}
+                    ORDER BY key, data_date, collected_at
+                ) TO '{target}' ({HISTORY_EXPORT_FORMATS[file_format]})
                 """,
                 params,
-            ).fetchall()
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    @staticmethod
+    def _indicadores_where(
+        produto: str,
+        inicio: datetime | None,
+        fim: datetime | None,
+        praca: str | None,
+    ) -> tuple[str, list[Any]]:
+        conditions = ["produto = ?"]
+        params: list[Any] = [produto.lower()]
+
+        if inicio:
+            conditions.append("data >= ?")
+            params.append(inicio)
 
-        columns = [
-            "produto",
-            "praca",
-            "data",
-            "valor",
-            "unidade",
-            "fonte",
-            "metodologia",
-            "variacao_percentual",
-            "collected_at",
-            "parser_version",
-        ]
-
-        indicadores = [dict(zip(columns, row)) for row in result]
+        if fim:
+            conditions.append("data <= ?")
+            params.append(fim)
+
+        if praca:
+            conditions.append("praca = ?")
+            params.append(praca)
+
+        return " AND ".join(conditions), params
+
+    def _indicadores_select(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        produto: str,
+        inicio: datetime | None,
+        fim: datetime | None,
+        praca: str | None,
+    ) -> duckdb.DuckDBPyConnection:
+        where, params = self._indicadores_where(produto, inicio, fim, praca)
+        return conn.execute(
+            f"""
+            SELECT {INDICADOR_COLUMNS}
+            FROM indicadores
+            WHERE {where}
+            ORDER BY data DESC
+            """,
+            params,
+        )
+
+    def indicadores_query(
+        self,
+        produto: str,
+        inicio: datetime | None = None,
+        fim: datetime | None = None,
+        praca: str | None = None,
+    ) -> list[dict[str, Any]]:
+        with self._reading() as conn:
+            result = self._indicadores_select(conn, produto, inicio, fim, praca)
+            columns = [col[0] for col in result.description]
+            indicadores = [dict(zip(columns, row)) for row in result.fetchall()]
 
         logger.debug(
             "indicadores_query",
@@ -399,65 +695,62 @@ class DuckDBStore:
 
         return indicadores
 
+    def indicadores_frame(
+        self,
+        produto: str,
+        inicio: datetime | None = None,
+        fim: datetime | None = None,
+        praca: str | None = None,
+    ) -> pd.DataFrame:
+        with self._reading() as conn:
+            df = self._indicadores_select(conn, produto, inicio, fim, praca).df()
+
+        logger.debug(
+            "indicadores_query",
+            produto=produto,
+            count=len(df),
+            inicio=inicio,
+            fim=fim,
+        )
+
+        return df
+
     @staticmethod
-    def _to_row(ind: dict[str, Any], now: datetime) -> tuple[Any, ...]:
+    def _upsert_select(columns: set[str]) -> str:
+        selects = []
+        for name, (sql_type, default) in _UPSERT_COLUMNS.items():
+            expr = f'"{name}"' if name in columns else (default or "NULL")
+            if name in columns and default:
+                expr = f"coalesce({expr}, {default})"
+            expr = f"TRY_CAST({expr} AS {sql_type})"
+            selects.append(f"lower({expr}) AS {name}" if name == "produto" else f"{expr} AS {name}")
         return (
-            ind.get("produto", "").lower(),
-            ind.get("praca"),
-            ind["data"],
-            float(ind["valor"]),
-            ind.get("unidade", "BRL/unidade"),
-            ind.get("fonte", "unknown"),
-            ind.get("metodologia"),
-            ind.get("variacao_percentual"),
-            now,
-            ind.get("parser_version", 1),
+            f"SELECT * FROM (SELECT {', '.join(selects)}, row_number() OVER () AS _pos "
+            f"FROM _ind_incoming) WHERE {_UPSERT_VALID}"
         )
 
-    def indicadores_upsert(self, indicadores: list[dict[str, Any]]) -> int:
-        if not indicadores:
+    def indicadores_upsert(self, indicadores: list[dict[str, Any]] | Any) -> int:
+        frame = (
+            pd.DataFrame.from_records(indicadores) if isinstance(indicadores, list) else indicadores
+        )
+        if len(frame) == 0:
             return 0
 
-        now = _utcnow()
+        names = frame.column_names if hasattr(frame, "column_names") else frame.columns
+        valid = self._upsert_select({str(c) for c in names})
 
-        rows: list[tuple[Any, ...]] = []
-        for ind in indicadores:
+        with self._transaction() as conn:
+            conn.register("_ind_incoming", frame)
             try:
-                rows.append(self._to_row(ind, now))
-            except (KeyError, ValueError, TypeError) as e:
-                logger.warning("indicador_row_invalid", data=ind.get("data"), error=str(e))
-
-        if not rows:
-            return 0
-
-        with self._lock:
-            conn = self._get_conn()
-            count = 0
-            conn.execute(_STAGING_DDL)
-
-            for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
-                chunk = rows[start : start + UPSERT_CHUNK_SIZE]
-                try:
-                    conn.execute("DELETE FROM _ind_staging")
-                    conn.executemany(_STAGING_INSERT, chunk)
-                    conn.execute(_MERGE_SQL)
-                    count += len(chunk)
-                except duckdb.Error:
-                    conn.execute("DELETE FROM _ind_staging")
-                    for row in chunk:
-                        try:
-                            conn.execute(_STAGING_INSERT, list(row))
-                        except duckdb.Error as e:
-                            logger.warning("indicador_upsert_failed", data=row[2], error=str(e))
-                    try:
-                        conn.execute(_MERGE_SQL)
-                        row_count = conn.execute("SELECT count(*) FROM _ind_staging").fetchone()
-                        count += row_count[0] if row_count else 0
-                    except duckdb.Error as e:
-                        logger.warning("indicador_merge_failed", error=str(e))
-                    conn.execute("DELETE FROM _ind_staging")
-
-        logger.info("indicadores_upsert", count=count, total=len(indicadores))
+                row = conn.execute(f"SELECT count(*) FROM ({valid})").fetchone()
+                count = int(row[0]) if row else 0
+                conn.execute(_UPSERT_SQL.format(valid=valid), [_utcnow()])
+            finally:
+                conn.unregister("_ind_incoming")
+
+        if count < len(frame):
+            logger.warning("indicador_rows_invalid", rejected=len(frame) - count, total=len(frame))
+        logger.info("indicadores_upsert", count=count, total=len(frame))
         return count
 
     def indicadores_get_dates(
@@ -466,22 +759,9 @@ class DuckDBStore:
         inicio: datetime | None = None,
         fim: datetime | None = None,
     ) -> set[datetime]:
-        with self._lock:
-            conn = self._get_conn()
-
-            conditions = ["produto = ?"]
-            params: list[Any] = [produto.lower()]
-
-            if inicio:
-                conditions.append("data >= ?")
-                params.append(inicio)
-
-            if fim:
-                conditions.append("data <= ?")
-                params.append(fim)
-
-            where = " AND ".join(conditions)
+        where, params = self._indicadores_where(produto, inicio, fim, None)
 
+        with self._reading() as conn:
             result = conn.execute(
                 f"SELECT DISTINCT data FROM indicadores WHERE {where}",
                 params,
@@ -490,11 +770,356 @@ class DuckDBStore:
         dates = {row[0] for row in result}
         return dates
 
+    def _fact_table(self, dataset: str) -> tuple[str, Contract]:
+        from agrobr.contracts import get_contract
+
+        contract = get_contract(dataset)
+        table = facts.table_name(dataset, contract)
+        if table not in self._fact_tables:
+            with self._write_lock:
+                self._cursor().execute(facts.create_table_sql(table, contract))
+            self._fact_tables.add(table)
+        return table, contract
+
+    def facts_upsert(self, dataset: str, frame: Any) -> int:
+        if len(frame) == 0:
+            return 0
+
+        table, contract = self._fact_table(dataset)
+        names = frame.column_names if hasattr(frame, "column_names") else frame.columns
+        available = {str(c) for c in names}
+
+        view = "_facts_incoming"
+        with self._transaction() as conn:
+            conn.register(view, frame)
+            try:
+                for statement in facts.upsert_sql(table, contract, view, available):
+                    params = [_utcnow()] if statement.startswith("INSERT") else []
+                    conn.execute(statement, params)
+            finally:
+                conn.unregister(view)
+
+        logger.debug("facts_upserted", dataset=dataset, table=table, rows=len(frame))
+        return len(frame)
+
+    def facts_query(self, dataset: str, filters: dict[str, Any] | None = None) -> pd.DataFrame:
+        table, contract = self._fact_table(dataset)
+        where, params = facts.where_sql(filters)
+        with self._reading() as conn:
+            return conn.execute(facts.select_sql(contract, table, where=where), params).df()
+
+    def facts_mark_loaded(
+        self,
+        dataset: str,
+        scope: dict[str, Any],
+        periods: list[Any],
+        frames: dict[str, bytes] | None = None,
+    ) -> None:
+        if not periods:
+            return
+        key = facts.scope_key(scope)
+        now = _utcnow()
+        frames = frames or {}
+        rows = []
+        for p in periods:
+            frame = frames.get(str(p))
+            blob = compress_blob(frame, self.settings) if frame is not None else None
+            rows.append([dataset, key, str(p), now, blob])
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO facts_loaded (dataset, scope, period, loaded_at, frame) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def facts_loaded_periods(self, dataset: str, scope: dict[str, Any]) -> set[str]:
+        with self._reading() as conn:
+            rows = conn.execute(
+                "SELECT period FROM facts_loaded WHERE dataset = ? AND scope = ?",
+                [dataset, facts.scope_key(scope)],
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def facts_loaded_frames(
+        self, dataset: str, scope: dict[str, Any], periods: list[Any]
+    ) -> dict[str, bytes]:
+        if not periods:
+            return {}
+        names = [str(p) for p in periods]
+        with self._reading() as conn:
+            rows = conn.execute(
+                "SELECT period, frame FROM facts_loaded "
+                f"WHERE dataset = ? AND scope = ? AND period IN ({', '.join('?' * len(names))}) "
+                "AND frame IS NOT NULL",
+                [dataset, facts.scope_key(scope), *names],
+            ).fetchall()
+        return {period: decompress_blob(blob) for period, blob in rows}
+
+    def cache_evict(
+        self,
+        max_bytes: int,
+        source: constants.Fonte | str | None = None,
+        policy: str = "lru",
+    ) -> tuple[int, int]:
+        if policy not in EVICTION_ORDER:
+            raise ValueError(f"Politica de eviction invalida: {policy}")
+
+        self.flush_hits()
+        where = "WHERE source = ?" if source else ""
+        params: list[Any] = [str(source)] if source else []
+        params.append(max_bytes)
+
+        with self._write_lock:
+            rows = (
+                self._cursor()
+                .execute(
+                    f"""
+                    DELETE FROM cache_entries WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, sum(octet_length(data)) OVER (
+                                ORDER BY {EVICTION_ORDER[policy]} ROWS UNBOUNDED PRECEDING
+                            ) AS kept
+                            FROM cache_entries {where}
+                        ) WHERE kept > ?
+                    ) RETURNING octet_length(data)
+                    """,
+                    params,
+                )
+                .fetchall()
+            )
+
+        freed = sum(row[0] for row in rows)
+        if rows:
+            logger.info(
+                "cache_evicted",
+                count=len(rows),
+                bytes=freed,
+                source=str(source) if source else "all",
+                policy=policy,
+            )
+        return len(rows), freed
+
+    def history_cleanup(
+        self,
+        older_than_days: int,
+        source: constants.Fonte | None = None,
+    ) -> int:
+        conditions = ["collected_at < ?"]
+        params: list[Any] = [_utcnow() - timedelta(days=older_than_days)]
+        if source:
+            conditions.append("source = ?")
+            params.append(source.value)
+
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"DELETE FROM history_entries WHERE {' AND '.join(conditions)} RETURNING id",
+                params,
+            ).fetchall()
+            conn.execute(
+                """
+                DELETE FROM history_blobs WHERE content_hash NOT IN (
+                    SELECT content_hash FROM history_entries WHERE content_hash IS NOT NULL
+                )
+                """
+            )
+
+        logger.info(
+            "history_cleaned",
+            count=len(rows),
+            older_than_days=older_than_days,
+            source=source.value if source else "all",
+        )
+        return len(rows)
+
+    def history_bytes(self) -> int:
+        with self._reading() as conn:
+            row = conn.execute(
+                """
+                SELECT (SELECT coalesce(sum(octet_length(data)), 0) FROM history_entries)
+                     + (SELECT coalesce(sum(octet_length(data)), 0) FROM history_blobs)
+                """
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def file_bytes(self) -> int:
+        wal = self.db_path.with_name(self.db_path.name + ".wal")
+        return sum(p.stat().st_size for p in (self.db_path, wal) if p.exists())
+
+    def checkpoint(self) -> None:
+        self.flush_hits()
+        with self._write_lock:
+            self._cursor().execute("CHECKPOINT")
+
+    def compact(self) -> int:
+        self.flush_hits()
+        before = self.file_bytes()
+        target = self.db_path.with_name(self.db_path.name + ".compact")
+        wal = self.db_path.with_name(self.db_path.name + ".wal")
+
+        with self._exclusive():
+            conn = self._get_conn()
+            target.unlink(missing_ok=True)
+            row = conn.execute("SELECT current_database()").fetchone()
+            name = row[0] if row else self.db_path.stem
+            path = str(target).replace("'", "''")
+
+            conn.execute(f"ATTACH '{path}' AS agrobr_compact")
+            try:
+                conn.execute(f'COPY FROM DATABASE "{name}" TO agrobr_compact')
+            except duckdb.Error:
+                conn.execute("DETACH agrobr_compact")
+                target.unlink(missing_ok=True)
+                raise
+            conn.execute("DETACH agrobr_compact")
+
+            self._close_conn()
+            target.replace(self.db_path)
+            wal.unlink(missing_ok=True)
+
+        reclaimed = before - self.file_bytes()
+        logger.info("cache_compacted", bytes_reclaimed=reclaimed)
+        return reclaimed
+
+    def _close_conn(self) -> None:
+        for cursor in list(self._cursors):
+            cursor.close()
+        self._cursors.clear()
+        self._generation += 1
+        self._fact_tables.clear()
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
     def close(self) -> None:
-        with self._lock:
-            if self._conn:
-                self._conn.close()
-                self._conn = None
+        if self._conn is not None:
+            self.flush_hits()
+        with self._exclusive():
+            self._close_conn()
+
+
+class AsyncDuckDBStore:
+    def __init__(self, store: Any = None, executor: Executor | None = None) -> None:
+        self.store = store if store is not None else get_store()
+        self._executor = executor
+
+    @property
+    def settings(self) -> constants.CacheSettings:
+        settings: constants.CacheSettings = self.store.settings
+        return settings
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, partial(ctx.run, func, *args, **kwargs))
+
+    async def cache_get(self, key: str) -> tuple[bytes | None, bool]:
+        return await self._run(self.store.cache_get, key)
+
+    async def flush_hits(self) -> int:
+        return await self._run(self.store.flush_hits)
+
+    async def cache_stats(self) -> dict[str, int]:
+        return await self._run(self.store.cache_stats)
+
+    async def cache_set(
+        self,
+        key: str,
+        data: bytes,
+        source: constants.Fonte,
+        ttl_seconds: int,
+    ) -> None:
+        await self._run(self.store.cache_set, key, data, source, ttl_seconds)
+
+    async def cache_created_at(self, key: str) -> datetime | None:
+        return await self._run(self.store.cache_created_at, key)
+
+    async def cache_invalidate(self, key: str) -> None:
+        await self._run(self.store.cache_invalidate, key)
+
+    async def cache_delete(self, key: str) -> None:
+        await self._run(self.store.cache_delete, key)
+
+    async def cache_clear(
+        self,
+        source: constants.Fonte | None = None,
+        older_than_days: int | None = None,
+    ) -> int:
+        return await self._run(self.store.cache_clear, source, older_than_days)
+
+    async def history_save(
+        self,
+        key: str,
+        data: bytes,
+        source: constants.Fonte,
+        data_date: datetime,
+        parser_version: int,
+        fingerprint_hash: str | None = None,
+    ) -> str | None:
+        return await self._run(
+            self.store.history_save,
+            key,
+            data,
+            source,
+            data_date,
+            parser_version,
+            fingerprint_hash,
+        )
+
+    async def history_get(self, key: str, data_date: datetime | None = None) -> bytes | None:
+        return await self._run(self.store.history_get, key, data_date)
+
+    async def history_latest_hash(self, key: str) -> str | None:
+        return await self._run(self.store.history_latest_hash, key)
+
+    async def history_query(
+        self,
+        source: constants.Fonte | str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        key_prefix: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self._run(self.store.history_query, source, start_date, end_date, key_prefix)
+
+    async def history_count(
+        self,
+        source: constants.Fonte | str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        key_prefix: str | None = None,
+    ) -> int:
+        return await self._run(self.store.history_count, source, start_date, end_date, key_prefix)
+
+    async def indicadores_query(
+        self,
+        produto: str,
+        inicio: datetime | None = None,
+        fim: datetime | None = None,
+        praca: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self._run(self.store.indicadores_query, produto, inicio, fim, praca)
+
+    async def indicadores_frame(
+        self,
+        produto: str,
+        inicio: datetime | None = None,
+        fim: datetime | None = None,
+        praca: str | None = None,
+    ) -> pd.DataFrame:
+        return await self._run(self.store.indicadores_frame, produto, inicio, fim, praca)
+
+    async def indicadores_upsert(self, indicadores: list[dict[str, Any]] | Any) -> int:
+        return await self._run(self.store.indicadores_upsert, indicadores)
+
+    async def indicadores_get_dates(
+        self,
+        produto: str,
+        inicio: datetime | None = None,
+        fim: datetime | None = None,
+    ) -> set[datetime]:
+        return await self._run(self.store.indicadores_get_dates, produto, inicio, fim)
+
+    async def close(self) -> None:
+        await self._run(self.store.close)
 
 
 _store: DuckDBStore | None = None
@@ -507,4 +1132,9 @@ def get_store() -> DuckDBStore:
         with _store_lock:
             if _store is None:
                 _store = DuckDBStore()
+                atexit.register(_store.flush_hits)
     return _store
+
+
+def get_async_store() -> AsyncDuckDBStore:
+    return AsyncDuckDBStore(get_store())
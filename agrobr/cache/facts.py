@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from agrobr.contracts import ColumnType
+
+if TYPE_CHECKING:
+    from agrobr.contracts import Contract
+
+SQL_TYPES: dict[ColumnType, str] = {
+    ColumnType.DATE: "DATE",
+    ColumnType.DATETIME: "TIMESTAMP",
+    ColumnType.STRING: "VARCHAR",
+    ColumnType.INTEGER: "BIGINT",
+    ColumnType.FLOAT: "DOUBLE",
+    ColumnType.DECIMAL: "DOUBLE",
+    ColumnType.BOOLEAN: "BOOLEAN",
+}
+
+SCHEMA_FACTS = """
+CREATE TABLE IF NOT EXISTS facts_loaded (
+    dataset TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    period TEXT NOT NULL,
+    loaded_at TIMESTAMP NOT NULL,
+    frame BLOB,
+    PRIMARY KEY (dataset, scope, period)
+);
+"""
+
+_IDENT = re.compile(r"[^0-9a-zA-Z_]")
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def table_name(dataset: str, contract: Contract) -> str:
+    version = contract.version.replace(".", "_")
+    return _IDENT.sub("_", f"facts_{dataset}_v{version}").lower()
+
+
+def create_table_sql(table: str, contract: Contract) -> str:
+    columns = [f"{_quote(c.name)} {SQL_TYPES[c.type]}" for c in contract.columns]
+    columns.append("collected_at TIMESTAMP NOT NULL")
+    return f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})"
+
+
+def upsert_sql(table: str, contract: Contract, source: str, available: set[str]) -> list[str]:
+    selects = [
+        f"CAST(i.{_quote(c.name)} AS {SQL_TYPES[c.type]})"
+        if c.name in available
+        else f"CAST(NULL AS {SQL_TYPES[c.type]})"
+        for c in contract.columns
+    ]
+    pk = [c for c in contract.primary_key if c in available]
+    types = {c.name: SQL_TYPES[c.type] for c in contract.columns}
+    incoming = (
+        f"(SELECT DISTINCT ON ({', '.join(_quote(c) for c in pk)}) * FROM {source})"
+        if pk
+        else source
+    )
+
+    statements = []
+    if pk:
+        match = " AND ".join(
+            f"t.{_quote(c)} IS NOT DISTINCT FROM CAST(i.{_quote(c)} AS {types[c]})" for c in pk
+        )
+        statements.append(
+            f"DELETE FROM {table} t WHERE EXISTS (SELECT 1 FROM {source} i WHERE {match})"
+        )
+    names = ", ".join(_quote(c.name) for c in contract.columns)
+    statements.append(
+        f"INSERT INTO {table} ({names}, collected_at) "
+        f"SELECT {', '.join(selects)}, CAST(? AS TIMESTAMP) FROM {incoming} i"
+    )
+    return statements
+
+
+def select_sql(contract: Contract, source: str, where: str = "TRUE") -> str:
+    columns = ", ".join(_quote(c.name) for c in contract.columns)
+    order = ", ".join(_quote(c) for c in contract.primary_key)
+    return f"SELECT {columns} FROM {source} WHERE {where}" + (f" ORDER BY {order}" if order else "")
+
+
+def where_sql(filters: dict[str, Any] | None) -> tuple[str, list[Any]]:
+    conditions = ["TRUE"]
+    params: list[Any] = []
+    for column, value in (filters or {}).items():
+        if value is None:
+            conditions.append(f"{_quote(column)} IS NULL")
+            continue
+        if isinstance(value, list | tuple | set):
+            values = list(value)
+            if not values:
+                conditions.append("FALSE")
+                continue
+            conditions.append(f"{_quote(column)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        else:
+            conditions.append(f"{_quote(column)} = ?")
+            params.append(value)
+    return " AND ".join(conditions), params
+
+
+def scope_key(scope: dict[str, Any]) -> str:
+    return "&".join(f"{k}={'' if v is None else v}" for k, v in sorted(scope.items()))
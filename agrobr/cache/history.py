@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from ..constants import Fonte
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = structlog.get_logger()
 
 
@@ -64,6 +67,19 @@ class HistoryManager:
     def get_latest(self, key: str) -> bytes | None:
         return self.get(key, None)
 
+    def latest_hash(self, key: str) -> str | None:
+        try:
+            result: str | None = self.store.history_latest_hash(key)
+            return result
+        except Exception as e:
+            logger.debug("history_hash_unavailable", key=key, reason=str(e))
+            return None
+
+    def has_changed(self, key: str, data: bytes) -> bool:
+        from .keys import content_hash
+
+        return self.latest_hash(key) != content_hash(data)
+
     def query(
         self,
         source: Fonte | None = None,
@@ -78,12 +94,22 @@ class HistoryManager:
             source=source,
             start_date=start_dt,
             end_date=end_dt,
+            key_prefix=key_prefix,
         )
+        return entries
 
-        if key_prefix:
-            entries = [e for e in entries if e["key"].startswith(key_prefix)]
+    def indicadores(
+        self,
+        produto: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        praca: str | None = None,
+    ) -> pd.DataFrame:
+        start_dt = datetime.combine(start_date, datetime.min.time()) if start_date else None
+        end_dt = datetime.combine(end_date, datetime.max.time()) if end_date else None
 
-        return entries
+        df: pd.DataFrame = self.store.indicadores_frame(produto, start_dt, end_dt, praca)
+        return df
 
     def get_dates(
         self,
@@ -91,19 +117,11 @@ class HistoryManager:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> list[date]:
-        entries = self.query(key_prefix=key, start_date=start_date, end_date=end_date)
-        dates = set()
-
-        for entry in entries:
-            if entry["key"] == key:
-                data_date = entry.get("data_date")
-                if data_date:
-                    if isinstance(data_date, datetime):
-                        dates.add(data_date.date())
-                    else:
-                        dates.add(data_date)
+        start_dt = datetime.combine(start_date, datetime.min.time()) if start_date else None
+        end_dt = datetime.combine(end_date, datetime.max.time()) if end_date else None
 
-        return sorted(dates)
+        dates: list[date] = self.store.history_dates(key, start_dt, end_dt)
+        return dates
 
     def find_gaps(
         self,
@@ -111,24 +129,20 @@ class HistoryManager:
         start_date: date,
         end_date: date,
     ) -> list[date]:
-        available = set(self.get_dates(key, start_date, end_date))
-
-        all_dates = []
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:
-                all_dates.append(current)
-            current = current + __import__("datetime").timedelta(days=1)
-
-        return [d for d in all_dates if d not in available]
+        gaps: list[date] = self.store.history_gaps(
+            key,
+            datetime.combine(start_date, datetime.min.time()),
+            datetime.combine(end_date, datetime.max.time()),
+        )
+        return gaps
 
     def count(
         self,
         source: Fonte | None = None,
         key_prefix: str | None = None,
     ) -> int:
-        entries = self.query(source=source, key_prefix=key_prefix)
-        return len(entries)
+        total: int = self.store.history_count(source=source, key_prefix=key_prefix)
+        return total
 
     def export(
         self,
@@ -138,29 +152,19 @@ class HistoryManager:
         end_date: date | None = None,
         format: str = "parquet",
     ) -> int:
-        import pandas as pd
-
-        entries = self.query(source=source, start_date=start_date, end_date=end_date)
+        start_dt = datetime.combine(start_date, datetime.min.time()) if start_date else None
+        end_dt = datetime.combine(end_date, datetime.max.time()) if end_date else None
 
-        if not entries:
+        if not self.store.history_count(source=source, start_date=start_dt, end_date=end_dt):
             return 0
 
-        df = pd.DataFrame(entries)
-
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        if format == "parquet":
-            df.to_parquet(path, index=False)
-        elif format == "csv":
-            df.to_csv(path, index=False)
-        elif format == "json":
-            df.to_json(path, orient="records", date_format="iso")
-        else:
-            raise ValueError(f"Formato não suportado: {format}")
+        count: int = self.store.history_export(str(path), format, source, start_dt, end_dt)
 
-        logger.info("history_exported", path=str(path), count=len(df), format=format)
-        return len(df)
+        logger.info("history_exported", path=str(path), count=count, format=format)
+        return count
 
     def cleanup(
         self,
@@ -171,13 +175,8 @@ class HistoryManager:
             logger.warning("history_cleanup_skipped", reason="no_age_specified")
             return 0
 
-        logger.warning(
-            "history_cleanup_starting",
-            older_than_days=older_than_days,
-            source=source.value if source else "all",
-        )
-
-        return 0
+        removed: int = self.store.history_cleanup(older_than_days, source)
+        return removed
 
 
 _history_manager: HistoryManager | None = None
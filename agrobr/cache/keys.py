@@ -41,3 +41,7 @@ def legacy_key_prefix(key: str) -> str:
     if len(parts) < 2:
         return key
     return f"{parts[0]}|{parts[1]}"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
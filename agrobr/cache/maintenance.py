@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from agrobr.constants import CacheSettings
+
+logger = structlog.get_logger()
+
+MB = 1024 * 1024
+
+
+@dataclass
+class MaintenanceReport:
+    expired_entries: int = 0
+    evicted_entries: int = 0
+    evicted_bytes: int = 0
+    history_removed: int = 0
+    compacted: bool = False
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return max(0, self.bytes_before - self.bytes_after)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "expired_entries": self.expired_entries,
+            "evicted_entries": self.evicted_entries,
+            "evicted_bytes": self.evicted_bytes,
+            "history_removed": self.history_removed,
+            "compacted": self.compacted,
+            "bytes_before": self.bytes_before,
+            "bytes_after": self.bytes_after,
+            "bytes_reclaimed": self.bytes_reclaimed,
+        }
+
+
+def _get_store() -> Any:
+    from .duckdb_store import get_store
+
+    return get_store()
+
+
+def run_maintenance(
+    store: Any = None,
+    *,
+    max_size_mb: int | None = None,
+    compact: bool = False,
+) -> MaintenanceReport:
+    store = store or _get_store()
+    settings: CacheSettings = store.settings
+    max_size_mb = settings.max_size_mb if max_size_mb is None else max_size_mb
+    policy = settings.eviction_policy
+
+    report = MaintenanceReport(bytes_before=store.file_bytes())
+
+    if settings.cache_max_age_days > 0:
+        report.expired_entries = store.cache_clear(older_than_days=settings.cache_max_age_days)
+
+    if settings.history_max_age_days > 0:
+        report.history_removed = store.history_cleanup(settings.history_max_age_days)
+
+    for source, quota_mb in settings.source_max_mb.items():
+        count, freed = store.cache_evict(quota_mb * MB, source=source, policy=policy)
+        report.evicted_entries += count
+        report.evicted_bytes += freed
+
+    if max_size_mb > 0:
+        budget = max(0, max_size_mb * MB - store.history_bytes())
+        count, freed = store.cache_evict(budget, policy=policy)
+        report.evicted_entries += count
+        report.evicted_bytes += freed
+
+    store.checkpoint()
+
+    if compact:
+        store.compact()
+        report.compacted = True
+
+    report.bytes_after = store.file_bytes()
+
+    logger.info("cache_maintenance", **report.to_dict())
+    return report
+
+
+async def run_periodically(
+    store: Any = None,
+    interval_seconds: float | None = None,
+) -> None:
+    store = store or _get_store()
+    interval = interval_seconds or store.settings.maintenance_interval
+
+    while True:
+        try:
+            await asyncio.to_thread(run_maintenance, store)
+        except Exception as e:
+            logger.warning("cache_maintenance_failed", error=str(e))
+        await asyncio.sleep(interval)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import structlog
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 6
 
 MIGRATIONS: dict[int, str] = {
     1: """
@@ -28,6 +29,101 @@ MIGRATIONS: dict[int, str] = {
         CREATE INDEX IF NOT EXISTS idx_history_key_date ON history_entries(key, data_date);
         CREATE INDEX IF NOT EXISTS idx_history_parser ON history_entries(parser_version);
     """,
+    5: """
+        CREATE TABLE IF NOT EXISTS history_blobs (
+            content_hash TEXT PRIMARY KEY,
+            data BLOB NOT NULL,
+            size_bytes BIGINT NOT NULL,
+            created_at TIMESTAMP NOT NULL
+        );
+        ALTER TABLE history_entries ADD COLUMN IF NOT EXISTS content_hash TEXT;
+        DROP INDEX IF EXISTS idx_history_source;
+        DROP INDEX IF EXISTS idx_history_date;
+        DROP INDEX IF EXISTS idx_history_key;
+        DROP INDEX IF EXISTS idx_history_key_date;
+        DROP INDEX IF EXISTS idx_history_parser;
+        ALTER TABLE history_entries ALTER COLUMN data DROP NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_history_source ON history_entries(source);
+        CREATE INDEX IF NOT EXISTS idx_history_date ON history_entries(data_date);
+        CREATE INDEX IF NOT EXISTS idx_history_key ON history_entries(key);
+        CREATE INDEX IF NOT EXISTS idx_history_key_date ON history_entries(key, data_date);
+        CREATE INDEX IF NOT EXISTS idx_history_parser ON history_entries(parser_version);
+    """,
+    6: """
+        ALTER TABLE facts_loaded ADD COLUMN IF NOT EXISTS frame BLOB;
+    """,
+}
+
+HISTORY_BLOB_BATCH = 500
+
+_LEGACY_KEY_FILTER = "key LIKE '%|%' AND len(string_split(key, '|')) <> 4"
+
+
+def _migrate_legacy_cache_keys(conn: duckdb.DuckDBPyConnection) -> None:
+    from agrobr import __version__
+
+    suffix = f"|v{__version__}|sv1.0"
+    conn.execute(
+        f"""
+        INSERT INTO cache_entries
+        (key, data, source, created_at, expires_at, last_accessed_at, hit_count, version, stale)
+        SELECT new_key, data, source, created_at, expires_at, last_accessed_at,
+               hit_count, version, stale
+        FROM (
+            SELECT *, split_part(key, '|', 1) || '|' || split_part(key, '|', 2) || ? AS new_key
+            FROM cache_entries
+            WHERE {_LEGACY_KEY_FILTER}
+        )
+        WHERE new_key NOT IN (SELECT key FROM cache_entries)
+        QUALIFY row_number() OVER (PARTITION BY new_key ORDER BY created_at DESC) = 1
+        """,
+        [suffix],
+    )
+    migrated = conn.execute(f"DELETE FROM cache_entries WHERE {_LEGACY_KEY_FILTER}").fetchone()
+    logger.info("legacy_cache_keys_migrated", count=migrated[0] if migrated else 0)
+
+
+def _move_history_to_blobs(conn: duckdb.DuckDBPyConnection) -> None:
+    from datetime import UTC, datetime
+
+    from .codecs import decompress_blob
+    from .keys import content_hash
+
+    ids = [
+        row[0]
+        for row in conn.execute(
+            "SELECT id FROM history_entries WHERE data IS NOT NULL ORDER BY id"
+        ).fetchall()
+    ]
+    now = datetime.now(UTC).replace(tzinfo=None)
+
+    for start in range(0, len(ids), HISTORY_BLOB_BATCH):
+        batch = ids[start : start + HISTORY_BLOB_BATCH]
+        placeholders = ", ".join("?" * len(batch))
+        rows = conn.execute(
+            f"SELECT id, data FROM history_entries WHERE id IN ({placeholders})", batch
+        ).fetchall()
+        for entry_id, blob in rows:
+            raw = decompress_blob(blob)
+            digest = content_hash(raw)
+            conn.execute(
+                """
+                INSERT INTO history_blobs (content_hash, data, size_bytes, created_at)
+                VALUES (?, ?, ?, ?) ON CONFLICT DO NOTHING
+                """,
+                [digest, blob, len(raw), now],
+            )
+            conn.execute(
+                "UPDATE history_entries SET content_hash = ?, data = NULL WHERE id = ?",
+                [digest, entry_id],
+            )
+
+    logger.info("history_blobs_migrated", entries=len(ids))
+
+
+DATA_MIGRATIONS: dict[int, Callable[[duckdb.DuckDBPyConnection], None]] = {
+    4: _migrate_legacy_cache_keys,
+    5: _move_history_to_blobs,
 }
 
 
@@ -50,9 +146,9 @@ def migrate(conn: duckdb.DuckDBPyConnection) -> None:
     logger.info("schema_migration_start", current=current, target=SCHEMA_VERSION)
 
     for version in range(current + 1, SCHEMA_VERSION + 1):
-        if version in MIGRATIONS:
+        if version in MIGRATIONS or version in DATA_MIGRATIONS:
             try:
-                for statement in MIGRATIONS[version].strip().split(";"):
+                for statement in MIGRATIONS.get(version, "").strip().split(";"):
                     statement = statement.strip()
                     if statement:
                         try:
@@ -64,6 +160,9 @@ def migrate(conn: duckdb.DuckDBPyConnection) -> None:
                                 continue
                             raise
 
+                if version in DATA_MIGRATIONS:
+                    DATA_MIGRATIONS[version](conn)
+
                 with contextlib.suppress(Exception):
                     conn.execute("INSERT INTO schema_version (version) VALUES (?)", [version])
 
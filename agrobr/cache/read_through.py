@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import inspect
+import json
+import warnings
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from functools import wraps
+from io import BytesIO
+from typing import Any, NamedTuple, ParamSpec, TypeVar
+
+import httpx
+import structlog
+
+from agrobr.constants import CacheSettings, Fonte
+from agrobr.exceptions import NetworkError, SourceUnavailableError, StaleDataWarning
+
+from .codecs import decode_dataframe, encode_dataframe
+from .keys import build_cache_key
+from .policies import POLICIES, get_ttl
+from .single_flight import copy_result, get_single_flight
+
+logger = structlog.get_logger()
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+FALLBACK_EXCEPTIONS: tuple[type[Exception], ...] = (
+    SourceUnavailableError,
+    NetworkError,
+    httpx.HTTPError,
+)
+
+
+class Codec(NamedTuple):
+    encode: Callable[[Any], bytes]
+    decode: Callable[[bytes], Any]
+
+
+BYTES_CODEC = Codec(encode=bytes, decode=bytes)
+
+TEXT_CODEC = Codec(
+    encode=lambda value: value.encode("utf-8"),
+    decode=lambda raw: raw.decode("utf-8"),
+)
+
+JSON_CODEC = Codec(
+    encode=lambda value: json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"),
+    decode=lambda raw: json.loads(raw.decode("utf-8")),
+)
+
+BYTESIO_CODEC = Codec(encode=lambda buffer: buffer.getvalue(), decode=BytesIO)
+
+
+DATAFRAME_CODEC = Codec(encode=encode_dataframe, decode=decode_dataframe)
+
+
+def with_url(codec: Codec) -> Codec:
+    def _encode(value: tuple[Any, str]) -> bytes:
+        payload, url = value
+        return url.encode("utf-8") + b"\n" + codec.encode(payload)
+
+    def _decode(raw: bytes) -> tuple[Any, str]:
+        url, _, payload = raw.partition(b"\n")
+        return codec.decode(payload), url.decode("utf-8")
+
+    return Codec(encode=_encode, decode=_decode)
+
+
+def with_meta(codec: Codec) -> Codec:
+    def _encode(value: tuple[Any, dict[str, Any]]) -> bytes:
+        payload, meta = value
+        return JSON_CODEC.encode(meta) + b"\n" + codec.encode(payload)
+
+    def _decode(raw: bytes) -> tuple[Any, dict[str, Any]]:
+        meta, _, payload = raw.partition(b"\n")
+        return codec.decode(payload), JSON_CODEC.decode(meta)
+
+    return Codec(encode=_encode, decode=_decode)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def resolve_ttl(settings: CacheSettings, source: Fonte, ttl: str | None = None) -> int:
+    if ttl and hasattr(settings, f"ttl_{ttl}"):
+        return int(getattr(settings, f"ttl_{ttl}"))
+    if ttl and ttl in POLICIES:
+        return POLICIES[ttl].ttl_seconds
+    if hasattr(settings, f"ttl_{source.value}"):
+        return int(getattr(settings, f"ttl_{source.value}"))
+    return get_ttl(source)
+
+
+def _get_store() -> Any:
+    from .duckdb_store import get_store
+
+    return get_store()
+
+
+def _async_store(store: Any) -> Any:
+    from .duckdb_store import AsyncDuckDBStore
+
+    return AsyncDuckDBStore(store)
+
+
+async def cached_fetch(
+    source: Fonte,
+    dataset: str,
+    params: dict[str, Any],
+    fetch: Callable[[], Awaitable[T]],
+    *,
+    ttl: str | None = None,
+    codec: Codec = BYTES_CODEC,
+    store: Any = None,
+) -> T:
+    try:
+        store = store or _get_store()
+    except Exception as e:
+        logger.warning("read_through_store_unavailable", dataset=dataset, error=str(e))
+        return await fetch()
+
+    settings: CacheSettings = store.settings
+    key = build_cache_key(dataset, params)
+    db = _async_store(store)
+
+    cached: bytes | None = None
+    stale = False
+    try:
+        cached, stale = await db.cache_get(key)
+    except Exception as e:
+        logger.warning("read_through_get_failed", key=key, error=str(e))
+
+    if cached is not None and not stale:
+        logger.debug("read_through_hit", source=source.value, dataset=dataset)
+        return codec.decode(cached)  # type: ignore[no-any-return]
+
+    if settings.offline_mode:
+        if cached is not None:
+            logger.info("read_through_offline_stale", source=source.value, dataset=dataset)
+            return codec.decode(cached)  # type: ignore[no-any-return]
+        raise SourceUnavailableError(
+            source=source.value,
+            url=dataset,
+            last_error="offline_mode ativo e nenhum dado em cache",
+        )
+
+    ttl_seconds = resolve_ttl(settings, source, ttl)
+
+    async def fetch_and_store() -> tuple[T, bytes | None]:
+        value = await fetch()
+        encoded: bytes | None = None
+        try:
+            encoded = codec.encode(value)
+            await db.cache_set(key, encoded, source, ttl_seconds)
+        except Exception as e:
+            logger.warning("read_through_set_failed", key=key, error=str(e))
+        return value, encoded
+
+    try:
+        (value, encoded), shared = await get_single_flight().do(key, fetch_and_store)
+    except FALLBACK_EXCEPTIONS as e:
+        if cached is not None and await _within_stale_window(db, key, ttl_seconds, settings):
+            logger.warning(
+                "read_through_stale_fallback",
+                source=source.value,
+                dataset=dataset,
+                error=str(e),
+            )
+            warnings.warn(
+                f"{source.value} indisponível ({e}). Usando cache expirado para {dataset}.",
+                StaleDataWarning,
+                stacklevel=3,
+            )
+            return codec.decode(cached)  # type: ignore[no-any-return]
+        raise
+
+    if shared and encoded is not None:
+        return codec.decode(encoded)  # type: ignore[no-any-return]
+    if shared:
+        return copy_result(value)  # type: ignore[no-any-return]
+    return value
+
+
+async def _within_stale_window(
+    db: Any,
+    key: str,
+    ttl_seconds: int,
+    settings: CacheSettings,
+) -> bool:
+    try:
+        created_at = await db.cache_created_at(key)
+    except Exception:
+        return False
+    if created_at is None:
+        return False
+    max_age = timedelta(seconds=ttl_seconds * settings.stale_multiplier)
+    return bool(_utcnow() - created_at <= max_age)
+
+
+def read_through(
+    source: Fonte,
+    *,
+    ttl: str | None = None,
+    codec: Codec = BYTES_CODEC,
+    exclude: Iterable[str] = (),
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    excluded = frozenset(exclude)
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        signature = inspect.signature(func)
+        dataset = f"{func.__module__.removeprefix('agrobr.')}.{func.__qualname__}"
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k not in excluded}
+
+            return await cached_fetch(
+                source,
+                dataset,
+                params,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                codec=codec,
+            )
+
+        return wrapper
+
+    return decorator
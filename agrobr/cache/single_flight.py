@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import dataclasses
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial, wraps
+from typing import Any, ParamSpec, TypeVar
+from weakref import WeakKeyDictionary
+
+import pandas as pd
+import structlog
+from pydantic import BaseModel
+
+from .keys import build_cache_key
+
+logger = structlog.get_logger()
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+MAX_IN_FLIGHT = 1024
+
+
+@dataclasses.dataclass
+class _Flight:
+    task: asyncio.Task[Any]
+    waiters: int = 0
+    joined: bool = False
+
+
+class SingleFlight:
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT) -> None:
+        self.max_in_flight = max_in_flight
+        self._flights: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, _Flight]] = (
+            WeakKeyDictionary()
+        )
+
+    def in_flight(self) -> int:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return 0
+        return len(self._flights.get(loop, {}))
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        loop = asyncio.get_running_loop()
+        flights = self._flights.setdefault(loop, {})
+        flight = flights.get(key)
+
+        if flight is None:
+            if len(flights) >= self.max_in_flight:
+                logger.debug("single_flight_full", key=key, in_flight=len(flights))
+                return await factory(), False
+
+            async def run() -> T:
+                return await factory()
+
+            flight = _Flight(loop.create_task(run()))
+            flights[key] = flight
+            flight.task.add_done_callback(partial(_release, flights, key, flight))
+        else:
+            flight.joined = True
+            logger.debug("single_flight_shared", key=key, waiters=flight.waiters)
+
+        flight.waiters += 1
+        try:
+            value = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                _release(flights, key, flight)
+                flight.task.cancel()
+        return value, flight.joined
+
+    def reset(self) -> None:
+        self._flights.clear()
+
+
+def _release(
+    flights: dict[str, _Flight],
+    key: str,
+    flight: _Flight,
+    _task: asyncio.Task[Any] | None = None,
+) -> None:
+    if flights.get(key) is flight:
+        del flights[key]
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight
+
+
+def copy_result(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return tuple(copy_result(v) for v in value)
+    if isinstance(value, pd.DataFrame | pd.Series):
+        return value.copy()
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    return copy.deepcopy(value)
+
+
+def single_flight(
+    dataset: str,
+    *,
+    exclude: Iterable[str] = (),
+    share: Callable[[Any], Any] = copy_result,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    excluded = frozenset(exclude)
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k not in excluded}
+            key = build_cache_key(dataset, params)
+
+            value, shared = await _single_flight.do(key, lambda: func(*args, **kwargs))
+            return share(value) if shared else value  # type: ignore[no-any-return]
+
+        return wrapper
+
+    return decorator
@@ -3,7 +3,6 @@ from __future__ import annotations
 import hashlib
 import time
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 import pandas as pd
@@ -11,12 +10,14 @@ import structlog
 
 from agrobr import constants
 from agrobr.cache.duckdb_store import get_store
+from agrobr.cache.history import HistoryManager
 from agrobr.cache.keys import build_cache_key
 from agrobr.cache.policies import calculate_expiry
+from agrobr.cache.single_flight import single_flight
 from agrobr.cepea import client
-from agrobr.cepea.parsers.detector import get_parser_with_fallback
-from agrobr.models import Indicador, MetaInfo
-from agrobr.validators.sanity import validate_batch
+from agrobr.cepea.parsers.detector import PARSERS, get_parser_with_fallback
+from agrobr.models import Indicador, IndicadorRecord, MetaInfo, indicador_records
+from agrobr.validators.sanity import validate_indicador_frame
 
 if TYPE_CHECKING:
     import polars as pl
@@ -25,6 +26,8 @@ logger = structlog.get_logger()
 
 SOURCE_WINDOW_DAYS = 10
 
+FRAME_COLUMNS = ("data", "produto", "praca", "valor", "unidade", "fonte", "metodologia")
+
 
 @overload
 async def indicador(
@@ -58,6 +61,7 @@ async def indicador(
 ) -> tuple[pd.DataFrame | pl.DataFrame, MetaInfo]: ...
 
 
+@single_flight("cepea:indicador")
 async def indicador(
     produto: str,
     praca: str | None = None,
@@ -88,22 +92,17 @@ async def indicador(
         inicio = fim - timedelta(days=365)
 
     store = get_store()
-    indicadores: list[Indicador] = []
+    history = HistoryManager(store)
+    cached = pd.DataFrame()
+    fresh = pd.DataFrame()
 
     source_url = ""
     parser_version = 1
 
     if not force_refresh:
-        cached_data = store.indicadores_query(
-            produto=produto,
-            inicio=datetime.combine(inicio, datetime.min.time()),
-            fim=datetime.combine(fim, datetime.max.time()),
-            praca=praca,
-        )
-
-        indicadores = _dicts_to_indicadores(cached_data)
+        cached = _cached_frame(store, produto, inicio, fim, praca)
 
-        if indicadores:
+        if not cached.empty:
             meta.from_cache = True
             meta.source = "cache"
             meta.source_method = "duckdb"
@@ -113,9 +112,11 @@ async def indicador(
             produto=produto,
             inicio=inicio,
             fim=fim,
-            cached_count=len(indicadores),
+            cached_count=len(cached),
         )
 
+    existing_dates = set(cached["data"].dt.date) if not cached.empty else set()
+
     needs_fetch = False
     if not offline:
         if force_refresh:
@@ -125,7 +126,6 @@ async def indicador(
             recent_start = today - timedelta(days=SOURCE_WINDOW_DAYS)
 
             if fim >= recent_start:
-                existing_dates = {ind.data for ind in indicadores}
                 for i in range(min(SOURCE_WINDOW_DAYS, (fim - max(inicio, recent_start)).days + 1)):
                     check_date = fim - timedelta(days=i)
                     if check_date.weekday() < 5 and check_date not in existing_dates:
@@ -140,23 +140,44 @@ async def indicador(
             fetch_result = await client.fetch_indicador_page(produto)
             html = fetch_result.html
             source_name = fetch_result.source
-            raw_content_size = len(html.encode("utf-8"))
-            raw_content_hash = f"sha256:{hashlib.sha256(html.encode('utf-8')).hexdigest()[:16]}"
+            raw = html.encode("utf-8")
+            raw_content_size = len(raw)
+            raw_content_hash = f"sha256:{hashlib.sha256(raw).hexdigest()[:16]}"
+            fonte = (
+                constants.Fonte.NOTICIAS_AGRICOLAS
+                if source_name == "noticias_agricolas"
+                else constants.Fonte.CEPEA
+            )
+            history_key = f"{fonte.value}:{produto}"
+            current_version = _current_parser_version(fonte)
+            unchanged = (
+                not force_refresh
+                and not history.has_changed(history_key, raw)
+                and _page_rows_current(
+                    store, history, history_key, fonte, current_version, produto, inicio, fim, praca
+                )
+            )
 
-            if source_name == "noticias_agricolas":
-                from agrobr.noticias_agricolas.parser import parse_indicador as na_parse
+            if unchanged:
+                new_frame = pd.DataFrame()
+                meta.source = fonte.value
+                meta.source_method = "httpx"
+                logger.info("source_unchanged", produto=produto, source=fonte.value)
+            elif source_name == "noticias_agricolas":
+                from agrobr.noticias_agricolas.parser import parse_indicador_frame
 
-                new_indicadores = na_parse(html, produto)
+                new_frame = parse_indicador_frame(html, produto)
                 source_url = f"https://www.noticiasagricolas.com.br/cotacoes/{produto}"
                 meta.source = "noticias_agricolas"
                 meta.source_method = "httpx"
+                parser_version = current_version
                 logger.info(
                     "parse_success",
                     source="noticias_agricolas",
-                    records_count=len(new_indicadores),
+                    records_count=len(new_frame),
                 )
             else:
-                parser, new_indicadores = await get_parser_with_fallback(html, produto)
+                parser, new_frame = await get_parser_with_fallback(html, produto, as_frame=True)
                 source_url = f"https://www.cepea.esalq.usp.br/br/indicador/{produto}.aspx"
                 meta.source = "cepea"
                 meta.source_method = "httpx"
@@ -168,24 +189,22 @@ async def indicador(
             meta.raw_content_hash = raw_content_hash
             meta.raw_content_size = raw_content_size
             meta.parser_version = parser_version
-            meta.from_cache = False
+            meta.from_cache = unchanged
 
-            if new_indicadores:
-                new_dicts = _indicadores_to_dicts(new_indicadores)
-                saved_count = store.indicadores_upsert(new_dicts)
+            if not new_frame.empty:
+                saved_count = store.indicadores_upsert(new_frame.drop(columns="anomalies"))
+                history.save(history_key, raw, fonte, date.today(), parser_version)
 
                 logger.info(
                     "new_data_saved",
                     produto=produto,
-                    fetched=len(new_indicadores),
+                    fetched=len(new_frame),
                     saved=saved_count,
                 )
 
-                existing_dates = {ind.data for ind in indicadores}
-                for ind in new_indicadores:
-                    if ind.data not in existing_dates:
-                        indicadores.append(ind)
-            elif indicadores:
+                is_new = ~new_frame["data"].dt.date.isin(existing_dates)
+                fresh = new_frame.loc[is_new, [*FRAME_COLUMNS, "anomalies"]]
+            elif not cached.empty and not unchanged:
                 import warnings
 
                 from agrobr.exceptions import StaleDataWarning
@@ -204,38 +223,36 @@ async def indicador(
                 error=str(e),
             )
             meta.validation_warnings.append(f"source_fetch_failed: {e}")
-            if not indicadores:
-                cached_fallback = store.indicadores_query(
-                    produto=produto,
-                    inicio=datetime.combine(inicio, datetime.min.time()),
-                    fim=datetime.combine(fim, datetime.max.time()),
-                    praca=praca,
-                )
-                if cached_fallback:
+            if cached.empty:
+                cached = _cached_frame(store, produto, inicio, fim, praca)
+                if not cached.empty:
                     import warnings
 
                     from agrobr.exceptions import StaleDataWarning
 
-                    indicadores = _dicts_to_indicadores(cached_fallback)
                     warnings.warn(
-                        f"All sources failed for '{produto}'. Using stale cache ({len(indicadores)} records).",
+                        f"All sources failed for '{produto}'. Using stale cache ({len(cached)} records).",
                         StaleDataWarning,
                         stacklevel=2,
                     )
                     meta.from_cache = True
                     meta.source = "cache_fallback"
 
-    if validate_sanity and indicadores:
-        indicadores, anomalies = await validate_batch(indicadores)
-
-    indicadores = [ind for ind in indicadores if inicio <= ind.data <= fim]
+    frames = [frame for frame in (cached, fresh) if not frame.empty]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
-    if praca:
-        indicadores = [
-            ind for ind in indicadores if ind.praca and ind.praca.lower() == praca.lower()
-        ]
+    if validate_sanity and not df.empty:
+        df, _ = validate_indicador_frame(df)
 
-    df = _to_dataframe(indicadores)
+    if not df.empty:
+        mask = (df["data"] >= pd.Timestamp(inicio)) & (
+            df["data"] < pd.Timestamp(fim) + pd.Timedelta(days=1)
+        )
+        if praca:
+            mask &= df["praca"].fillna("").str.lower() == praca.lower()
+        df = df[mask].sort_values("data").reset_index(drop=True)
+        if df.empty:
+            df = pd.DataFrame()
 
     meta.fetch_duration_ms = int((time.perf_counter() - fetch_start) * 1000)
     meta.records_count = len(df)
@@ -263,24 +280,67 @@ async def indicador(
     return df
 
 
-def _dicts_to_indicadores(dicts: list[dict[str, Any]]) -> list[Indicador]:
-    indicadores = []
-    for d in dicts:
-        try:
-            ind = Indicador(
-                fonte=constants.Fonte(d["fonte"]) if d.get("fonte") else constants.Fonte.CEPEA,
-                produto=d["produto"],
-                praca=d.get("praca"),
-                data=d["data"] if isinstance(d["data"], date) else d["data"].date(),
-                valor=Decimal(str(d["valor"])),
-                unidade=d.get("unidade", "BRL/unidade"),
-                metodologia=d.get("metodologia"),
-                parser_version=d.get("parser_version", 1),
-            )
-            indicadores.append(ind)
-        except Exception as e:
-            logger.warning("indicador_conversion_failed", error=str(e), data=d)
-    return indicadores
+def _current_parser_version(fonte: constants.Fonte) -> int:
+    if fonte == constants.Fonte.NOTICIAS_AGRICOLAS:
+        from agrobr.noticias_agricolas.parser import PARSER_VERSION
+
+        return PARSER_VERSION
+    return max(parser.version for parser in PARSERS)
+
+
+def _page_rows_current(
+    store: Any,
+    history: HistoryManager,
+    history_key: str,
+    fonte: constants.Fonte,
+    parser_version: int,
+    produto: str,
+    inicio: date,
+    fim: date,
+    praca: str | None,
+) -> bool:
+    entries = [e for e in history.query(key_prefix=history_key) if e["key"] == history_key]
+    if not entries:
+        return False
+    page = max(entries, key=lambda e: e["collected_at"])
+    if page["parser_version"] != parser_version:
+        return False
+
+    rows: pd.DataFrame = store.indicadores_frame(
+        produto=produto,
+        inicio=datetime.combine(inicio, datetime.min.time()),
+        fim=datetime.combine(fim, datetime.max.time()),
+        praca=praca,
+    )
+    if rows.empty:
+        return False
+    rows = rows[rows["fonte"].fillna(constants.Fonte.CEPEA.value) == fonte.value]
+    if rows.empty or (rows["parser_version"] != parser_version).any():
+        return False
+    return bool(pd.to_datetime(rows["collected_at"]).max().date() >= page["collected_at"].date())
+
+
+def _cached_frame(
+    store: Any,
+    produto: str,
+    inicio: date,
+    fim: date,
+    praca: str | None,
+) -> pd.DataFrame:
+    df: pd.DataFrame = store.indicadores_frame(
+        produto=produto,
+        inicio=datetime.combine(inicio, datetime.min.time()),
+        fim=datetime.combine(fim, datetime.max.time()),
+        praca=praca,
+    )
+    if df.empty:
+        return pd.DataFrame()
+
+    df = df[list(FRAME_COLUMNS)].copy()
+    df["data"] = pd.to_datetime(df["data"])
+    df["fonte"] = df["fonte"].fillna(constants.Fonte.CEPEA.value)
+    df["anomalies"] = None
+    return df
 
 
 def _indicadores_to_dicts(indicadores: list[Indicador]) -> list[dict[str, Any]]:
@@ -325,7 +385,7 @@ async def pracas(produto: str) -> list[str]:
 
 async def ultimo(produto: str, praca: str | None = None, offline: bool = False) -> Indicador:
     store = get_store()
-    indicadores: list[Indicador] = []
+    indicadores: list[Indicador | IndicadorRecord] = []
 
     fim = date.today()
     inicio = fim - timedelta(days=30)
@@ -338,7 +398,9 @@ async def ultimo(produto: str, praca: str | None = None, offline: bool = False)
     )
 
     if cached_data:
-        indicadores = _dicts_to_indicadores(cached_data)
+        cached = pd.DataFrame.from_records(cached_data)
+        cached["fonte"] = cached["fonte"].fillna(constants.Fonte.CEPEA.value)
+        indicadores.extend(indicador_records(cached))
 
     if not offline:
         has_recent = any(ind.data >= fim - timedelta(days=3) for ind in indicadores)
@@ -382,30 +444,5 @@ async def ultimo(produto: str, praca: str | None = None, offline: bool = False)
             reason=f"No indicators found for {produto}",
         )
 
-    indicadores.sort(key=lambda x: x.data, reverse=True)
-    return indicadores[0]
-
-
-def _to_dataframe(indicadores: list[Indicador]) -> pd.DataFrame:
-    if not indicadores:
-        return pd.DataFrame()
-
-    data = [
-        {
-            "data": ind.data,
-            "produto": ind.produto,
-            "praca": ind.praca,
-            "valor": float(ind.valor),
-            "unidade": ind.unidade,
-            "fonte": ind.fonte.value,
-            "metodologia": ind.metodologia,
-            "anomalies": ind.anomalies if ind.anomalies else None,
-        }
-        for ind in indicadores
-    ]
-
-    df = pd.DataFrame(data)
-    df["data"] = pd.to_datetime(df["data"])
-    df = df.sort_values("data").reset_index(drop=True)
-
-    return df
+    latest = max(indicadores, key=lambda x: x.data)
+    return latest if isinstance(latest, Indicador) else latest.to_model()
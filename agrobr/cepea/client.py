@@ -9,6 +9,7 @@ import structlog
 from agrobr import constants
 from agrobr.constants import MIN_HTML_PAGE_SIZE
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.rate_limiter import RateLimiter
 from agrobr.http.retry import retry_async, should_retry_status
 from agrobr.http.user_agents import UserAgentRotator
@@ -83,14 +84,9 @@ def _get_produto_url(produto: str) -> str:
 async def _fetch_with_httpx(url: str, headers: dict[str, str]) -> FetchResult:
 
     async def _fetch() -> httpx.Response:
-        async with (
-            RateLimiter.acquire(constants.Fonte.CEPEA),
-            httpx.AsyncClient(
-                timeout=_get_timeout(),
-                follow_redirects=True,
-            ) as client,
-        ):
-            response = await client.get(url, headers=headers)
+        async with RateLimiter.acquire(constants.Fonte.CEPEA):
+            client = ClientPool.get(constants.Fonte.CEPEA)
+            response = await client.get(url, headers=headers, timeout=_get_timeout())
 
             if should_retry_status(response.status_code):
                 raise httpx.HTTPStatusError(
@@ -233,14 +229,9 @@ async def fetch_series_historica(produto: str, anos: int = 5) -> str:
     )
 
     async def _fetch() -> httpx.Response:
-        async with (
-            RateLimiter.acquire(constants.Fonte.CEPEA),
-            httpx.AsyncClient(
-                timeout=_get_timeout(),
-                follow_redirects=True,
-            ) as client,
-        ):
-            response = await client.get(url, headers=headers)
+        async with RateLimiter.acquire(constants.Fonte.CEPEA):
+            client = ClientPool.get(constants.Fonte.CEPEA)
+            response = await client.get(url, headers=headers, timeout=_get_timeout())
             response.raise_for_status()
             return response
 
@@ -12,6 +12,7 @@ from agrobr.cepea.parsers.consensus import (
     select_best_result,
 )
 from agrobr.cepea.parsers.detector import get_parser_with_fallback
+from agrobr.cepea.parsers.document import HtmlDocument, parse_document
 from agrobr.cepea.parsers.fingerprint import (
     compare_fingerprints,
     extract_fingerprint,
@@ -26,6 +27,8 @@ __all__ = [
     "compare_fingerprints",
     "extract_fingerprint",
     "get_parser_with_fallback",
+    "HtmlDocument",
+    "parse_document",
     "load_baseline_fingerprint",
     "save_baseline_fingerprint",
     "ConsensusResult",
@@ -4,8 +4,45 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import TYPE_CHECKING
 
+import pandas as pd
+
 if TYPE_CHECKING:
     from agrobr import models
+    from agrobr.cepea.parsers.document import HtmlDocument
+
+INDICADOR_FRAME_COLUMNS = (
+    "data",
+    "produto",
+    "praca",
+    "valor",
+    "unidade",
+    "fonte",
+    "metodologia",
+    "variacao_percentual",
+    "parser_version",
+    "anomalies",
+)
+
+
+def indicadores_to_frame(indicadores: list[models.Indicador]) -> pd.DataFrame:
+    frame = pd.DataFrame(
+        {
+            "data": pd.to_datetime([ind.data for ind in indicadores]),
+            "produto": [ind.produto for ind in indicadores],
+            "praca": [ind.praca for ind in indicadores],
+            "valor": [float(ind.valor) for ind in indicadores],
+            "unidade": [ind.unidade for ind in indicadores],
+            "fonte": [ind.fonte.value for ind in indicadores],
+            "metodologia": [ind.metodologia for ind in indicadores],
+            "variacao_percentual": [ind.meta.get("variacao_percentual") for ind in indicadores],
+            "parser_version": [ind.parser_version for ind in indicadores],
+            "anomalies": [ind.anomalies or None for ind in indicadores],
+        },
+        columns=list(INDICADOR_FRAME_COLUMNS),
+    )
+    frame["valor"] = frame["valor"].astype("float64")
+    frame["variacao_percentual"] = frame["variacao_percentual"].astype("float64")
+    return frame
 
 
 class BaseParser(ABC):
@@ -16,13 +53,16 @@ class BaseParser(ABC):
     expected_fingerprint: dict[str, str] | None = None
 
     @abstractmethod
-    def can_parse(self, html: str) -> tuple[bool, float]:
+    def can_parse(self, html: str | HtmlDocument) -> tuple[bool, float]:
         pass
 
     @abstractmethod
-    def parse(self, html: str, produto: str) -> list[models.Indicador]:
+    def parse(self, html: str | HtmlDocument, produto: str) -> list[models.Indicador]:
         pass
 
+    def parse_frame(self, html: str | HtmlDocument, produto: str) -> pd.DataFrame:
+        return indicadores_to_frame(self.parse(html, produto))
+
     @abstractmethod
-    def extract_fingerprint(self, html: str) -> dict[str, str]:
+    def extract_fingerprint(self, html: str | HtmlDocument) -> dict[str, str]:
         pass
@@ -9,6 +9,7 @@ from ...alerts.notifier import AlertLevel, send_alert
 from ...exceptions import ParseError
 from ...models import Indicador
 from .base import BaseParser
+from .document import HtmlDocument, parse_document
 from .v1 import CepeaParserV1
 
 logger = structlog.get_logger()
@@ -39,19 +40,20 @@ class ParserDivergence:
 
 
 async def parse_with_consensus(
-    html: str,
+    html: str | HtmlDocument,
     produto: str,
     require_consensus: bool = False,
 ) -> ConsensusResult:
     results: dict[int, list[Indicador]] = {}
     errors: dict[int, str] = {}
+    doc = parse_document(html)
 
     for parser_cls in CONSENSUS_PARSERS:
         parser = parser_cls()
         try:
-            can_parse, confidence = parser.can_parse(html)
+            can_parse, confidence = parser.can_parse(doc)
             if can_parse and confidence > 0.5:
-                parsed = parser.parse(html, produto)
+                parsed = parser.parse(doc, produto)
                 results[parser.version] = parsed
                 logger.debug(
                     "consensus_parser_success",
@@ -212,7 +214,7 @@ class ConsensusValidator:
         self.history: list[ConsensusResult] = []
         self.divergence_count = 0
 
-    async def validate(self, html: str, produto: str) -> ConsensusResult:
+    async def validate(self, html: str | HtmlDocument, produto: str) -> ConsensusResult:
         result = await parse_with_consensus(html, produto, require_consensus=False)
 
         self.history.append(result)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, overload
 
 import structlog
 
 from agrobr import constants, exceptions
 from agrobr.cepea.parsers import base
+from agrobr.cepea.parsers.document import HtmlDocument, parse_document
 from agrobr.cepea.parsers.v1 import CepeaParserV1
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from agrobr import models
 
 logger = structlog.get_logger()
@@ -19,18 +22,43 @@ PARSERS: list[type[base.BaseParser]] = [
 ]
 
 
+@overload
+async def get_parser_with_fallback(
+    html: str | HtmlDocument,
+    produto: str,
+    data_referencia: date | None = None,
+    strict: bool = False,
+    *,
+    as_frame: Literal[False] = False,
+) -> tuple[base.BaseParser, list[models.Indicador]]: ...
+
+
+@overload
+async def get_parser_with_fallback(
+    html: str | HtmlDocument,
+    produto: str,
+    data_referencia: date | None = None,
+    strict: bool = False,
+    *,
+    as_frame: Literal[True],
+) -> tuple[base.BaseParser, pd.DataFrame]: ...
+
+
 async def get_parser_with_fallback(
-    html: str,
+    html: str | HtmlDocument,
     produto: str,
     data_referencia: date | None = None,
     strict: bool = False,
-) -> tuple[base.BaseParser, list[models.Indicador]]:
+    *,
+    as_frame: bool = False,
+) -> tuple[base.BaseParser, list[models.Indicador] | pd.DataFrame]:
+    doc = parse_document(html)
     if not PARSERS:
         raise exceptions.ParseError(
             source="cepea",
             parser_version=0,
             reason="No parsers registered. CEPEA parser will be implemented in WEEK 3.",
-            html_snippet=html[:200],
+            html_snippet=doc.html[:200],
         )
 
     errors: list[tuple[str, str]] = []
@@ -45,7 +73,7 @@ async def get_parser_with_fallback(
             if parser.valid_until and data_referencia > parser.valid_until:
                 continue
 
-        can_parse, confidence = parser.can_parse(html)
+        can_parse, confidence = parser.can_parse(doc)
 
         logger.debug(
             "parser_check",
@@ -71,9 +99,9 @@ async def get_parser_with_fallback(
             )
 
         try:
-            result = parser.parse(html, produto)
+            result = parser.parse_frame(doc, produto) if as_frame else parser.parse(doc, produto)
 
-            if not result:
+            if len(result) == 0:
                 errors.append((f"v{parser.version}", "No data extracted"))
                 continue
 
@@ -101,5 +129,5 @@ async def get_parser_with_fallback(
         source=PARSERS[0]().source if PARSERS else "cepea",
         parser_version=0,
         reason=f"All parsers failed: {error_summary}",
-        html_snippet=html[:500],
+        html_snippet=doc.html[:500],
     )
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any
+
+import lxml.html
+from lxml import etree
+
+
+class HtmlDocument:
+    def __init__(self, html: str) -> None:
+        self.html = html
+
+    @cached_property
+    def root(self) -> Any:
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+        try:
+            return lxml.html.document_fromstring(self.html.encode("utf-8"), parser=parser)
+        except etree.ParserError:
+            return lxml.html.document_fromstring(b"<html></html>", parser=parser)
+
+    @cached_property
+    def tables(self) -> list[Any]:
+        return list(self.root.iter("table"))
+
+    @cached_property
+    def header_texts(self) -> list[str]:
+        return [text_of(th) for th in self.root.iter("th")]
+
+    @cached_property
+    def text(self) -> str:
+        return " ".join(self.root.itertext())
+
+
+def parse_document(html: str | HtmlDocument) -> HtmlDocument:
+    return html if isinstance(html, HtmlDocument) else HtmlDocument(html)
+
+
+def text_of(element: Any) -> str:
+    if not len(element):
+        return (element.text or "").strip()
+    return "".join(s.strip() for s in element.itertext())
+
+
+def classes_of(element: Any) -> list[str]:
+    return str(element.get("class") or "").split()
+
+
+def element_children(element: Any) -> list[Any]:
+    return [child for child in element if isinstance(child.tag, str)]
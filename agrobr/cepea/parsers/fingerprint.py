@@ -3,80 +3,65 @@ from __future__ import annotations
 import hashlib
 import json
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import structlog
-from bs4 import BeautifulSoup
 
 from agrobr.constants import Fonte
 from agrobr.models import Fingerprint
 
+from .document import HtmlDocument, classes_of, element_children, parse_document, text_of
+
 logger = structlog.get_logger()
 
 
 def extract_fingerprint(
-    html: str,
+    html: str | HtmlDocument,
     source: Fonte,
     url: str,
 ) -> Fingerprint:
-    soup = BeautifulSoup(html, "lxml")
-
-    table_classes: list[list[str]] = []
-    for table in soup.find_all("table")[:10]:
-        classes_raw = table.get("class")
-        if classes_raw is None:
-            classes: list[str] = []
-        elif isinstance(classes_raw, str):
-            classes = [classes_raw]
-        else:
-            classes = list(classes_raw)
-        table_classes.append(sorted(classes))
+    doc = parse_document(html)
+    root = doc.root
+
+    table_classes = [sorted(classes_of(table)) for table in doc.tables[:10]]
 
     keywords = ["preco", "indicador", "cotacao", "valor", "tabela", "dados"]
     key_ids: list[str] = []
-    for elem in soup.find_all(id=True):
-        elem_id_raw = elem.get("id")
-        if elem_id_raw is None or not isinstance(elem_id_raw, str):
-            continue
-        elem_id = elem_id_raw.lower()
-        if any(kw in elem_id for kw in keywords):
-            key_ids.append(elem_id_raw)
+    for elem_id_raw in root.xpath("//*/@id"):
+        elem_id = str(elem_id_raw)
+        if any(kw in elem_id.lower() for kw in keywords):
+            key_ids.append(elem_id)
     key_ids = sorted(set(key_ids))[:20]
 
     table_headers: list[list[str]] = []
-    for table in soup.find_all("table")[:5]:
+    for table in doc.tables[:5]:
         headers: list[str] = []
-        for th in table.find_all("th"):
-            text = th.get_text(strip=True)[:50]
+        for th in table.iter("th"):
+            text = text_of(th)[:50]
             if text:
                 headers.append(text)
         if headers:
             table_headers.append(headers)
 
     element_counts = {
-        "tables": len(soup.find_all("table")),
-        "forms": len(soup.find_all("form")),
-        "divs_with_id": len(soup.find_all("div", id=True)),
-        "inputs": len(soup.find_all("input")),
-        "selects": len(soup.find_all("select")),
-        "links": len(soup.find_all("a")),
-        "scripts": len(soup.find_all("script")),
+        "tables": len(doc.tables),
+        "forms": sum(1 for _ in root.iter("form")),
+        "divs_with_id": len(root.xpath("//div[@id]")),
+        "inputs": sum(1 for _ in root.iter("input")),
+        "selects": sum(1 for _ in root.iter("select")),
+        "links": sum(1 for _ in root.iter("a")),
+        "scripts": sum(1 for _ in root.iter("script")),
     }
 
     structure_elements: list[tuple[str, int, tuple[str, ...]]] = []
-    for tag in soup.find_all(["table", "div", "form", "section", "article"])[:30]:
-        tag_classes_raw = tag.get("class")
-        if tag_classes_raw is None:
-            tag_classes: list[str] = []
-        elif isinstance(tag_classes_raw, str):
-            tag_classes = [tag_classes_raw]
-        else:
-            tag_classes = list(tag_classes_raw)
+    for tag in islice(root.iter("table", "div", "form", "section", "article"), 30):
+        tag_classes = classes_of(tag)
         structure_elements.append(
             (
-                tag.name or "",
-                len(tag.find_all(recursive=False)),
+                tag.tag,
+                len(element_children(tag)),
                 tuple(sorted(tag_classes))[:3] if tag_classes else (),
             )
         )
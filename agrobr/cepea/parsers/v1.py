@@ -3,20 +3,58 @@ from __future__ import annotations
 import re
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any
+from typing import Any, NoReturn
 
+import numpy as np
+import pandas as pd
 import structlog
-from bs4 import BeautifulSoup
 
 from agrobr.constants import Fonte
 from agrobr.exceptions import ParseError
 from agrobr.models import Indicador
 
-from .base import BaseParser
+from .base import INDICADOR_FRAME_COLUMNS, BaseParser
+from .document import HtmlDocument, parse_document, text_of
 from .fingerprint import extract_fingerprint
 
 logger = structlog.get_logger()
 
+_DETECT_TABLE = re.compile(r"indicador|preco|cotacao", re.I)
+_DATA_TABLE_ID = re.compile(r"indicador|preco|cotacao|dados", re.I)
+_DATA_TABLE_CLASS = re.compile(r"indicador|preco|cotacao|dados|table", re.I)
+_CEPEA_TEXT = re.compile(r"cepea|esalq|indicador", re.I)
+
+_DATE_KEYWORDS = ("data", "dia", "date")
+_VALUE_KEYWORDS = ("valor", "preço", "preco", "r$", "price")
+_DATE_PATTERNS = (
+    (r"\d{2}/\d{2}/\d{4}", "%d/%m/%Y"),
+    (r"\d{2}-\d{2}-\d{4}", "%d-%m-%Y"),
+    (r"\d{4}-\d{2}-\d{2}", "%Y-%m-%d"),
+    (r"\d{2}/\d{2}/\d{2}", "%d/%m/%y"),
+)
+
+
+def _parse_dates(texts: pd.Series) -> pd.Series:
+    result = pd.Series(pd.NaT, index=texts.index, dtype="datetime64[ns]")
+    for pattern, date_format in _DATE_PATTERNS:
+        pending = result.isna()
+        if not pending.any():
+            break
+        matched = texts[pending].str.extract(f"({pattern})", expand=False)
+        result[pending] = pd.to_datetime(matched, format=date_format, errors="coerce")
+    return result
+
+
+def _parse_decimals(texts: pd.Series) -> pd.Series:
+    cleaned = texts.str.replace(r"[R$\s]", "", regex=True)
+    both = cleaned.str.contains(",", regex=False, na=False) & cleaned.str.contains(
+        ".", regex=False, na=False
+    )
+    cleaned = cleaned.mask(both, cleaned.str.replace(".", "", regex=False))
+    cleaned = cleaned.str.replace(",", ".", regex=False).str.replace(r"[^\d.\-]", "", regex=True)
+    values = pd.to_numeric(cleaned, errors="coerce").astype("float64")
+    return values.where(values > 0)
+
 
 class CepeaParserV1(BaseParser):
     version = 1
@@ -24,37 +62,32 @@ class CepeaParserV1(BaseParser):
     valid_from = date(2024, 1, 1)
     valid_until = None
 
-    def can_parse(self, html: str) -> tuple[bool, float]:
-        soup = BeautifulSoup(html, "lxml")
+    def can_parse(self, html: str | HtmlDocument) -> tuple[bool, float]:
+        doc = parse_document(html)
 
         confidence = 0.0
         checks_passed = 0
         total_checks = 5
 
-        tables = soup.find_all("table")
-        if tables:
+        if doc.tables:
             checks_passed += 1
 
-        indicador_table = soup.find("table", id=re.compile(r"indicador|preco|cotacao", re.I))
-        if not indicador_table:
-            indicador_table = soup.find(
-                "table", class_=re.compile(r"indicador|preco|cotacao", re.I)
-            )
-        if indicador_table:
+        indicador_table = self._match_table(doc, "id", _DETECT_TABLE)
+        if indicador_table is None:
+            indicador_table = self._match_table(doc, "class", _DETECT_TABLE)
+        if indicador_table is not None:
             checks_passed += 1
 
-        headers = soup.find_all("th")
-        header_texts = [th.get_text(strip=True).lower() for th in headers]
+        header_text = " ".join(t.lower() for t in doc.header_texts)
         date_keywords = ["data", "dia", "date"]
         value_keywords = ["valor", "preço", "preco", "price", "r$"]
 
-        if any(kw in " ".join(header_texts) for kw in date_keywords):
+        if any(kw in header_text for kw in date_keywords):
             checks_passed += 1
-        if any(kw in " ".join(header_texts) for kw in value_keywords):
+        if any(kw in header_text for kw in value_keywords):
             checks_passed += 1
 
-        cepea_indicators = soup.find_all(string=re.compile(r"cepea|esalq|indicador", re.I))
-        if cepea_indicators:
+        if _CEPEA_TEXT.search(doc.text):
             checks_passed += 1
 
         confidence = checks_passed / total_checks
@@ -70,55 +103,22 @@ class CepeaParserV1(BaseParser):
 
         return can_parse, confidence
 
-    def parse(self, html: str, produto: str) -> list[Indicador]:
-        soup = BeautifulSoup(html, "lxml")
+    def parse(self, html: str | HtmlDocument, produto: str) -> list[Indicador]:
+        doc = parse_document(html)
+        headers, rows = self._data_rows(doc)
         indicadores: list[Indicador] = []
 
-        tables = soup.find_all("table")
-        if not tables:
-            raise ParseError(
-                source=self.source,
-                parser_version=self.version,
-                reason="No tables found in HTML",
-                html_snippet=html[:500],
-            )
-
-        data_table = self._find_data_table(soup)
-        if not data_table:
-            raise ParseError(
-                source=self.source,
-                parser_version=self.version,
-                reason="Could not identify data table",
-                html_snippet=html[:500],
-            )
-
-        headers = self._extract_headers(data_table)
-        rows = data_table.find_all("tr")[1:]
-
-        for row in rows:
-            cells = row.find_all(["td", "th"])
-            if len(cells) < 2:
-                continue
-
+        for cell_texts in rows:
             try:
-                indicador = self._parse_row(cells, headers, produto)
+                indicador = self._parse_row(cell_texts, headers, produto)
                 if indicador:
                     indicadores.append(indicador)
             except (ValueError, InvalidOperation) as e:
-                logger.debug(
-                    "row_parse_failed",
-                    error=str(e),
-                    cells=[c.get_text(strip=True) for c in cells],
-                )
+                logger.debug("row_parse_failed", error=str(e), cells=cell_texts)
                 continue
 
         if not indicadores:
-            raise ParseError(
-                source=self.source,
-                parser_version=self.version,
-                reason="No valid indicators extracted",
-                html_snippet=html[:500],
-            )
+            self._raise_empty(doc)
 
         logger.info(
             "parse_success",
@@ -129,48 +129,137 @@ class CepeaParserV1(BaseParser):
 
         return indicadores
 
-    def extract_fingerprint(self, html: str) -> dict[str, Any]:
+    def parse_frame(self, html: str | HtmlDocument, produto: str) -> pd.DataFrame:
+        doc = parse_document(html)
+        headers, rows = self._data_rows(doc)
+        cells = pd.DataFrame(rows, dtype=object)
+
+        datas = pd.Series(pd.NaT, index=cells.index, dtype="datetime64[ns]")
+        valores = pd.Series(np.nan, index=cells.index, dtype="float64")
+        for i, header in enumerate(headers[: cells.shape[1]]):
+            present = cells[i].notna()
+            if any(kw in header for kw in _DATE_KEYWORDS):
+                datas = datas.mask(present, _parse_dates(cells[i]))
+            elif any(kw in header for kw in _VALUE_KEYWORDS):
+                valores = valores.mask(present, _parse_decimals(cells[i]))
+
+        if datas.isna().any():
+            datas = datas.fillna(_parse_dates(cells[0]))
+        for i in range(1, cells.shape[1]):
+            if not valores.isna().any():
+                break
+            valores = valores.fillna(_parse_decimals(cells[i]))
+
+        valid = (datas.notna() & valores.notna()).to_numpy()
+        if not valid.any():
+            self._raise_empty(doc)
+
+        count = int(valid.sum())
+        frame = pd.DataFrame(
+            {
+                "data": datas[valid].to_numpy(),
+                "produto": produto.lower().strip(),
+                "praca": None,
+                "valor": valores[valid].to_numpy(),
+                "unidade": self._detect_unidade(produto, headers),
+                "fonte": Fonte.CEPEA.value,
+                "metodologia": "indicador_esalq",
+                "variacao_percentual": np.full(count, np.nan),
+                "parser_version": self.version,
+                "anomalies": None,
+            },
+            columns=list(INDICADOR_FRAME_COLUMNS),
+        )
+
+        logger.info(
+            "parse_success",
+            source=self.source,
+            parser_version=self.version,
+            records_count=count,
+        )
+
+        return frame
+
+    def extract_fingerprint(self, html: str | HtmlDocument) -> dict[str, Any]:
         fp = extract_fingerprint(html, Fonte.CEPEA, "internal")
         return fp.model_dump()
 
-    def _find_data_table(self, soup: BeautifulSoup) -> Any | None:
-        table = soup.find("table", id=re.compile(r"indicador|preco|cotacao|dados", re.I))
-        if table:
+    @staticmethod
+    def _match_table(doc: HtmlDocument, attr: str, pattern: re.Pattern[str]) -> Any | None:
+        for table in doc.tables:
+            value = table.get(attr)
+            if value and pattern.search(value):
+                return table
+        return None
+
+    def _data_rows(self, doc: HtmlDocument) -> tuple[list[str], list[list[str]]]:
+        if not doc.tables:
+            raise ParseError(
+                source=self.source,
+                parser_version=self.version,
+                reason="No tables found in HTML",
+                html_snippet=doc.html[:500],
+            )
+
+        data_table = self._find_data_table(doc)
+        if data_table is None:
+            raise ParseError(
+                source=self.source,
+                parser_version=self.version,
+                reason="Could not identify data table",
+                html_snippet=doc.html[:500],
+            )
+
+        rows = (
+            [text_of(c) for c in row.iter("td", "th")] for row in list(data_table.iter("tr"))[1:]
+        )
+        return self._extract_headers(data_table), [r for r in rows if len(r) >= 2]
+
+    def _raise_empty(self, doc: HtmlDocument) -> NoReturn:
+        raise ParseError(
+            source=self.source,
+            parser_version=self.version,
+            reason="No valid indicators extracted",
+            html_snippet=doc.html[:500],
+        )
+
+    def _find_data_table(self, doc: HtmlDocument) -> Any | None:
+        table = self._match_table(doc, "id", _DATA_TABLE_ID)
+        if table is not None:
             return table
 
-        table = soup.find("table", class_=re.compile(r"indicador|preco|cotacao|dados|table", re.I))
-        if table:
+        table = self._match_table(doc, "class", _DATA_TABLE_CLASS)
+        if table is not None:
             return table
 
-        tables = soup.find_all("table")
-        for table in tables:
-            headers = table.find_all("th")
-            header_text = " ".join(th.get_text(strip=True).lower() for th in headers)
+        for table in doc.tables:
+            header_text = " ".join(text_of(th).lower() for th in table.iter("th"))
             if "data" in header_text and ("valor" in header_text or "r$" in header_text):
                 return table
 
-        if tables:
-            largest_table = max(tables, key=lambda t: len(t.find_all("tr")))
-            if len(largest_table.find_all("tr")) >= 3:
-                return largest_table
+        if doc.tables:
+            row_counts = [sum(1 for _ in t.iter("tr")) for t in doc.tables]
+            largest = max(range(len(row_counts)), key=row_counts.__getitem__)
+            if row_counts[largest] >= 3:
+                return doc.tables[largest]
 
         return None
 
     def _extract_headers(self, table: Any) -> list[str]:
         headers: list[str] = []
-        header_row = table.find("tr")
+        header_row = next(table.iter("tr"), None)
 
-        if header_row:
-            for cell in header_row.find_all(["th", "td"]):
-                text = cell.get_text(strip=True).lower()
+        if header_row is not None:
+            for cell in header_row.iter("th", "td"):
+                text = text_of(cell).lower()
                 text = re.sub(r"\s+", " ", text)
                 headers.append(text)
 
         return headers
 
-    def _parse_row(self, cells: list[Any], headers: list[str], produto: str) -> Indicador | None:
-        cell_texts = [c.get_text(strip=True) for c in cells]
-
+    def _parse_row(
+        self, cell_texts: list[str], headers: list[str], produto: str
+    ) -> Indicador | None:
         data_value = None
         valor_value = None
         variacao_value = None
@@ -178,9 +267,9 @@ class CepeaParserV1(BaseParser):
         for _i, (header, cell_text) in enumerate(zip(headers, cell_texts)):
             header_lower = header.lower()
 
-            if any(kw in header_lower for kw in ["data", "dia", "date"]):
+            if any(kw in header_lower for kw in _DATE_KEYWORDS):
                 data_value = self._parse_date(cell_text)
-            elif any(kw in header_lower for kw in ["valor", "preço", "preco", "r$", "price"]):
+            elif any(kw in header_lower for kw in _VALUE_KEYWORDS):
                 valor_value = self._parse_decimal(cell_text)
             elif "var" in header_lower or "%" in header_lower:
                 variacao_value = cell_text
@@ -216,14 +305,7 @@ class CepeaParserV1(BaseParser):
     def _parse_date(self, text: str) -> date | None:
         text = text.strip()
 
-        patterns = [
-            (r"(\d{2})/(\d{2})/(\d{4})", "%d/%m/%Y"),
-            (r"(\d{2})-(\d{2})-(\d{4})", "%d-%m-%Y"),
-            (r"(\d{4})-(\d{2})-(\d{2})", "%Y-%m-%d"),
-            (r"(\d{2})/(\d{2})/(\d{2})", "%d/%m/%y"),
-        ]
-
-        for pattern, date_format in patterns:
+        for pattern, date_format in _DATE_PATTERNS:
             match = re.search(pattern, text)
             if match:
                 try:
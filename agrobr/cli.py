@@ -102,6 +102,33 @@ def cache_clear(
     typer.echo("Limpeza de cache em desenvolvimento")
 
 
+@cache_app.command("maintain")  # type: ignore[misc, untyped-decorator]
+def cache_maintain(
+    max_size_mb: int | None = typer.Option(
+        None, "--max-size-mb", help="Tamanho maximo dos dados (padrao: AGROBR_CACHE_MAX_SIZE_MB)"
+    ),
+    compact: bool = typer.Option(
+        False,
+        "--compact/--no-compact",
+        help="Reescrever o arquivo (exige acesso exclusivo ao cache)",
+    ),
+    output: str = typer.Option("text", "--output", "-o", help="Formato: text, json"),
+) -> None:
+    from agrobr.cache.maintenance import run_maintenance
+
+    report = run_maintenance(max_size_mb=max_size_mb, compact=compact)
+
+    if output == "json":
+        typer.echo(json.dumps(report.to_dict(), indent=2))
+        return
+
+    typer.echo(f"Entradas expiradas:  {report.expired_entries}")
+    typer.echo(f"Entradas removidas:  {report.evicted_entries}")
+    typer.echo(f"Historico removido:  {report.history_removed}")
+    typer.echo(f"Compactado:          {'sim' if report.compacted else 'nao'}")
+    typer.echo(f"Bytes recuperados:   {report.bytes_reclaimed:,}")
+
+
 conab_app = typer.Typer(help="Dados CONAB - Safras e balanco")
 app.add_typer(conab_app, name="conab")
 
@@ -7,11 +7,19 @@ from typing import Literal, overload
 import pandas as pd
 import structlog
 
+from agrobr.constants import Fonte
+from agrobr.http.fanout import fetch_all, parse_all
 from agrobr.models import MetaInfo
 
 from . import client
 from .models import resolve_ncm
-from .parser import PARSER_VERSION, agregar_mensal, parse_exportacao
+from .parser import (
+    PARSER_VERSION,
+    ExportacaoStreamParser,
+    agregar_mensal,
+    parse_exportacao,
+    parse_exportacao_parquet,
+)
 
 logger = structlog.get_logger()
 
@@ -19,10 +27,12 @@ logger = structlog.get_logger()
 @overload
 async def exportacao(
     produto: str,
-    ano: int | None = None,
+    ano: int | list[int] | None = None,
     uf: str | None = None,
     agregacao: str = "mensal",
     *,
+    stream: bool = False,
+    cache_parquet: bool = False,
     return_meta: Literal[False] = False,
 ) -> pd.DataFrame: ...
 
@@ -30,23 +40,29 @@ async def exportacao(
 @overload
 async def exportacao(
     produto: str,
-    ano: int | None = None,
+    ano: int | list[int] | None = None,
     uf: str | None = None,
     agregacao: str = "mensal",
     *,
+    stream: bool = False,
+    cache_parquet: bool = False,
     return_meta: Literal[True],
 ) -> tuple[pd.DataFrame, MetaInfo]: ...
 
 
 async def exportacao(
     produto: str,
-    ano: int | None = None,
+    ano: int | list[int] | None = None,
     uf: str | None = None,
     agregacao: str = "mensal",
+    *,
+    stream: bool = False,
+    cache_parquet: bool = False,
     return_meta: bool = False,
 ) -> pd.DataFrame | tuple[pd.DataFrame, MetaInfo]:
     if ano is None:
         ano = datetime.now().year
+    anos = [ano] if isinstance(ano, int) else list(ano)
 
     ncm = resolve_ncm(produto)
 
@@ -60,11 +76,34 @@ async def exportacao(
         uf=uf,
     )
 
-    csv_text = await client.fetch_exportacao_csv(ano)
-    fetch_ms = int((time.monotonic() - t0) * 1000)
-
-    t1 = time.monotonic()
-    df = parse_exportacao(csv_text, ncm=ncm, uf=uf)
+    dfs: list[pd.DataFrame]
+    if cache_parquet:
+        paths = await client.fetch_parquet_anos("EXP", anos)
+        fetch_ms = int((time.monotonic() - t0) * 1000)
+        t1 = time.monotonic()
+        dfs = [parse_exportacao_parquet(path, ncm=ncm, uf=uf) for path in paths]
+        source_method = "httpx+parquet"
+    elif stream:
+
+        async def _stream(ano_csv: int) -> ExportacaoStreamParser:
+            stream_parser = ExportacaoStreamParser(ncm=ncm, uf=uf)
+            async for chunk in client.stream_csv(f"{client.BULK_CSV_BASE}/EXP_{ano_csv}.csv"):
+                stream_parser.feed(chunk)
+            return stream_parser
+
+        stream_parsers = await fetch_all(Fonte.COMEXSTAT, anos, _stream)
+        fetch_ms = int((time.monotonic() - t0) * 1000)
+        t1 = time.monotonic()
+        dfs = [stream_parser.finish() for stream_parser in stream_parsers]
+        source_method = "httpx+stream"
+    else:
+        csv_texts = await client.fetch_exportacao_csv_anos(anos)
+        fetch_ms = int((time.monotonic() - t0) * 1000)
+        t1 = time.monotonic()
+        dfs = await parse_all(parse_exportacao, csv_texts, ncm=ncm, uf=uf)
+        source_method = "httpx"
+
+    df = dfs[0] if len(dfs) == 1 else pd.concat(dfs, ignore_index=True)
 
     if agregacao == "mensal":
         df = agregar_mensal(df)
@@ -82,8 +121,8 @@ async def exportacao(
     if return_meta:
         meta = MetaInfo(
             source="comexstat",
-            source_url=f"{client.BULK_CSV_BASE}/EXP_{ano}.csv",
-            source_method="httpx",
+            source_url=f"{client.BULK_CSV_BASE}/EXP_{anos[0]}.csv",
+            source_method=source_method,
             fetched_at=datetime.now(UTC),
             fetch_duration_ms=fetch_ms,
             parse_duration_ms=parse_ms,
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import os
+import time
+import warnings
+from collections.abc import AsyncIterator
+from pathlib import Path
+
 import httpx
 import structlog
 
-from agrobr.constants import MIN_CSV_SIZE, URLS, Fonte, HTTPSettings
-from agrobr.http.retry import retry_on_status
+from agrobr.cache.read_through import FALLBACK_EXCEPTIONS, TEXT_CODEC, read_through
+from agrobr.constants import MIN_CSV_SIZE, URLS, CacheSettings, Fonte, HTTPSettings
+from agrobr.exceptions import StaleDataWarning
+from agrobr.http.fanout import fetch_all
+from agrobr.http.pool import ClientPool
+from agrobr.http.retry import retry_on_status, should_retry_status
 from agrobr.http.user_agents import UserAgentRotator
 
+from .parser import csv_to_parquet
+
 logger = structlog.get_logger()
 
 BULK_CSV_BASE = URLS[Fonte.COMEXSTAT]["bulk_csv"]
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 _settings = HTTPSettings()
 
 TIMEOUT = httpx.Timeout(
@@ -21,42 +35,39 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.COMEXSTAT, codec=TEXT_CODEC)
 async def download_csv(url: str) -> str:
     logger.info("comexstat_download_csv", url=url)
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="comexstat"),
-        follow_redirects=True,
-        verify=False,
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="comexstat",
-        )
+    headers = UserAgentRotator.get_headers(source="comexstat")
+    client = ClientPool.get(Fonte.COMEXSTAT, verify=False)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="comexstat",
+    )
 
-        response.raise_for_status()
+    response.raise_for_status()
 
-        content = response.text
+    content = response.text
 
-        if len(content) < MIN_CSV_SIZE or ";" not in content:
-            from agrobr.exceptions import SourceUnavailableError
+    if len(content) < MIN_CSV_SIZE or ";" not in content:
+        from agrobr.exceptions import SourceUnavailableError
 
-            raise SourceUnavailableError(
-                source="comexstat",
-                url=url,
-                last_error=(
-                    f"CSV response too small or missing delimiter "
-                    f"({len(content)} chars, no ';' separator found)"
-                ),
-            )
-
-        logger.info(
-            "comexstat_download_ok",
+        raise SourceUnavailableError(
+            source="comexstat",
             url=url,
-            size_chars=len(content),
+            last_error=(
+                f"CSV response too small or missing delimiter "
+                f"({len(content)} chars, no ';' separator found)"
+            ),
         )
-        return content
+
+    logger.info(
+        "comexstat_download_ok",
+        url=url,
+        size_chars=len(content),
+    )
+    return content
 
 
 async def fetch_exportacao_csv(ano: int) -> str:
@@ -67,3 +78,111 @@ async def fetch_exportacao_csv(ano: int) -> str:
 async def fetch_importacao_csv(ano: int) -> str:
     url = f"{BULK_CSV_BASE}/IMP_{ano}.csv"
     return await download_csv(url)
+
+
+async def fetch_exportacao_csv_anos(anos: list[int]) -> list[str]:
+    return await fetch_all(Fonte.COMEXSTAT, anos, fetch_exportacao_csv)
+
+
+async def fetch_importacao_csv_anos(anos: list[int]) -> list[str]:
+    return await fetch_all(Fonte.COMEXSTAT, anos, fetch_importacao_csv)
+
+
+async def stream_csv(url: str) -> AsyncIterator[bytes]:
+    logger.info("comexstat_stream_csv", url=url)
+
+    headers = UserAgentRotator.get_headers(source="comexstat")
+    client = ClientPool.get(Fonte.COMEXSTAT, verify=False)
+
+    async def _send() -> httpx.Response:
+        request = client.build_request("GET", url, headers=headers, timeout=TIMEOUT)
+        response = await client.send(request, stream=True)
+        if should_retry_status(response.status_code):
+            await response.aclose()
+        return response
+
+    response = await retry_on_status(_send, source="comexstat")
+    try:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+async def download_to_file(url: str, path: Path) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    size = 0
+    with path.open("wb") as f:
+        async for chunk in stream_csv(url):
+            f.write(chunk)
+            size += len(chunk)
+
+    if size < MIN_CSV_SIZE:
+        from agrobr.exceptions import SourceUnavailableError
+
+        path.unlink(missing_ok=True)
+        raise SourceUnavailableError(
+            source="comexstat",
+            url=url,
+            last_error=f"CSV response too small ({size} bytes)",
+        )
+
+    logger.info("comexstat_download_file_ok", url=url, path=str(path), size_bytes=size)
+    return size
+
+
+def parquet_path(fluxo: str, ano: int, settings: CacheSettings | None = None) -> Path:
+    settings = settings or CacheSettings()
+    return settings.cache_dir / "comexstat" / f"{fluxo}_{ano}.parquet"
+
+
+async def fetch_parquet(fluxo: str, ano: int, settings: CacheSettings | None = None) -> Path:
+    settings = settings or CacheSettings()
+    path = parquet_path(fluxo, ano, settings)
+
+    if path.exists():
+        age = time.time() - path.stat().st_mtime
+        if settings.offline_mode or age < settings.ttl_comexstat:
+            logger.debug("comexstat_parquet_hit", path=str(path), age_seconds=int(age))
+            return path
+
+    url = f"{BULK_CSV_BASE}/{fluxo}_{ano}.csv"
+    if settings.offline_mode:
+        from agrobr.exceptions import SourceUnavailableError
+
+        raise SourceUnavailableError(
+            source="comexstat", url=url, last_error="offline_mode ativo e nenhum parquet em cache"
+        )
+
+    csv_part = path.with_suffix(".csv.part")
+    parquet_part = path.with_suffix(".parquet.part")
+
+    try:
+        await download_to_file(url, csv_part)
+        csv_to_parquet(csv_part, parquet_part)
+        os.replace(parquet_part, path)
+    except FALLBACK_EXCEPTIONS as e:
+        if not path.exists():
+            raise
+        logger.warning("comexstat_parquet_stale_fallback", path=str(path), error=str(e))
+        warnings.warn(
+            f"comexstat indisponível ({e}). Usando parquet expirado {path.name}.",
+            StaleDataWarning,
+            stacklevel=2,
+        )
+    finally:
+        csv_part.unlink(missing_ok=True)
+        parquet_part.unlink(missing_ok=True)
+
+    logger.info("comexstat_parquet_ready", path=str(path), size_bytes=path.stat().st_size)
+    return path
+
+
+async def fetch_parquet_anos(
+    fluxo: str, anos: list[int], settings: CacheSettings | None = None
+) -> list[Path]:
+    async def _fetch(ano: int) -> Path:
+        return await fetch_parquet(fluxo, ano, settings)
+
+    return await fetch_all(Fonte.COMEXSTAT, anos, _fetch)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from io import StringIO
+from io import BytesIO, StringIO
+from pathlib import Path
 
+import duckdb
 import pandas as pd
 import structlog
 
@@ -11,6 +13,8 @@ logger = structlog.get_logger()
 
 PARSER_VERSION = 1
 
+STREAM_PARSE_BYTES = 8 * 1024 * 1024
+
 COLUNAS_MAP: dict[str, str] = {
     "CO_ANO": "ano",
     "CO_MES": "mes",
@@ -68,6 +72,14 @@ def parse_exportacao(
             reason="CSV parseado mas sem registros",
         )
 
+    return _normalizar(df, ncm=ncm, uf=uf)
+
+
+def _normalizar(
+    df: pd.DataFrame,
+    ncm: str | None = None,
+    uf: str | None = None,
+) -> pd.DataFrame:
     rename = {k: v for k, v in COLUNAS_MAP.items() if k in df.columns}
     df = df.rename(columns=rename)
 
@@ -105,6 +117,144 @@ def parse_exportacao(
     return df
 
 
+def _filtrar_bruto(df: pd.DataFrame, ncm: str | None, uf: str | None) -> pd.DataFrame:
+    if ncm and "CO_NCM" in df.columns:
+        df = df[df["CO_NCM"].astype(str).str.zfill(8).str.startswith(ncm)]
+    if uf and "SG_UF_NCM" in df.columns:
+        df = df[df["SG_UF_NCM"].astype(str).str.upper().str.strip() == uf.upper()]
+    return df
+
+
+class ExportacaoStreamParser:
+    def __init__(
+        self,
+        ncm: str | None = None,
+        uf: str | None = None,
+        parse_bytes: int = STREAM_PARSE_BYTES,
+    ) -> None:
+        self.ncm = ncm
+        self.uf = uf
+        self.parse_bytes = parse_bytes
+        self.rows_read = 0
+        self._header: bytes | None = None
+        self._sep = ";"
+        self._buffer = bytearray()
+        self._frames: list[pd.DataFrame] = []
+
+    def feed(self, data: bytes) -> None:
+        self._buffer.extend(data)
+        if self._header is None:
+            end = self._buffer.find(b"\n")
+            if end < 0:
+                return
+            self._header = bytes(self._buffer[: end + 1])
+            del self._buffer[: end + 1]
+            self._sep = _detect_separator(self._header.decode("utf-8-sig", errors="replace"))
+
+        if len(self._buffer) < self.parse_bytes:
+            return
+
+        cut = self._buffer.rfind(b"\n")
+        if cut < 0:
+            return
+        self._parse(bytes(self._buffer[: cut + 1]))
+        del self._buffer[: cut + 1]
+
+    def _parse(self, lines: bytes) -> None:
+        if not lines.strip() or self._header is None:
+            return
+        try:
+            chunk = pd.read_csv(
+                BytesIO(self._header + lines),
+                sep=self._sep,
+                dtype={"CO_NCM": str, "SG_UF_NCM": str},
+                encoding="utf-8-sig",
+                encoding_errors="replace",
+            )
+        except Exception as e:
+            raise ParseError(
+                source="comexstat",
+                parser_version=PARSER_VERSION,
+                reason=f"Erro ao ler CSV: {e}",
+            ) from e
+
+        self.rows_read += len(chunk)
+        chunk = _filtrar_bruto(chunk, self.ncm, self.uf)
+        if not chunk.empty:
+            self._frames.append(chunk)
+
+    def finish(self) -> pd.DataFrame:
+        self._parse(bytes(self._buffer))
+        self._buffer.clear()
+
+        if self._header is None or self.rows_read == 0:
+            raise ParseError(
+                source="comexstat",
+                parser_version=PARSER_VERSION,
+                reason="CSV de exportação vazio",
+            )
+
+        if self._frames:
+            df = pd.concat(self._frames, ignore_index=True)
+        else:
+            columns = self._header.decode("utf-8-sig", errors="replace").strip().split(self._sep)
+            df = pd.DataFrame(columns=[c.strip('"') for c in columns])
+
+        logger.debug("comexstat_stream_parsed", rows_read=self.rows_read, rows_kept=len(df))
+        return _normalizar(df, ncm=self.ncm, uf=self.uf)
+
+
+def csv_to_parquet(csv_path: Path, parquet_path: Path) -> None:
+    conn = duckdb.connect()
+    try:
+        conn.execute(
+            f"""
+            COPY (
+                SELECT * FROM read_csv(
+                    '{csv_path.as_posix()}',
+                    header = true,
+                    types = {{'CO_NCM': 'VARCHAR', 'SG_UF_NCM': 'VARCHAR'}}
+                )
+            ) TO '{parquet_path.as_posix()}' (FORMAT PARQUET, COMPRESSION ZSTD)
+            """
+        )
+    finally:
+        conn.close()
+
+
+def parse_exportacao_parquet(
+    parquet_path: Path,
+    ncm: str | None = None,
+    uf: str | None = None,
+) -> pd.DataFrame:
+    where: list[str] = []
+    params: list[str] = []
+    if ncm:
+        where.append("lpad(CO_NCM, 8, '0') LIKE ?")
+        params.append(f"{ncm}%")
+    if uf:
+        where.append("upper(trim(SG_UF_NCM)) = ?")
+        params.append(uf.upper())
+
+    sql = f"SELECT * FROM read_parquet('{parquet_path.as_posix()}')"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+
+    conn = duckdb.connect()
+    try:
+        df = conn.execute(sql, params).df()
+    except duckdb.Error as e:
+        raise ParseError(
+            source="comexstat",
+            parser_version=PARSER_VERSION,
+            reason=f"Erro ao ler parquet: {e}",
+        ) from e
+    finally:
+        conn.close()
+
+    return _normalizar(df, ncm=ncm, uf=uf)
+
+
 def agregar_mensal(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
@@ -7,8 +7,10 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import JSON_CODEC, cached_fetch, with_url
 from agrobr.constants import URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -103,7 +105,7 @@ async def _fetch_chunks(
             p: dict[str, str],
         ) -> Callable[[], Awaitable[httpx.Response]]:
             async def _do_get() -> httpx.Response:
-                return await http.get(url, headers=headers, params=p)
+                return await http.get(url, headers=headers, params=p, timeout=TIMEOUT)
 
             return _do_get
 
@@ -148,6 +150,42 @@ async def fetch_trade_data(
     api_key: str | None = None,
 ) -> tuple[list[dict[str, Any]], str]:
     key = _get_api_key(api_key)
+    params = {
+        "reporter": reporter,
+        "partner": partner,
+        "hs_codes": ",".join(hs_codes),
+        "flow": flow.upper(),
+        "period": period,
+        "freq": freq.upper(),
+        "authenticated": key is not None,
+    }
+    return await cached_fetch(
+        Fonte.COMTRADE,
+        "comtrade.client.fetch_trade_data",
+        params,
+        lambda: _fetch_trade_data(
+            reporter=reporter,
+            partner=partner,
+            hs_codes=hs_codes,
+            flow=flow,
+            period=period,
+            freq=freq,
+            key=key,
+        ),
+        codec=with_url(JSON_CODEC),
+    )
+
+
+async def _fetch_trade_data(
+    *,
+    reporter: int,
+    partner: int,
+    hs_codes: list[str],
+    flow: str,
+    period: str,
+    freq: str,
+    key: str | None,
+) -> tuple[list[dict[str, Any]], str]:
     chunks = _chunk_period(period, freq)
 
     params_base: dict[str, str] = {
@@ -159,32 +197,32 @@ async def fetch_trade_data(
     if partner != 0:
         params_base["partnerCode"] = str(partner)
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, follow_redirects=True) as http:
-        if key:
-            url = f"{BASE_URL_AUTH}/C/{freq.upper()}/HS"
-            headers = _build_headers(key)
-            params_base["maxRecords"] = str(_max_records(key))
-
-            result = await _fetch_chunks(http, url, headers, params_base, chunks)
-            if result is not None:
-                return result, url
-
-            logger.warning("comtrade_auth_failed_fallback_guest", url=url)
-
-        url = f"{BASE_URL_GUEST}/C/{freq.upper()}/HS"
-        headers = _build_headers(None)
-        params_base["maxRecords"] = str(_max_records(None))
+    http = ClientPool.get(Fonte.COMTRADE)
+    if key:
+        url = f"{BASE_URL_AUTH}/C/{freq.upper()}/HS"
+        headers = _build_headers(key)
+        params_base["maxRecords"] = str(_max_records(key))
 
         result = await _fetch_chunks(http, url, headers, params_base, chunks)
         if result is not None:
             return result, url
 
-        raise SourceUnavailableError(
-            source="comtrade",
-            url=url,
-            last_error=(
-                "HTTP 401/403 em ambos endpoints (auth + guest). "
-                "Verifique AGROBR_COMTRADE_API_KEY ou registre em "
-                "https://comtradeplus.un.org"
-            ),
-        )
+        logger.warning("comtrade_auth_failed_fallback_guest", url=url)
+
+    url = f"{BASE_URL_GUEST}/C/{freq.upper()}/HS"
+    headers = _build_headers(None)
+    params_base["maxRecords"] = str(_max_records(None))
+
+    result = await _fetch_chunks(http, url, headers, params_base, chunks)
+    if result is not None:
+        return result, url
+
+    raise SourceUnavailableError(
+        source="comtrade",
+        url=url,
+        last_error=(
+            "HTTP 401/403 em ambos endpoints (auth + guest). "
+            "Verifique AGROBR_COMTRADE_API_KEY ou registre em "
+            "https://comtradeplus.un.org"
+        ),
+    )
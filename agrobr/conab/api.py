@@ -10,9 +10,11 @@ import structlog
 from agrobr import constants
 from agrobr.cache.keys import build_cache_key
 from agrobr.cache.policies import calculate_expiry
+from agrobr.cache.single_flight import single_flight
 from agrobr.conab import client
 from agrobr.conab.parsers.v1 import ConabParserV1
-from agrobr.models import MetaInfo
+from agrobr.models import MetaInfo, SafraRecord, records_to_frame
+from agrobr.validators.sanity import validate_safra_frame
 
 logger = structlog.get_logger()
 
@@ -24,6 +26,7 @@ async def safras(
     uf: str | None = None,
     levantamento: int | None = None,
     as_polars: bool = False,
+    validate_sanity: bool = False,
     *,
     return_meta: Literal[False] = False,
 ) -> pd.DataFrame: ...
@@ -36,17 +39,20 @@ async def safras(
     uf: str | None = None,
     levantamento: int | None = None,
     as_polars: bool = False,
+    validate_sanity: bool = False,
     *,
     return_meta: Literal[True],
 ) -> tuple[pd.DataFrame, MetaInfo]: ...
 
 
+@single_flight("conab:safras")
 async def safras(
     produto: str,
     safra: str | None = None,
     uf: str | None = None,
     levantamento: int | None = None,
     as_polars: bool = False,
+    validate_sanity: bool = False,
     return_meta: bool = False,
 ) -> pd.DataFrame | tuple[pd.DataFrame, MetaInfo]:
     fetch_start = time.perf_counter()
@@ -77,7 +83,7 @@ async def safras(
     meta.source_url = metadata.get("url", meta.source_url)
 
     parser = ConabParserV1()
-    safra_list = parser.parse_safra_produto(
+    safra_list = parser.parse_safra_records(
         xlsx=xlsx,
         produto=produto,
         safra_ref=safra or metadata["safra"],
@@ -106,7 +112,7 @@ async def safras(
             return df, meta
         return df
 
-    df = pd.DataFrame([s.model_dump() for s in safra_list])
+    df = records_to_frame(safra_list, SafraRecord)
 
     for col in ("area_plantada", "produtividade", "producao"):
         if col in df.columns:
@@ -129,6 +135,9 @@ async def safras(
     ]
     df = df[[c for c in contract_cols if c in df.columns]]
 
+    if validate_sanity:
+        df, _ = validate_safra_frame(df)
+
     meta.fetch_duration_ms = int((time.perf_counter() - fetch_start) * 1000)
     meta.records_count = len(df)
     meta.columns = df.columns.tolist()
@@ -6,8 +6,10 @@ from urllib.parse import urlencode
 import httpx
 import structlog
 
-from agrobr.constants import HTTPSettings
+from agrobr.cache.read_through import JSON_CODEC, read_through, with_url
+from agrobr.constants import Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -41,6 +43,7 @@ def _build_url(cda_path: str, query_id: str) -> str:
     return f"{PENTAHO_BASE}?{urlencode(params)}"
 
 
+@read_through(Fonte.CONAB, ttl="conab_ceasa", codec=with_url(JSON_CODEC))
 async def _fetch_query(cda_path: str, query_id: str) -> tuple[dict[str, Any], str]:
     url = _build_url(cda_path, query_id)
     logger.debug("conab_ceasa_fetch", query=query_id, url=url)
@@ -48,15 +51,11 @@ async def _fetch_query(cda_path: str, query_id: str) -> tuple[dict[str, Any], st
     headers = UserAgentRotator.get_headers(source="conab_ceasa")
     headers["Accept"] = "application/json"
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=headers,
-        follow_redirects=True,
-    ) as http:
-        resp = await retry_on_status(
-            lambda: http.get(url),
-            source="conab_ceasa",
-        )
+    http = ClientPool.get(Fonte.CONAB)
+    resp = await retry_on_status(
+        lambda: http.get(url, headers=headers, timeout=TIMEOUT),
+        source="conab_ceasa",
+    )
 
     if resp.status_code != 200:
         raise SourceUnavailableError(
@@ -7,6 +7,7 @@ from typing import Any
 import structlog
 
 from agrobr import constants
+from agrobr.cache.read_through import BYTESIO_CODEC, TEXT_CODEC, read_through, with_meta
 from agrobr.constants import MIN_HTML_PAGE_SIZE, MIN_XLSX_SIZE
 from agrobr.exceptions import SourceUnavailableError
 from agrobr.http.rate_limiter import RateLimiter
@@ -20,6 +21,7 @@ except ImportError:  # pragma: no cover
 logger = structlog.get_logger()
 
 
+@read_through(constants.Fonte.CONAB, codec=TEXT_CODEC)
 async def fetch_boletim_page() -> str:
     import asyncio
 
@@ -121,7 +123,12 @@ async def list_levantamentos(html: str | None = None) -> list[dict[str, Any]]:
     return levantamentos
 
 
+@read_through(constants.Fonte.CONAB, codec=BYTESIO_CODEC)
 async def download_xlsx(url: str) -> BytesIO:
+    return await _download_xlsx(url)
+
+
+async def _download_xlsx(url: str) -> BytesIO:
     logger.info("conab_download_xlsx", url=url)
 
     from agrobr.http.browser import is_available
@@ -189,34 +196,63 @@ async def download_xlsx(url: str) -> BytesIO:
             await browser.close()
 
 
+def _no_levantamentos(reason: str) -> SourceUnavailableError:
+    return SourceUnavailableError(
+        source="conab",
+        url=constants.URLS[constants.Fonte.CONAB]["boletim_graos"],
+        last_error=reason,
+    )
+
+
+@read_through(
+    constants.Fonte.CONAB,
+    ttl="conab_levantamento",
+    codec=with_meta(BYTESIO_CODEC),
+    exclude=("target",),
+)
+async def fetch_levantamento_xlsx(
+    safra: str,
+    levantamento: int,
+    target: dict[str, Any] | None = None,
+) -> tuple[BytesIO, dict[str, Any]]:
+    if target is None:
+        levantamentos = await list_levantamentos()
+        matches = [
+            lev
+            for lev in levantamentos
+            if lev["safra"] == safra and lev["levantamento"] == levantamento
+        ]
+        if not matches:
+            raise _no_levantamentos(
+                f"No levantamento found for safra={safra}, levantamento={levantamento}"
+            )
+        target = matches[0]
+
+    xlsx = await _download_xlsx(target["url"])
+    return xlsx, target
+
+
 async def fetch_latest_safra_xlsx() -> tuple[BytesIO, dict[str, Any]]:
     levantamentos = await list_levantamentos()
 
     if not levantamentos:
-        raise SourceUnavailableError(
-            source="conab",
-            url=constants.URLS[constants.Fonte.CONAB]["boletim_graos"],
-            last_error="No levantamentos found",
-        )
+        raise _no_levantamentos("No levantamentos found")
 
     latest = levantamentos[0]
-    xlsx = await download_xlsx(latest["url"])
-
-    return xlsx, latest
+    return await fetch_levantamento_xlsx(latest["safra"], latest["levantamento"], target=latest)
 
 
 async def fetch_safra_xlsx(
     safra: str | None = None,
     levantamento: int | None = None,
 ) -> tuple[BytesIO, dict[str, Any]]:
+    if safra and levantamento:
+        return await fetch_levantamento_xlsx(safra, levantamento)
+
     levantamentos = await list_levantamentos()
 
     if not levantamentos:
-        raise SourceUnavailableError(
-            source="conab",
-            url=constants.URLS[constants.Fonte.CONAB]["boletim_graos"],
-            last_error="No levantamentos found",
-        )
+        raise _no_levantamentos("No levantamentos found")
 
     filtered = levantamentos
 
@@ -227,13 +263,9 @@ async def fetch_safra_xlsx(
         filtered = [lev for lev in filtered if lev["levantamento"] == levantamento]
 
     if not filtered:
-        raise SourceUnavailableError(
-            source="conab",
-            url=constants.URLS[constants.Fonte.CONAB]["boletim_graos"],
-            last_error=f"No levantamento found for safra={safra}, levantamento={levantamento}",
+        raise _no_levantamentos(
+            f"No levantamento found for safra={safra}, levantamento={levantamento}"
         )
 
     target = filtered[0]
-    xlsx = await download_xlsx(target["url"])
-
-    return xlsx, target
+    return await fetch_levantamento_xlsx(target["safra"], target["levantamento"], target=target)
@@ -7,8 +7,10 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import BYTESIO_CODEC, TEXT_CODEC, read_through
 from agrobr.constants import URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.user_agents import UserAgentRotator
 
 logger = structlog.get_logger()
@@ -42,38 +44,40 @@ ACCEPT_EXCEL_HTML = (
 )
 
 
+@read_through(Fonte.CONAB, ttl="conab_custo", codec=TEXT_CODEC)
 async def fetch_custos_page() -> str:
     combined_html = ""
     headers = UserAgentRotator.get_headers(source="conab_custo")
     headers["Accept"] = ACCEPT_EXCEL_HTML
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, headers=headers, follow_redirects=True) as client:
-        for slug in _TAB_SLUGS:
-            url = f"{CUSTOS_PAGE}/{slug}"
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                combined_html += response.text
-                logger.info("conab_custo_tab_ok", slug=slug, content_length=len(response.text))
-            except httpx.HTTPError as e:
-                logger.warning("conab_custo_tab_error", slug=slug, error=str(e))
-
-        if not combined_html:
-            try:
-                response = await client.get(CUSTOS_PAGE)
-                response.raise_for_status()
-                combined_html = response.text
-                logger.info("conab_custo_page_ok", content_length=len(response.text))
-            except httpx.HTTPError as e:
-                raise SourceUnavailableError(
-                    source="conab_custo",
-                    url=CUSTOS_PAGE,
-                    last_error=str(e),
-                ) from e
+    client = ClientPool.get(Fonte.CONAB)
+    for slug in _TAB_SLUGS:
+        url = f"{CUSTOS_PAGE}/{slug}"
+        try:
+            response = await client.get(url, headers=headers, timeout=TIMEOUT)
+            response.raise_for_status()
+            combined_html += response.text
+            logger.info("conab_custo_tab_ok", slug=slug, content_length=len(response.text))
+        except httpx.HTTPError as e:
+            logger.warning("conab_custo_tab_error", slug=slug, error=str(e))
+
+    if not combined_html:
+        try:
+            response = await client.get(CUSTOS_PAGE, headers=headers, timeout=TIMEOUT)
+            response.raise_for_status()
+            combined_html = response.text
+            logger.info("conab_custo_page_ok", content_length=len(response.text))
+        except httpx.HTTPError as e:
+            raise SourceUnavailableError(
+                source="conab_custo",
+                url=CUSTOS_PAGE,
+                last_error=str(e),
+            ) from e
 
     return combined_html
 
 
+@read_through(Fonte.CONAB, ttl="conab_custo", codec=BYTESIO_CODEC)
 async def download_xlsx(url: str) -> BytesIO:
     from agrobr.http.retry import retry_on_status
 
@@ -85,28 +89,28 @@ async def download_xlsx(url: str) -> BytesIO:
     headers = UserAgentRotator.get_headers(source="conab_custo")
     headers["Accept"] = ACCEPT_EXCEL_HTML
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, headers=headers, follow_redirects=True) as client:
-        try:
-            response = await retry_on_status(
-                lambda: client.get(url),
-                source="conab_custo",
-            )
-            response.raise_for_status()
-            content = response.content
+    client = ClientPool.get(Fonte.CONAB)
+    try:
+        response = await retry_on_status(
+            lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+            source="conab_custo",
+        )
+        response.raise_for_status()
+        content = response.content
 
-            logger.info(
-                "conab_custo_download_ok",
-                url=url,
-                size_bytes=len(content),
-            )
+        logger.info(
+            "conab_custo_download_ok",
+            url=url,
+            size_bytes=len(content),
+        )
 
-            return BytesIO(content)
-        except httpx.HTTPError as e:
-            raise SourceUnavailableError(
-                source="conab_custo",
-                url=url,
-                last_error=str(e),
-            ) from e
+        return BytesIO(content)
+    except httpx.HTTPError as e:
+        raise SourceUnavailableError(
+            source="conab_custo",
+            url=url,
+            last_error=str(e),
+        ) from e
 
 
 def parse_links_from_html(html: str) -> list[dict[str, str]]:
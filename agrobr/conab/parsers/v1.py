@@ -9,8 +9,9 @@ import pandas as pd
 import structlog
 
 from agrobr import constants
+from agrobr.conab.parsers import workbook
 from agrobr.exceptions import ParseError
-from agrobr.models import Safra
+from agrobr.models import Safra, SafraRecord, records_to_frame, validate_safra_columns
 
 logger = structlog.get_logger()
 
@@ -28,6 +29,16 @@ class ConabParserV1:
         safra_ref: str | None = None,
         levantamento: int | None = None,
     ) -> list[Safra]:
+        records = self.parse_safra_records(xlsx, produto, safra_ref, levantamento)
+        return [record.to_model() for record in records]
+
+    def parse_safra_records(
+        self,
+        xlsx: BytesIO,
+        produto: str,
+        safra_ref: str | None = None,
+        levantamento: int | None = None,
+    ) -> list[SafraRecord]:
         sheet_name = constants.CONAB_PRODUTOS.get(produto.lower())
         if not sheet_name:
             raise ParseError(
@@ -36,8 +47,51 @@ class ConabParserV1:
                 reason=f"Produto não suportado: {produto}",
             )
 
+        df = self._read_sheet(xlsx, sheet_name)
+        return self._parse_safra_sheet(df, sheet_name, produto, safra_ref, levantamento)
+
+    def parse_safras(
+        self,
+        xlsx: BytesIO,
+        produtos: list[str] | None = None,
+        safra_ref: str | None = None,
+        levantamento: int | None = None,
+    ) -> dict[str, list[Safra]]:
+        produtos = produtos or list(constants.CONAB_PRODUTOS)
+        sheets: dict[str, str] = {}
+        for produto in produtos:
+            sheet_name = constants.CONAB_PRODUTOS.get(produto.lower())
+            if not sheet_name:
+                raise ParseError(
+                    source="conab",
+                    parser_version=self.version,
+                    reason=f"Produto não suportado: {produto}",
+                )
+            sheets[produto] = sheet_name
+
+        try:
+            frames = workbook.read_sheets(xlsx, sheets.values())
+        except Exception as e:
+            raise ParseError(
+                source="conab",
+                parser_version=self.version,
+                reason=f"Erro ao ler workbook: {e}",
+            ) from e
+
+        result: dict[str, list[Safra]] = {}
+        for produto, sheet_name in sheets.items():
+            if sheet_name not in frames:
+                logger.warning("conab_sheet_missing", produto=produto, sheet=sheet_name)
+                continue
+            records = self._parse_safra_sheet(
+                frames[sheet_name], sheet_name, produto, safra_ref, levantamento
+            )
+            result[produto] = [record.to_model() for record in records]
+        return result
+
+    def _read_sheet(self, xlsx: BytesIO, sheet_name: str) -> pd.DataFrame:
         try:
-            df = pd.read_excel(xlsx, sheet_name=sheet_name, header=None)
+            return workbook.read_sheet(xlsx, sheet_name)
         except Exception as e:
             raise ParseError(
                 source="conab",
@@ -45,6 +99,14 @@ class ConabParserV1:
                 reason=f"Erro ao ler aba {sheet_name}: {e}",
             ) from e
 
+    def _parse_safra_sheet(
+        self,
+        df: pd.DataFrame,
+        sheet_name: str,
+        produto: str,
+        safra_ref: str | None,
+        levantamento: int | None,
+    ) -> list[SafraRecord]:
         header_row = self._find_header_row(df)
         if header_row is None:
             raise ParseError(
@@ -53,10 +115,11 @@ class ConabParserV1:
                 reason=f"Não encontrou header na aba {sheet_name}",
             )
 
-        safras = []
+        safras: list[SafraRecord] = []
         data_row = header_row + 3
 
         safra_cols = self._extract_safra_columns(df, header_row)
+        today = date.today()
 
         for idx in range(data_row, len(df)):
             row = df.iloc[idx]
@@ -82,29 +145,30 @@ class ConabParserV1:
                 if area is None and producao is None:
                     continue
 
-                try:
-                    safra = Safra(
+                safras.append(
+                    SafraRecord(
                         fonte=constants.Fonte.CONAB,
                         produto=produto.lower(),
                         safra=safra_str,
                         uf=uf.upper() if len(uf) == 2 else None,
-                        area_plantada=area,
-                        producao=producao,
-                        produtividade=produtividade,
-                        unidade_area="mil_ha",
-                        unidade_producao="mil_ton",
+                        area_plantada=None if area is None else float(area),
+                        producao=None if producao is None else float(producao),
+                        produtividade=None if produtividade is None else float(produtividade),
                         levantamento=levantamento or 1,
-                        data_publicacao=date.today(),
+                        data_publicacao=today,
                         parser_version=self.version,
                     )
-                    safras.append(safra)
-                except Exception as e:
-                    logger.warning(
-                        "conab_parse_row_error",
-                        uf=uf,
-                        safra=safra_str,
-                        error=str(e),
-                    )
+                )
+
+        if safras:
+            valid = validate_safra_columns(records_to_frame(safras, SafraRecord))
+            if not valid.all():
+                logger.warning(
+                    "conab_parse_rows_invalid",
+                    produto=produto,
+                    count=int((~valid).sum()),
+                )
+                safras = [s for s, ok in zip(safras, valid.tolist(), strict=True) if ok]
 
         logger.info(
             "conab_parse_safra_success",
@@ -159,16 +223,7 @@ class ConabParserV1:
         xlsx: BytesIO,
         produto: str | None = None,
     ) -> list[dict[str, Any]]:
-        try:
-            if hasattr(xlsx, "seek"):
-                xlsx.seek(0)
-            df = pd.read_excel(xlsx, sheet_name="Suprimento", header=None)
-        except Exception as e:
-            raise ParseError(
-                source="conab",
-                parser_version=self.version,
-                reason=f"Erro ao ler aba Suprimento: {e}",
-            ) from e
+        df = self._read_sheet(xlsx, "Suprimento")
 
         header_row = None
         for idx, row in df.iterrows():
@@ -234,9 +289,7 @@ class ConabParserV1:
         sheet_name: str,
         produto: str,
     ) -> list[dict[str, Any]]:
-        if hasattr(xlsx, "seek"):
-            xlsx.seek(0)
-        df = pd.read_excel(xlsx, sheet_name=sheet_name, header=None)
+        df = self._read_sheet(xlsx, sheet_name)
 
         safra_row = None
         for idx, row in df.iterrows():
@@ -346,14 +399,7 @@ class ConabParserV1:
         xlsx: BytesIO,
         safra_ref: str | None = None,
     ) -> list[dict[str, Any]]:
-        try:
-            df = pd.read_excel(xlsx, sheet_name="Brasil - Total por Produto", header=None)
-        except Exception as e:
-            raise ParseError(
-                source="conab",
-                parser_version=self.version,
-                reason=f"Erro ao ler aba Brasil - Total por Produto: {e}",
-            ) from e
+        df = self._read_sheet(xlsx, "Brasil - Total por Produto")
 
         totais: list[dict[str, Any]] = []
 
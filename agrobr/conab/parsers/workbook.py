@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger()
+
+MAX_WORKBOOKS = 4
+
+
+@dataclass
+class _Workbook:
+    book: pd.ExcelFile
+    sheets: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+_workbooks: OrderedDict[str, _Workbook] = OrderedDict()
+_lock = threading.Lock()
+
+
+def workbook_digest(xlsx: BytesIO | bytes) -> str:
+    data = xlsx if isinstance(xlsx, bytes) else xlsx.getbuffer()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _open(digest: str, xlsx: BytesIO | bytes) -> _Workbook:
+    entry = _workbooks.get(digest)
+    if entry is not None:
+        _workbooks.move_to_end(digest)
+        return entry
+
+    data = xlsx if isinstance(xlsx, bytes) else xlsx.getvalue()
+    entry = _Workbook(book=pd.ExcelFile(BytesIO(data), engine="openpyxl"))
+    _workbooks[digest] = entry
+    logger.debug("conab_workbook_open", digest=digest[:12], sheets=len(entry.book.sheet_names))
+
+    while len(_workbooks) > MAX_WORKBOOKS:
+        _, evicted = _workbooks.popitem(last=False)
+        evicted.book.close()
+    return entry
+
+
+def read_sheets(xlsx: BytesIO | bytes, names: Iterable[str]) -> dict[str, pd.DataFrame]:
+    digest = workbook_digest(xlsx)
+    with _lock:
+        entry = _open(digest, xlsx)
+        result: dict[str, pd.DataFrame] = {}
+        for name in dict.fromkeys(names):
+            if name not in entry.sheets:
+                if name not in entry.book.sheet_names:
+                    continue
+                entry.sheets[name] = entry.book.parse(name, header=None)
+            result[name] = entry.sheets[name]
+        return result
+
+
+def read_sheet(xlsx: BytesIO | bytes, name: str) -> pd.DataFrame:
+    sheets = read_sheets(xlsx, [name])
+    if name not in sheets:
+        raise ValueError(f"Worksheet named '{name}' not found")
+    return sheets[name]
+
+
+def clear_cache() -> None:
+    with _lock:
+        for entry in _workbooks.values():
+            entry.book.close()
+        _workbooks.clear()
@@ -7,8 +7,10 @@ import httpx
 import structlog
 from bs4 import BeautifulSoup
 
+from agrobr.cache.read_through import BYTES_CODEC, JSON_CODEC, Codec, read_through, with_url
 from agrobr.constants import MIN_XLSX_SIZE, URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -29,6 +31,11 @@ TIMEOUT = httpx.Timeout(
 
 PAGE_SIZE = 20
 
+_WEEKS_CODEC = Codec(
+    encode=JSON_CODEC.encode,
+    decode=lambda raw: [tuple(week) for week in JSON_CODEC.decode(raw)],
+)
+
 
 def _extract_week_links(html: str) -> list[tuple[str, str]]:
     soup = BeautifulSoup(html, "lxml")
@@ -63,69 +70,71 @@ def _parse_week_date(text: str) -> str:
     return text.strip()
 
 
+@read_through(Fonte.CONAB, ttl="conab_progresso", codec=_WEEKS_CODEC)
 async def list_semanas(max_pages: int = 4) -> list[tuple[str, str]]:
     all_weeks: list[tuple[str, str]] = []
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="conab_progresso"),
-        follow_redirects=True,
-    ) as client:
-        for page in range(max_pages):
-            offset = page * PAGE_SIZE
-            url = f"{BASE_URL}?b_start:int={offset}" if offset else BASE_URL
-            logger.debug("conab_progresso_list", url=url, page=page)
-            response = await retry_on_status(partial(client.get, url), source="conab")
-            if response.status_code != 200:
-                break
-            weeks = _extract_week_links(response.text)
-            if not weeks:
-                break
-            all_weeks.extend(weeks)
+    headers = UserAgentRotator.get_headers(source="conab_progresso")
+    client = ClientPool.get(Fonte.CONAB)
+    for page in range(max_pages):
+        offset = page * PAGE_SIZE
+        url = f"{BASE_URL}?b_start:int={offset}" if offset else BASE_URL
+        logger.debug("conab_progresso_list", url=url, page=page)
+        response = await retry_on_status(
+            partial(client.get, url, headers=headers, timeout=TIMEOUT), source="conab"
+        )
+        if response.status_code != 200:
+            break
+        weeks = _extract_week_links(response.text)
+        if not weeks:
+            break
+        all_weeks.extend(weeks)
     return all_weeks
 
 
+@read_through(Fonte.CONAB, ttl="conab_progresso", codec=with_url(BYTES_CODEC))
 async def fetch_xlsx_semanal(week_url: str) -> tuple[bytes, str]:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=UserAgentRotator.get_headers(source="conab_progresso"),
-        follow_redirects=True,
-    ) as client:
-        logger.debug("conab_progresso_week", url=week_url)
-        resp = await retry_on_status(lambda: client.get(week_url), source="conab")
-        if resp.status_code != 200:
-            raise SourceUnavailableError(
-                source="conab_progresso",
-                url=week_url,
-                last_error=f"HTTP {resp.status_code}",
-            )
-
-        xlsx_url = _extract_plantio_link(resp.text)
-        if xlsx_url is None:
-            raise SourceUnavailableError(
-                source="conab_progresso",
-                url=week_url,
-                last_error="Link plantio/colheita nao encontrado na pagina semanal",
-            )
-
-        logger.debug("conab_progresso_xlsx", url=xlsx_url)
-        xlsx_resp = await retry_on_status(lambda: client.get(xlsx_url), source="conab")
-        if xlsx_resp.status_code != 200:
-            raise SourceUnavailableError(
-                source="conab_progresso",
-                url=xlsx_url,
-                last_error=f"HTTP {xlsx_resp.status_code}",
-            )
-
-        ct = xlsx_resp.headers.get("content-type", "")
-        if "spreadsheet" not in ct and "excel" not in ct and len(xlsx_resp.content) < MIN_XLSX_SIZE:
-            raise SourceUnavailableError(
-                source="conab_progresso",
-                url=xlsx_url,
-                last_error=f"Content-Type inesperado: {ct}",
-            )
-
-        logger.info("conab_progresso_xlsx_ok", url=xlsx_url, size=len(xlsx_resp.content))
-        return xlsx_resp.content, xlsx_url
+    headers = UserAgentRotator.get_headers(source="conab_progresso")
+    client = ClientPool.get(Fonte.CONAB)
+    logger.debug("conab_progresso_week", url=week_url)
+    resp = await retry_on_status(
+        lambda: client.get(week_url, headers=headers, timeout=TIMEOUT), source="conab"
+    )
+    if resp.status_code != 200:
+        raise SourceUnavailableError(
+            source="conab_progresso",
+            url=week_url,
+            last_error=f"HTTP {resp.status_code}",
+        )
+
+    xlsx_url = _extract_plantio_link(resp.text)
+    if xlsx_url is None:
+        raise SourceUnavailableError(
+            source="conab_progresso",
+            url=week_url,
+            last_error="Link plantio/colheita nao encontrado na pagina semanal",
+        )
+
+    logger.debug("conab_progresso_xlsx", url=xlsx_url)
+    xlsx_resp = await retry_on_status(
+        lambda: client.get(xlsx_url, headers=headers, timeout=TIMEOUT), source="conab"
+    )
+    if xlsx_resp.status_code != 200:
+        raise SourceUnavailableError(
+            source="conab_progresso",
+            url=xlsx_url,
+            last_error=f"HTTP {xlsx_resp.status_code}",
+        )
+
+    ct = xlsx_resp.headers.get("content-type", "")
+    if "spreadsheet" not in ct and "excel" not in ct and len(xlsx_resp.content) < MIN_XLSX_SIZE:
+        raise SourceUnavailableError(
+            source="conab_progresso",
+            url=xlsx_url,
+            last_error=f"Content-Type inesperado: {ct}",
+        )
+
+    logger.info("conab_progresso_xlsx_ok", url=xlsx_url, size=len(xlsx_resp.content))
+    return xlsx_resp.content, xlsx_url
 
 
 async def fetch_latest() -> tuple[bytes, str, str]:
@@ -6,8 +6,10 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import BYTESIO_CODEC, TEXT_CODEC, read_through, with_meta
 from agrobr.constants import URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.user_agents import UserAgentRotator
 
 logger = structlog.get_logger()
@@ -98,6 +100,7 @@ def list_produtos() -> list[dict[str, str]]:
     return result
 
 
+@read_through(Fonte.CONAB, codec=with_meta(BYTESIO_CODEC))
 async def download_xls(produto: str) -> tuple[BytesIO, dict[str, Any]]:
     from agrobr.http.retry import retry_on_status
 
@@ -107,67 +110,64 @@ async def download_xls(produto: str) -> tuple[BytesIO, dict[str, Any]]:
     headers = UserAgentRotator.get_headers(source="conab_serie")
     headers["Accept"] = ACCEPT_EXCEL
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, headers=headers, follow_redirects=True) as client:
-        try:
-            response = await retry_on_status(
-                lambda: client.get(url),
-                source="conab_serie",
-            )
-            response.raise_for_status()
-            content = response.content
-
-            logger.info(
-                "conab_serie_historica_download_ok",
-                produto=produto,
-                url=url,
-                size_bytes=len(content),
-            )
-
-            categoria, _, _ = _PRODUCT_REGISTRY.get(produto.lower().strip(), ("unknown", "", ""))
-            metadata: dict[str, Any] = {
-                "url": str(response.url),
-                "produto": produto,
-                "categoria": categoria,
-                "size_bytes": len(content),
-                "content_type": response.headers.get("content-type", ""),
-            }
+    client = ClientPool.get(Fonte.CONAB)
+    try:
+        response = await retry_on_status(
+            lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+            source="conab_serie",
+        )
+        response.raise_for_status()
+        content = response.content
+
+        logger.info(
+            "conab_serie_historica_download_ok",
+            produto=produto,
+            url=url,
+            size_bytes=len(content),
+        )
+
+        categoria, _, _ = _PRODUCT_REGISTRY.get(produto.lower().strip(), ("unknown", "", ""))
+        metadata: dict[str, Any] = {
+            "url": str(response.url),
+            "produto": produto,
+            "categoria": categoria,
+            "size_bytes": len(content),
+            "content_type": response.headers.get("content-type", ""),
+        }
 
-            return BytesIO(content), metadata
+        return BytesIO(content), metadata
 
-        except httpx.HTTPError as e:
-            raise SourceUnavailableError(
-                source="conab_serie_historica",
-                url=url,
-                last_error=str(e),
-            ) from e
+    except httpx.HTTPError as e:
+        raise SourceUnavailableError(
+            source="conab_serie_historica",
+            url=url,
+            last_error=str(e),
+        ) from e
 
 
+@read_through(Fonte.CONAB, codec=TEXT_CODEC)
 async def fetch_series_page(categoria: str = "graos") -> str:
     url = f"{SERIES_HISTORICAS_URL}/{categoria}"
 
     headers = UserAgentRotator.get_headers(source="conab_serie")
     headers["Accept"] = "text/html,*/*;q=0.8"
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT,
-        headers=headers,
-        follow_redirects=True,
-    ) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            logger.info(
-                "conab_serie_historica_page_ok",
-                categoria=categoria,
-                content_length=len(response.text),
-            )
-            return response.text
-        except httpx.HTTPError as e:
-            raise SourceUnavailableError(
-                source="conab_serie_historica",
-                url=url,
-                last_error=str(e),
-            ) from e
+    client = ClientPool.get(Fonte.CONAB)
+    try:
+        response = await client.get(url, headers=headers, timeout=TIMEOUT)
+        response.raise_for_status()
+        logger.info(
+            "conab_serie_historica_page_ok",
+            categoria=categoria,
+            content_length=len(response.text),
+        )
+        return response.text
+    except httpx.HTTPError as e:
+        raise SourceUnavailableError(
+            source="conab_serie_historica",
+            url=url,
+            last_error=str(e),
+        ) from e
 
 
 def parse_xls_links_from_html(html: str) -> list[dict[str, str]]:
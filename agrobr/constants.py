@@ -26,6 +26,7 @@ class Fonte(StrEnum):
     NOTICIAS_AGRICOLAS = "noticias_agricolas"
     DESMATAMENTO = "desmatamento"
     MAPBIOMAS = "mapbiomas"
+    MAPA_PSR = "mapa_psr"
     QUEIMADAS = "queimadas"
     SICAR = "sicar"
     USDA = "usda"
@@ -249,6 +250,7 @@ class CacheSettings(BaseSettings):
     ttl_cepea_diario: int = 4 * 3600
     ttl_cepea_semanal: int = 24 * 3600
     ttl_conab: int = 24 * 3600
+    ttl_conab_levantamento: int = 365 * 24 * 3600
     ttl_ibge_pam: int = 168 * 3600
     ttl_ibge_lspa: int = 24 * 3600
     ttl_ibge_ppm: int = 7 * 24 * 3600
@@ -271,6 +273,7 @@ class CacheSettings(BaseSettings):
     ttl_anp_diesel: int = 7 * 24 * 3600
     ttl_antaq: int = 7 * 24 * 3600
     ttl_antt_pedagio: int = 7 * 24 * 3600
+    ttl_mapa_psr: int = 7 * 24 * 3600
     ttl_sicar: int = 7 * 24 * 3600
     ttl_conab_ceasa: int = 4 * 3600
 
@@ -283,6 +286,14 @@ class CacheSettings(BaseSettings):
     cache_max_age_days: int = 30
     history_max_age_days: int = 0
 
+    max_size_mb: int = 0
+    source_max_mb: dict[str, int] = {}
+    eviction_policy: str = "lru"
+    maintenance_interval: int = 3600
+
+    compression: str = "auto"
+    compression_min_bytes: int = 4096
+
     model_config = SettingsConfigDict(env_prefix="AGROBR_CACHE_")
 
 
@@ -292,6 +303,15 @@ class HTTPSettings(BaseSettings):
     timeout_write: float = 10.0
     timeout_pool: float = 10.0
 
+    http2: bool = False
+    pool_max_connections: int = 10
+    pool_max_keepalive: int = 5
+    pool_keepalive_expiry: float = 30.0
+
+    max_concurrency: int = 4
+    parse_processes: int = 0
+    parse_min_bytes: int = 8 * 1024 * 1024
+
     max_retries: int = 3
     retry_base_delay: float = 1.0
     retry_max_delay: float = 30.0
@@ -315,12 +335,17 @@ class HTTPSettings(BaseSettings):
     rate_limit_noticias_agricolas: float = 2.0
     rate_limit_desmatamento: float = 2.0
     rate_limit_mapbiomas: float = 2.0
+    rate_limit_mapa_psr: float = 2.0
     rate_limit_queimadas: float = 1.0
     rate_limit_sicar: float = 2.0
     rate_limit_usda: float = 1.0
     rate_limit_b3: float = 1.0
     rate_limit_conab_ceasa: float = 2.0
     rate_limit_default: float = 1.0
+    rate_limit_burst: int = 1
+    rate_limit_concurrency: int = 4
+    rate_limit_source_burst: dict[str, int] = {}
+    rate_limit_source_concurrency: dict[str, int] = {}
 
     model_config = SettingsConfigDict(env_prefix="AGROBR_HTTP_")
 
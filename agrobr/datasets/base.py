@@ -93,6 +93,76 @@ class BaseDataset(ABC):
         if has_contract(self.info.name):
             validate_dataset(df, self.info.name)
 
+    async def _fetch_periods(
+        self,
+        produto: str,
+        period_column: str,
+        periods: list[Any],
+        normalize: Callable[[pd.DataFrame], pd.DataFrame],
+        **kwargs: Any,
+    ) -> tuple[pd.DataFrame, str, Any, list[str]]:
+        df, source_name, meta, attempted = await self._try_sources(
+            produto, **{period_column: periods if len(periods) != 1 else periods[0]}, **kwargs
+        )
+        df = normalize(df)
+        self._validate_contract(df)
+        return df, source_name, meta, attempted
+
+    async def _fetch_incremental(
+        self,
+        produto: str,
+        period_column: str,
+        periods: list[Any],
+        scope: dict[str, Any],
+        is_final: Callable[[Any], bool],
+        normalize: Callable[[pd.DataFrame], pd.DataFrame],
+        **kwargs: Any,
+    ) -> tuple[pd.DataFrame, str, Any, list[str]]:
+        import pandas as pd
+
+        from agrobr.cache.duckdb_store import get_store
+        from agrobr.cache.read_through import DATAFRAME_CODEC
+
+        name = self.info.name
+        source_name, meta = "local", None
+        attempted: list[str] = []
+
+        try:
+            store = get_store()
+            stored = store.facts_loaded_frames(name, scope, [p for p in periods if is_final(p)])
+        except Exception as e:
+            logger.warning("facts_store_unavailable", dataset=name, error=str(e))
+            return await self._fetch_periods(produto, period_column, periods, normalize, **kwargs)
+
+        parts = [DATAFRAME_CODEC.decode(stored[str(p)]) for p in periods if str(p) in stored]
+        missing = [p for p in periods if str(p) not in stored]
+        if missing:
+            df, source_name, meta, attempted = await self._fetch_periods(
+                produto, period_column, missing, normalize, **kwargs
+            )
+            parts.append(df)
+            final = [p for p in missing if is_final(p)]
+            try:
+                store.facts_upsert(name, df)
+                by_period = df[period_column].astype(str)
+                frames = {
+                    str(p): DATAFRAME_CODEC.encode(df[by_period == str(p)].reset_index(drop=True))
+                    for p in final
+                }
+                store.facts_mark_loaded(name, scope, final, frames)
+            except Exception as e:
+                logger.warning("facts_upsert_failed", dataset=name, error=str(e))
+
+        df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        logger.info(
+            "dataset_incremental",
+            dataset=name,
+            periods=len(periods),
+            fetched=len(missing),
+            rows=len(df),
+        )
+        return df, source_name, meta, attempted
+
     async def _try_sources(
         self,
         produto: str,
@@ -29,9 +29,13 @@ async def _fetch_comexstat(produto: str, **kwargs: Any) -> tuple[pd.DataFrame, M
 async def _fetch_abiove(produto: str, **kwargs: Any) -> tuple[pd.DataFrame, MetaInfo | None]:
     from agrobr import abiove
 
-    ano: int = kwargs.get("ano", datetime.now(UTC).year)
+    ano: int | list[int] = kwargs.get("ano") or datetime.now(UTC).year
     mes: int | None = kwargs.get("mes")
 
+    if isinstance(ano, list):
+        partes = [await _fetch_abiove(produto, ano=a, mes=mes) for a in ano]
+        return pd.concat([df for df, _ in partes], ignore_index=True), partes[-1][1]
+
     result = await abiove.exportacao(ano=ano, mes=mes, produto=produto, return_meta=True)
 
     if isinstance(result, tuple):
@@ -82,7 +86,7 @@ class ExportacaoDataset(BaseDataset):
     async def fetch(  # type: ignore[override]
         self,
         produto: str,
-        ano: int | None = None,
+        ano: int | list[int] | None = None,
         uf: str | None = None,
         return_meta: bool = False,
         **kwargs: Any,
@@ -93,12 +97,25 @@ class ExportacaoDataset(BaseDataset):
         if snapshot and ano is None:
             ano = int(snapshot[:4])
 
-        df, source_name, source_meta, attempted = await self._try_sources(
-            produto, ano=ano, uf=uf, **kwargs
-        )
-
-        df = self._normalize(df, produto)
-        self._validate_contract(df)
+        if kwargs:
+            df, source_name, source_meta, attempted = await self._try_sources(
+                produto, ano=ano, uf=uf, **kwargs
+            )
+            df = self._normalize(df, produto)
+            self._validate_contract(df)
+        else:
+            ano_atual = datetime.now(UTC).year
+            anos = [ano_atual if ano is None else ano] if not isinstance(ano, list) else ano
+            self._validate_produto(produto)
+            df, source_name, source_meta, attempted = await self._fetch_incremental(
+                produto,
+                "ano",
+                anos,
+                {"produto": produto, "uf": uf.upper() if uf else None},
+                lambda a: a < ano_atual,
+                lambda raw: self._normalize(raw, produto),
+                uf=uf,
+            )
 
         if return_meta:
             now = datetime.now(UTC)
@@ -109,7 +126,7 @@ class ExportacaoDataset(BaseDataset):
                 fetched_at=source_meta.fetched_at if source_meta else now,
                 records_count=len(df),
                 columns=df.columns.tolist(),
-                from_cache=False,
+                from_cache=source_name == "local",
                 parser_version=source_meta.parser_version if source_meta else 1,
                 dataset="exportacao",
                 contract_version=self.info.contract_version,
@@ -138,7 +155,7 @@ register(_exportacao)
 
 async def exportacao(
     produto: str,
-    ano: int | None = None,
+    ano: int | list[int] | None = None,
     uf: str | None = None,
     return_meta: bool = False,
     **kwargs: Any,
@@ -47,16 +47,15 @@ async def _fetch_cache(produto: str, **kwargs: Any) -> tuple[pd.DataFrame, None]
     elif isinstance(fim, date):
         fim = datetime.combine(fim, datetime.max.time())
 
-    indicadores = store.indicadores_query(
+    df = store.indicadores_frame(
         produto=produto,
         inicio=inicio,
         fim=fim,
     )
 
-    if not indicadores:
+    if df.empty:
         raise ValueError(f"No cached data for {produto}")
 
-    df = pd.DataFrame(indicadores)
     df["data"] = pd.to_datetime(df["data"])
 
     return df, None
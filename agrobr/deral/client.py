@@ -3,8 +3,10 @@ from __future__ import annotations
 import httpx
 import structlog
 
+from agrobr.cache.read_through import read_through
 from agrobr.constants import MIN_XLSX_SIZE, URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -22,39 +24,39 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.DERAL)
 async def _fetch_bytes(url: str) -> bytes:
     headers = UserAgentRotator.get_bot_headers()
     headers["Accept"] = (
         "application/vnd.ms-excel, application/vnd.openxmlformats-officedocument.spreadsheetml.sheet, */*"
     )
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, headers=headers, follow_redirects=True) as client:
-        logger.debug("deral_request", url=url)
-        response = await retry_on_status(
-            lambda: client.get(url),
+    client = ClientPool.get(Fonte.DERAL)
+    logger.debug("deral_request", url=url)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="deral",
+    )
+
+    if response.status_code == 404:
+        raise SourceUnavailableError(
             source="deral",
+            url=url,
+            last_error="Arquivo não encontrado (404)",
         )
 
-        if response.status_code == 404:
-            raise SourceUnavailableError(
-                source="deral",
-                url=url,
-                last_error="Arquivo não encontrado (404)",
-            )
-
-        response.raise_for_status()
-
-        content = response.content
-        if len(content) < MIN_XLSX_SIZE:
-            raise SourceUnavailableError(
-                source="deral",
-                url=url,
-                last_error=(
-                    f"Downloaded file too small ({len(content)} bytes), "
-                    f"expected a valid spreadsheet"
-                ),
-            )
-        return content
+    response.raise_for_status()
+
+    content = response.content
+    if len(content) < MIN_XLSX_SIZE:
+        raise SourceUnavailableError(
+            source="deral",
+            url=url,
+            last_error=(
+                f"Downloaded file too small ({len(content)} bytes), expected a valid spreadsheet"
+            ),
+        )
+    return content
 
 
 async def fetch_pc_xls() -> bytes:
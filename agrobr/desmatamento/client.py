@@ -5,8 +5,10 @@ from urllib.parse import quote
 import httpx
 import structlog
 
+from agrobr.cache.read_through import read_through
 from agrobr.constants import MIN_WFS_SIZE, URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -57,31 +59,31 @@ def _build_wfs_url(
     return url
 
 
+@read_through(Fonte.DESMATAMENTO)
 async def _fetch_url(url: str) -> bytes:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as client:
-        logger.debug("desmatamento_request", url=url)
-        response = await retry_on_status(
-            lambda: client.get(url),
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.DESMATAMENTO)
+    logger.debug("desmatamento_request", url=url)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="desmatamento",
+    )
+
+    if response.status_code == 404:
+        raise SourceUnavailableError(source="desmatamento", url=url, last_error="HTTP 404")
+
+    response.raise_for_status()
+
+    content = response.content
+    if len(content) < MIN_WFS_SIZE:
+        raise SourceUnavailableError(
             source="desmatamento",
+            url=url,
+            last_error=(
+                f"CSV response too small ({len(content)} bytes), expected WFS feature data"
+            ),
         )
-
-        if response.status_code == 404:
-            raise SourceUnavailableError(source="desmatamento", url=url, last_error="HTTP 404")
-
-        response.raise_for_status()
-
-        content = response.content
-        if len(content) < MIN_WFS_SIZE:
-            raise SourceUnavailableError(
-                source="desmatamento",
-                url=url,
-                last_error=(
-                    f"CSV response too small ({len(content)} bytes), expected WFS feature data"
-                ),
-            )
-        return content
+    return content
 
 
 async def fetch_prodes(
@@ -35,6 +35,7 @@ async def check_cepea() -> CheckResult:
     from agrobr.cepea import client as cepea_client
     from agrobr.cepea.parsers import fingerprint as fp
     from agrobr.cepea.parsers.detector import get_parser_with_fallback
+    from agrobr.cepea.parsers.document import parse_document
 
     start = time.monotonic()
     details: dict[str, Any] = {}
@@ -57,7 +58,8 @@ async def check_cepea() -> CheckResult:
                 timestamp=datetime.utcnow(),
             )
 
-        current_fp = fp.extract_fingerprint(html, Fonte.CEPEA, "health_check")
+        doc = parse_document(html)
+        current_fp = fp.extract_fingerprint(doc, Fonte.CEPEA, "health_check")
         baseline_fp = fp.load_baseline_fingerprint(".structures/baseline.json")
 
         if baseline_fp:
@@ -77,7 +79,7 @@ async def check_cepea() -> CheckResult:
             elif similarity < 0.85:
                 details["warning"] = "Fingerprint drift detected"
 
-        parser, results = await get_parser_with_fallback(html, "soja")
+        parser, results = await get_parser_with_fallback(doc, "soja")
         details["parser_version"] = parser.version
         details["records_parsed"] = len(results)
 
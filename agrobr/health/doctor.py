@@ -33,6 +33,8 @@ class CacheStats:
     size_bytes: int
     total_records: int
     by_source: dict[str, dict[str, Any]] = field(default_factory=dict)
+    cache_entries: int = 0
+    cache_hits: int = 0
 
 
 @dataclass
@@ -65,6 +67,8 @@ class DiagnosticsResult:
                 "size_mb": round(self.cache.size_bytes / 1024 / 1024, 2),
                 "total_records": self.cache.total_records,
                 "by_source": self.cache.by_source,
+                "cache_entries": self.cache.cache_entries,
+                "cache_hits": self.cache.cache_hits,
             },
             "last_collections": {
                 k: v.isoformat() if v else None for k, v in self.last_collections.items()
@@ -103,6 +107,7 @@ class DiagnosticsResult:
                 f"  Location:      {self.cache.location}",
                 f"  Size:          {self.cache.size_bytes / 1024 / 1024:.2f} MB",
                 f"  Total records: {self.cache.total_records:,}",
+                f"  Cache entries: {self.cache.cache_entries:,} ({self.cache.cache_hits:,} hits)",
                 "",
                 "  By source:",
             ]
@@ -214,11 +219,20 @@ def _get_cache_stats() -> CacheStats:
 
         total_records = sum(s.get("count", 0) for s in by_source.values())
 
+        entries = hits = 0
+        try:
+            stats = store.cache_stats()
+            entries, hits = stats["entries"], stats["hits"]
+        except Exception:
+            logger.warning("cache_stats_entries_failed", exc_info=True)
+
         return CacheStats(
             location=str(cache_path),
             size_bytes=size_bytes,
             total_records=total_records,
             by_source=by_source,
+            cache_entries=entries,
+            cache_hits=hits,
         )
 
     except Exception as e:
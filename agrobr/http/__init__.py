@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from agrobr.http.rate_limiter import RateLimiter
+from agrobr.http.fanout import fetch_all, fetch_pages, parse_all
+from agrobr.http.pool import ClientPool
+from agrobr.http.rate_limiter import RateLimiter, RateLimitMetrics
 from agrobr.http.retry import retry_async, with_retry
 from agrobr.http.settings import get_client_kwargs, get_rate_limit, get_timeout
 from agrobr.http.user_agents import UserAgentRotator, get_bot_ua
 
 __all__ = [
+    "ClientPool",
+    "RateLimitMetrics",
     "RateLimiter",
     "UserAgentRotator",
+    "fetch_all",
+    "fetch_pages",
     "get_bot_ua",
     "get_client_kwargs",
     "get_rate_limit",
     "get_timeout",
+    "parse_all",
     "retry_async",
     "with_retry",
 ]
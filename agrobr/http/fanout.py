@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, TypeVar
+
+import structlog
+
+from agrobr import constants
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+R = TypeVar("R")
+P = TypeVar("P")
+
+_executor: ProcessPoolExecutor | None = None
+
+
+async def fetch_all(
+    source: constants.Fonte,
+    items: Iterable[T],
+    fetch: Callable[[T], Awaitable[R]],
+    *,
+    max_concurrency: int | None = None,
+) -> list[R]:
+    items = list(items)
+    if not items:
+        return []
+
+    limit = max(1, max_concurrency or constants.HTTPSettings().max_concurrency)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(item: T) -> R:
+        async with semaphore:
+            return await fetch(item)
+
+    logger.debug("http_fanout", source=source.value, items=len(items), concurrency=limit)
+
+    tasks = [asyncio.ensure_future(_run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def fetch_pages(
+    source: constants.Fonte,
+    fetch_page: Callable[[int], Awaitable[P]],
+    *,
+    total_pages: int | None = None,
+    is_last: Callable[[P], bool] | None = None,
+    start: int = 0,
+    max_concurrency: int | None = None,
+) -> AsyncIterator[tuple[int, P]]:
+    if total_pages is None and is_last is None:
+        raise ValueError("fetch_pages precisa de total_pages ou is_last")
+
+    limit = max(1, max_concurrency or constants.HTTPSettings().max_concurrency)
+    pending: dict[int, asyncio.Future[P]] = {}
+    next_page = start
+    current = start
+
+    logger.debug(
+        "http_pages", source=source.value, start=start, total_pages=total_pages, concurrency=limit
+    )
+
+    try:
+        while total_pages is None or current < total_pages:
+            while len(pending) < limit and (total_pages is None or next_page < total_pages):
+                pending[next_page] = asyncio.ensure_future(fetch_page(next_page))
+                next_page += 1
+
+            try:
+                page = await pending.pop(current)
+            except Exception:
+                logger.warning("http_page_failed", source=source.value, page=current)
+                raise
+
+            yield current, page
+
+            if is_last is not None and is_last(page):
+                break
+            current += 1
+    finally:
+        for task in pending.values():
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=workers)
+    return _executor
+
+
+def shutdown_parse_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def parse_all(
+    func: Callable[..., R],
+    payloads: Sequence[bytes | str],
+    **kwargs: Any,
+) -> list[R]:
+    settings = constants.HTTPSettings()
+    workers = min(settings.parse_processes or os.cpu_count() or 1, len(payloads))
+    total_bytes = sum(len(p) for p in payloads)
+
+    if workers < 2 or total_bytes < settings.parse_min_bytes:
+        return [func(p, **kwargs) for p in payloads]
+
+    loop = asyncio.get_running_loop()
+    executor = _get_executor(settings.parse_processes or os.cpu_count() or 1)
+    logger.debug("parse_process_pool", func=func.__name__, payloads=len(payloads))
+
+    try:
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, partial(func, p, **kwargs)) for p in payloads)
+            )
+        )
+    except BrokenProcessPool as e:
+        logger.warning("parse_process_pool_broken", func=func.__name__, error=str(e))
+        shutdown_parse_pool()
+        return [func(p, **kwargs) for p in payloads]
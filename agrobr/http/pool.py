@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import ssl
+from weakref import WeakKeyDictionary
+
+import httpx
+import structlog
+
+from agrobr import constants
+from agrobr.http.settings import get_timeout
+
+logger = structlog.get_logger()
+
+_PoolKey = tuple[str, object]
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ClientPool:
+    _clients: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_PoolKey, httpx.AsyncClient]] = (
+        WeakKeyDictionary()
+    )
+
+    @classmethod
+    def _build(
+        cls,
+        source: constants.Fonte | str,
+        verify: bool | ssl.SSLContext,
+    ) -> httpx.AsyncClient:
+        settings = constants.HTTPSettings()
+        http2 = settings.http2 and _http2_available()
+        if settings.http2 and not http2:
+            logger.warning("http2_unavailable", source=str(source), hint="pip install h2")
+
+        logger.debug("http_pool_client_created", source=str(source), http2=http2)
+        return httpx.AsyncClient(
+            timeout=get_timeout(settings),
+            limits=httpx.Limits(
+                max_connections=settings.pool_max_connections,
+                max_keepalive_connections=settings.pool_max_keepalive,
+                keepalive_expiry=settings.pool_keepalive_expiry,
+            ),
+            http2=http2,
+            verify=verify,
+            follow_redirects=True,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        source: constants.Fonte | str,
+        *,
+        verify: bool | ssl.SSLContext = True,
+    ) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        clients = cls._clients.setdefault(loop, {})
+        key: _PoolKey = (str(source), verify if isinstance(verify, bool) else id(verify))
+
+        client = clients.get(key)
+        if client is None or client.is_closed is True:
+            client = cls._build(source, verify)
+            clients[key] = client
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        clients = cls._clients.pop(loop, {})
+        for client in clients.values():
+            await client.aclose()
+
+        if clients:
+            logger.debug("http_pool_closed", clients=len(clients))
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._clients.clear()
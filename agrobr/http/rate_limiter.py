@@ -4,6 +4,9 @@ import asyncio
 import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from weakref import WeakKeyDictionary
 
 import structlog
 
@@ -11,62 +14,183 @@ from agrobr import constants
 
 logger = structlog.get_logger()
 
+MAX_PENALTY = 5
+
+_held: ContextVar[frozenset[str]] = ContextVar("rate_limit_held", default=frozenset())
+
+
+@dataclass
+class RateLimitMetrics:
+    requests: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    in_flight: int = 0
+    throttled: int = 0
+
+
+@dataclass
+class _Bucket:
+    delay: float
+    burst: int
+    concurrency: int
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    penalty: int = 0
+
+    @property
+    def interval(self) -> float:
+        return float(self.delay * 2**self.penalty)
+
+    def reserve(self, now: float) -> float:
+        if self.delay <= 0:
+            return max(0.0, self.blocked_until - now)
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+        self.updated = now
+        self.tokens -= 1
+
+        wait = -self.tokens * self.interval if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
 
 class RateLimiter:
-    _semaphores: dict[str, asyncio.Semaphore] = {}
-    _last_request: dict[str, float] = {}
-    _lock = asyncio.Lock()
+    _buckets: dict[str, _Bucket] = {}
+    _metrics: dict[str, RateLimitMetrics] = {}
+    _semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+        WeakKeyDictionary()
+    )
 
     @classmethod
-    def _get_delay(cls, source: constants.Fonte) -> float:
+    def _get_delay(cls, source: constants.Fonte | str) -> float:
         settings = constants.HTTPSettings()
-        delays = {
-            constants.Fonte.ABIOVE: settings.rate_limit_abiove,
-            constants.Fonte.ANDA: settings.rate_limit_anda,
-            constants.Fonte.BCB: settings.rate_limit_bcb,
-            constants.Fonte.CEPEA: settings.rate_limit_cepea,
-            constants.Fonte.COMEXSTAT: settings.rate_limit_comexstat,
-            constants.Fonte.CONAB: settings.rate_limit_conab,
-            constants.Fonte.DERAL: settings.rate_limit_deral,
-            constants.Fonte.IBGE: settings.rate_limit_ibge,
-            constants.Fonte.IMEA: settings.rate_limit_imea,
-            constants.Fonte.INMET: settings.rate_limit_inmet,
-            constants.Fonte.NASA_POWER: settings.rate_limit_nasa_power,
-            constants.Fonte.NOTICIAS_AGRICOLAS: settings.rate_limit_noticias_agricolas,
-            constants.Fonte.USDA: settings.rate_limit_usda,
-        }
-        return delays.get(source, 1.0)
+        delay: float = getattr(settings, f"rate_limit_{source}", settings.rate_limit_default)
+        return delay
+
+    @classmethod
+    def _bucket(cls, source: constants.Fonte | str) -> _Bucket:
+        key = str(source)
+        bucket = cls._buckets.get(key)
+        if bucket is None:
+            settings = constants.HTTPSettings()
+            burst = max(1, settings.rate_limit_source_burst.get(key, settings.rate_limit_burst))
+            concurrency = max(
+                1,
+                settings.rate_limit_source_concurrency.get(key, settings.rate_limit_concurrency),
+            )
+            bucket = _Bucket(
+                delay=cls._get_delay(source),
+                burst=burst,
+                concurrency=concurrency,
+                tokens=float(burst),
+                updated=time.monotonic(),
+            )
+            cls._buckets[key] = bucket
+        return bucket
+
+    @classmethod
+    def _semaphore(cls, key: str, bucket: _Bucket) -> asyncio.Semaphore:
+        semaphores = cls._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(bucket.concurrency)
+        return semaphores[key]
+
+    @classmethod
+    def _metric(cls, key: str) -> RateLimitMetrics:
+        return cls._metrics.setdefault(key, RateLimitMetrics())
+
+    @classmethod
+    async def _take(cls, key: str, bucket: _Bucket, started: float) -> None:
+        wait_time = bucket.reserve(time.monotonic())
+        if wait_time > 0:
+            logger.debug("rate_limit_wait", source=key, wait_seconds=wait_time)
+            await asyncio.sleep(wait_time)
+
+        metric = cls._metric(key)
+        waited = time.monotonic() - started
+        metric.requests += 1
+        metric.wait_seconds += waited
+        metric.max_wait_seconds = max(metric.max_wait_seconds, waited)
+
+    @classmethod
+    @asynccontextmanager
+    async def _queued(cls, key: str) -> AsyncIterator[None]:
+        metric = cls._metric(key)
+        metric.queue_depth += 1
+        metric.max_queue_depth = max(metric.max_queue_depth, metric.queue_depth)
+        try:
+            yield
+        finally:
+            metric.queue_depth -= 1
 
     @classmethod
     @asynccontextmanager
-    async def acquire(cls, source: constants.Fonte) -> AsyncIterator[None]:
-        source_key = source.value
-
-        async with cls._lock:
-            if source_key not in cls._semaphores:
-                cls._semaphores[source_key] = asyncio.Semaphore(1)
-
-        async with cls._semaphores[source_key]:
-            now = time.monotonic()
-            last = cls._last_request.get(source_key, 0)
-            delay = cls._get_delay(source)
-            elapsed = now - last
-
-            if elapsed < delay:
-                wait_time = delay - elapsed
-                logger.debug(
-                    "rate_limit_wait",
-                    source=source_key,
-                    wait_seconds=wait_time,
-                )
-                await asyncio.sleep(wait_time)
+    async def acquire(cls, source: constants.Fonte | str) -> AsyncIterator[None]:
+        key = str(source)
+        bucket = cls._bucket(source)
+        metric = cls._metric(key)
+        started = time.monotonic()
 
+        semaphore = cls._semaphore(key, bucket)
+        async with cls._queued(key):
+            await semaphore.acquire()
+        try:
+            async with cls._queued(key):
+                await cls._take(key, bucket, started)
+
+            metric.in_flight += 1
+            token = _held.set(_held.get() | {key})
             try:
                 yield
             finally:
-                cls._last_request[source_key] = time.monotonic()
+                _held.reset(token)
+                metric.in_flight -= 1
+        finally:
+            semaphore.release()
+
+    @classmethod
+    async def wait(cls, source: constants.Fonte | str) -> None:
+        key = str(source)
+        if key in _held.get():
+            return
+
+        async with cls._queued(key):
+            await cls._take(key, cls._bucket(source), time.monotonic())
+
+    @classmethod
+    def throttle(cls, source: constants.Fonte | str, retry_after: float | None = None) -> None:
+        key = str(source)
+        bucket = cls._bucket(source)
+        bucket.penalty = min(bucket.penalty + 1, MAX_PENALTY)
+
+        pause = retry_after if retry_after is not None else bucket.interval
+        now = time.monotonic()
+        bucket.blocked_until = max(bucket.blocked_until, now + pause)
+        bucket.tokens = min(bucket.tokens, 0.0)
+        bucket.updated = now
+        cls._metric(key).throttled += 1
+
+        logger.warning(
+            "rate_limit_throttled",
+            source=key,
+            pause_seconds=pause,
+            interval_seconds=bucket.interval,
+        )
+
+    @classmethod
+    def record_success(cls, source: constants.Fonte | str) -> None:
+        bucket = cls._buckets.get(str(source))
+        if bucket is not None and bucket.penalty > 0:
+            bucket.penalty -= 1
+
+    @classmethod
+    def metrics(cls) -> dict[str, RateLimitMetrics]:
+        return {key: replace(metric) for key, metric in cls._metrics.items()}
 
     @classmethod
     def reset(cls) -> None:
+        cls._buckets.clear()
+        cls._metrics.clear()
         cls._semaphores.clear()
-        cls._last_request.clear()
@@ -9,6 +9,7 @@ import httpx
 import structlog
 
 from agrobr import constants
+from agrobr.http.rate_limiter import RateLimiter
 
 logger = structlog.get_logger()
 T = TypeVar("T")
@@ -95,8 +96,16 @@ async def retry_on_status(
 
     last_response: httpx.Response | None = None
 
+    await RateLimiter.wait(source)
+
     for attempt in range(_max):
         response = await func()
+        retry_after = _extract_retry_after(response)
+
+        if response.status_code == 429 or retry_after is not None:
+            RateLimiter.throttle(source, retry_after)
+        elif not should_retry_status(response.status_code):
+            RateLimiter.record_success(source)
 
         if not should_retry_status(response.status_code):
             return response
@@ -105,7 +114,6 @@ async def retry_on_status(
 
         if attempt < _max - 1:
             delay = min(_base * (settings.retry_exponential_base**attempt), _cap)
-            retry_after = _extract_retry_after(response)
             if retry_after is not None:
                 delay = min(retry_after, _cap)
             logger.warning(
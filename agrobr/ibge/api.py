@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from datetime import datetime
 from typing import Literal, overload
@@ -10,6 +11,7 @@ import structlog
 from agrobr import constants
 from agrobr.cache.keys import build_cache_key
 from agrobr.cache.policies import calculate_expiry
+from agrobr.cache.single_flight import single_flight
 from agrobr.ibge import client
 from agrobr.models import MetaInfo
 
@@ -60,6 +62,7 @@ async def pam(
 ) -> tuple[pd.DataFrame, MetaInfo]: ...
 
 
+@single_flight("ibge:pam")
 async def pam(
     produto: str,
     ano: int | str | list[int] | None = None,
@@ -262,16 +265,21 @@ async def lspa(
     territorial_level = "3" if uf else "1"
     ibge_code = client.uf_to_ibge_code(uf) if uf else "all"
 
-    frames: list[pd.DataFrame] = []
-    for sub_nome, sub_cod in sub_produtos:
-        sub_df = await client.fetch_sidra(
-            table_code=client.TABELAS["lspa"],
-            territorial_level=territorial_level,
-            ibge_territorial_code=ibge_code,
-            period=period,
-            classifications={"48": sub_cod},
+    sub_dfs = await asyncio.gather(
+        *(
+            client.fetch_sidra(
+                table_code=client.TABELAS["lspa"],
+                territorial_level=territorial_level,
+                ibge_territorial_code=ibge_code,
+                period=period,
+                classifications={"48": sub_cod},
+            )
+            for _, sub_cod in sub_produtos
         )
+    )
 
+    frames: list[pd.DataFrame] = []
+    for (sub_nome, _), sub_df in zip(sub_produtos, sub_dfs, strict=True):
         sub_df = client.parse_sidra_response(sub_df)
 
         sub_df["ano"] = ano
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
+import asyncio
+import ssl
+from functools import partial
 from typing import Any
 
+import httpx
 import pandas as pd
 import sidrapy
 import structlog
 
 from agrobr import constants
+from agrobr.cache.read_through import DATAFRAME_CODEC, cached_fetch
+from agrobr.http.pool import ClientPool
 from agrobr.http.rate_limiter import RateLimiter
+from agrobr.http.user_agents import UserAgentRotator
 
 logger = structlog.get_logger()
 
+API_URL = constants.URLS[constants.Fonte.IBGE]["api"]
+
+_settings = constants.HTTPSettings()
+
+TIMEOUT = httpx.Timeout(
+    connect=_settings.timeout_connect,
+    read=120.0,
+    write=_settings.timeout_write,
+    pool=_settings.timeout_pool,
+)
+
+_ssl_ctx = ssl.create_default_context()
+_ssl_ctx.options |= getattr(ssl, "OP_LEGACY_SERVER_CONNECT", 0x4)
+
 TABELAS = {
     "pam_temporarias": "1612",
     "pam_permanentes": "1613",
@@ -172,6 +193,14 @@ PRODUTOS_LSPA = {
     "triticale": "109185",
 }
 
+TTL_POR_TABELA: dict[str, str] = {
+    **dict.fromkeys(("1612", "1613", "5457"), "ibge_pam"),
+    **dict.fromkeys(("6588", "1618"), "ibge_lspa"),
+    **dict.fromkeys(("3939", "74"), "ibge_ppm"),
+    **dict.fromkeys(TABELAS_ABATE.values(), "ibge_abate"),
+    **dict.fromkeys(TABELAS_CENSO_AGRO.values(), "ibge_censo_agro"),
+}
+
 
 async def fetch_sidra(
     table_code: str,
@@ -181,6 +210,34 @@ async def fetch_sidra(
     period: str | list[str] | None = None,
     classifications: dict[str, str | list[str]] | None = None,
     header: str = "n",
+) -> pd.DataFrame:
+    params = {
+        "table_code": table_code,
+        "territorial_level": territorial_level,
+        "ibge_territorial_code": ibge_territorial_code,
+        "variable": variable,
+        "period": period,
+        "classifications": classifications,
+        "header": header,
+    }
+    return await cached_fetch(
+        constants.Fonte.IBGE,
+        "ibge.client.fetch_sidra",
+        params,
+        lambda: _fetch_sidra(**params),  # type: ignore[arg-type]
+        ttl=TTL_POR_TABELA.get(table_code),
+        codec=DATAFRAME_CODEC,
+    )
+
+
+async def _fetch_sidra(
+    table_code: str,
+    territorial_level: str = "1",
+    ibge_territorial_code: str = "all",
+    variable: str | list[str] | None = None,
+    period: str | list[str] | None = None,
+    classifications: dict[str, str | list[str]] | None = None,
+    header: str = "n",
 ) -> pd.DataFrame:
     logger.info(
         "ibge_fetch_start",
@@ -215,10 +272,10 @@ async def fetch_sidra(
         from agrobr.http.retry import retry_async
 
         async def _do_fetch() -> pd.DataFrame:
-            df = sidrapy.get_table(**kwargs)
+            df = await _get_table(kwargs)
             if header == "n" and len(df) > 1:
                 df = df.iloc[1:].reset_index(drop=True)
-            return pd.DataFrame(df)
+            return df
 
         df = await retry_async(
             _do_fetch,
@@ -234,6 +291,50 @@ async def fetch_sidra(
         return df
 
 
+def build_sidra_url(
+    table_code: str,
+    territorial_level: str,
+    ibge_territorial_code: str,
+    variable: str | None = None,
+    period: str | None = None,
+    classifications: dict[str, str | list[str]] | None = None,
+    header: str | None = None,
+) -> str:
+    url = f"{API_URL}/values/t/{table_code}/n{territorial_level}/{ibge_territorial_code}"
+    if header:
+        url += f"/h/{header}"
+    if period:
+        url += f"/p/{period}"
+    if variable:
+        url += f"/v/{variable}"
+    for classificacao, categorias in (classifications or {}).items():
+        if isinstance(categorias, list):
+            categorias = ",".join(categorias)
+        url += f"/c{classificacao}/{categorias}"
+    return url
+
+
+async def _get_table(kwargs: dict[str, Any]) -> pd.DataFrame:
+    url = build_sidra_url(**kwargs)
+    client = ClientPool.get(constants.Fonte.IBGE, verify=_ssl_ctx)
+    logger.debug("ibge_sidra_request", url=url)
+
+    try:
+        response = await client.get(
+            url, headers=UserAgentRotator.get_bot_headers(), timeout=TIMEOUT
+        )
+    except httpx.ConnectError as e:
+        logger.warning("ibge_sidra_connect_failed_fallback_sidrapy", url=url, error=str(e))
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, partial(sidrapy.get_table, **kwargs))
+        return pd.DataFrame(data)
+
+    if not response.is_success:
+        raise ValueError(response.text)
+
+    return pd.DataFrame.from_records(response.json())
+
+
 def parse_sidra_response(
     df: pd.DataFrame,
     rename_columns: dict[str, str] | None = None,
@@ -5,7 +5,9 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import JSON_CODEC, read_through
 from agrobr.constants import URLS, Fonte, HTTPSettings
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -23,19 +25,19 @@ TIMEOUT = httpx.Timeout(
 )
 
 
+@read_through(Fonte.IMEA, codec=JSON_CODEC)
 async def _fetch_json(url: str) -> list[dict[str, Any]]:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as client:
-        logger.debug("imea_request", url=url)
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="imea",
-        )
-
-        response.raise_for_status()
-        data = response.json()
-        return data if isinstance(data, list) else []
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.IMEA)
+    logger.debug("imea_request", url=url)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="imea",
+    )
+
+    response.raise_for_status()
+    data = response.json()
+    return data if isinstance(data, list) else []
 
 
 async def fetch_cotacoes(cadeia_id: int) -> list[dict[str, Any]]:
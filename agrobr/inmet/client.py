@@ -7,7 +7,9 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import JSON_CODEC, read_through
 from agrobr.constants import RETRIABLE_STATUS_CODES, URLS, Fonte, HTTPSettings
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -41,6 +43,7 @@ def _build_headers() -> dict[str, str]:
     return headers
 
 
+@read_through(Fonte.INMET, codec=JSON_CODEC)
 async def _get_json(path: str) -> list[dict[str, Any]]:
     url = f"{BASE_URL}{path}"
     headers = _build_headers()
@@ -51,21 +54,21 @@ async def _get_json(path: str) -> list[dict[str, Any]]:
             hint="Defina AGROBR_INMET_TOKEN para acessar dados observacionais",
         )
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, headers=headers) as client:
-        response = await retry_on_status(
-            lambda: client.get(url),
-            source="inmet",
-        )
+    client = ClientPool.get(Fonte.INMET)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="inmet",
+    )
 
-        if response.status_code == 204:
-            logger.info("inmet_no_content", path=path)
-            return []
+    if response.status_code == 204:
+        logger.info("inmet_no_content", path=path)
+        return []
 
-        response.raise_for_status()
-        data = response.json()
-        if not isinstance(data, list):
-            return []
-        return data
+    response.raise_for_status()
+    data = response.json()
+    if not isinstance(data, list):
+        return []
+    return data
 
 
 async def fetch_estacoes(tipo: str = "T") -> list[dict[str, Any]]:
@@ -3,8 +3,10 @@ from __future__ import annotations
 import httpx
 import structlog
 
+from agrobr.cache.read_through import read_through
 from agrobr.constants import MIN_XLSX_SIZE, URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -30,32 +32,31 @@ def _build_xlsx_url(nivel: str) -> str:
     return f"{DATAVERSE_BASE}/{BIOME_STATE_FILE_ID}?format=original"
 
 
+@read_through(Fonte.MAPBIOMAS)
 async def _fetch_url(url: str) -> bytes:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as client:
-        logger.debug("mapbiomas_request", url=url)
-        response = await retry_on_status(
-            lambda: client.get(url),
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.MAPBIOMAS)
+    logger.debug("mapbiomas_request", url=url)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
+        source="mapbiomas",
+    )
+
+    if response.status_code == 404:
+        raise SourceUnavailableError(source="mapbiomas", url=url, last_error="HTTP 404")
+
+    response.raise_for_status()
+
+    content = response.content
+    if len(content) < MIN_XLSX_SIZE:
+        raise SourceUnavailableError(
             source="mapbiomas",
+            url=url,
+            last_error=(
+                f"Downloaded XLSX too small ({len(content)} bytes), expected a valid spreadsheet"
+            ),
         )
-
-        if response.status_code == 404:
-            raise SourceUnavailableError(source="mapbiomas", url=url, last_error="HTTP 404")
-
-        response.raise_for_status()
-
-        content = response.content
-        if len(content) < MIN_XLSX_SIZE:
-            raise SourceUnavailableError(
-                source="mapbiomas",
-                url=url,
-                last_error=(
-                    f"Downloaded XLSX too small ({len(content)} bytes), "
-                    f"expected a valid spreadsheet"
-                ),
-            )
-        return content
+    return content
 
 
 async def fetch_biome_state() -> tuple[bytes, str]:
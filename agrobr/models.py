@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import hashlib
 import json
+import math
 import sys
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 from dataclasses import field as dataclass_field
 from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
+import structlog
 from pydantic import BaseModel, Field, field_validator
 
 from .constants import Fonte
@@ -16,6 +19,8 @@ from .constants import Fonte
 if TYPE_CHECKING:
     import pandas as pd
 
+logger = structlog.get_logger()
+
 
 class Indicador(BaseModel):
     fonte: Fonte
@@ -59,6 +64,209 @@ class Safra(BaseModel):
     anomalies: list[str] = Field(default_factory=list)
 
 
+@dataclass(slots=True)
+class IndicadorRecord:
+    fonte: Fonte
+    produto: str
+    praca: str | None
+    data: date
+    valor: float
+    unidade: str
+    metodologia: str | None = None
+    parser_version: int = 1
+    variacao_percentual: float | None = None
+    anomalies: list[str] | None = None
+
+    @classmethod
+    def from_model(cls, indicador: Indicador) -> IndicadorRecord:
+        return cls(
+            fonte=indicador.fonte,
+            produto=indicador.produto,
+            praca=indicador.praca,
+            data=indicador.data,
+            valor=float(indicador.valor),
+            unidade=indicador.unidade,
+            metodologia=indicador.metodologia,
+            parser_version=indicador.parser_version,
+            variacao_percentual=indicador.meta.get("variacao_percentual"),
+            anomalies=list(indicador.anomalies) or None,
+        )
+
+    def to_model(self) -> Indicador:
+        meta = {}
+        if self.variacao_percentual is not None:
+            meta["variacao_percentual"] = self.variacao_percentual
+        return Indicador(
+            fonte=self.fonte,
+            produto=self.produto,
+            praca=self.praca,
+            data=self.data,
+            valor=Decimal(str(self.valor)),
+            unidade=self.unidade,
+            metodologia=self.metodologia,
+            meta=meta,
+            parser_version=self.parser_version,
+            anomalies=list(self.anomalies or []),
+        )
+
+
+@dataclass(slots=True)
+class SafraRecord:
+    fonte: Fonte
+    produto: str
+    safra: str
+    uf: str | None
+    area_plantada: float | None
+    producao: float | None
+    produtividade: float | None
+    levantamento: int
+    data_publicacao: date
+    unidade_area: str = "mil_ha"
+    unidade_producao: str = "mil_ton"
+    parser_version: int = 1
+    anomalies: list[str] | None = None
+
+    @classmethod
+    def from_model(cls, safra: Safra) -> SafraRecord:
+        return cls(
+            fonte=safra.fonte,
+            produto=safra.produto,
+            safra=safra.safra,
+            uf=safra.uf,
+            area_plantada=_to_float(safra.area_plantada),
+            producao=_to_float(safra.producao),
+            produtividade=_to_float(safra.produtividade),
+            levantamento=safra.levantamento,
+            data_publicacao=safra.data_publicacao,
+            unidade_area=safra.unidade_area,
+            unidade_producao=safra.unidade_producao,
+            parser_version=safra.parser_version,
+            anomalies=list(safra.anomalies) or None,
+        )
+
+    def to_model(self) -> Safra:
+        return Safra(
+            fonte=self.fonte,
+            produto=self.produto,
+            safra=self.safra,
+            uf=self.uf,
+            area_plantada=_to_decimal(self.area_plantada),
+            producao=_to_decimal(self.producao),
+            produtividade=_to_decimal(self.produtividade),
+            unidade_area=self.unidade_area,
+            unidade_producao=self.unidade_producao,
+            levantamento=self.levantamento,
+            data_publicacao=self.data_publicacao,
+            parser_version=self.parser_version,
+            anomalies=list(self.anomalies or []),
+        )
+
+
+def _to_float(value: Decimal | None) -> float | None:
+    return None if value is None else float(value)
+
+
+def _to_decimal(value: float | None) -> Decimal | None:
+    return None if value is None else Decimal(str(value))
+
+
+def records_to_frame(
+    records: Sequence[IndicadorRecord] | Sequence[SafraRecord],
+    record_type: type[IndicadorRecord] | type[SafraRecord],
+) -> pd.DataFrame:
+    import pandas as pd
+
+    names = [f.name for f in fields(record_type)]
+    return pd.DataFrame(
+        {name: [getattr(r, name) for r in records] for name in names},
+        columns=names,
+    )
+
+
+def validate_indicador_columns(df: pd.DataFrame) -> pd.Series:
+    import pandas as pd
+
+    produto = df["produto"].astype("string").str.strip()
+    valor = pd.to_numeric(df["valor"], errors="coerce")
+    valid = (
+        df["fonte"].isin(list(Fonte))
+        & (produto.str.len() >= 2)
+        & pd.to_datetime(df["data"], errors="coerce").notna()
+        & (valor > 0)
+        & (valor < math.inf)
+        & df["unidade"].notna()
+    )
+    return valid.fillna(False).astype(bool)
+
+
+def validate_safra_columns(df: pd.DataFrame) -> pd.Series:
+    import pandas as pd
+
+    valid = (
+        df["fonte"].isin(list(Fonte))
+        & df["safra"].astype("string").str.fullmatch(r"\d{4}/\d{2}")
+        & (df["uf"].isna() | (df["uf"].astype("string").str.len() == 2))
+        & pd.to_datetime(df["data_publicacao"], errors="coerce").notna()
+    )
+    for column in ("area_plantada", "producao", "produtividade"):
+        values = pd.to_numeric(df[column], errors="coerce")
+        valid &= df[column].isna() | (values >= 0)
+    levantamento = pd.to_numeric(df["levantamento"], errors="coerce")
+    valid &= levantamento.between(1, 12)
+    return valid.fillna(False).astype(bool)
+
+
+def indicador_records(df: pd.DataFrame) -> list[IndicadorRecord]:
+    import pandas as pd
+
+    if df.empty:
+        return []
+
+    valid = validate_indicador_columns(df)
+    if not valid.all():
+        logger.warning("indicador_rows_invalid", count=int((~valid).sum()))
+        df = df[valid]
+
+    def optional(name: str) -> list[Any]:
+        if name not in df:
+            return [None] * len(df)
+        column = df[name].astype(object)
+        return column.where(column.notna(), None).tolist()
+
+    fontes = [Fonte(f) for f in df["fonte"]]
+    versions = pd.to_numeric(
+        df["parser_version"] if "parser_version" in df else pd.Series(1, index=df.index),
+        errors="coerce",
+    ).fillna(1)
+    return [
+        IndicadorRecord(
+            fonte=fonte,
+            produto=produto,
+            praca=praca,
+            data=data,
+            valor=valor,
+            unidade=unidade,
+            metodologia=metodologia,
+            parser_version=int(version),
+            variacao_percentual=variacao,
+            anomalies=list(anomalies) if anomalies else None,
+        )
+        for fonte, produto, praca, data, valor, unidade, metodologia, version, variacao, anomalies in zip(
+            fontes,
+            df["produto"].astype("string").str.strip().str.lower().tolist(),
+            optional("praca"),
+            pd.to_datetime(df["data"]).dt.date.tolist(),
+            pd.to_numeric(df["valor"]).astype("float64").tolist(),
+            df["unidade"].tolist(),
+            optional("metodologia"),
+            versions.tolist(),
+            optional("variacao_percentual"),
+            optional("anomalies"),
+            strict=True,
+        )
+    ]
+
+
 class CacheEntry(BaseModel):
     key: str
     data: bytes
@@ -7,7 +7,9 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import JSON_CODEC, read_through
 from agrobr.constants import RETRIABLE_STATUS_CODES, URLS, Fonte, HTTPSettings
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -29,19 +31,19 @@ RATE_LIMIT_DELAY = 1.0
 MAX_DAYS_PER_REQUEST = 365
 
 
+@read_through(Fonte.NASA_POWER, codec=JSON_CODEC)
 async def _get_json(params: dict[str, Any]) -> dict[str, Any]:
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers()
-    ) as client:
-        response = await retry_on_status(
-            lambda: client.get(BASE_URL, params=params),
-            source="nasa_power",
-        )
-        response.raise_for_status()
-        data = response.json()
-        if not isinstance(data, dict):
-            return {}
-        return data
+    headers = UserAgentRotator.get_bot_headers()
+    client = ClientPool.get(Fonte.NASA_POWER)
+    response = await retry_on_status(
+        lambda: client.get(BASE_URL, params=params, headers=headers, timeout=TIMEOUT),
+        source="nasa_power",
+    )
+    response.raise_for_status()
+    data = response.json()
+    if not isinstance(data, dict):
+        return {}
+    return data
 
 
 async def fetch_daily(
@@ -7,6 +7,7 @@ import structlog
 
 from agrobr import constants
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.rate_limiter import RateLimiter
 from agrobr.http.retry import retry_async, should_retry_status
 from agrobr.http.user_agents import UserAgentRotator
@@ -76,14 +77,9 @@ async def fetch_indicador_page(produto: str) -> str:
     )
 
     async def _fetch() -> httpx.Response:
-        async with (
-            RateLimiter.acquire(constants.Fonte.NOTICIAS_AGRICOLAS),
-            httpx.AsyncClient(
-                timeout=_get_timeout(),
-                follow_redirects=True,
-            ) as client,
-        ):
-            response = await client.get(url, headers=headers)
+        async with RateLimiter.acquire(constants.Fonte.NOTICIAS_AGRICOLAS):
+            client = ClientPool.get(constants.Fonte.NOTICIAS_AGRICOLAS)
+            response = await client.get(url, headers=headers, timeout=_get_timeout())
 
             if should_retry_status(response.status_code):
                 raise httpx.HTTPStatusError(
@@ -4,15 +4,20 @@ import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
+import pandas as pd
 import structlog
 from bs4 import BeautifulSoup
 
+from agrobr.cepea.parsers.base import INDICADOR_FRAME_COLUMNS
+from agrobr.cepea.parsers.document import classes_of, parse_document, text_of
 from agrobr.constants import Fonte
 from agrobr.exceptions import ParseError
 from agrobr.models import Indicador
 
 logger = structlog.get_logger()
 
+PARSER_VERSION = 2
+
 UNIDADES = {
     "soja": "BRL/sc60kg",
     "soja_parana": "BRL/sc60kg",
@@ -197,7 +202,7 @@ def parse_indicador(html: str, produto: str) -> list[Indicador]:
                 unidade=unidade,
                 metodologia="CEPEA/ESALQ via Notícias Agrícolas",
                 meta=meta,
-                parser_version=2,
+                parser_version=PARSER_VERSION,
                 anomalies=["media_semanal"] if is_weekly else [],
             )
 
@@ -223,3 +228,125 @@ def parse_indicador(html: str, produto: str) -> list[Indicador]:
     )
 
     return indicadores
+
+
+def _parse_dates(texts: pd.Series) -> tuple[pd.Series, pd.Series]:
+    daily = texts.str.extract(r"^(\d{2}/\d{2}/\d{4})", expand=False)
+    weekly = texts.str.extract(r"^\d{2}\s*-\s*(\d{2}/\d{2}/\d{4})", expand=False)
+    is_weekly = daily.isna() & weekly.notna()
+    datas = pd.to_datetime(daily.fillna(weekly), format="%d/%m/%Y", errors="coerce")
+    return datas, is_weekly & datas.notna()
+
+
+def _parse_valores(texts: pd.Series) -> pd.Series:
+    cleaned = (
+        texts.str.strip()
+        .str.replace(r"R\$\s*", "", regex=True)
+        .str.replace(".", "", regex=False)
+        .str.replace(",", ".", regex=False)
+    )
+    return pd.to_numeric(cleaned, errors="coerce").astype("float64")
+
+
+def _parse_variacoes(texts: pd.Series) -> pd.Series:
+    cleaned = texts.str.replace(r"[%\s]", "", regex=True).str.replace(",", ".", regex=False)
+    return pd.to_numeric(cleaned, errors="coerce").astype("float64")
+
+
+def parse_indicador_frame(html: str, produto: str) -> pd.DataFrame:
+    doc = parse_document(html)
+
+    produto_lower = produto.lower()
+    unidade = UNIDADES.get(produto_lower, "BRL/unidade")
+    praca = PRACAS.get(produto_lower)
+
+    tables = [t for t in doc.tables if "cot-fisicas" in classes_of(t)] or doc.tables
+
+    has_region_col = produto_lower == "trigo"
+    frames: list[pd.DataFrame] = []
+
+    for table in tables:
+        header_text = " ".join(text_of(th).lower() for th in table.iter("th"))
+
+        if "data" not in header_text:
+            continue
+
+        has_valor = "valor" in header_text or "r$" in header_text
+        has_region_header = "regi" in header_text
+        if not has_valor and not has_region_header:
+            continue
+
+        if has_region_header:
+            has_region_col = True
+
+        tbody = next(table.iter("tbody"), None)
+        rows = list(tbody.iter("tr")) if tbody is not None else list(table.iter("tr"))[1:]
+        cell_rows = [
+            r for r in ([text_of(td) for td in row.iter("td")] for row in rows) if len(r) >= 2
+        ]
+        if not cell_rows:
+            continue
+
+        cells = pd.DataFrame(cell_rows, dtype=object)
+        for col in range(cells.shape[1], 4):
+            cells[col] = None
+
+        lengths = cells.notna().sum(axis=1)
+        region = (lengths >= 3) if has_region_col else pd.Series(False, index=cells.index)
+        regiao = cells[1].where(region)
+        valor_str = cells[2].where(region, cells[1])
+        var_str = cells[3].where(region, cells[2])
+
+        datas, is_weekly = _parse_dates(cells[0])
+        valores = _parse_valores(valor_str)
+        valid = datas.notna() & valores.notna() & (valores > 0)
+
+        failed = int((~valid).sum())
+        if failed:
+            logger.warning(
+                "parse_row_failed",
+                source="noticias_agricolas",
+                rows=failed,
+                sample=cells.loc[~valid, 0].head(3).tolist(),
+            )
+
+        row_praca = regiao.where(regiao.fillna("") != "", praca)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "data": datas[valid],
+                    "produto": produto_lower,
+                    "praca": row_praca[valid],
+                    "valor": valores[valid],
+                    "unidade": unidade,
+                    "fonte": Fonte.NOTICIAS_AGRICOLAS.value,
+                    "metodologia": "CEPEA/ESALQ via Notícias Agrícolas",
+                    "variacao_percentual": _parse_variacoes(var_str)[valid],
+                    "parser_version": PARSER_VERSION,
+                    "anomalies": [["media_semanal"] if w else None for w in is_weekly[valid]],
+                },
+                columns=list(INDICADOR_FRAME_COLUMNS),
+            )
+        )
+
+    frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    if frame.empty:
+        raise ParseError(
+            source="noticias_agricolas",
+            parser_version=1,
+            reason=(
+                f"No indicators found for '{produto}'. "
+                f"{'Tables found but no data rows matched expected format.' if doc.tables else 'No tables found in HTML.'}"
+            ),
+            html_snippet=html[:500],
+        )
+
+    logger.info(
+        "parse_complete",
+        source="noticias_agricolas",
+        produto=produto,
+        count=len(frame),
+    )
+
+    return frame
@@ -6,8 +6,10 @@ import zipfile
 import httpx
 import structlog
 
+from agrobr.cache.read_through import BYTES_CODEC, read_through, with_url
 from agrobr.constants import MIN_WFS_SIZE, URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -27,10 +29,10 @@ TIMEOUT = httpx.Timeout(
 )
 
 
-async def _try_fetch(client: httpx.AsyncClient, url: str) -> bytes | None:
+async def _try_fetch(client: httpx.AsyncClient, url: str, headers: dict[str, str]) -> bytes | None:
     logger.debug("queimadas_request", url=url)
     response = await retry_on_status(
-        lambda: client.get(url),
+        lambda: client.get(url, headers=headers, timeout=TIMEOUT),
         source="queimadas",
     )
     if response.status_code == 404:
@@ -60,50 +62,50 @@ def _extract_csv_from_zip(data: bytes) -> bytes:
         return zf.read(csv_names[0])
 
 
+@read_through(Fonte.QUEIMADAS, codec=with_url(BYTES_CODEC))
 async def fetch_focos_diario(data: str) -> tuple[bytes, str]:
     url = f"{BASE_URL}/diario/Brasil/focos_diario_br_{data}.csv"
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as c:
-        content = await _try_fetch(c, url)
+    headers = UserAgentRotator.get_bot_headers()
+    c = ClientPool.get(Fonte.QUEIMADAS)
+    content = await _try_fetch(c, url, headers)
     if content is None:
         raise SourceUnavailableError(source="queimadas", url=url, last_error="HTTP 404")
     logger.info("queimadas_csv_found", url=url, size=len(content))
     return content, url
 
 
+@read_through(Fonte.QUEIMADAS, codec=with_url(BYTES_CODEC))
 async def fetch_focos_mensal(ano: int, mes: int) -> tuple[bytes, str]:
     periodo = f"{ano:04d}{mes:02d}"
     csv_url = f"{BASE_URL}/mensal/Brasil/focos_mensal_br_{periodo}.csv"
     zip_url = f"{BASE_URL}/mensal/Brasil/focos_mensal_br_{periodo}.zip"
     anual_url = f"{ANUAL_URL}/focos_br_todos-sats_{ano:04d}.zip"
 
-    async with httpx.AsyncClient(
-        timeout=TIMEOUT, headers=UserAgentRotator.get_bot_headers(), follow_redirects=True
-    ) as c:
-        content = await _try_fetch(c, csv_url)
-        if content is not None:
-            logger.info("queimadas_csv_found", url=csv_url, size=len(content))
-            return content, csv_url
-
-        logger.debug("queimadas_csv_404_trying_zip", periodo=periodo)
-        content = await _try_fetch(c, zip_url)
-        if content is not None:
-            csv_bytes = _extract_csv_from_zip(content)
-            logger.info("queimadas_zip_found", url=zip_url, size=len(csv_bytes))
-            return csv_bytes, zip_url
-
-        logger.debug("queimadas_zip_404_trying_anual", ano=ano)
-        content = await _try_fetch(c, anual_url)
-        if content is not None:
-            csv_bytes = _extract_csv_from_zip(content)
-            logger.info(
-                "queimadas_anual_found",
-                url=anual_url,
-                size_raw=len(csv_bytes),
-                filtering_month=mes,
-            )
-            return csv_bytes, anual_url
+    headers = UserAgentRotator.get_bot_headers()
+    c = ClientPool.get(Fonte.QUEIMADAS)
+    content = await _try_fetch(c, csv_url, headers)
+    if content is not None:
+        logger.info("queimadas_csv_found", url=csv_url, size=len(content))
+        return content, csv_url
+
+    logger.debug("queimadas_csv_404_trying_zip", periodo=periodo)
+    content = await _try_fetch(c, zip_url, headers)
+    if content is not None:
+        csv_bytes = _extract_csv_from_zip(content)
+        logger.info("queimadas_zip_found", url=zip_url, size=len(csv_bytes))
+        return csv_bytes, zip_url
+
+    logger.debug("queimadas_zip_404_trying_anual", ano=ano)
+    content = await _try_fetch(c, anual_url, headers)
+    if content is not None:
+        csv_bytes = _extract_csv_from_zip(content)
+        logger.info(
+            "queimadas_anual_found",
+            url=anual_url,
+            size_raw=len(csv_bytes),
+            filtering_month=mes,
+        )
+        return csv_bytes, anual_url
 
     raise SourceUnavailableError(
         source="queimadas",
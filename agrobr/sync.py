@@ -5,6 +5,8 @@ import functools
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
+from agrobr.http.pool import ClientPool
+
 T = TypeVar("T")
 
 
@@ -30,6 +32,13 @@ def _get_or_create_event_loop() -> asyncio.AbstractEventLoop:
             return loop
 
 
+async def _run_and_close_clients(coro: Awaitable[T]) -> T:
+    try:
+        return await coro
+    finally:
+        await ClientPool.aclose()
+
+
 def run_sync(coro: Awaitable[T]) -> T:
     loop = _get_or_create_event_loop()
 
@@ -39,7 +48,7 @@ def run_sync(coro: Awaitable[T]) -> T:
         nest_asyncio.apply()
         return loop.run_until_complete(coro)
     else:
-        return asyncio.run(coro)  # type: ignore[arg-type]
+        return asyncio.run(_run_and_close_clients(coro))
 
 
 def sync_wrapper(async_func: Callable[..., Awaitable[T]]) -> Callable[..., T]:
@@ -6,8 +6,10 @@ from typing import Any
 import httpx
 import structlog
 
+from agrobr.cache.read_through import JSON_CODEC, read_through
 from agrobr.constants import URLS, Fonte, HTTPSettings
 from agrobr.exceptions import SourceUnavailableError
+from agrobr.http.pool import ClientPool
 from agrobr.http.retry import retry_on_status
 from agrobr.http.user_agents import UserAgentRotator
 
@@ -40,32 +42,33 @@ def _get_api_key(api_key: str | None = None) -> str:
     return key
 
 
+@read_through(Fonte.USDA, codec=JSON_CODEC, exclude=("api_key",))
 async def _fetch_json(
     url: str, api_key: str, params: dict[str, str] | None = None
 ) -> list[dict[str, Any]]:
     headers = UserAgentRotator.get_bot_headers()
     headers["API_KEY"] = api_key
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, follow_redirects=True) as client:
-        logger.debug("usda_request", url=url)
-        response = await retry_on_status(
-            lambda: client.get(url, headers=headers, params=params),
+    client = ClientPool.get(Fonte.USDA)
+    logger.debug("usda_request", url=url)
+    response = await retry_on_status(
+        lambda: client.get(url, headers=headers, params=params, timeout=TIMEOUT),
+        source="usda",
+    )
+
+    if response.status_code == 401:
+        raise SourceUnavailableError(
             source="usda",
+            url=url,
+            last_error="API key inválida (HTTP 401). Verifique AGROBR_USDA_API_KEY.",
         )
 
-        if response.status_code == 401:
-            raise SourceUnavailableError(
-                source="usda",
-                url=url,
-                last_error="API key inválida (HTTP 401). Verifique AGROBR_USDA_API_KEY.",
-            )
-
-        if response.status_code == 404:
-            return []
+    if response.status_code == 404:
+        return []
 
-        response.raise_for_status()
-        data = response.json()
-        return data if isinstance(data, list) else []
+    response.raise_for_status()
+    data = response.json()
+    return data if isinstance(data, list) else []
 
 
 async def fetch_psd_country(
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from .sanity import (
+    ANOMALY_COLUMNS,
     AnomalyReport,
     SanityRule,
     validate_batch,
     validate_indicador,
+    validate_indicador_frame,
     validate_safra,
+    validate_safra_frame,
 )
 from .structural import (
     StructuralMonitor,
@@ -20,11 +23,14 @@ from .structural import (
 )
 
 __all__: list[str] = [
+    "ANOMALY_COLUMNS",
     "AnomalyReport",
     "SanityRule",
     "validate_batch",
     "validate_indicador",
+    "validate_indicador_frame",
     "validate_safra",
+    "validate_safra_frame",
     "StructuralValidationResult",
     "validate_structure",
     "validate_against_baseline",
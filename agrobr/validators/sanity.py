@@ -2,15 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import Any, TypeVar, cast
 
+import numpy as np
+import pandas as pd
 import structlog
 
 from agrobr.exceptions import ValidationError
-from agrobr.models import Indicador, Safra
+from agrobr.models import Indicador, IndicadorRecord, Safra, SafraRecord
 
 logger = structlog.get_logger()
 
+IndicadorT = TypeVar("IndicadorT", Indicador, IndicadorRecord)
+
 
 @dataclass
 class SanityRule:
@@ -116,8 +120,8 @@ class AnomalyReport:
 
 
 def validate_indicador(
-    indicador: Indicador,
-    valor_anterior: Decimal | None = None,
+    indicador: Indicador | IndicadorRecord,
+    valor_anterior: Decimal | float | None = None,
 ) -> list[AnomalyReport]:
     anomalies: list[AnomalyReport] = []
     rule = PRICE_RULES.get(indicador.produto.lower())
@@ -126,47 +130,51 @@ def validate_indicador(
         logger.debug("sanity_no_rules", produto=indicador.produto)
         return anomalies
 
-    if rule.min_value and indicador.valor < rule.min_value:
+    valor = _as_decimal(indicador.valor)
+    if valor_anterior is not None:
+        valor_anterior = _as_decimal(valor_anterior)
+
+    if rule.min_value and valor < rule.min_value:
         anomalies.append(
             AnomalyReport(
                 field="valor",
-                value=indicador.valor,
+                value=valor,
                 expected_range=f"[{rule.min_value}, {rule.max_value}]",
                 anomaly_type="out_of_range",
                 severity="critical",
                 details={
                     "produto": indicador.produto,
                     "rule": rule.description,
-                    "below_min_by": float(rule.min_value - indicador.valor),
+                    "below_min_by": float(rule.min_value - valor),
                 },
             )
         )
 
-    if rule.max_value and indicador.valor > rule.max_value:
+    if rule.max_value and valor > rule.max_value:
         anomalies.append(
             AnomalyReport(
                 field="valor",
-                value=indicador.valor,
+                value=valor,
                 expected_range=f"[{rule.min_value}, {rule.max_value}]",
                 anomaly_type="out_of_range",
                 severity="critical",
                 details={
                     "produto": indicador.produto,
                     "rule": rule.description,
-                    "above_max_by": float(indicador.valor - rule.max_value),
+                    "above_max_by": float(valor - rule.max_value),
                 },
             )
         )
 
     if valor_anterior and rule.max_daily_change_pct:
-        change_pct = abs((indicador.valor - valor_anterior) / valor_anterior) * 100
+        change_pct = abs((valor - valor_anterior) / valor_anterior) * 100
 
         if change_pct > rule.max_daily_change_pct:
             severity = "critical" if change_pct > rule.max_daily_change_pct * 2 else "warning"
             anomalies.append(
                 AnomalyReport(
                     field="valor",
-                    value=indicador.valor,
+                    value=valor,
                     expected_range=f"±{rule.max_daily_change_pct}% do dia anterior",
                     anomaly_type="excessive_change",
                     severity=severity,
@@ -192,7 +200,7 @@ def validate_indicador(
     return anomalies
 
 
-def validate_safra(safra: Safra) -> list[AnomalyReport]:
+def validate_safra(safra: Safra | SafraRecord) -> list[AnomalyReport]:
     anomalies: list[AnomalyReport] = []
     rules = SAFRA_RULES.get(safra.produto.lower(), {})
 
@@ -229,31 +237,224 @@ def validate_safra(safra: Safra) -> list[AnomalyReport]:
     return anomalies
 
 
-async def validate_batch(
-    indicadores: list[Indicador],
+def _as_decimal(value: Decimal | float) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+ANOMALY_COLUMNS = (
+    "row",
+    "produto",
+    "field",
+    "value",
+    "expected_range",
+    "anomaly_type",
+    "severity",
+    "details",
+)
+
+
+def _range_anomalies(
+    frame: pd.DataFrame,
+    field_name: str,
+    rules: dict[str, SanityRule],
+    order: int,
+    detailed: bool,
+) -> list[pd.DataFrame]:
+    key = frame["produto"].astype("string").str.lower()
+    values = pd.to_numeric(frame[field_name], errors="coerce").astype("float64")
+    expected = key.map({p: f"[{r.min_value}, {r.max_value}]" for p, r in rules.items()})
+    description = key.map({p: r.description for p, r in rules.items()})
+
+    parts = []
+    for offset, (bound, detail) in enumerate(
+        (("min_value", "below_min_by"), ("max_value", "above_max_by"))
+    ):
+        limits = {p: float(v) for p, r in rules.items() if (v := getattr(r, bound))}
+        limit = key.map(limits).astype("float64")
+        excess = limit - values if bound == "min_value" else values - limit
+        hit = (excess > 0).to_numpy()
+        if not hit.any():
+            continue
+
+        produtos = frame["produto"][hit].tolist()
+        details: list[dict[str, Any]] = [
+            {"produto": p, "rule": d, detail: e} if detailed else {"rule": d}
+            for p, d, e in zip(produtos, description[hit], excess[hit], strict=True)
+        ]
+        parts.append(
+            pd.DataFrame(
+                {
+                    "row": frame.index[hit],
+                    "order": order + offset,
+                    "produto": produtos,
+                    "field": field_name,
+                    "value": values[hit].to_numpy(),
+                    "expected_range": expected[hit].to_numpy(),
+                    "anomaly_type": "out_of_range",
+                    "severity": "critical",
+                    "details": details,
+                }
+            )
+        )
+    return parts
+
+
+def _change_anomalies(frame: pd.DataFrame, order: int) -> list[pd.DataFrame]:
+    key = frame["produto"].astype("string").str.lower()
+    max_pct = key.map(
+        {p: float(r.max_daily_change_pct) for p, r in PRICE_RULES.items() if r.max_daily_change_pct}
+    ).astype("float64")
+    values = pd.to_numeric(frame["valor"], errors="coerce").astype("float64")
+    produto = frame["produto"]
+    same = produto.eq(produto.shift()) | (produto.isna() & produto.shift().isna())
+    previous = values.shift().where(same)
+    change = (values - previous).abs() * 100 / previous.abs()
+
+    hit = ((change > max_pct) & previous.ne(0)).to_numpy()
+    if not hit.any():
+        return []
+
+    produtos = frame["produto"][hit].tolist()
+    details = [
+        {"produto": p, "valor_anterior": v, "change_pct": c, "max_allowed_pct": m}
+        for p, v, c, m in zip(produtos, previous[hit], change[hit], max_pct[hit], strict=True)
+    ]
+    limit = max_pct[hit].to_numpy()
+    return [
+        pd.DataFrame(
+            {
+                "row": frame.index[hit],
+                "order": order,
+                "produto": produtos,
+                "field": "valor",
+                "value": values[hit].to_numpy(),
+                "expected_range": key[hit]
+                .map(
+                    {
+                        p: f"±{r.max_daily_change_pct}% do dia anterior"
+                        for p, r in PRICE_RULES.items()
+                    }
+                )
+                .to_numpy(),
+                "anomaly_type": "excessive_change",
+                "severity": np.where(change[hit].to_numpy() > limit * 2, "critical", "warning"),
+                "details": details,
+            }
+        )
+    ]
+
+
+def _collect(parts: list[pd.DataFrame]) -> pd.DataFrame:
+    if not parts:
+        return pd.DataFrame(columns=list(ANOMALY_COLUMNS))
+    anomalies = pd.concat(parts, ignore_index=True)
+    anomalies = anomalies.sort_values(["row", "order"], kind="stable")
+    return anomalies[list(ANOMALY_COLUMNS)].reset_index(drop=True)
+
+
+def _annotate(frame: pd.DataFrame, anomalies: pd.DataFrame) -> pd.DataFrame:
+    if "anomalies" in frame:
+        column = frame["anomalies"].astype(object).tolist()
+    else:
+        column = [None] * len(frame)
+
+    if not anomalies.empty:
+        labels = (anomalies["anomaly_type"] + ": " + anomalies["field"]).groupby(
+            anomalies["row"], sort=False
+        )
+        for row, label in labels:
+            column[cast(int, row)] = label.tolist()
+
+    frame["anomalies"] = pd.Series(column, index=frame.index, dtype=object)
+    return frame
+
+
+def _log_anomalies(anomalies: pd.DataFrame, rows: int) -> None:
+    if anomalies.empty:
+        logger.debug("sanity_check_passed", rows=rows)
+        return
+    logger.warning(
+        "sanity_anomalies_detected",
+        count=len(anomalies),
+        rows=anomalies["row"].nunique(),
+        types=sorted(set(anomalies["anomaly_type"])),
+    )
+
+
+def validate_indicador_frame(
+    df: pd.DataFrame,
     strict: bool = False,
-) -> tuple[list[Indicador], list[AnomalyReport]]:
-    all_anomalies: list[AnomalyReport] = []
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    frame = df.sort_values("data", kind="stable").reset_index(drop=True)
+    anomalies = _collect(
+        [
+            *_range_anomalies(frame, "valor", PRICE_RULES, order=0, detailed=True),
+            *_change_anomalies(frame, order=2),
+        ]
+    )
+    _log_anomalies(anomalies, len(frame))
+
+    if strict:
+        critical = anomalies["row"][anomalies["severity"] == "critical"]
+        if not critical.empty:
+            first = anomalies[anomalies["row"] == critical.iloc[0]].iloc[0]
+            fonte = frame.at[first["row"], "fonte"] if "fonte" in frame else None
+            raise ValidationError(
+                source=str(fonte or "unknown"),
+                field=first["field"],
+                value=first["value"],
+                reason=first["anomaly_type"],
+            )
 
-    sorted_indicadores = sorted(indicadores, key=lambda x: x.data)
+    return _annotate(frame, anomalies), anomalies
 
-    for i, ind in enumerate(sorted_indicadores):
-        valor_anterior = None
-        if i > 0 and sorted_indicadores[i - 1].produto == ind.produto:
-            valor_anterior = sorted_indicadores[i - 1].valor
 
-        anomalies = validate_indicador(ind, valor_anterior)
+def validate_safra_frame(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    frame = df.reset_index(drop=True)
+    fields = list(dict.fromkeys(f for rules in SAFRA_RULES.values() for f in rules))
 
-        if anomalies:
-            ind.anomalies = [f"{a.anomaly_type}: {a.field}" for a in anomalies]
-            all_anomalies.extend(anomalies)
+    parts = []
+    for i, field_name in enumerate(fields):
+        if field_name not in frame:
+            continue
+        rules = {p: r[field_name] for p, r in SAFRA_RULES.items() if field_name in r}
+        parts.extend(_range_anomalies(frame, field_name, rules, order=2 * i, detailed=False))
+    anomalies = _collect(parts)
+    _log_anomalies(anomalies, len(frame))
+    return _annotate(frame, anomalies), anomalies
 
-            if strict and any(a.severity == "critical" for a in anomalies):
-                raise ValidationError(
-                    source=ind.fonte.value,
-                    field=anomalies[0].field,
-                    value=anomalies[0].value,
-                    reason=anomalies[0].anomaly_type,
-                )
 
-    return sorted_indicadores, all_anomalies
+async def validate_batch(
+    indicadores: list[IndicadorT],
+    strict: bool = False,
+) -> tuple[list[IndicadorT], list[AnomalyReport]]:
+    sorted_indicadores = sorted(indicadores, key=lambda x: x.data)
+    if not sorted_indicadores:
+        return [], []
+
+    frame = pd.DataFrame(
+        {
+            "data": [ind.data for ind in sorted_indicadores],
+            "produto": [ind.produto for ind in sorted_indicadores],
+            "valor": [float(ind.valor) for ind in sorted_indicadores],
+            "fonte": [ind.fonte.value for ind in sorted_indicadores],
+        }
+    )
+    annotated, anomalies = validate_indicador_frame(frame, strict=strict)
+
+    for row in anomalies["row"].unique().tolist():
+        sorted_indicadores[row].anomalies = annotated.at[row, "anomalies"]
+
+    records = cast(list[dict[str, Any]], anomalies.to_dict("records"))
+    reports = [
+        AnomalyReport(
+            field=a["field"],
+            value=sorted_indicadores[a["row"]].valor,
+            expected_range=a["expected_range"],
+            anomaly_type=a["anomaly_type"],
+            severity=a["severity"],
+            details=a["details"],
+        )
+        for a in records
+    ]
+    return sorted_indicadores, reports
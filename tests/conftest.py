@@ -11,6 +11,38 @@ CASSETTES_DIR = FIXTURES_DIR / "cassettes"
 GOLDEN_DATA_DIR = FIXTURES_DIR / "golden_data"
 
 
+@pytest.fixture(scope="session")
+def _cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("agrobr_cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(_cache_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    """Aponta o cache para um DuckDB temporário, descartado a cada teste."""
+    from agrobr.cache import duckdb_store
+
+    monkeypatch.setenv("AGROBR_CACHE_CACHE_DIR", str(_cache_dir))
+    monkeypatch.setattr(duckdb_store, "_store", None)
+    yield
+    store = duckdb_store._store
+    if store is not None:
+        store.close()
+        for path in _cache_dir.glob(f"{store.db_path.name}*"):
+            path.unlink()
+
+
+@pytest.fixture(autouse=True)
+def _reset_http_state():
+    from agrobr.http.pool import ClientPool
+    from agrobr.http.rate_limiter import RateLimiter
+
+    ClientPool.reset()
+    RateLimiter.reset()
+    yield
+    ClientPool.reset()
+    RateLimiter.reset()
+
+
 @pytest.fixture
 def sample_html_cepea() -> str:
     """HTML mínimo para testes de parsing CEPEA."""
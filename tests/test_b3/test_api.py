@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -9,6 +10,7 @@ import pytest
 
 from agrobr.b3 import api, client, parser
 from agrobr.b3.models import B3_CONTRATOS_AGRO, COLUNAS_OI_SAIDA, COLUNAS_SAIDA
+from agrobr.constants import HTTPSettings
 from agrobr.models import MetaInfo
 
 GOLDEN_DIR = Path(__file__).parent.parent / "golden_data" / "b3" / "ajustes_sample"
@@ -125,7 +127,7 @@ class TestHistorico:
 
     @pytest.mark.asyncio
     async def test_returns_dataframe(self, mock_ajustes):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.historico(
                 contrato="boi",
                 inicio=date(2025, 2, 13),
@@ -136,7 +138,7 @@ class TestHistorico:
 
     @pytest.mark.asyncio
     async def test_accepts_string_dates(self, mock_ajustes):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.historico(
                 contrato="boi",
                 inicio="2025-02-13",
@@ -147,7 +149,7 @@ class TestHistorico:
 
     @pytest.mark.asyncio
     async def test_skips_weekends(self, mock_ajustes):
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             await api.historico(
                 contrato="boi",
                 inicio=date(2025, 2, 8),
@@ -157,7 +159,7 @@ class TestHistorico:
 
     @pytest.mark.asyncio
     async def test_multiple_days(self, mock_ajustes):
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.historico(
                 contrato="boi",
                 inicio=date(2025, 2, 10),
@@ -168,7 +170,7 @@ class TestHistorico:
 
     @pytest.mark.asyncio
     async def test_filter_vencimento(self, mock_ajustes):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.historico(
                 contrato="boi",
                 inicio=date(2025, 2, 13),
@@ -180,7 +182,7 @@ class TestHistorico:
 
     @pytest.mark.asyncio
     async def test_return_meta(self, mock_ajustes):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             result = await api.historico(
                 contrato="boi",
                 inicio=date(2025, 2, 13),
@@ -194,7 +196,7 @@ class TestHistorico:
 
     @pytest.mark.asyncio
     async def test_empty_range_returns_empty(self, mock_ajustes):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.historico(
                 contrato="boi",
                 inicio=date(2025, 2, 15),
@@ -203,6 +205,73 @@ class TestHistorico:
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 0
 
+    @pytest.mark.asyncio
+    async def test_skips_holidays(self, mock_ajustes):
+        await api.historico(contrato="boi", inicio=date(2025, 4, 17), fim=date(2025, 4, 22))
+        assert mock_ajustes.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_second_run_served_from_history(self, mock_ajustes):
+        first = await api.historico(contrato="boi", inicio=date(2025, 2, 10), fim=date(2025, 2, 12))
+        second = await api.historico(
+            contrato="milho", inicio=date(2025, 2, 10), fim=date(2025, 2, 14)
+        )
+
+        assert mock_ajustes.call_count == 5
+        assert len(first) > 0
+        assert (second["ticker"] == "CCM").all()
+
+    @pytest.mark.asyncio
+    async def test_cached_day_keeps_dtypes(self, mock_ajustes):  # noqa: ARG002
+        fresh = await api.historico(contrato="boi", inicio=date(2025, 2, 13), fim=date(2025, 2, 13))
+        cached = await api.historico(
+            contrato="boi", inicio=date(2025, 2, 13), fim=date(2025, 2, 13)
+        )
+        pd.testing.assert_frame_equal(fresh, cached)
+
+    @pytest.mark.asyncio
+    async def test_failed_day_refetched_next_run(self, mock_ajustes):
+        mock_ajustes.side_effect = [Exception("503"), mock_ajustes.return_value]
+        df = await api.historico(contrato="boi", inicio=date(2025, 2, 13), fim=date(2025, 2, 13))
+        assert df.empty
+
+        mock_ajustes.side_effect = None
+        df = await api.historico(contrato="boi", inicio=date(2025, 2, 13), fim=date(2025, 2, 13))
+        assert len(df) > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self, mock_ajustes):
+        ativos = 0
+        pico = 0
+        original = mock_ajustes.return_value
+
+        async def _fetch(_data):
+            nonlocal ativos, pico
+            ativos += 1
+            pico = max(pico, ativos)
+            await asyncio.sleep(0.01)
+            ativos -= 1
+            return original
+
+        mock_ajustes.side_effect = _fetch
+        await api.historico(contrato="boi", inicio=date(2025, 2, 3), fim=date(2025, 2, 28))
+
+        assert mock_ajustes.call_count == 20
+        assert 1 < pico <= HTTPSettings().max_concurrency
+
+    @pytest.mark.asyncio
+    async def test_open_session_not_saved(self, mock_ajustes):
+        hoje = date.today()
+        frame = pd.DataFrame({"ticker": ["BGI"]})
+        fetch_dia = AsyncMock(return_value=frame)
+
+        for _ in range(2):
+            frames = await api._coletar_pregoes([hoje], api.HISTORY_KEY_AJUSTES, fetch_dia, 1)
+            assert len(frames) == 1
+
+        assert fetch_dia.call_count == 2
+        mock_ajustes.assert_not_called()
+
 
 class TestContratos:
     def test_returns_sorted_list(self):
@@ -323,7 +392,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_returns_dataframe(self, mock_fetch_oi):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.oi_historico(
                 contrato="boi",
                 inicio=date(2025, 12, 19),
@@ -334,7 +403,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_accepts_string_dates(self, mock_fetch_oi):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.oi_historico(
                 contrato="boi",
                 inicio="2025-12-19",
@@ -345,7 +414,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_skips_weekends(self, mock_fetch_oi):
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             await api.oi_historico(
                 contrato="boi",
                 inicio=date(2025, 12, 20),
@@ -355,7 +424,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_multiple_days(self, mock_fetch_oi):
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.oi_historico(
                 contrato="boi",
                 inicio=date(2025, 12, 15),
@@ -366,7 +435,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_filter_vencimento(self, mock_fetch_oi):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.oi_historico(
                 contrato="boi",
                 inicio=date(2025, 12, 19),
@@ -378,7 +447,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_filter_tipo(self, mock_fetch_oi):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.oi_historico(
                 contrato="boi",
                 inicio=date(2025, 12, 19),
@@ -390,7 +459,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_return_meta(self, mock_fetch_oi):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             result = await api.oi_historico(
                 contrato="boi",
                 inicio=date(2025, 12, 19),
@@ -404,7 +473,7 @@ class TestOiHistorico:
 
     @pytest.mark.asyncio
     async def test_empty_range_returns_empty(self, mock_fetch_oi):  # noqa: ARG002
-        with patch("agrobr.b3.api.asyncio.sleep", new_callable=AsyncMock):
+        with patch("asyncio.sleep", new_callable=AsyncMock):
             df = await api.oi_historico(
                 contrato="boi",
                 inicio=date(2025, 12, 20),
@@ -412,3 +481,18 @@ class TestOiHistorico:
             )
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 0
+
+    @pytest.mark.asyncio
+    async def test_second_run_served_from_history(self, mock_fetch_oi):
+        await api.oi_historico(contrato="boi", inicio=date(2025, 12, 15), fim=date(2025, 12, 19))
+        df = await api.oi_historico(
+            contrato="milho", inicio=date(2025, 12, 15), fim=date(2025, 12, 19), tipo="futuro"
+        )
+
+        assert mock_fetch_oi.call_count == 5
+        assert (df["tipo"] == "futuro").all()
+
+    @pytest.mark.asyncio
+    async def test_skips_christmas_eve(self, mock_fetch_oi):
+        await api.oi_historico(contrato="boi", inicio=date(2025, 12, 22), fim=date(2025, 12, 26))
+        assert mock_fetch_oi.call_count == 3
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from agrobr.b3.calendario import feriados, is_pregao, pascoa, pregoes
+
+
+class TestPascoa:
+    @pytest.mark.parametrize(
+        ("ano", "esperado"),
+        [(2019, date(2019, 4, 21)), (2024, date(2024, 3, 31)), (2025, date(2025, 4, 20))],
+    )
+    def test_known_dates(self, ano, esperado):
+        assert pascoa(ano) == esperado
+
+
+class TestFeriados:
+    def test_moveis_2025(self):
+        dias = feriados(2025)
+        assert date(2025, 3, 3) in dias
+        assert date(2025, 3, 4) in dias
+        assert date(2025, 4, 18) in dias
+        assert date(2025, 6, 19) in dias
+
+    def test_sem_pregao_fim_de_ano(self):
+        assert {date(2025, 12, 24), date(2025, 12, 31)} <= feriados(2025)
+
+    def test_consciencia_negra(self):
+        assert date(2024, 11, 20) in feriados(2024)
+        assert date(2023, 11, 20) not in feriados(2023)
+        assert date(2021, 11, 20) in feriados(2021)
+
+    def test_aniversario_sp_ate_2021(self):
+        assert date(2021, 1, 25) in feriados(2021)
+        assert date(2023, 1, 25) not in feriados(2023)
+
+
+class TestPregoes:
+    def test_skips_weekend_and_holidays(self):
+        dias = pregoes(date(2025, 4, 17), date(2025, 4, 22))
+        assert dias == [date(2025, 4, 17), date(2025, 4, 22)]
+
+    def test_empty_when_inverted(self):
+        assert pregoes(date(2025, 2, 15), date(2025, 2, 14)) == []
+
+    def test_is_pregao(self):
+        assert is_pregao(date(2025, 2, 13))
+        assert not is_pregao(date(2025, 2, 15))
+        assert not is_pregao(date(2025, 1, 1))
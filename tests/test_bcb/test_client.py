@@ -171,6 +171,123 @@ class TestBcbFetchCreditoRural:
 
         assert all(r["AnoEmissao"] == "2023" for r in result)
 
+    @pytest.mark.asyncio
+    async def test_pages_fetched_ahead_and_kept_in_order(self, monkeypatch):
+        monkeypatch.setattr(client, "PAGE_SIZE", 2)
+        pages = {
+            0: [{"AnoEmissao": "2023", "id": 1}, {"AnoEmissao": "2024", "id": 2}],
+            2: [{"AnoEmissao": "2023", "id": 3}, {"AnoEmissao": "2023", "id": 4}],
+            4: [{"AnoEmissao": "2023", "id": 5}],
+        }
+        skips: list[int] = []
+
+        async def _fake_odata(**kwargs):
+            skips.append(kwargs["skip"])
+            return {"value": pages.get(kwargs["skip"], [])}
+
+        with patch.object(client, "_fetch_odata", side_effect=_fake_odata):
+            result = await client.fetch_credito_rural(finalidade="custeio", safra_sicor="2023/2024")
+
+        assert [r["id"] for r in result] == [1, 3, 4, 5]
+        assert skips[:3] == [0, 2, 4]
+        assert len(skips) > 3
+
+
+class TestBcbPushdown:
+    def test_filters_translated_to_odata(self):
+        filters = client._build_pushdown_filters(safra_sicor="2023/2024", cd_uf="51")
+        assert filters == ["AnoEmissao eq '2023'", "nomeUF eq 'MT'"]
+
+    def test_ano_emissao_overrides_safra(self):
+        filters = client._build_pushdown_filters(safra_sicor="2023/2024", ano_emissao="2024")
+        assert filters == ["AnoEmissao eq '2024'"]
+
+    def test_literal_quotes_escaped(self):
+        assert client._odata_literal("D'OESTE") == "'D''OESTE'"
+
+    def test_select_only_parser_columns(self):
+        from agrobr.bcb.parser import COLUNAS_MAP
+
+        for columns in client.SELECT_MAP.values():
+            assert set(columns) <= set(COLUNAS_MAP)
+
+    def test_select_covers_mapped_columns(self):
+        import json
+        from pathlib import Path
+
+        from agrobr.bcb.parser import COLUNAS_MAP
+
+        golden = Path(__file__).parent.parent / "golden_data" / "bcb" / "custeio_sample"
+        registros = json.loads((golden / "response.json").read_text(encoding="utf-8"))
+        if isinstance(registros, dict):
+            registros = registros["value"]
+        mapeadas = {k for r in registros for k in r if k in COLUNAS_MAP}
+        mapeadas |= {"cdEstado", "nomeUF", "AnoEmissao", "nomeProduto"}
+
+        assert mapeadas <= set(client.SELECT_MAP["CusteioRegiaoUFProduto"])
+        for columns in client.SELECT_MAP.values():
+            assert "cdEstado" in columns
+
+    @pytest.mark.asyncio
+    async def test_filter_and_select_sent_to_server(self):
+        calls: list[dict] = []
+
+        async def _fake_odata(**kwargs):
+            calls.append(kwargs)
+            return {"value": [{"AnoEmissao": "2023", "nomeUF": "MT", "VlCusteio": 1.0}]}
+
+        with patch.object(client, "_fetch_odata", side_effect=_fake_odata):
+            result = await client.fetch_credito_rural(
+                finalidade="custeio", produto_sicor="SOJA", safra_sicor="2023/2024", cd_uf="51"
+            )
+
+        assert len(result) == 1
+        assert calls[0]["filters"] == [
+            "contains(nomeProduto,'SOJA')",
+            "AnoEmissao eq '2023'",
+            "nomeUF eq 'MT'",
+        ]
+        assert calls[0]["select"] == client.SELECT_MAP["CusteioRegiaoUFProduto"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_pushdown_falls_back_to_local_filter(self):
+        calls: list[dict] = []
+        records = [
+            {"AnoEmissao": "2023", "nomeUF": "MT"},
+            {"AnoEmissao": "2023", "nomeUF": "PR"},
+            {"AnoEmissao": "2022", "nomeUF": "MT"},
+        ]
+
+        async def _fake_odata(**kwargs):
+            calls.append(kwargs)
+            if kwargs["select"] is not None:
+                raise httpx.HTTPStatusError(
+                    "HTTP 400", request=MagicMock(), response=_mock_response(400)
+                )
+            return {"value": records}
+
+        with patch.object(client, "_fetch_odata", side_effect=_fake_odata):
+            result = await client.fetch_credito_rural(
+                finalidade="custeio", produto_sicor="SOJA", safra_sicor="2023/2024", cd_uf="51"
+            )
+
+        assert result == [{"AnoEmissao": "2023", "nomeUF": "MT"}]
+        fallback = [c for c in calls if c["select"] is None]
+        assert fallback[0]["filters"] == ["contains(nomeProduto,'SOJA')"]
+
+    @pytest.mark.asyncio
+    async def test_server_error_not_treated_as_rejection(self):
+        async def _fake_odata(**_kwargs):
+            raise httpx.HTTPStatusError(
+                "HTTP 403", request=MagicMock(), response=_mock_response(403)
+            )
+
+        with (
+            patch.object(client, "_fetch_odata", side_effect=_fake_odata),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await client.fetch_credito_rural(finalidade="custeio", safra_sicor="2023/2024")
+
 
 class TestBcbFallback:
     @pytest.mark.asyncio
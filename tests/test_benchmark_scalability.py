@@ -260,6 +260,37 @@ class TestMemoryProfiling:
         assert per_model < 10_000, f"Indicador too large: {per_model:.0f} bytes/model"
         del indicadores
 
+    def test_indicador_record_memory(self):
+        from agrobr.models import IndicadorRecord
+
+        gc.collect()
+        tracemalloc.start()
+        snap_before = tracemalloc.take_snapshot()
+
+        records = [
+            IndicadorRecord(
+                fonte=Fonte.CEPEA,
+                produto="soja",
+                praca=None,
+                data=date(2024, 1, 1) + timedelta(days=i),
+                valor=145.5,
+                unidade="BRL/sc60kg",
+            )
+            for i in range(5000)
+        ]
+
+        snap_after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        stats = snap_after.compare_to(snap_before, "lineno")
+        delta = sum(s.size_diff for s in stats if s.size_diff > 0)
+        per_record = delta / 5000
+        print(
+            f"\n  [MEM] 5000 IndicadorRecord: total={_mb(delta):.2f} MB, per_record={per_record:.0f} bytes"
+        )
+        assert per_record < 1_000, f"IndicadorRecord too large: {per_record:.0f} bytes/record"
+        del records
+
 
 # ============================================================================
 # 2. VOLUME DE DADOS — parser scaling
@@ -339,6 +370,102 @@ class TestVolumeScaling:
         )
         assert ratio < 20, f"NA parser is super-linear: {ratio:.1f}x for 10x data"
 
+    @pytest.mark.parametrize("num_rows", [100, 1000])
+    def test_cepea_shared_document_pipeline(self, num_rows):
+        from bs4 import BeautifulSoup
+
+        from agrobr.cepea.parsers.document import parse_document
+        from agrobr.cepea.parsers.fingerprint import extract_fingerprint
+        from agrobr.cepea.parsers.v1 import CepeaParserV1
+
+        html = _generate_cepea_html(num_rows)
+        parser = CepeaParserV1()
+
+        start = time.perf_counter()
+        for _ in range(3):
+            BeautifulSoup(html, "lxml")
+        t_bs4 = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        doc = parse_document(html)
+        can, _conf = parser.can_parse(doc)
+        extract_fingerprint(doc, Fonte.CEPEA, "benchmark")
+        results = parser.parse(doc, "soja")
+        t_shared = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\n  [VOL] CEPEA pipeline {num_rows} rows: 3x BS4 tokenise={_fmt(t_bs4)}, "
+            f"shared lxml detect+fingerprint+parse={_fmt(t_shared)}"
+        )
+        assert can
+        assert len(results) == num_rows
+
+    @pytest.mark.parametrize("num_rows", [100, 1000, 5000])
+    def test_parse_frame_scaling(self, num_rows):
+        from agrobr.cepea.parsers.v1 import CepeaParserV1
+        from agrobr.noticias_agricolas.parser import parse_indicador, parse_indicador_frame
+
+        parser = CepeaParserV1()
+        cepea_html = _generate_cepea_html(num_rows)
+        na_html = _generate_na_html(num_rows)
+
+        timings = {}
+        for name, fn in [
+            ("cepea list", lambda: parser.parse(cepea_html, "soja")),
+            ("cepea frame", lambda: parser.parse_frame(cepea_html, "soja")),
+            ("na list", lambda: parse_indicador(na_html, "soja")),
+            ("na frame", lambda: parse_indicador_frame(na_html, "soja")),
+        ]:
+            start = time.perf_counter()
+            result = fn()
+            timings[name] = (time.perf_counter() - start) * 1000
+            assert len(result) == num_rows
+
+        print(
+            f"\n  [VOL] parse {num_rows} rows: "
+            + ", ".join(f"{name}={_fmt(ms)}" for name, ms in timings.items())
+        )
+
+    @pytest.mark.parametrize("num_rows", [1000, 7300])
+    def test_sanity_frame_scaling(self, num_rows):
+        import pandas as pd
+
+        from agrobr.validators.sanity import validate_indicador, validate_indicador_frame
+
+        df = pd.DataFrame(
+            {
+                "data": pd.date_range("2006-01-01", periods=num_rows),
+                "produto": "soja",
+                "valor": [130.0 + (i % 50) for i in range(num_rows)],
+                "fonte": "cepea",
+            }
+        )
+        indicadores = [
+            Indicador(
+                fonte=Fonte.CEPEA,
+                produto="soja",
+                data=d.date(),
+                valor=Decimal(str(v)),
+                unidade="BRL/sc60kg",
+            )
+            for d, v in zip(df["data"], df["valor"], strict=True)
+        ]
+
+        start = time.perf_counter()
+        for i, ind in enumerate(indicadores):
+            validate_indicador(ind, indicadores[i - 1].valor if i else None)
+        per_row_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        _, anomalies = validate_indicador_frame(df)
+        frame_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\n  [VOL] sanity {num_rows} rows: per-row={_fmt(per_row_ms)}, frame={_fmt(frame_ms)}, "
+            f"anomalies={len(anomalies)}"
+        )
+        assert len(anomalies) > 0
+
     def test_pydantic_validation_scaling(self):
         times = {}
         for n in [100, 1000, 5000]:
@@ -566,6 +693,34 @@ class TestRateLimitingConcurrency:
         )
         assert total > 500, "Requests not serialized — rate limiter bypassed"
 
+    @pytest.mark.asyncio
+    async def test_identical_requests_single_flight(self, tmp_path):
+        from agrobr.cache.read_through import cached_fetch
+
+        store = DuckDBStore(CacheSettings(cache_dir=tmp_path, db_name="bench.duckdb"))
+        downloads = 0
+
+        async def download() -> bytes:
+            nonlocal downloads
+            downloads += 1
+            async with RateLimiter.acquire(Fonte.CEPEA):
+                await asyncio.sleep(0.05)
+            return b"payload"
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[
+                cached_fetch(Fonte.CEPEA, "bench", {"produto": "soja"}, download, store=store)
+                for _ in range(10)
+            ]
+        )
+        total = (time.perf_counter() - start) * 1000
+        store.close()
+
+        print(f"\n  [RATE] 10 identical cold requests: total={_fmt(total)}, downloads={downloads}")
+        assert downloads == 1
+        assert results == [b"payload"] * 10
+
     @pytest.mark.asyncio
     async def test_concurrent_different_sources_parallel(self):
         sources = [Fonte.CEPEA, Fonte.CONAB, Fonte.IBGE]
@@ -697,6 +852,12 @@ class TestAsyncPerformance:
         BeautifulSoup(html, "lxml")
         t_parse_html = (time.perf_counter() - t0) * 1000
 
+        from agrobr.cepea.parsers.document import parse_document
+
+        t0 = time.perf_counter()
+        _ = parse_document(html).root
+        t_parse_lxml = (time.perf_counter() - t0) * 1000
+
         t0 = time.perf_counter()
         results = parser.parse(html, "soja")
         t_full_parse = (time.perf_counter() - t0) * 1000
@@ -707,6 +868,7 @@ class TestAsyncPerformance:
 
         print("\n  [ASYNC] Phase breakdown (500 rows):")
         print(f"    HTML->BS4:    {_fmt(t_parse_html)}")
+        print(f"    HTML->lxml:   {_fmt(t_parse_lxml)}")
         print(f"    Full parse:   {_fmt(t_full_parse)}")
         print(f"    Serialize:    {_fmt(t_serialize)}")
         print(f"    Data size:    {len(serialized) / 1024:.1f} KB")
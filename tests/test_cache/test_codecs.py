@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+import zlib
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from agrobr.cache import codecs
+from agrobr.cache.codecs import (
+    BLOB_MAGIC,
+    FRAME_MAGIC,
+    compress_blob,
+    decode_dataframe,
+    decompress_blob,
+    encode_dataframe,
+    register_compressor,
+)
+from agrobr.cache.duckdb_store import DuckDBStore
+from agrobr.constants import CacheSettings, Fonte
+
+CSV = b"data;produto;valor\n" + b"2025-02-14;soja;131,50\n" * 2000
+
+
+@pytest.fixture()
+def tmp_store(tmp_path: Path) -> DuckDBStore:
+    store = DuckDBStore(CacheSettings(cache_dir=tmp_path, db_name="test.duckdb"))
+    yield store
+    store.close()
+
+
+class TestCompressBlob:
+    def test_roundtrip_shrinks(self):
+        blob = compress_blob(CSV)
+        assert blob.startswith(BLOB_MAGIC)
+        assert len(blob) < len(CSV) // 10
+        assert decompress_blob(blob) == CSV
+
+    def test_small_payload_kept_raw(self):
+        assert compress_blob(b"abc") == b"abc"
+
+    def test_incompressible_kept_raw(self):
+        data = os.urandom(64 * 1024)
+        assert compress_blob(data) == data
+
+    def test_zip_payload_kept_raw(self):
+        data = b"PK\x03\x04" + CSV
+        assert compress_blob(data) == data
+
+    def test_raw_with_magic_prefix_is_escaped(self):
+        data = BLOB_MAGIC + b"nao comprimido"
+        blob = compress_blob(data)
+        assert blob != data
+        assert decompress_blob(blob) == data
+
+    def test_method_none(self):
+        assert compress_blob(CSV, CacheSettings(compression="none")) == CSV
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError, match="brotli"):
+            compress_blob(CSV, CacheSettings(compression="brotli"))
+
+    def test_unknown_tag(self):
+        with pytest.raises(ValueError, match="tag 200"):
+            decompress_blob(BLOB_MAGIC + bytes([200]) + b"xyz")
+
+    def test_register_compressor(self, monkeypatch):
+        monkeypatch.setattr(codecs, "_COMPRESSORS", dict(codecs._COMPRESSORS))
+        monkeypatch.setattr(codecs, "_BY_TAG", dict(codecs._BY_TAG))
+        register_compressor("zlib9", 42, lambda b: zlib.compress(b, 9), zlib.decompress)
+
+        blob = compress_blob(CSV, CacheSettings(compression="zlib9"))
+        assert blob[len(BLOB_MAGIC)] == 42
+        assert decompress_blob(blob) == CSV
+
+    def test_register_conflicting_tag(self):
+        with pytest.raises(ValueError, match="Tag"):
+            register_compressor("outro", 1, bytes, bytes)
+
+
+class TestStoreCompression:
+    def test_cache_roundtrip(self, tmp_store):
+        tmp_store.cache_set("k", CSV, Fonte.CEPEA, ttl_seconds=3600)
+        assert tmp_store.cache_get("k") == (CSV, False)
+
+        stored = (
+            tmp_store._cursor().execute("SELECT octet_length(data) FROM cache_entries").fetchone()
+        )
+        assert stored[0] < len(CSV) // 10
+
+    def test_history_roundtrip(self, tmp_store):
+        from datetime import datetime
+
+        tmp_store.history_save("k", CSV, Fonte.CEPEA, datetime(2025, 2, 14), parser_version=1)
+        assert tmp_store.history_get("k") == CSV
+
+    def test_reads_uncompressed_rows(self, tmp_store):
+        tmp_store._cursor().execute(
+            """
+            INSERT INTO cache_entries
+            (key, data, source, created_at, expires_at, last_accessed_at, hit_count, version, stale)
+            VALUES ('k', ?, 'cepea', now(), now() + INTERVAL 1 HOUR, now(), 0, 1, FALSE)
+            """,
+            [CSV],
+        )
+        assert tmp_store.cache_get("k")[0] == CSV
+
+
+class TestDataFrameCodec:
+    def test_parquet_frame(self):
+        df = pd.DataFrame(
+            {
+                "data": pd.date_range("2025-01-01", periods=500),
+                "produto": pd.Categorical(["soja", "milho"] * 250),
+                "valor": [float(i) for i in range(500)],
+            }
+        )
+        raw = encode_dataframe(df)
+        assert raw.startswith(FRAME_MAGIC)
+        pd.testing.assert_frame_equal(decode_dataframe(raw), df)
+
+    def test_object_values_fall_back_to_json(self):
+        df = pd.DataFrame({"valor": [Decimal("1.5"), Decimal("2.25")]})
+        raw = encode_dataframe(df)
+        assert raw.startswith(b"{")
+        assert decode_dataframe(raw)["valor"].tolist() == [Decimal("1.5"), Decimal("2.25")]
+
+    def test_json_fallback_restores_dates_and_decimals(self):
+        df = pd.DataFrame(
+            {
+                "data": [date(2024, 1, 2), None, date(2024, 3, 4)],
+                "valor": [Decimal("0.1"), Decimal("123456789.000000001"), None],
+                "produto": ["soja", "milho", None],
+            }
+        )
+        decoded = decode_dataframe(encode_dataframe(df))
+
+        pd.testing.assert_frame_equal(decoded, df)
+        assert isinstance(decoded["data"][0], date)
+        assert isinstance(decoded["valor"][1], Decimal)
+
+    def test_unserializable_objects_rejected(self):
+        df = pd.DataFrame({"raw": [b"\x00", b"\x01"]})
+        with pytest.raises(TypeError):
+            encode_dataframe(df)
+
+    def test_empty_frame(self):
+        df = pd.DataFrame({"a": pd.Series([], dtype="float64")})
+        pd.testing.assert_frame_equal(decode_dataframe(encode_dataframe(df)), df)
+
+    def test_sidra_frame_roundtrip(self):
+        df = pd.DataFrame({"NC": ["Nível Territorial", "1"], "V": ["Valor", "123.4"]})
+        raw = encode_dataframe(df)
+        assert raw.startswith(FRAME_MAGIC)
+        pd.testing.assert_frame_equal(decode_dataframe(raw), df)
+
+    def test_legacy_split_json_without_dtypes(self):
+        df = pd.DataFrame({"NC": ["1", "2"], "V": ["10", "20"]})
+        raw = df.to_json(orient="split", index=False).encode("utf-8")
+        pd.testing.assert_frame_equal(decode_dataframe(raw), df, check_dtype=False)
+
+    def test_parquet_without_temp_files(self, monkeypatch):
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(codecs.tempfile, "TemporaryDirectory", None)
+        df = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+        pd.testing.assert_frame_equal(decode_dataframe(encode_dataframe(df)), df)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import gc
 import threading
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
 from pathlib import Path
 from unittest import mock
 
+import pandas as pd
 import pytest
 
-from agrobr.cache.duckdb_store import DuckDBStore
+from agrobr.cache.duckdb_store import AsyncDuckDBStore, DuckDBStore
 from agrobr.constants import CacheSettings, Fonte
 
 
@@ -70,6 +73,10 @@ class TestCacheGet:
 
         conn = tmp_store._get_conn()
         row = conn.execute("SELECT hit_count FROM cache_entries WHERE key = ?", ["k1"]).fetchone()
+        assert row[0] == 0
+
+        assert tmp_store.flush_hits() == 1
+        row = conn.execute("SELECT hit_count FROM cache_entries WHERE key = ?", ["k1"]).fetchone()
         assert row[0] == 3
 
 
@@ -283,6 +290,114 @@ class TestHistorySave:
         assert result is None
         store.close()
 
+    def test_identical_payload_stored_once(self, tmp_store: DuckDBStore):
+        first = tmp_store.history_save("a", b"same", Fonte.CEPEA, datetime(2024, 1, 1), 1)
+        second = tmp_store.history_save("b", b"same", Fonte.CEPEA, datetime(2024, 1, 2), 1)
+
+        conn = tmp_store._get_conn()
+        blobs = conn.execute("SELECT count(*) FROM history_blobs").fetchone()
+        entries = conn.execute("SELECT count(*) FROM history_entries").fetchone()
+
+        assert first == second
+        assert blobs[0] == 1
+        assert entries[0] == 2
+        assert tmp_store.history_get("b") == b"same"
+
+    def test_latest_hash(self, tmp_store: DuckDBStore):
+        from agrobr.cache.keys import content_hash
+
+        assert tmp_store.history_latest_hash("k") is None
+        tmp_store.history_save("k", b"v1", Fonte.CEPEA, datetime(2024, 1, 1), 1)
+
+        assert tmp_store.history_latest_hash("k") == content_hash(b"v1")
+
+    def test_cleanup_drops_orphan_blobs(self, tmp_store: DuckDBStore):
+        tmp_store.history_save("k", b"old", Fonte.CEPEA, datetime(2024, 1, 1), 1)
+        conn = tmp_store._get_conn()
+        conn.execute(
+            "UPDATE history_entries SET collected_at = ?",
+            [datetime(2020, 1, 1)],
+        )
+        tmp_store.history_save("k", b"new", Fonte.CEPEA, datetime(2024, 1, 2), 1)
+
+        assert tmp_store.history_cleanup(90) == 1
+        blobs = conn.execute("SELECT count(*) FROM history_blobs").fetchone()
+        assert blobs[0] == 1
+
+    def test_migration_moves_inline_payloads(self, tmp_store: DuckDBStore):
+        from agrobr.cache.migrations import migrate
+
+        conn = tmp_store._get_conn()
+        for day in (1, 2):
+            conn.execute(
+                """
+                INSERT INTO history_entries
+                (key, data, source, data_date, collected_at, parser_version)
+                VALUES ('k', ?, 'cepea', ?, ?, 1)
+                """,
+                [b"inline", datetime(2024, 1, day), datetime(2024, 1, day)],
+            )
+        conn.execute("DELETE FROM schema_version WHERE version >= 5")
+        migrate(conn)
+
+        inline = conn.execute(
+            "SELECT count(*) FROM history_entries WHERE data IS NOT NULL"
+        ).fetchone()
+        blobs = conn.execute("SELECT count(*) FROM history_blobs").fetchone()
+
+        assert inline[0] == 0
+        assert blobs[0] == 1
+        assert tmp_store.history_get("k", datetime(2024, 1, 1)) == b"inline"
+
+
+class TestHistoryQueries:
+    @pytest.fixture()
+    def filled_store(self, tmp_store: DuckDBStore) -> DuckDBStore:
+        for day in (8, 10):
+            tmp_store.history_save("cepea:soja", b"x", Fonte.CEPEA, datetime(2024, 1, day), 1)
+        tmp_store.history_save("conab:milho", b"y", Fonte.CONAB, datetime(2024, 1, 9), 1)
+        return tmp_store
+
+    def test_query_metadata_only(self, filled_store: DuckDBStore):
+        rows = filled_store.history_query(key_prefix="cepea")
+
+        assert [r["key"] for r in rows] == ["cepea:soja", "cepea:soja"]
+        assert "data" not in rows[0]
+        assert rows[0]["content_hash"]
+
+    def test_query_by_source_and_range(self, filled_store: DuckDBStore):
+        rows = filled_store.history_query(
+            source=Fonte.CEPEA, start_date=datetime(2024, 1, 9), end_date=datetime(2024, 1, 31)
+        )
+
+        assert [r["data_date"] for r in rows] == [date(2024, 1, 10)]
+
+    def test_count(self, filled_store: DuckDBStore):
+        assert filled_store.history_count() == 3
+        assert filled_store.history_count(source=Fonte.CONAB) == 1
+        assert filled_store.history_count(key_prefix="cepea:") == 2
+
+    def test_dates(self, filled_store: DuckDBStore):
+        assert filled_store.history_dates("cepea:soja") == [date(2024, 1, 8), date(2024, 1, 10)]
+
+    def test_gaps_skip_weekends(self, filled_store: DuckDBStore):
+        gaps = filled_store.history_gaps("cepea:soja", datetime(2024, 1, 5), datetime(2024, 1, 12))
+
+        assert gaps == [date(2024, 1, 5), date(2024, 1, 9), date(2024, 1, 11), date(2024, 1, 12)]
+
+    @pytest.mark.parametrize("file_format", ["parquet", "csv", "json"])
+    def test_export(self, filled_store: DuckDBStore, tmp_path: Path, file_format: str):
+        path = tmp_path / f"history.{file_format}"
+
+        count = filled_store.history_export(str(path), file_format, source=Fonte.CEPEA)
+
+        assert count == 2
+        assert path.stat().st_size > 0
+
+    def test_export_rejects_unknown_format(self, filled_store: DuckDBStore, tmp_path: Path):
+        with pytest.raises(ValueError, match="Formato"):
+            filled_store.history_export(str(tmp_path / "h.xml"), "xml")
+
 
 class TestIndicadores:
     def test_upsert_and_query(self, tmp_store: DuckDBStore):
@@ -332,10 +447,36 @@ class TestIndicadores:
         results = tmp_store.indicadores_query("inexistente")
         assert results == []
 
-    def test_upsert_chunked_boundary(self, tmp_store: DuckDBStore):
-        from agrobr.cache.duckdb_store import UPSERT_CHUNK_SIZE
+    def test_frame_matches_query(self, tmp_store: DuckDBStore):
+        tmp_store.indicadores_upsert(
+            [
+                {
+                    "produto": "soja",
+                    "praca": "paranagua" if i % 2 else None,
+                    "data": datetime(2024, 1, 1) + timedelta(days=i),
+                    "valor": 100.5 + i,
+                    "unidade": "BRL/sc60kg",
+                    "fonte": "cepea",
+                }
+                for i in range(10)
+            ]
+        )
+
+        df = tmp_store.indicadores_frame("soja", inicio=datetime(2024, 1, 3))
+        rows = tmp_store.indicadores_query("soja", inicio=datetime(2024, 1, 3))
+
+        assert len(df) == len(rows) == 8
+        assert df["valor"].tolist() == [float(r["valor"]) for r in rows]
+        assert df["data"].dt.date.tolist() == [r["data"] for r in rows]
+        assert pd.api.types.is_float_dtype(df["valor"])
+
+    def test_frame_empty(self, tmp_store: DuckDBStore):
+        df = tmp_store.indicadores_frame("inexistente")
+        assert df.empty
+        assert "valor" in df.columns
 
-        n = UPSERT_CHUNK_SIZE + 50
+    def test_upsert_large_batch(self, tmp_store: DuckDBStore):
+        n = 5050
         indicadores = [
             {
                 "produto": "soja",
@@ -486,78 +627,49 @@ class TestIndicadoresGetDatesFilters:
         assert len(dates) == 2
 
 
-class TestIndicadoresUpsertChunkError:
-    def test_chunk_error_fallback_row_by_row(self, tmp_store: DuckDBStore):
-        indicadores = [
+class TestIndicadoresUpsertFrame:
+    def test_accepts_dataframe(self, tmp_store: DuckDBStore):
+        df = pd.DataFrame(
             {
-                "produto": "soja",
-                "praca": f"p_{i}",
-                "data": datetime(2024, 1, 1) + timedelta(days=i),
-                "valor": 100.0 + i,
-                "unidade": "BRL/sc",
-                "fonte": "cepea",
+                "produto": ["SOJA", "soja"],
+                "praca": ["paranagua", "paranagua"],
+                "data": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+                "valor": [130.5, 131.0],
+                "fonte": ["cepea", "cepea"],
             }
-            for i in range(3)
-        ]
-
-        real_conn = tmp_store._get_conn()
-        call_count = [0]
-
-        class ConnWrapper:
-            def __getattr__(self, name):
-                if name == "executemany":
-
-                    def patched_executemany(sql, params):
-                        call_count[0] += 1
-                        if call_count[0] == 1 and "_ind_staging" in sql:
-                            import duckdb
-
-                            raise duckdb.Error("simulated chunk error")
-                        return real_conn.executemany(sql, params)
+        )
+        assert tmp_store.indicadores_upsert(df) == 2
 
-                    return patched_executemany
-                return getattr(real_conn, name)
+        results = tmp_store.indicadores_query("soja")
+        assert sorted(float(r["valor"]) for r in results) == [130.5, 131.0]
+        assert {r["unidade"] for r in results} == {"BRL/unidade"}
+        assert {r["parser_version"] for r in results} == {1}
 
-        with mock.patch.object(tmp_store, "_get_conn", return_value=ConnWrapper()):
-            count = tmp_store.indicadores_upsert(indicadores)
+    def test_invalid_rows_masked(self, tmp_store: DuckDBStore):
+        df = pd.DataFrame(
+            {
+                "produto": ["soja", None, "soja", "soja"],
+                "data": ["2024-01-02", "2024-01-03", "nao-e-data", "2024-01-05"],
+                "valor": [100.0, 101.0, 102.0, None],
+            }
+        )
+        assert tmp_store.indicadores_upsert(df) == 1
+        assert len(tmp_store.indicadores_query("soja")) == 1
 
-        assert count >= 0
+    def test_last_duplicate_in_batch_wins(self, tmp_store: DuckDBStore):
+        row = {"produto": "soja", "praca": "paranagua", "data": datetime(2024, 1, 2)}
+        count = tmp_store.indicadores_upsert(
+            [{**row, "valor": Decimal("100.00")}, {**row, "valor": Decimal("105.25")}]
+        )
 
+        assert count == 2
+        results = tmp_store.indicadores_query("soja")
+        assert len(results) == 1
+        assert results[0]["valor"] == Decimal("105.25")
 
-class TestToRow:
-    def test_defaults_applied(self):
-        now = datetime(2024, 1, 1)
-        ind = {
-            "produto": "SOJA",
-            "data": datetime(2024, 6, 15),
-            "valor": 100.5,
-        }
-        row = DuckDBStore._to_row(ind, now)
-        assert row[0] == "soja"
-        assert row[1] is None
-        assert row[4] == "BRL/unidade"
-        assert row[5] == "unknown"
-        assert row[9] == 1
-
-    def test_full_values(self):
-        now = datetime(2024, 1, 1)
-        ind = {
-            "produto": "Milho",
-            "praca": "Campinas",
-            "data": datetime(2024, 6, 15),
-            "valor": 50.25,
-            "unidade": "BRL/sc",
-            "fonte": "cepea",
-            "metodologia": "media",
-            "variacao_percentual": 1.5,
-            "parser_version": 2,
-        }
-        row = DuckDBStore._to_row(ind, now)
-        assert row[0] == "milho"
-        assert row[1] == "Campinas"
-        assert row[6] == "media"
-        assert row[7] == 1.5
-        assert row[9] == 2
+    def test_empty_frame(self, tmp_store: DuckDBStore):
+        assert tmp_store.indicadores_upsert(pd.DataFrame()) == 0
+        assert tmp_store.indicadores_upsert([]) == 0
 
 
 class TestGetStore:
@@ -573,3 +685,190 @@ class TestGetStore:
             assert s1 is s2
             mock_cls.assert_called_once()
         store_mod._store = None
+
+
+class TestConcurrentReaders:
+    def test_reads_do_not_wait_for_writer(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"payload", Fonte.CEPEA, ttl_seconds=3600)
+        results: list[object] = []
+
+        def reader() -> None:
+            results.append(tmp_store.cache_get("k1"))
+            results.append(tmp_store.indicadores_query("soja"))
+
+        with tmp_store._write_lock:
+            t = threading.Thread(target=reader)
+            t.start()
+            t.join(timeout=5)
+            assert not t.is_alive()
+
+        assert results == [(b"payload", False), []]
+
+    def test_cursor_per_thread(self, tmp_store: DuckDBStore):
+        cursors: list[object] = []
+
+        def worker() -> None:
+            cursors.append(tmp_store._cursor())
+            cursors.append(tmp_store._cursor())
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        assert len({id(c) for c in cursors}) == 3
+        assert len(tmp_store._cursors) == 3
+
+        cursors.clear()
+        gc.collect()
+        assert len(tmp_store._cursors) == 0
+
+    def test_stale_cursor_replaced_after_close(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"v", Fonte.CEPEA, ttl_seconds=3600)
+        before = tmp_store._cursor()
+        tmp_store.close()
+
+        after = tmp_store._cursor()
+        assert after is not before
+        assert tmp_store.cache_get("k1") == (b"v", False)
+
+    def test_upsert_releases_incoming_view(self, tmp_store: DuckDBStore):
+        indicadores = [
+            {
+                "produto": "soja",
+                "praca": "paranagua",
+                "data": datetime(2024, 1, 1) + timedelta(days=i),
+                "valor": 100.0 + i,
+            }
+            for i in range(5)
+        ]
+        assert tmp_store.indicadores_upsert(indicadores) == 5
+        assert tmp_store.indicadores_upsert(indicadores[:2]) == 2
+        assert len(tmp_store.indicadores_query("soja")) == 5
+
+    def test_close_then_reuse(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"v", Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.close()
+
+        assert len(tmp_store._cursors) == 0
+        assert tmp_store.cache_get("k1") == (b"v", False)
+
+
+class TestAsyncDuckDBStore:
+    async def test_roundtrip(self, tmp_store: DuckDBStore):
+        db = AsyncDuckDBStore(tmp_store)
+        await db.cache_set("k1", b"payload", Fonte.CEPEA, 3600)
+
+        assert await db.cache_get("k1") == (b"payload", False)
+        assert await db.cache_created_at("k1") is not None
+        await db.cache_invalidate("k1")
+        assert await db.cache_get("k1") == (b"payload", True)
+        assert await db.cache_clear() == 1
+
+    async def test_runs_outside_event_loop_thread(self, tmp_store: DuckDBStore):
+        loop_thread = threading.get_ident()
+        seen: list[int] = []
+        real_get = tmp_store.cache_get
+
+        def _get(key: str):
+            seen.append(threading.get_ident())
+            return real_get(key)
+
+        with mock.patch.object(tmp_store, "cache_get", side_effect=_get):
+            await AsyncDuckDBStore(tmp_store).cache_get("k1")
+
+        assert seen and seen[0] != loop_thread
+
+    async def test_indicadores(self, tmp_store: DuckDBStore):
+        db = AsyncDuckDBStore(tmp_store)
+        count = await db.indicadores_upsert(
+            [{"produto": "soja", "praca": "p", "data": datetime(2024, 1, 2), "valor": 1.0}]
+        )
+
+        assert count == 1
+        assert len(await db.indicadores_query("soja")) == 1
+        assert await db.indicadores_get_dates("soja") == {datetime(2024, 1, 2).date()}
+
+
+class TestHitStats:
+    def test_hit_is_pure_select(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"data", Fonte.CEPEA, ttl_seconds=3600)
+        real_cursor = tmp_store._cursor()
+        statements: list[str] = []
+
+        class CursorSpy:
+            def __getattr__(self, name):
+                if name in ("execute", "executemany"):
+
+                    def _spy(sql, *args):
+                        statements.append(sql.strip().split()[0].upper())
+                        return getattr(real_cursor, name)(sql, *args)
+
+                    return _spy
+                return getattr(real_cursor, name)
+
+        with mock.patch.object(tmp_store, "_cursor", return_value=CursorSpy()):
+            for _ in range(5):
+                tmp_store.cache_get("k1")
+
+        assert statements == ["SELECT"] * 5
+
+    def test_flush_updates_last_accessed(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"data", Fonte.CEPEA, ttl_seconds=3600)
+        conn = tmp_store._get_conn()
+        before = conn.execute(
+            "SELECT last_accessed_at FROM cache_entries WHERE key = 'k1'"
+        ).fetchone()[0]
+
+        tmp_store.cache_get("k1")
+        tmp_store.flush_hits()
+
+        after = conn.execute(
+            "SELECT last_accessed_at FROM cache_entries WHERE key = 'k1'"
+        ).fetchone()[0]
+        assert after >= before
+
+    def test_flush_when_pending_threshold_reached(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"data", Fonte.CEPEA, ttl_seconds=3600)
+        with mock.patch("agrobr.cache.duckdb_store.HIT_FLUSH_MAX_PENDING", 3):
+            for _ in range(3):
+                tmp_store.cache_get("k1")
+
+        assert tmp_store._pending_hits == {}
+        row = (
+            tmp_store._get_conn()
+            .execute("SELECT hit_count FROM cache_entries WHERE key = 'k1'")
+            .fetchone()
+        )
+        assert row[0] == 3
+
+    def test_flush_skipped_while_writer_busy(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"data", Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.cache_get("k1")
+
+        with tmp_store._write_lock:
+            assert tmp_store.flush_hits(blocking=False) == 0
+        assert tmp_store._pending_hits["k1"][0] == 1
+
+    def test_cache_stats_includes_pending_hits(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k1", b"abc", Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.cache_set("k2", b"de", Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.cache_get("k1")
+        tmp_store.cache_get("k1")
+        tmp_store.cache_get("k2")
+
+        assert tmp_store.cache_stats() == {"entries": 2, "hits": 3, "bytes": 5}
+
+    def test_close_flushes_hits(self, tmp_path: Path):
+        settings = CacheSettings(cache_dir=tmp_path, db_name="test.duckdb")
+        store = DuckDBStore(settings)
+        store.cache_set("k1", b"data", Fonte.CEPEA, ttl_seconds=3600)
+        store.cache_get("k1")
+        store.close()
+
+        reopened = DuckDBStore(settings)
+        try:
+            assert reopened.cache_stats()["hits"] == 1
+        finally:
+            reopened.close()
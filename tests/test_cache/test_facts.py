@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agrobr.cache import facts
+from agrobr.cache.duckdb_store import DuckDBStore
+from agrobr.constants import CacheSettings
+from agrobr.contracts import get_contract
+
+
+@pytest.fixture()
+def tmp_store(tmp_path: Path) -> DuckDBStore:
+    settings = CacheSettings(cache_dir=tmp_path, db_name="test.duckdb")
+    store = DuckDBStore(settings)
+    yield store
+    store.close()
+
+
+def _exportacao(kg: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ano": [2023, 2023, 2024],
+            "mes": [1, 2, 1],
+            "produto": "soja",
+            "uf": ["MT", None, "MT"],
+            "kg_liquido": kg,
+            "valor_fob_usd": [1, 2, 3],
+            "ncm": "12019000",
+        }
+    )
+
+
+class TestFactsSql:
+    def test_table_name_includes_contract_version(self):
+        contract = get_contract("exportacao")
+        assert facts.table_name("exportacao", contract) == "facts_exportacao_v1_0"
+
+    def test_where_sql(self):
+        where, params = facts.where_sql({"produto": "soja", "ano": [2023, 2024], "uf": None})
+        assert where == 'TRUE AND "produto" = ? AND "ano" IN (?, ?) AND "uf" IS NULL'
+        assert params == ["soja", 2023, 2024]
+
+    def test_scope_key_is_order_independent(self):
+        assert facts.scope_key({"uf": None, "produto": "soja"}) == facts.scope_key(
+            {"produto": "soja", "uf": None}
+        )
+
+
+class TestFactsStore:
+    def test_upsert_creates_typed_table(self, tmp_store: DuckDBStore):
+        assert tmp_store.facts_upsert("exportacao", _exportacao([1.0, np.nan, 3.0])) == 3
+
+        df = tmp_store.facts_query("exportacao")
+
+        assert list(df.columns) == get_contract("exportacao").list_columns()
+        assert pd.api.types.is_integer_dtype(df["ano"])
+        assert pd.api.types.is_float_dtype(df["valor_fob_usd"])
+        assert df["kg_liquido"].isna().sum() == 1
+
+    def test_upsert_replaces_by_primary_key(self, tmp_store: DuckDBStore):
+        tmp_store.facts_upsert("exportacao", _exportacao([1.0, 2.0, 3.0]))
+        tmp_store.facts_upsert("exportacao", _exportacao([10.0, 20.0, 30.0]).iloc[:2])
+
+        df = tmp_store.facts_query("exportacao")
+
+        assert len(df) == 3
+        assert df["kg_liquido"].tolist() == [10.0, 20.0, 3.0]
+
+    def test_query_filters(self, tmp_store: DuckDBStore):
+        tmp_store.facts_upsert("exportacao", _exportacao([1.0, 2.0, 3.0]))
+
+        df = tmp_store.facts_query("exportacao", {"ano": [2024], "uf": "MT"})
+
+        assert df["ano"].tolist() == [2024]
+
+    def test_unknown_dataset_raises(self, tmp_store: DuckDBStore):
+        with pytest.raises(KeyError):
+            tmp_store.facts_query("inexistente")
+
+    def test_loaded_periods(self, tmp_store: DuckDBStore):
+        scope = {"produto": "soja", "uf": None}
+        tmp_store.facts_mark_loaded("exportacao", scope, [2022, 2023])
+        tmp_store.facts_mark_loaded("exportacao", scope, [2023])
+
+        assert tmp_store.facts_loaded_periods("exportacao", scope) == {"2022", "2023"}
+        assert tmp_store.facts_loaded_periods("exportacao", {"produto": "milho"}) == set()
+
+    def test_loaded_frames_by_scope(self, tmp_store: DuckDBStore):
+        nacional = {"produto": "soja", "uf": None}
+        mt = {"produto": "soja", "uf": "MT"}
+        tmp_store.facts_mark_loaded("exportacao", nacional, [2022, 2023], {"2022": b"brasil"})
+        tmp_store.facts_mark_loaded("exportacao", mt, [2022], {"2022": b"mt"})
+
+        assert tmp_store.facts_loaded_frames("exportacao", nacional, [2022, 2023]) == {
+            "2022": b"brasil"
+        }
+        assert tmp_store.facts_loaded_frames("exportacao", mt, [2022, 2023]) == {"2022": b"mt"}
+        assert tmp_store.facts_loaded_frames("exportacao", mt, []) == {}
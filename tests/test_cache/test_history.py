@@ -106,6 +106,32 @@ class TestHistoryGet:
         assert call_args[0][1] is None
 
 
+class TestHistoryHasChanged:
+    def test_unchanged_when_hash_matches(self):
+        from agrobr.cache.keys import content_hash
+
+        store = _make_mock_store()
+        store.history_latest_hash.return_value = content_hash(b"page")
+        mgr = HistoryManager(store=store)
+
+        assert mgr.has_changed("cepea:soja", b"page") is False
+        assert mgr.has_changed("cepea:soja", b"other") is True
+
+    def test_changed_without_history(self):
+        store = _make_mock_store()
+        store.history_latest_hash.return_value = None
+        mgr = HistoryManager(store=store)
+
+        assert mgr.has_changed("cepea:soja", b"page") is True
+
+    def test_store_error_counts_as_changed(self):
+        store = _make_mock_store()
+        store.history_latest_hash.side_effect = Exception("db locked")
+        mgr = HistoryManager(store=store)
+
+        assert mgr.has_changed("cepea:soja", b"page") is True
+
+
 class TestHistoryQuery:
     def test_query_by_source(self):
         store = _make_mock_store()
@@ -141,38 +167,36 @@ class TestHistoryQuery:
 
         assert mgr.query() == []
 
-    def test_query_with_key_prefix_filters(self):
+    def test_query_passes_key_prefix_to_store(self):
         store = _make_mock_store()
-        store.history_query.return_value = [
-            {"key": "cepea:soja", "data_date": date(2024, 1, 1)},
-            {"key": "conab:milho", "data_date": date(2024, 1, 1)},
-        ]
         mgr = HistoryManager(store=store)
 
-        results = mgr.query(key_prefix="cepea")
+        mgr.query(key_prefix="cepea")
 
-        assert len(results) == 1
-        assert results[0]["key"] == "cepea:soja"
+        assert store.history_query.call_args.kwargs["key_prefix"] == "cepea"
 
 
-class TestHistoryCount:
-    def test_count_delegates_to_query(self):
+class TestHistoryIndicadores:
+    def test_delegates_to_frame(self):
         store = _make_mock_store()
-        store.history_query.return_value = [
-            {"key": "a"},
-            {"key": "b"},
-            {"key": "c"},
-        ]
         mgr = HistoryManager(store=store)
 
-        assert mgr.count() == 3
+        df = mgr.indicadores("soja", start_date=date(2024, 1, 1), praca="paranagua")
+
+        assert df is store.indicadores_frame.return_value
+        store.indicadores_frame.assert_called_once_with(
+            "soja", datetime(2024, 1, 1), None, "paranagua"
+        )
+
 
-    def test_count_with_source(self):
+class TestHistoryCount:
+    def test_count_delegates_to_store(self):
         store = _make_mock_store()
-        store.history_query.return_value = [{"key": "a"}]
+        store.history_count.return_value = 3
         mgr = HistoryManager(store=store)
 
-        assert mgr.count(source=Fonte.CEPEA) == 1
+        assert mgr.count(source=Fonte.CEPEA, key_prefix="cepea") == 3
+        store.history_count.assert_called_once_with(source=Fonte.CEPEA, key_prefix="cepea")
 
 
 class TestHistoryCleanup:
@@ -186,62 +210,60 @@ class TestHistoryCleanup:
         store = _make_mock_store()
         mgr = HistoryManager(store=store)
 
+        store.history_cleanup.return_value = 3
+
         result = mgr.cleanup(older_than_days=90, source=Fonte.CEPEA)
 
-        assert result == 0
+        assert result == 3
+        store.history_cleanup.assert_called_once_with(90, Fonte.CEPEA)
 
 
 class TestHistoryGetDates:
-    def test_get_dates_extracts_dates(self):
+    def test_get_dates_converts_range(self):
         store = _make_mock_store()
-        store.history_query.return_value = [
-            {"key": "k", "data_date": datetime(2024, 1, 10)},
-            {"key": "k", "data_date": datetime(2024, 3, 15)},
-            {"key": "other", "data_date": datetime(2024, 5, 1)},
-        ]
+        store.history_dates.return_value = [date(2024, 1, 10)]
         mgr = HistoryManager(store=store)
 
-        dates = mgr.get_dates("k")
+        dates = mgr.get_dates("k", start_date=date(2024, 1, 1))
+
+        assert dates == [date(2024, 1, 10)]
+        store.history_dates.assert_called_once_with("k", datetime(2024, 1, 1), None)
 
-        assert len(dates) == 2
-        assert date(2024, 1, 10) in dates
-        assert date(2024, 3, 15) in dates
 
-    def test_get_dates_handles_date_objects(self):
+class TestHistoryFindGaps:
+    def test_find_gaps_delegates_to_store(self):
         store = _make_mock_store()
-        store.history_query.return_value = [
-            {"key": "k", "data_date": date(2024, 1, 10)},
-        ]
+        store.history_gaps.return_value = [date(2024, 1, 9)]
         mgr = HistoryManager(store=store)
 
-        dates = mgr.get_dates("k")
+        gaps = mgr.find_gaps("k", date(2024, 1, 8), date(2024, 1, 12))
+
+        assert gaps == [date(2024, 1, 9)]
+        args = store.history_gaps.call_args.args
+        assert args[0] == "k"
+        assert args[1] == datetime(2024, 1, 8)
+        assert args[2].date() == date(2024, 1, 12)
 
-        assert dates == [date(2024, 1, 10)]
 
-    def test_get_dates_empty(self):
+class TestHistoryExport:
+    def test_export_empty_skips_copy(self, tmp_path):
         store = _make_mock_store()
-        store.history_query.return_value = []
+        store.history_count.return_value = 0
         mgr = HistoryManager(store=store)
 
-        assert mgr.get_dates("k") == []
-
+        assert mgr.export(tmp_path / "h.parquet") == 0
+        store.history_export.assert_not_called()
 
-class TestHistoryFindGaps:
-    def test_find_gaps_identifies_missing_weekdays(self):
+    def test_export_delegates_to_copy(self, tmp_path):
         store = _make_mock_store()
-        store.history_query.return_value = [
-            {"key": "k", "data_date": date(2024, 1, 8)},
-            {"key": "k", "data_date": date(2024, 1, 10)},
-        ]
+        store.history_count.return_value = 2
+        store.history_export.return_value = 2
         mgr = HistoryManager(store=store)
 
-        gaps = mgr.find_gaps("k", date(2024, 1, 8), date(2024, 1, 12))
-
-        assert date(2024, 1, 9) in gaps
-        assert date(2024, 1, 11) in gaps
-        assert date(2024, 1, 12) in gaps
-        assert date(2024, 1, 8) not in gaps
-        assert date(2024, 1, 10) not in gaps
+        path = tmp_path / "out" / "h.csv"
+        assert mgr.export(path, source=Fonte.CEPEA, format="csv") == 2
+        store.history_export.assert_called_once_with(str(path), "csv", Fonte.CEPEA, None, None)
+        assert path.parent.exists()
 
 
 class TestHistorySingleton:
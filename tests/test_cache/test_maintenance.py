@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from agrobr.cache.duckdb_store import DuckDBStore
+from agrobr.cache.maintenance import MB, run_maintenance, run_periodically
+from agrobr.constants import CacheSettings, Fonte
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _make_store(tmp_path: Path, **overrides) -> DuckDBStore:
+    settings = CacheSettings(cache_dir=tmp_path, db_name="test.duckdb", **overrides)
+    return DuckDBStore(settings)
+
+
+@pytest.fixture()
+def tmp_store(tmp_path: Path) -> DuckDBStore:
+    store = _make_store(tmp_path)
+    yield store
+    store.close()
+
+
+def _set_accessed(store: DuckDBStore, key: str, when: datetime) -> None:
+    store._get_conn().execute(
+        "UPDATE cache_entries SET last_accessed_at = ? WHERE key = ?", [when, key]
+    )
+
+
+def _keys(store: DuckDBStore) -> set[str]:
+    rows = store._get_conn().execute("SELECT key FROM cache_entries").fetchall()
+    return {r[0] for r in rows}
+
+
+class TestCacheEvict:
+    def test_lru_keeps_most_recent(self, tmp_store: DuckDBStore):
+        now = _utcnow()
+        for i in range(4):
+            tmp_store.cache_set(f"k{i}", b"x" * 100, Fonte.CEPEA, ttl_seconds=3600)
+            _set_accessed(tmp_store, f"k{i}", now - timedelta(hours=4 - i))
+
+        count, freed = tmp_store.cache_evict(250)
+
+        assert (count, freed) == (2, 200)
+        assert _keys(tmp_store) == {"k2", "k3"}
+
+    def test_lfu_keeps_most_hit(self, tmp_store: DuckDBStore):
+        for i in range(3):
+            tmp_store.cache_set(f"k{i}", b"x" * 100, Fonte.CEPEA, ttl_seconds=3600)
+        for _ in range(5):
+            tmp_store.cache_get("k0")
+
+        tmp_store.cache_evict(100, policy="lfu")
+
+        assert _keys(tmp_store) == {"k0"}
+
+    def test_source_quota_only_touches_source(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("a", b"x" * 100, Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.cache_set("b", b"x" * 100, Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.cache_set("c", b"x" * 100, Fonte.CONAB, ttl_seconds=3600)
+
+        count, _ = tmp_store.cache_evict(0, source=Fonte.CEPEA)
+
+        assert count == 2
+        assert _keys(tmp_store) == {"c"}
+
+    def test_invalid_policy(self, tmp_store: DuckDBStore):
+        with pytest.raises(ValueError, match="eviction"):
+            tmp_store.cache_evict(0, policy="fifo")
+
+
+class TestHistoryCleanup:
+    def test_removes_old_entries(self, tmp_store: DuckDBStore):
+        tmp_store.history_save("k", b"d", Fonte.CEPEA, datetime(2024, 1, 1), 1)
+        tmp_store.history_save("k", b"d", Fonte.CEPEA, datetime(2024, 1, 2), 1)
+        tmp_store._get_conn().execute(
+            "UPDATE history_entries SET collected_at = ? WHERE data_date = ?",
+            [_utcnow() - timedelta(days=100), datetime(2024, 1, 1)],
+        )
+
+        assert tmp_store.history_cleanup(90) == 1
+        assert tmp_store.history_get("k", datetime(2024, 1, 2)) == b"d"
+        assert tmp_store.history_get("k", datetime(2024, 1, 1)) is None
+
+
+class TestRunMaintenance:
+    def test_enforces_max_size(self, tmp_store: DuckDBStore):
+        for i in range(5):
+            tmp_store.cache_set(f"k{i}", os.urandom(MB // 2), Fonte.CEPEA, ttl_seconds=3600)
+
+        report = run_maintenance(tmp_store, max_size_mb=1, compact=False)
+
+        assert report.evicted_entries == 3
+        assert report.evicted_bytes == 3 * (MB // 2)
+        assert tmp_store.cache_stats()["bytes"] <= MB
+
+    def test_source_quota_from_settings(self, tmp_path: Path):
+        store = _make_store(tmp_path, source_max_mb={"cepea": 0})
+        try:
+            store.cache_set("a", b"x", Fonte.CEPEA, ttl_seconds=3600)
+            store.cache_set("b", b"x", Fonte.CONAB, ttl_seconds=3600)
+            report = run_maintenance(store, compact=False)
+            assert report.evicted_entries == 1
+            assert _keys(store) == {"b"}
+        finally:
+            store.close()
+
+    def test_expires_old_cache_and_history(self, tmp_path: Path):
+        store = _make_store(tmp_path, cache_max_age_days=10, history_max_age_days=10)
+        try:
+            store.cache_set("old", b"x", Fonte.CEPEA, ttl_seconds=3600)
+            store.cache_set("new", b"x", Fonte.CEPEA, ttl_seconds=3600)
+            store.history_save("h", b"d", Fonte.CEPEA, datetime(2024, 1, 1), 1)
+            conn = store._get_conn()
+            old = _utcnow() - timedelta(days=20)
+            conn.execute("UPDATE cache_entries SET created_at = ? WHERE key = 'old'", [old])
+            conn.execute("UPDATE history_entries SET collected_at = ?", [old])
+
+            report = run_maintenance(store, compact=False)
+
+            assert report.expired_entries == 1
+            assert report.history_removed == 1
+            assert _keys(store) == {"new"}
+        finally:
+            store.close()
+
+    def test_compact_reclaims_bytes(self, tmp_store: DuckDBStore):
+        for i in range(20):
+            tmp_store.cache_set(f"k{i}", os.urandom(256 * 4000), Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.checkpoint()
+        tmp_store.cache_clear()
+
+        report = run_maintenance(tmp_store, compact=True)
+
+        assert report.compacted is True
+        assert report.bytes_reclaimed > 10 * MB
+        tmp_store.cache_set("after", b"ok", Fonte.CEPEA, ttl_seconds=3600)
+        assert tmp_store.cache_get("after") == (b"ok", False)
+
+    def test_never_compacts_by_default(self, tmp_store: DuckDBStore):
+        for i in range(20):
+            tmp_store.cache_set(f"k{i}", os.urandom(256 * 4000), Fonte.CEPEA, ttl_seconds=3600)
+        tmp_store.checkpoint()
+        tmp_store.cache_clear()
+
+        with mock.patch.object(tmp_store, "compact") as mock_compact:
+            report = run_maintenance(tmp_store)
+
+        mock_compact.assert_not_called()
+        assert report.compacted is False
+
+    def test_compact_keeps_sequences(self, tmp_store: DuckDBStore):
+        tmp_store.history_save("k", b"a", Fonte.CEPEA, datetime(2024, 1, 1), 1)
+        tmp_store.compact()
+        tmp_store.history_save("k", b"b", Fonte.CEPEA, datetime(2024, 1, 2), 1)
+
+        ids = tmp_store._get_conn().execute("SELECT id FROM history_entries ORDER BY id").fetchall()
+        assert [r[0] for r in ids] == [1, 2]
+
+    def test_compact_waits_for_reads_in_flight(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k", b"x", Fonte.CEPEA, ttl_seconds=3600)
+        reading, release = threading.Event(), threading.Event()
+        results: list[tuple[bytes | None, bool]] = []
+
+        def reader():
+            with tmp_store._reading() as conn:
+                reading.set()
+                release.wait(5)
+                conn.execute("SELECT count(*) FROM cache_entries").fetchone()
+            results.append(tmp_store.cache_get("k"))
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        reading.wait(5)
+        compactor = threading.Thread(target=tmp_store.compact)
+        compactor.start()
+        compactor.join(0.2)
+        assert compactor.is_alive()
+
+        release.set()
+        compactor.join(5)
+        thread.join(5)
+
+        assert not compactor.is_alive()
+        assert results == [(b"x", False)]
+
+    def test_no_budget_only_checkpoints(self, tmp_store: DuckDBStore):
+        tmp_store.cache_set("k", b"x", Fonte.CEPEA, ttl_seconds=3600)
+
+        report = run_maintenance(tmp_store, compact=False)
+
+        assert report.evicted_entries == 0
+        assert report.compacted is False
+        assert _keys(tmp_store) == {"k"}
+
+
+class TestRunPeriodically:
+    async def test_runs_until_cancelled(self, tmp_store: DuckDBStore):
+        with mock.patch("agrobr.cache.maintenance.run_maintenance") as mock_run:
+            task = asyncio.create_task(run_periodically(tmp_store, interval_seconds=0.01))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert mock_run.call_count >= 2
+
+    async def test_failure_does_not_stop_loop(self, tmp_store: DuckDBStore):
+        with mock.patch(
+            "agrobr.cache.maintenance.run_maintenance", side_effect=OSError("disco")
+        ) as mock_run:
+            task = asyncio.create_task(run_periodically(tmp_store, interval_seconds=0.01))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert mock_run.call_count >= 2
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+
+from agrobr.cache.duckdb_store import DuckDBStore
+from agrobr.cache.keys import build_cache_key
+from agrobr.cache.read_through import (
+    BYTESIO_CODEC,
+    DATAFRAME_CODEC,
+    JSON_CODEC,
+    TEXT_CODEC,
+    cached_fetch,
+    read_through,
+    resolve_ttl,
+    with_meta,
+    with_url,
+)
+from agrobr.constants import CacheSettings, Fonte
+from agrobr.exceptions import SourceUnavailableError, StaleDataWarning
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@pytest.fixture()
+def tmp_store(tmp_path: Path) -> DuckDBStore:
+    store = DuckDBStore(CacheSettings(cache_dir=tmp_path, db_name="test.duckdb"))
+    yield store
+    store.close()
+
+
+def _expire(store: DuckDBStore, key: str, age: timedelta) -> None:
+    created = _utcnow() - age
+    store._get_conn().execute(
+        "UPDATE cache_entries SET created_at = ?, expires_at = ? WHERE key = ?",
+        [created, created + timedelta(seconds=1), key],
+    )
+
+
+class TestCachedFetch:
+    @pytest.mark.asyncio
+    async def test_miss_fetches_and_stores(self, tmp_store):
+        fetch = AsyncMock(return_value=b"payload")
+
+        result = await cached_fetch(Fonte.ANTAQ, "ds", {"ano": 2024}, fetch, store=tmp_store)
+
+        assert result == b"payload"
+        fetch.assert_awaited_once()
+        data, stale = tmp_store.cache_get(build_cache_key("ds", {"ano": 2024}))
+        assert data == b"payload"
+        assert stale is False
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_fetch(self, tmp_store):
+        fetch = AsyncMock(return_value=b"payload")
+
+        await cached_fetch(Fonte.ANTAQ, "ds", {"ano": 2024}, fetch, store=tmp_store)
+        await cached_fetch(Fonte.ANTAQ, "ds", {"ano": 2024}, fetch, store=tmp_store)
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_distinct_params_distinct_entries(self, tmp_store):
+        fetch = AsyncMock(side_effect=[b"a", b"b"])
+
+        a = await cached_fetch(Fonte.ANTAQ, "ds", {"ano": 2023}, fetch, store=tmp_store)
+        b = await cached_fetch(Fonte.ANTAQ, "ds", {"ano": 2024}, fetch, store=tmp_store)
+
+        assert (a, b) == (b"a", b"b")
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetches(self, tmp_store):
+        await cached_fetch(Fonte.ANTAQ, "ds", {}, AsyncMock(return_value=b"old"), store=tmp_store)
+        _expire(tmp_store, build_cache_key("ds", {}), timedelta(hours=1))
+
+        result = await cached_fetch(
+            Fonte.ANTAQ, "ds", {}, AsyncMock(return_value=b"new"), store=tmp_store
+        )
+
+        assert result == b"new"
+
+    @pytest.mark.asyncio
+    async def test_stale_served_when_source_down(self, tmp_store):
+        await cached_fetch(Fonte.ANTAQ, "ds", {}, AsyncMock(return_value=b"old"), store=tmp_store)
+        _expire(tmp_store, build_cache_key("ds", {}), timedelta(hours=1))
+        failing = AsyncMock(side_effect=SourceUnavailableError(source="antaq", last_error="503"))
+
+        with pytest.warns(StaleDataWarning):
+            result = await cached_fetch(Fonte.ANTAQ, "ds", {}, failing, store=tmp_store)
+
+        assert result == b"old"
+
+    @pytest.mark.asyncio
+    async def test_stale_beyond_multiplier_raises(self, tmp_store):
+        await cached_fetch(Fonte.ANTAQ, "ds", {}, AsyncMock(return_value=b"old"), store=tmp_store)
+        ttl = resolve_ttl(tmp_store.settings, Fonte.ANTAQ)
+        too_old = timedelta(seconds=ttl * tmp_store.settings.stale_multiplier + 60)
+        _expire(tmp_store, build_cache_key("ds", {}), too_old)
+        failing = AsyncMock(side_effect=SourceUnavailableError(source="antaq", last_error="503"))
+
+        with pytest.raises(SourceUnavailableError):
+            await cached_fetch(Fonte.ANTAQ, "ds", {}, failing, store=tmp_store)
+
+    @pytest.mark.asyncio
+    async def test_offline_without_cache_raises(self, tmp_path):
+        store = DuckDBStore(CacheSettings(cache_dir=tmp_path, offline_mode=True))
+        fetch = AsyncMock(return_value=b"payload")
+
+        with pytest.raises(SourceUnavailableError, match="offline_mode"):
+            await cached_fetch(Fonte.BCB, "ds", {}, fetch, store=store)
+
+        fetch.assert_not_awaited()
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_offline_serves_expired_entry(self, tmp_path):
+        store = DuckDBStore(CacheSettings(cache_dir=tmp_path, offline_mode=True))
+        store.cache_set(build_cache_key("ds", {}), b"old", Fonte.BCB, ttl_seconds=1)
+        _expire(store, build_cache_key("ds", {}), timedelta(days=365))
+        fetch = AsyncMock(return_value=b"payload")
+
+        result = await cached_fetch(Fonte.BCB, "ds", {}, fetch, store=store)
+
+        assert result == b"old"
+        fetch.assert_not_awaited()
+        store.close()
+
+
+class TestResolveTtl:
+    def test_source_setting(self):
+        settings = CacheSettings(ttl_comexstat=123)
+        assert resolve_ttl(settings, Fonte.COMEXSTAT) == 123
+
+    def test_explicit_name_wins(self):
+        settings = CacheSettings(ttl_conab_ceasa=42)
+        assert resolve_ttl(settings, Fonte.CONAB, "conab_ceasa") == 42
+
+    def test_policy_fallback(self):
+        assert resolve_ttl(CacheSettings(), Fonte.CONAB, "conab_custo") == 30 * 24 * 3600
+
+
+class TestCodecs:
+    def test_text(self):
+        assert TEXT_CODEC.decode(TEXT_CODEC.encode("açúcar;1")) == "açúcar;1"
+
+    def test_json(self):
+        value = [{"a": 1, "b": "ç"}]
+        assert JSON_CODEC.decode(JSON_CODEC.encode(value)) == value
+
+    def test_bytesio(self):
+        assert BYTESIO_CODEC.decode(BYTESIO_CODEC.encode(BytesIO(b"xlsx"))).read() == b"xlsx"
+
+    def test_dataframe_keeps_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "data": pd.to_datetime(["2025-02-13", "2025-02-14"]),
+                "ticker": ["BGI", "CCM"],
+                "valor": [310.5, None],
+                "ano": pd.array([2025, None], dtype="Int64"),
+            }
+        )
+        pd.testing.assert_frame_equal(DATAFRAME_CODEC.decode(DATAFRAME_CODEC.encode(df)), df)
+
+    def test_with_url(self):
+        codec = with_url(TEXT_CODEC)
+        assert codec.decode(codec.encode(("a\nb", "https://x/y?z=1"))) == (
+            "a\nb",
+            "https://x/y?z=1",
+        )
+
+    def test_with_meta(self):
+        codec = with_meta(BYTESIO_CODEC)
+        buf, meta = codec.decode(codec.encode((BytesIO(b"\x00\n\x01"), {"url": "u"})))
+        assert buf.read() == b"\x00\n\x01"
+        assert meta == {"url": "u"}
+
+
+class TestReadThroughDecorator:
+    @pytest.mark.asyncio
+    async def test_caches_by_arguments(self):
+        calls: list[str] = []
+
+        @read_through(Fonte.DERAL)
+        async def download(url: str) -> bytes:
+            calls.append(url)
+            return url.encode()
+
+        assert await download("https://a") == b"https://a"
+        assert await download(url="https://a") == b"https://a"
+        assert await download("https://b") == b"https://b"
+        assert calls == ["https://a", "https://b"]
+
+    @pytest.mark.asyncio
+    async def test_excluded_arguments_do_not_split_key(self):
+        calls: list[str] = []
+
+        @read_through(Fonte.USDA, codec=JSON_CODEC, exclude=("api_key",))
+        async def fetch(url: str, api_key: str) -> list[str]:
+            calls.append(api_key)
+            return [url]
+
+        await fetch("u", "key-1")
+        assert await fetch("u", "key-2") == ["u"]
+        assert calls == ["key-1"]
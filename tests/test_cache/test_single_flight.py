@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from agrobr.cache.duckdb_store import DuckDBStore
+from agrobr.cache.read_through import BYTESIO_CODEC, Codec, cached_fetch
+from agrobr.cache.single_flight import (
+    SingleFlight,
+    copy_result,
+    get_single_flight,
+    single_flight,
+)
+from agrobr.constants import CacheSettings, Fonte
+from agrobr.models import Indicador, MetaInfo
+
+
+@pytest.fixture()
+def tmp_store(tmp_path: Path) -> DuckDBStore:
+    store = DuckDBStore(CacheSettings(cache_dir=tmp_path, db_name="test.duckdb"))
+    yield store
+    store.close()
+
+
+class _Source:
+    """Fonte falsa que so responde quando ``release`` e liberado."""
+
+    def __init__(self, value: object = "ok", error: Exception | None = None) -> None:
+        self.calls = 0
+        self.value = value
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.value
+
+
+async def _settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_run(self):
+        flight = SingleFlight()
+        source = _Source()
+
+        tasks = [asyncio.create_task(flight.do("k", source)) for _ in range(5)]
+        await _settle()
+        assert flight.in_flight() == 1
+        source.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert source.calls == 1
+        assert [value for value, _ in results] == ["ok"] * 5
+        assert [shared for _, shared in results] == [True] * 5
+        assert flight.in_flight() == 0
+
+    async def test_distinct_keys_run_separately(self):
+        flight = SingleFlight()
+        source = _Source()
+        source.release.set()
+
+        await asyncio.gather(flight.do("a", source), flight.do("b", source))
+
+        assert source.calls == 2
+
+    async def test_exception_reaches_every_waiter(self):
+        flight = SingleFlight()
+        source = _Source(error=ValueError("boom"))
+
+        tasks = [asyncio.create_task(flight.do("k", source)) for _ in range(3)]
+        await _settle()
+        source.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert source.calls == 1
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.in_flight() == 0
+
+    async def test_retries_after_failure(self):
+        flight = SingleFlight()
+        failing = _Source(error=ValueError("boom"))
+        failing.release.set()
+        with pytest.raises(ValueError):
+            await flight.do("k", failing)
+
+        ok = _Source()
+        ok.release.set()
+        assert await flight.do("k", ok) == ("ok", False)
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        flight = SingleFlight()
+        source = _Source()
+
+        leader = asyncio.create_task(flight.do("k", source))
+        follower = asyncio.create_task(flight.do("k", source))
+        await _settle()
+        leader.cancel()
+        await _settle()
+        source.release.set()
+
+        assert await follower == ("ok", True)
+        assert leader.cancelled()
+
+    async def test_all_waiters_cancelled_cancels_run(self):
+        flight = SingleFlight()
+        source = _Source()
+
+        tasks = [asyncio.create_task(flight.do("k", source)) for _ in range(2)]
+        await _settle()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert flight.in_flight() == 0
+        source.release.set()
+        assert await flight.do("k", source) == ("ok", False)
+        assert source.calls == 2
+
+    async def test_bounded_in_flight(self):
+        flight = SingleFlight(max_in_flight=1)
+        source = _Source()
+
+        tasks = [
+            asyncio.create_task(flight.do("a", source)),
+            asyncio.create_task(flight.do("b", source)),
+            asyncio.create_task(flight.do("b", source)),
+        ]
+        await _settle()
+        assert flight.in_flight() == 1
+        source.release.set()
+        await asyncio.gather(*tasks)
+
+        assert source.calls == 3
+
+
+class TestCopyResult:
+    def test_frame_and_meta_are_copied(self):
+        df = pd.DataFrame({"a": [1]})
+        meta = MetaInfo(source="x", source_url="", source_method="", fetched_at=datetime.now())
+
+        df_copy, meta_copy = copy_result((df, meta))
+        df_copy.loc[0, "a"] = 2
+        meta_copy.validation_warnings.append("w")
+
+        assert df.loc[0, "a"] == 1
+        assert meta.validation_warnings == []
+
+    def test_nested_values_are_deep_copied(self):
+        indicador = Indicador(
+            fonte=Fonte.CEPEA,
+            produto="soja",
+            data=date(2024, 1, 2),
+            valor=Decimal("140"),
+            unidade="BRL/sc60kg",
+            meta={"fontes": ["cepea"]},
+        )
+        meta = MetaInfo(source="x", source_url="", source_method="", fetched_at=datetime.now())
+        value = {"itens": [indicador], "meta": meta, "linhas": [[1]]}
+
+        copia = copy_result(value)
+        copia["itens"][0].anomalies.append("a")
+        copia["itens"][0].meta["fontes"].append("na")
+        copia["meta"].attempted_sources.append("cepea")
+        copia["linhas"][0].append(2)
+        modelo = copy_result(indicador)
+        modelo.meta["fontes"].append("x")
+
+        assert indicador.anomalies == []
+        assert indicador.meta == {"fontes": ["cepea"]}
+        assert meta.attempted_sources == []
+        assert value["linhas"] == [[1]]
+
+
+class TestDecorator:
+    async def test_followers_get_copies(self):
+        calls = []
+        release = asyncio.Event()
+
+        @single_flight("teste:frame")
+        async def load(produto: str, ano: int | None = None) -> pd.DataFrame:
+            calls.append((produto, ano))
+            await release.wait()
+            return pd.DataFrame({"produto": [produto]})
+
+        tasks = [
+            asyncio.create_task(load("soja")),
+            asyncio.create_task(load(produto="soja", ano=None)),
+            asyncio.create_task(load("milho")),
+        ]
+        await _settle()
+        release.set()
+        leader, follower, other = await asyncio.gather(*tasks)
+
+        assert calls == [("soja", None), ("milho", None)]
+        assert follower is not leader
+        follower.loc[0, "produto"] = "x"
+        assert leader.loc[0, "produto"] == "soja"
+        assert other["produto"].tolist() == ["milho"]
+
+    async def test_leader_mutation_not_seen_by_followers(self):
+        release = asyncio.Event()
+
+        @single_flight("teste:mutacao")
+        async def load(x: int) -> pd.DataFrame:
+            await release.wait()
+            return pd.DataFrame({"v": [x, x, x]})
+
+        async def leader() -> pd.DataFrame:
+            df = await load(1)
+            df["v"] = -1
+            return df
+
+        tasks = [asyncio.create_task(leader()), asyncio.create_task(load(1))]
+        await _settle()
+        release.set()
+        mutated, follower = await asyncio.gather(*tasks)
+
+        assert mutated["v"].tolist() == [-1, -1, -1]
+        assert follower["v"].tolist() == [1, 1, 1]
+
+    async def test_uncontended_call_returns_original(self):
+        frame = pd.DataFrame({"v": [1]})
+
+        @single_flight("teste:original")
+        async def load() -> pd.DataFrame:
+            return frame
+
+        assert await load() is frame
+
+
+class TestCachedFetchCoalescing:
+    async def test_concurrent_misses_fetch_once(self, tmp_store):
+        from io import BytesIO
+
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> BytesIO:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return BytesIO(b"xlsx")
+
+        tasks = [
+            asyncio.create_task(
+                cached_fetch(
+                    Fonte.CONAB, "ds", {"ano": 2024}, fetch, codec=BYTESIO_CODEC, store=tmp_store
+                )
+            )
+            for _ in range(3)
+        ]
+        await _settle()
+        release.set()
+        buffers = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert len({id(b) for b in buffers}) == 3
+        assert [b.read() for b in buffers] == [b"xlsx"] * 3
+        assert get_single_flight().in_flight() == 0
+
+    async def test_encode_failure_still_copies(self, tmp_store):
+        from io import BytesIO
+
+        release = asyncio.Event()
+
+        async def fetch() -> BytesIO:
+            await release.wait()
+            return BytesIO(b"xlsx")
+
+        def _fail(_value: BytesIO) -> bytes:
+            raise ValueError("encode")
+
+        codec = Codec(encode=_fail, decode=BYTESIO_CODEC.decode)
+        tasks = [
+            asyncio.create_task(
+                cached_fetch(Fonte.CONAB, "ds", {"ano": 2023}, fetch, codec=codec, store=tmp_store)
+            )
+            for _ in range(3)
+        ]
+        await _settle()
+        release.set()
+        buffers = await asyncio.gather(*tasks)
+
+        assert len({id(b) for b in buffers}) == 3
+        assert [b.read() for b in buffers] == [b"xlsx"] * 3
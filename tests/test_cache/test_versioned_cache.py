@@ -84,21 +84,35 @@ def strict_store(tmp_path: Path) -> DuckDBStore:
     store.close()
 
 
+def _insert_legacy(conn, key: str, data: bytes, stale: bool = False, created_at=None) -> None:
+    now = _utcnow()
+    conn.execute(
+        """
+        INSERT INTO cache_entries
+        (key, data, source, created_at, expires_at, last_accessed_at, hit_count, version, stale)
+        VALUES (?, ?, ?, ?, ?, ?, 0, 1, ?)
+        """,
+        [key, data, "cepea", created_at or now, now + timedelta(hours=4), now, stale],
+    )
+
+
+def _rerun_legacy_migration(conn) -> None:
+    from agrobr.cache.migrations import migrate
+
+    conn.execute("DELETE FROM schema_version WHERE version >= 4")
+    migrate(conn)
+
+
 class TestLegacyCacheMigration:
     def test_migration_legacy_key_rewritten(self, tmp_store: DuckDBStore):
+        from agrobr import __version__
+
         legacy_key = "cepea|abc123def456"
         conn = tmp_store._get_conn()
-        now = _utcnow()
-        conn.execute(
-            """
-            INSERT INTO cache_entries
-            (key, data, source, created_at, expires_at, last_accessed_at, hit_count, version, stale)
-            VALUES (?, ?, ?, ?, ?, ?, 0, 1, FALSE)
-            """,
-            [legacy_key, b"legacy_data", "cepea", now, now + timedelta(hours=4), now],
-        )
+        _insert_legacy(conn, legacy_key, b"legacy_data")
+        _rerun_legacy_migration(conn)
 
-        versioned_key = "cepea|abc123def456|v0.9.0|sv1.0"
+        versioned_key = f"cepea|abc123def456|v{__version__}|sv1.0"
         data, stale = tmp_store.cache_get(versioned_key)
 
         assert data == b"legacy_data"
@@ -111,24 +125,54 @@ class TestLegacyCacheMigration:
         assert new is not None
 
     def test_migration_preserves_stale_flag(self, tmp_store: DuckDBStore):
-        legacy_key = "cepea|abc123def456"
+        from agrobr import __version__
+
         conn = tmp_store._get_conn()
-        now = _utcnow()
-        conn.execute(
-            """
-            INSERT INTO cache_entries
-            (key, data, source, created_at, expires_at, last_accessed_at, hit_count, version, stale)
-            VALUES (?, ?, ?, ?, ?, ?, 0, 1, TRUE)
-            """,
-            [legacy_key, b"stale_data", "cepea", now, now + timedelta(hours=4), now],
-        )
+        _insert_legacy(conn, "cepea|abc123def456", b"stale_data", stale=True)
+        _rerun_legacy_migration(conn)
 
-        versioned_key = "cepea|abc123def456|v0.9.0|sv1.0"
-        data, stale = tmp_store.cache_get(versioned_key)
+        data, stale = tmp_store.cache_get(f"cepea|abc123def456|v{__version__}|sv1.0")
 
         assert data == b"stale_data"
         assert stale is True
 
+    def test_migration_keeps_existing_versioned_entry(self, tmp_store: DuckDBStore):
+        from agrobr import __version__
+
+        versioned_key = f"cepea|abc123def456|v{__version__}|sv1.0"
+        tmp_store.cache_set(versioned_key, b"current", Fonte.CEPEA, ttl_seconds=3600)
+        conn = tmp_store._get_conn()
+        _insert_legacy(conn, "cepea|abc123def456", b"legacy_data")
+        _rerun_legacy_migration(conn)
+
+        data, _ = tmp_store.cache_get(versioned_key)
+
+        assert data == b"current"
+        count = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        assert count[0] == 1
+
+    def test_migration_dedupes_by_newest(self, tmp_store: DuckDBStore):
+        from agrobr import __version__
+
+        conn = tmp_store._get_conn()
+        now = _utcnow()
+        _insert_legacy(conn, "cepea|abc123def456", b"old", created_at=now - timedelta(days=1))
+        _insert_legacy(conn, "cepea|abc123def456|v0.1", b"new", created_at=now)
+        _rerun_legacy_migration(conn)
+
+        data, _ = tmp_store.cache_get(f"cepea|abc123def456|v{__version__}|sv1.0")
+
+        assert data == b"new"
+
+    def test_miss_does_not_scan_legacy_prefix(self, tmp_store: DuckDBStore):
+        conn = tmp_store._get_conn()
+        _insert_legacy(conn, "cepea|abc123def456", b"legacy_data")
+
+        data, stale = tmp_store.cache_get("cepea|abc123def456|v0.9.0|sv1.0")
+
+        assert data is None
+        assert stale is False
+
     def test_no_migration_for_non_legacy_miss(self, tmp_store: DuckDBStore):
         versioned_key = build_cache_key("cepea", {"produto": "soja"})
         data, stale = tmp_store.cache_get(versioned_key)
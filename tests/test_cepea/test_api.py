@@ -13,6 +13,7 @@ import pytest
 from agrobr import cepea, constants
 from agrobr.cepea import api
 from agrobr.cepea.client import FetchResult
+from agrobr.cepea.parsers.base import indicadores_to_frame
 from agrobr.exceptions import ParseError, SourceUnavailableError, StaleDataWarning
 from agrobr.models import Indicador
 
@@ -71,11 +72,18 @@ def _indicador_to_dict(ind: Indicador) -> dict:
     }
 
 
+def _frame(dicts: list[dict]) -> pd.DataFrame:
+    df = pd.DataFrame(dicts)
+    if not df.empty:
+        df["data"] = pd.to_datetime(df["data"])
+    return df
+
+
 class TestIndicador:
     @pytest.fixture(autouse=True)
     def _setup_mocks(self):
         self.mock_store = MagicMock()
-        self.mock_store.indicadores_query.return_value = []
+        self.mock_store.indicadores_frame.return_value = _frame([])
         self.mock_store.indicadores_upsert.return_value = 0
 
         with patch("agrobr.cepea.api.get_store", return_value=self.mock_store):
@@ -83,7 +91,7 @@ class TestIndicador:
 
     async def test_valid_product_returns_dataframe(self):
         ind = _make_indicador()
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(ind)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(ind)])
 
         df = await api.indicador("soja", offline=True)
 
@@ -101,7 +109,7 @@ class TestIndicador:
 
     async def test_return_meta_flag(self):
         ind = _make_indicador()
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(ind)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(ind)])
 
         result = await api.indicador("soja", offline=True, return_meta=True)
 
@@ -115,7 +123,7 @@ class TestIndicador:
         ind_in = _make_indicador(data=today - timedelta(days=5))
         ind_out = _make_indicador(data=today - timedelta(days=100))
         dicts = [_indicador_to_dict(ind_in), _indicador_to_dict(ind_out)]
-        self.mock_store.indicadores_query.return_value = dicts
+        self.mock_store.indicadores_frame.return_value = _frame(dicts)
 
         inicio = today - timedelta(days=10)
         fim = today
@@ -127,7 +135,7 @@ class TestIndicador:
     async def test_string_date_params(self):
         today = date.today()
         ind = _make_indicador(data=today - timedelta(days=2))
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(ind)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(ind)])
 
         inicio_str = (today - timedelta(days=10)).strftime("%Y-%m-%d")
         fim_str = today.strftime("%Y-%m-%d")
@@ -139,7 +147,7 @@ class TestIndicador:
         ind_sp = _make_indicador(praca="sao_paulo")
         ind_pr = _make_indicador(praca="parana")
         dicts = [_indicador_to_dict(ind_sp), _indicador_to_dict(ind_pr)]
-        self.mock_store.indicadores_query.return_value = dicts
+        self.mock_store.indicadores_frame.return_value = _frame(dicts)
 
         df = await api.indicador("soja", praca="sao_paulo", offline=True)
 
@@ -158,18 +166,18 @@ class TestIndicador:
             ) as mock_parser,
         ):
             mock_fetch.return_value = FetchResult(html, "cepea")
-            mock_parser.return_value = (MagicMock(version=1), [new_ind])
+            mock_parser.return_value = (MagicMock(version=1), indicadores_to_frame([new_ind]))
 
             await api.indicador("soja", force_refresh=True)
 
         mock_fetch.assert_awaited_once_with("soja")
-        assert self.mock_store.indicadores_query.call_count == 0
+        assert self.mock_store.indicadores_frame.call_count == 0
 
     async def test_fetch_new_data_merges_with_cache(self):
         today = date.today()
         cached = _make_indicador(data=today - timedelta(days=5))
         fresh = _make_indicador(data=today - timedelta(days=1))
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(cached)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(cached)])
 
         html = "<html>CEPEA data</html>"
         with (
@@ -181,7 +189,7 @@ class TestIndicador:
             ) as mock_parser,
         ):
             mock_fetch.return_value = FetchResult(html, "cepea")
-            mock_parser.return_value = (MagicMock(version=1), [fresh])
+            mock_parser.return_value = (MagicMock(version=1), indicadores_to_frame([fresh]))
 
             df = await api.indicador(
                 "soja",
@@ -190,8 +198,76 @@ class TestIndicador:
             )
 
         assert len(df) == 2
+        assert mock_parser.await_args.kwargs["as_frame"] is True
+        upserted = self.mock_store.indicadores_upsert.call_args.args[0]
+        assert isinstance(upserted, pd.DataFrame)
+        assert upserted["valor"].tolist() == [145.5]
+
+    async def _fetch_unchanged_page(self, rows: list[dict], page_version: int = 1):
+        from agrobr.cache.keys import content_hash
+
+        today = date.today()
+        self.mock_store.indicadores_frame.return_value = _frame(rows)
+
+        html = "<html>CEPEA data</html>"
+        self.mock_store.history_latest_hash.return_value = content_hash(html.encode("utf-8"))
+        self.mock_store.history_query.return_value = [
+            {
+                "key": "cepea:soja",
+                "collected_at": datetime.utcnow() - timedelta(minutes=1),
+                "parser_version": page_version,
+            }
+        ]
+        with (
+            patch(
+                "agrobr.cepea.api.client.fetch_indicador_page", new_callable=AsyncMock
+            ) as mock_fetch,
+            patch(
+                "agrobr.cepea.api.get_parser_with_fallback", new_callable=AsyncMock
+            ) as mock_parser,
+        ):
+            mock_fetch.return_value = FetchResult(html, "cepea")
+            mock_parser.return_value = (
+                MagicMock(version=1),
+                indicadores_to_frame([_make_indicador(data=today - timedelta(days=1))]),
+            )
+
+            df = await api.indicador("soja", inicio=today - timedelta(days=10), fim=today)
+
+        return df, mock_parser
+
+    async def test_unchanged_page_skips_parse_and_upsert(self):
+        cached = _make_indicador(data=date.today() - timedelta(days=5))
+
+        df, mock_parser = await self._fetch_unchanged_page([_indicador_to_dict(cached)])
+
+        mock_parser.assert_not_awaited()
+        self.mock_store.indicadores_upsert.assert_not_called()
+        assert len(df) == 1
+
+    async def test_unchanged_page_reparsed_when_rows_missing(self):
+        _, mock_parser = await self._fetch_unchanged_page([])
+
+        mock_parser.assert_awaited_once()
+        self.mock_store.indicadores_upsert.assert_called_once()
+
+    async def test_unchanged_page_reparsed_for_old_parser_version(self):
+        row = _indicador_to_dict(_make_indicador(data=date.today() - timedelta(days=5)))
+        row["parser_version"] = 0
+
+        _, mock_parser = await self._fetch_unchanged_page([row], page_version=0)
+
+        mock_parser.assert_awaited_once()
         self.mock_store.indicadores_upsert.assert_called_once()
 
+    async def test_unchanged_page_reparsed_when_rows_predate_page(self):
+        row = _indicador_to_dict(_make_indicador(data=date.today() - timedelta(days=5)))
+        row["collected_at"] = datetime.utcnow() - timedelta(days=3)
+
+        _, mock_parser = await self._fetch_unchanged_page([row])
+
+        mock_parser.assert_awaited_once()
+
     async def test_noticias_agricolas_source_detected(self):
         today = date.today()
         ind = _make_indicador(data=today - timedelta(days=1))
@@ -201,10 +277,10 @@ class TestIndicador:
             patch(
                 "agrobr.cepea.api.client.fetch_indicador_page", new_callable=AsyncMock
             ) as mock_fetch,
-            patch("agrobr.noticias_agricolas.parser.parse_indicador") as mock_na_parse,
+            patch("agrobr.noticias_agricolas.parser.parse_indicador_frame") as mock_na_parse,
         ):
             mock_fetch.return_value = FetchResult(html, "noticias_agricolas")
-            mock_na_parse.return_value = [ind]
+            mock_na_parse.return_value = indicadores_to_frame([ind])
 
             result = await api.indicador("soja", force_refresh=True, return_meta=True)
 
@@ -214,7 +290,7 @@ class TestIndicador:
     async def test_source_fetch_failure_falls_back_to_cache(self):
         today = date.today()
         cached = _make_indicador(data=today - timedelta(days=3))
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(cached)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(cached)])
 
         with patch(
             "agrobr.cepea.api.client.fetch_indicador_page",
@@ -231,7 +307,7 @@ class TestIndicador:
         assert not df.empty
 
     async def test_source_fetch_failure_no_cache_returns_empty(self):
-        self.mock_store.indicadores_query.return_value = []
+        self.mock_store.indicadores_frame.return_value = _frame([])
 
         with patch(
             "agrobr.cepea.api.client.fetch_indicador_page",
@@ -254,7 +330,7 @@ class TestIndicador:
     async def test_empty_fetch_with_existing_cache_warns_stale(self):
         today = date.today()
         cached = _make_indicador(data=today - timedelta(days=1))
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(cached)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(cached)])
 
         html = "<html>CEPEA data</html>"
         with (
@@ -268,7 +344,7 @@ class TestIndicador:
         ):
             warnings.simplefilter("always")
             mock_fetch.return_value = FetchResult(html, "cepea")
-            mock_parser.return_value = (MagicMock(version=1), [])
+            mock_parser.return_value = (MagicMock(version=1), pd.DataFrame())
             await api.indicador(
                 "soja",
                 inicio=today - timedelta(days=10),
@@ -283,15 +359,15 @@ class TestIndicador:
         df = await api.indicador("soja", offline=True)
 
         assert isinstance(df, pd.DataFrame)
-        self.mock_store.indicadores_query.assert_called_once()
-        call_kwargs = self.mock_store.indicadores_query.call_args
+        self.mock_store.indicadores_frame.assert_called_once()
+        call_kwargs = self.mock_store.indicadores_frame.call_args
         assert call_kwargs.kwargs["produto"] == "soja"
 
     async def test_na_soft_block_falls_back_to_cache(self):
         """When NA returns a soft block (SourceUnavailableError), cached data is used."""
         today = date.today()
         cached = _make_indicador(data=today - timedelta(days=3))
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(cached)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(cached)])
 
         with patch(
             "agrobr.cepea.api.client.fetch_indicador_page",
@@ -312,13 +388,51 @@ class TestIndicador:
 
     async def test_cache_hit_sets_meta_source(self):
         ind = _make_indicador()
-        self.mock_store.indicadores_query.return_value = [_indicador_to_dict(ind)]
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(ind)])
 
         _, meta = await api.indicador("soja", offline=True, return_meta=True)
 
         assert meta.from_cache is True
         assert meta.source == "cache"
 
+    async def test_cache_path_skips_models(self):
+        ind = _make_indicador(praca=None)
+        self.mock_store.indicadores_frame.return_value = _frame([_indicador_to_dict(ind)])
+
+        with patch("agrobr.cepea.api.indicador_records") as mock_convert:
+            df = await api.indicador("soja", offline=True)
+
+        mock_convert.assert_not_called()
+        self.mock_store.indicadores_query.assert_not_called()
+        assert df["valor"].tolist() == [145.5]
+        assert df.columns.tolist() == [
+            "data",
+            "produto",
+            "praca",
+            "valor",
+            "unidade",
+            "fonte",
+            "metodologia",
+            "anomalies",
+        ]
+
+    async def test_validate_sanity_annotates_frame(self):
+        today = date.today()
+        inds = [
+            _make_indicador(data=today - timedelta(days=2), valor=Decimal("145.50")),
+            _make_indicador(data=today - timedelta(days=1), valor=Decimal("190.00")),
+        ]
+        self.mock_store.indicadores_frame.return_value = _frame(
+            [_indicador_to_dict(ind) for ind in inds]
+        )
+
+        with patch("agrobr.cepea.api.indicador_records") as mock_convert:
+            df = await api.indicador("soja", offline=True, validate_sanity=True)
+
+        mock_convert.assert_not_called()
+        assert df["valor"].tolist() == [145.5, 190.0]
+        assert df["anomalies"].tolist() == [None, ["excessive_change: valor"]]
+
 
 class TestUltimo:
     @pytest.fixture(autouse=True)
@@ -7,6 +7,8 @@ from decimal import Decimal
 
 import pytest
 
+from agrobr.cepea.parsers.base import INDICADOR_FRAME_COLUMNS
+from agrobr.cepea.parsers.document import parse_document
 from agrobr.cepea.parsers.v1 import CepeaParserV1
 from agrobr.exceptions import ParseError
 
@@ -78,3 +80,65 @@ class TestCepeaParserV1:
         assert self.parser.source == "cepea"
         assert self.parser.valid_from == date(2024, 1, 1)
         assert self.parser.valid_until is None
+
+    def test_parse_frame_matches_parse(self, sample_html_cepea):
+        """Test columnar extraction yields the same rows as parse."""
+        df = self.parser.parse_frame(sample_html_cepea, "soja")
+        indicadores = self.parser.parse(sample_html_cepea, "soja")
+
+        assert list(df.columns) == list(INDICADOR_FRAME_COLUMNS)
+        assert df["data"].dt.date.tolist() == [i.data for i in indicadores]
+        assert df["valor"].tolist() == [float(i.valor) for i in indicadores]
+        assert set(df["unidade"]) == {"BRL/sc60kg"}
+        assert set(df["fonte"]) == {"cepea"}
+
+    def test_parse_frame_row_fallbacks(self):
+        """Test first-column date and first positive value fallbacks."""
+        html = """
+        <table id="indicador">
+            <tr><th>Dia</th><th>Preço</th><th>Outro</th></tr>
+            <tr><td>01/02/2024</td><td>-1</td><td>R$ 1.234,56</td></tr>
+            <tr><td>2024-02-02</td><td>150,25</td><td>x</td></tr>
+            <tr><td>31/02/2024</td><td>150,00</td><td>1</td></tr>
+        </table>
+        """
+        df = self.parser.parse_frame(html, "soja")
+
+        assert df["data"].dt.date.tolist() == [date(2024, 2, 1), date(2024, 2, 2)]
+        assert df["valor"].tolist() == [1234.56, 150.25]
+
+    def test_parse_frame_raises_on_empty_table(self, sample_html_empty):
+        with pytest.raises(ParseError, match="No tables found"):
+            self.parser.parse_frame(sample_html_empty, "soja")
+
+
+class TestHtmlDocument:
+    """Tests for the shared parsed document."""
+
+    def test_parse_document_reuses_instance(self, sample_html_cepea):
+        doc = parse_document(sample_html_cepea)
+        assert parse_document(doc) is doc
+
+    def test_tree_built_once_for_pipeline(self, sample_html_cepea, monkeypatch):
+        import lxml.html
+
+        from agrobr.cepea.parsers.fingerprint import extract_fingerprint
+        from agrobr.constants import Fonte
+
+        real = lxml.html.document_fromstring
+        calls = []
+        monkeypatch.setattr(
+            lxml.html, "document_fromstring", lambda *a, **kw: calls.append(1) or real(*a, **kw)
+        )
+
+        doc = parse_document(sample_html_cepea)
+        parser = CepeaParserV1()
+        assert parser.can_parse(doc)[0] is True
+        extract_fingerprint(doc, Fonte.CEPEA, "test")
+        assert len(parser.parse(doc, "soja")) == 2
+        assert len(calls) == 1
+
+    def test_empty_html(self):
+        doc = parse_document("")
+        assert doc.tables == []
+        assert CepeaParserV1().can_parse(doc)[0] is False
@@ -101,6 +101,29 @@ class TestCacheCommands:
         result = runner.invoke(app, ["cache", "clear"])
         assert result.exit_code == 0
 
+    def test_cache_maintain(self):
+        from agrobr.cache.maintenance import MaintenanceReport
+
+        report = MaintenanceReport(evicted_entries=3, bytes_before=5000, bytes_after=1000)
+        with patch("agrobr.cache.maintenance.run_maintenance", return_value=report) as mock_run:
+            result = runner.invoke(app, ["cache", "maintain", "--max-size-mb", "10"])
+
+        assert result.exit_code == 0
+        assert "4,000" in result.output
+        mock_run.assert_called_once_with(max_size_mb=10, compact=False)
+
+    def test_cache_maintain_json(self):
+        from agrobr.cache.maintenance import MaintenanceReport
+
+        report = MaintenanceReport(bytes_before=10, bytes_after=4, compacted=True)
+        with patch("agrobr.cache.maintenance.run_maintenance", return_value=report):
+            result = runner.invoke(app, ["cache", "maintain", "--compact", "-o", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["bytes_reclaimed"] == 6
+        assert data["compacted"] is True
+
 
 class TestConabCommands:
     def test_conab_safras_success(self):
@@ -77,3 +77,57 @@ class TestExportacao:
 
         assert len(df) == 1
         assert df.iloc[0]["uf"] == "PR"
+
+
+class TestExportacaoModes:
+    @pytest.mark.asyncio
+    async def test_stream_matches_default(self):
+        async def _chunks(_url):
+            data = _mock_csv().encode()
+            for i in range(0, len(data), 17):
+                yield data[i : i + 17]
+
+        with patch.object(
+            api.client, "fetch_exportacao_csv", new_callable=AsyncMock, return_value=_mock_csv()
+        ):
+            expected = await api.exportacao("soja", ano=2024, agregacao="detalhado")
+
+        with patch.object(api.client, "stream_csv", side_effect=_chunks):
+            df, meta = await api.exportacao(
+                "soja", ano=2024, agregacao="detalhado", stream=True, return_meta=True
+            )
+
+        assert df.to_dict("records") == expected.to_dict("records")
+        assert meta.source_method == "httpx+stream"
+
+    @pytest.mark.asyncio
+    async def test_cache_parquet(self, tmp_path):
+        from agrobr.comexstat.parser import csv_to_parquet
+
+        csv_path = tmp_path / "EXP_2024.csv"
+        csv_path.write_text(_mock_csv())
+        parquet_path = tmp_path / "EXP_2024.parquet"
+        csv_to_parquet(csv_path, parquet_path)
+
+        with patch.object(
+            api.client, "fetch_parquet", new_callable=AsyncMock, return_value=parquet_path
+        ):
+            df = await api.exportacao("soja", ano=2024, uf="MT", cache_parquet=True)
+
+        assert len(df) == 3
+        assert df["kg_liquido"].sum() == 120000000
+
+    @pytest.mark.asyncio
+    async def test_multiplos_anos(self):
+        csv_2023 = _mock_csv().replace("2024;", "2023;")
+
+        async def _fetch(ano):
+            return csv_2023 if ano == 2023 else _mock_csv()
+
+        with patch.object(api.client, "fetch_exportacao_csv", side_effect=_fetch) as mock:
+            df, meta = await api.exportacao("soja", ano=[2023, 2024], return_meta=True)
+
+        assert sorted(c.args[0] for c in mock.call_args_list) == [2023, 2024]
+        assert sorted(df["ano"].unique().tolist()) == [2023, 2024]
+        assert len(df) == 6
+        assert meta.source_url.endswith("EXP_2023.csv")
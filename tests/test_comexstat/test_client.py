@@ -8,7 +8,9 @@ import httpx
 import pytest
 
 from agrobr.comexstat import client
-from agrobr.exceptions import SourceUnavailableError
+from agrobr.constants import CacheSettings
+from agrobr.exceptions import SourceUnavailableError, StaleDataWarning
+from agrobr.http.pool import ClientPool
 
 RETRY_SLEEP = "agrobr.http.retry.asyncio.sleep"
 
@@ -157,3 +159,84 @@ class TestComexstatFetchHelpers:
             await client.fetch_importacao_csv(2024)
             url_arg = mock.call_args[0][0]
             assert "IMP_2024.csv" in url_arg
+
+
+_CSV = (
+    "CO_ANO;CO_MES;CO_NCM;CO_UNID;CO_PAIS;SG_UF_NCM;CO_VIA;CO_URF;QT_ESTAT;KG_LIQUIDO;VL_FOB\n"
+    + "".join(f"2024;{m};12019000;10;160;MT;4;817800;1000;5000000;2000000\n" for m in range(1, 13))
+    + "2024;1;10059010;10;160;PR;4;817800;500;3000000;1000000\n"
+).encode()
+
+_REAL_ASYNC_CLIENT = httpx.AsyncClient
+
+
+def _transport_client(handler):
+    return patch(
+        "agrobr.comexstat.client.httpx.AsyncClient",
+        side_effect=lambda **kw: _REAL_ASYNC_CLIENT(transport=httpx.MockTransport(handler), **kw),
+    )
+
+
+class TestComexstatStream:
+    @pytest.mark.asyncio
+    async def test_stream_yields_body(self):
+        with _transport_client(lambda _request: httpx.Response(200, content=_CSV)):
+            chunks = [c async for c in client.stream_csv("https://test.gov.br/EXP_2024.csv")]
+        assert b"".join(chunks) == _CSV
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_5xx(self):
+        responses = iter([httpx.Response(503), httpx.Response(200, content=_CSV)])
+        with (
+            _transport_client(lambda _request: next(responses)),
+            patch(RETRY_SLEEP, new_callable=AsyncMock),
+        ):
+            chunks = [c async for c in client.stream_csv("https://test.gov.br/EXP_2024.csv")]
+        assert b"".join(chunks) == _CSV
+
+    @pytest.mark.asyncio
+    async def test_stream_404_raises(self):
+        with (
+            _transport_client(lambda _request: httpx.Response(404)),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            async for _ in client.stream_csv("https://test.gov.br/EXP_2024.csv"):
+                pass
+
+
+class TestComexstatParquet:
+    @pytest.mark.asyncio
+    async def test_downloads_once_then_scans(self, tmp_path):
+        settings = CacheSettings(cache_dir=tmp_path)
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(200, content=_CSV)
+
+        with _transport_client(handler):
+            path = await client.fetch_parquet("EXP", 2024, settings)
+            again = await client.fetch_parquet("EXP", 2024, settings)
+
+        assert path == again == tmp_path / "comexstat" / "EXP_2024.parquet"
+        assert len(calls) == 1
+        assert not list(path.parent.glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_expired_file_served_when_source_down(self, tmp_path):
+        settings = CacheSettings(cache_dir=tmp_path, ttl_comexstat=0)
+        with _transport_client(lambda _request: httpx.Response(200, content=_CSV)):
+            path = await client.fetch_parquet("EXP", 2024, settings)
+        await ClientPool.aclose()
+
+        with (
+            _transport_client(lambda _request: httpx.Response(404)),
+            pytest.warns(StaleDataWarning),
+        ):
+            assert await client.fetch_parquet("EXP", 2024, settings) == path
+
+    @pytest.mark.asyncio
+    async def test_offline_without_file_raises(self, tmp_path):
+        settings = CacheSettings(cache_dir=tmp_path, offline_mode=True)
+        with pytest.raises(SourceUnavailableError, match="offline_mode"):
+            await client.fetch_parquet("EXP", 2024, settings)
@@ -4,9 +4,12 @@ import pytest
 
 from agrobr.comexstat.parser import (
     PARSER_VERSION,
+    ExportacaoStreamParser,
     _detect_separator,
     agregar_mensal,
+    csv_to_parquet,
     parse_exportacao,
+    parse_exportacao_parquet,
 )
 from agrobr.exceptions import ParseError
 
@@ -185,6 +188,89 @@ class TestAgregarMensal:
         assert result.empty
 
 
+def _mixed_csv() -> str:
+    csv = _sample_csv(rows=4)
+    csv += "\n2024;1;10059010;10;160;MT;4;817800;500;3000000;1000000"
+    csv += "\n2024;2;12019000;10;160;PR;4;817800;500;3000000;1000000"
+    csv += "\n2024;3;9011110;10;160;MG;4;817800;100;5000;2000\n"
+    return csv
+
+
+def _feed(parser: ExportacaoStreamParser, data: bytes, size: int) -> None:
+    for i in range(0, len(data), size):
+        parser.feed(data[i : i + size])
+
+
+class TestExportacaoStreamParser:
+    @pytest.mark.parametrize("feed_size", [1, 7, 64, 10_000])
+    def test_matches_full_parse(self, feed_size):
+        csv = _mixed_csv()
+        parser = ExportacaoStreamParser(ncm="1201", uf="mt", parse_bytes=32)
+        _feed(parser, csv.encode(), feed_size)
+
+        df = parser.finish()
+        expected = parse_exportacao(csv, ncm="1201", uf="mt")
+        assert df.to_dict("records") == expected.to_dict("records")
+
+    def test_only_matching_rows_kept(self):
+        parser = ExportacaoStreamParser(ncm="0901", parse_bytes=16)
+        _feed(parser, _mixed_csv().encode(), 5)
+
+        assert sum(len(f) for f in parser._frames) == 1
+        df = parser.finish()
+        assert parser.rows_read == 7
+        assert df["ncm"].tolist() == ["09011110"]
+
+    def test_no_match_returns_empty_with_columns(self):
+        parser = ExportacaoStreamParser(ncm="99")
+        parser.feed(_mixed_csv().encode())
+
+        df = parser.finish()
+        assert df.empty
+        assert "ncm" in df.columns
+
+    def test_utf8_bom_header(self):
+        parser = ExportacaoStreamParser(uf="MT")
+        parser.feed(b"\xef\xbb\xbf" + _sample_csv(rows=2).encode())
+
+        df = parser.finish()
+        assert len(df) == 2
+        assert "ano" in df.columns
+
+    def test_empty_raises(self):
+        parser = ExportacaoStreamParser()
+        with pytest.raises(ParseError):
+            parser.finish()
+
+
+class TestParquet:
+    def test_roundtrip_with_pushdown(self, tmp_path):
+        csv_path = tmp_path / "EXP_2024.csv"
+        csv_path.write_text(_mixed_csv())
+        parquet_path = tmp_path / "EXP_2024.parquet"
+
+        csv_to_parquet(csv_path, parquet_path)
+
+        df = parse_exportacao_parquet(parquet_path, ncm="1201", uf="MT")
+        expected = parse_exportacao(_mixed_csv(), ncm="1201", uf="MT")
+        assert len(df) == len(expected) == 4
+        assert df["ncm"].tolist() == expected["ncm"].tolist()
+        assert df["valor_fob_usd"].tolist() == expected["valor_fob_usd"].tolist()
+
+    def test_ncm_zero_padding_preserved(self, tmp_path):
+        csv_path = tmp_path / "EXP_2024.csv"
+        csv_path.write_text(_mixed_csv())
+        parquet_path = tmp_path / "EXP_2024.parquet"
+        csv_to_parquet(csv_path, parquet_path)
+
+        df = parse_exportacao_parquet(parquet_path, ncm="0901")
+        assert df["ncm"].tolist() == ["09011110"]
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(ParseError):
+            parse_exportacao_parquet(tmp_path / "nope.parquet")
+
+
 class TestParserVersion:
     def test_version_is_int(self):
         assert isinstance(PARSER_VERSION, int)
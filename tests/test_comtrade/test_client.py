@@ -176,17 +176,15 @@ class TestFetchTradeData:
             await client.fetch_trade_data(**_FETCH_ARGS, api_key="bad-key")
 
     @pytest.mark.asyncio
-    async def test_guest_no_key_uses_preview(self):
+    async def test_guest_no_key_uses_preview(self, monkeypatch):
+        monkeypatch.delenv("AGROBR_COMTRADE_API_KEY", raising=False)
         resp = _mock_response(200, {"data": []})
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=resp)
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with (
-            patch("agrobr.comtrade.client.httpx.AsyncClient", return_value=mock_client),
-            patch.dict("os.environ", {}, clear=True),
-        ):
+        with patch("agrobr.comtrade.client.httpx.AsyncClient", return_value=mock_client):
             _records, url = await client.fetch_trade_data(**_FETCH_ARGS)
 
         assert "public/v1/preview" in url
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 from decimal import Decimal
 from io import BytesIO
@@ -13,7 +14,7 @@ import pytest
 from agrobr import constants
 from agrobr.conab import api
 from agrobr.exceptions import ParseError, SourceUnavailableError
-from agrobr.models import Safra
+from agrobr.models import SafraRecord
 
 
 def _make_safra(
@@ -21,15 +22,15 @@ def _make_safra(
     uf: str = "MT",
     safra: str = "2025/26",
     levantamento: int = 1,
-) -> Safra:
-    return Safra(
+) -> SafraRecord:
+    return SafraRecord(
         fonte=constants.Fonte.CONAB,
         produto=produto,
         safra=safra,
         uf=uf,
-        area_plantada=Decimal("10000.0"),
-        producao=Decimal("30000.0"),
-        produtividade=Decimal("3000.0"),
+        area_plantada=10000.0,
+        producao=30000.0,
+        produtividade=3000.0,
         levantamento=levantamento,
         data_publicacao=date.today(),
     )
@@ -45,7 +46,7 @@ def _mock_fetch_safra_xlsx(safra_list=None, suprimentos=None, totais=None):
     mock_parser = MagicMock()
     mock_parser.version = 1
     if safra_list is not None:
-        mock_parser.parse_safra_produto.return_value = safra_list
+        mock_parser.parse_safra_records.return_value = safra_list
     if suprimentos is not None:
         mock_parser.parse_suprimento.return_value = suprimentos
     if totais is not None:
@@ -70,6 +71,21 @@ class TestSafras:
         assert "produto" in df.columns
         assert "uf" in df.columns
 
+    async def test_concurrent_identical_calls_coalesce(self):
+        mock_client, mock_parser = _mock_fetch_safra_xlsx(safra_list=[_make_safra(uf="MT")])
+
+        with (
+            patch("agrobr.conab.api.client.fetch_safra_xlsx", mock_client),
+            patch("agrobr.conab.api.ConabParserV1", return_value=mock_parser),
+        ):
+            a, b = await asyncio.gather(api.safras("soja"), api.safras("soja"))
+            c = await api.safras("soja", uf="MT")
+
+        assert mock_client.await_count == 2
+        assert a is not b
+        pd.testing.assert_frame_equal(a, b)
+        assert len(c) == 1
+
     async def test_returns_empty_dataframe_when_no_data(self):
         mock_client, mock_parser = _mock_fetch_safra_xlsx(safra_list=[])
 
@@ -82,6 +98,25 @@ class TestSafras:
         assert isinstance(df, pd.DataFrame)
         assert df.empty
 
+    async def test_validate_sanity_annotates_frame(self):
+        fora = _make_safra(uf="PR")
+        fora.area_plantada = 30000.0
+        fora.producao = 90000.0
+        mock_client, mock_parser = _mock_fetch_safra_xlsx(safra_list=[_make_safra(uf="MT"), fora])
+
+        with (
+            patch("agrobr.conab.api.client.fetch_safra_xlsx", mock_client),
+            patch("agrobr.conab.api.ConabParserV1", return_value=mock_parser),
+        ):
+            df = await api.safras("soja", validate_sanity=True)
+            sem = await api.safras("soja")
+
+        assert df["anomalies"].tolist() == [
+            ["out_of_range: area_plantada", "out_of_range: producao"],
+            None,
+        ]
+        assert "anomalies" not in sem.columns
+
     async def test_uf_filter(self):
         safras = [_make_safra(uf="MT"), _make_safra(uf="PR"), _make_safra(uf="RS")]
         mock_client, mock_parser = _mock_fetch_safra_xlsx(safra_list=safras)
@@ -167,7 +202,7 @@ class TestSafras:
         ):
             await api.safras("milho", safra="2025/26")
 
-        call_kwargs = mock_parser.parse_safra_produto.call_args.kwargs
+        call_kwargs = mock_parser.parse_safra_records.call_args.kwargs
         assert call_kwargs["produto"] == "milho"
 
     async def test_source_unavailable_propagates(self):
@@ -184,7 +219,7 @@ class TestSafras:
     async def test_parse_error_propagates(self):
         mock_client = AsyncMock(return_value=(BytesIO(b"x"), {"safra": "2025/26"}))
         mock_parser = MagicMock()
-        mock_parser.parse_safra_produto.side_effect = ParseError(
+        mock_parser.parse_safra_records.side_effect = ParseError(
             source="conab", parser_version=1, reason="bad layout"
         )
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from io import BytesIO
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -90,3 +91,44 @@ class TestConabFetchSafra:
                 )
             )
             await client.fetch_boletim_page()
+
+
+class TestConabLevantamentoCache:
+    _LEVANTAMENTOS = [
+        {"safra": "2024/25", "levantamento": 12, "url": "https://conab.gov.br/12.xlsx"},
+        {"safra": "2024/25", "levantamento": 11, "url": "https://conab.gov.br/11.xlsx"},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_published_levantamento_downloaded_once(self):
+        with (
+            patch("agrobr.conab.client.list_levantamentos", new_callable=AsyncMock) as mock_list,
+            patch("agrobr.conab.client._download_xlsx", new_callable=AsyncMock) as mock_dl,
+        ):
+            mock_list.return_value = self._LEVANTAMENTOS
+            mock_dl.side_effect = lambda url: BytesIO(url.encode())
+
+            first, meta = await client.fetch_safra_xlsx(safra="2024/25", levantamento=11)
+            second, _ = await client.fetch_safra_xlsx(safra="2024/25", levantamento=11)
+
+        assert first.getvalue() == second.getvalue() == b"https://conab.gov.br/11.xlsx"
+        assert meta["levantamento"] == 11
+        assert mock_dl.await_count == 1
+        assert mock_list.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_shares_levantamento_cache(self):
+        with (
+            patch("agrobr.conab.client.list_levantamentos", new_callable=AsyncMock) as mock_list,
+            patch("agrobr.conab.client._download_xlsx", new_callable=AsyncMock) as mock_dl,
+        ):
+            mock_list.return_value = self._LEVANTAMENTOS
+            mock_dl.side_effect = lambda url: BytesIO(url.encode())
+
+            await client.fetch_latest_safra_xlsx()
+            xlsx, meta = await client.fetch_safra_xlsx(safra="2024/25", levantamento=12)
+
+        assert xlsx.getvalue() == b"https://conab.gov.br/12.xlsx"
+        assert meta["url"] == "https://conab.gov.br/12.xlsx"
+        assert mock_dl.await_count == 1
+        assert mock_list.await_count == 1
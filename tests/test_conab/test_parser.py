@@ -222,3 +222,46 @@ class TestConabParserEdgeCases:
         sample_xlsx.seek(0)
         result = parser._parse_suprimento_long(sample_xlsx, produto="milho")
         assert isinstance(result, list)
+
+
+class TestConabParseSafras:
+    def test_records_match_models(self, parser, sample_xlsx):
+        from agrobr.models import SafraRecord
+
+        records = parser.parse_safra_records(sample_xlsx, "soja")
+        models = parser.parse_safra_produto(sample_xlsx, "soja")
+
+        assert records
+        assert all(isinstance(r, SafraRecord) for r in records)
+        assert [r.to_model().model_dump(exclude={"parsed_at"}) for r in records] == [
+            m.model_dump(exclude={"parsed_at"}) for m in models
+        ]
+
+    def test_matches_single_product_parse(self, parser, sample_xlsx):
+        todos = parser.parse_safras(sample_xlsx, produtos=["soja", "milho"])
+
+        assert set(todos) == {"soja", "milho"}
+        for produto, safras in todos.items():
+            individual = parser.parse_safra_produto(sample_xlsx, produto)
+            assert [s.model_dump(exclude={"parsed_at"}) for s in safras] == [
+                s.model_dump(exclude={"parsed_at"}) for s in individual
+            ]
+
+    def test_all_products_single_workbook_open(self, parser, sample_xlsx):
+        from unittest.mock import patch
+
+        from agrobr.conab.parsers import workbook
+
+        workbook.clear_cache()
+        with patch("agrobr.conab.parsers.workbook.pd.ExcelFile", wraps=pd.ExcelFile) as mock_open:
+            todos = parser.parse_safras(sample_xlsx)
+            parser.parse_brasil_total(sample_xlsx)
+
+        assert mock_open.call_count == 1
+        assert len(todos["soja"]) > 0
+
+    def test_invalid_product_raises(self, parser, sample_xlsx):
+        from agrobr.exceptions import ParseError
+
+        with pytest.raises(ParseError, match="Produto não suportado"):
+            parser.parse_safras(sample_xlsx, produtos=["soja", "inexistente"])
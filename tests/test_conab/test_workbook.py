@@ -0,0 +1,78 @@
+"""Testes do cache de abas dos workbooks CONAB."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from agrobr.conab.parsers import workbook
+
+
+def _xlsx(**sheets: list[list[object]]) -> BytesIO:
+    wb = Workbook()
+    wb.remove(wb.active)
+    for name, rows in sheets.items():
+        ws = wb.create_sheet(name)
+        for row in rows:
+            ws.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    buf.seek(0)
+    return buf
+
+
+@pytest.fixture(autouse=True)
+def _clear_workbooks():
+    workbook.clear_cache()
+    yield
+    workbook.clear_cache()
+
+
+def _count_opens():
+    return patch("agrobr.conab.parsers.workbook.pd.ExcelFile", wraps=pd.ExcelFile)
+
+
+class TestReadSheets:
+    def test_same_as_read_excel(self):
+        xlsx = _xlsx(Soja=[["UF", None, 1.5], [None, None, None], ["MT", 10, 2]])
+        expected = pd.read_excel(BytesIO(xlsx.getvalue()), sheet_name="Soja", header=None)
+
+        pd.testing.assert_frame_equal(workbook.read_sheet(xlsx, "Soja"), expected)
+
+    def test_opens_workbook_once_for_many_sheets(self):
+        xlsx = _xlsx(A=[[1]], B=[[2]], C=[[3]])
+        with _count_opens() as mock_open:
+            workbook.read_sheets(xlsx, ["A", "B"])
+            workbook.read_sheet(BytesIO(xlsx.getvalue()), "C")
+        assert mock_open.call_count == 1
+
+    def test_parsed_sheet_memoized(self):
+        xlsx = _xlsx(A=[[1]])
+        first = workbook.read_sheet(xlsx, "A")
+        assert workbook.read_sheet(BytesIO(xlsx.getvalue()), "A") is first
+
+    def test_missing_sheet(self):
+        xlsx = _xlsx(A=[[1]])
+        assert list(workbook.read_sheets(xlsx, ["A", "Z"])) == ["A"]
+        with pytest.raises(ValueError, match="Z"):
+            workbook.read_sheet(xlsx, "Z")
+
+    def test_lru_evicts_oldest_workbook(self):
+        books = [_xlsx(A=[[i]]) for i in range(workbook.MAX_WORKBOOKS + 1)]
+        for book in books:
+            workbook.read_sheet(book, "A")
+
+        with _count_opens() as mock_open:
+            workbook.read_sheet(books[-1], "A")
+            assert mock_open.call_count == 0
+            workbook.read_sheet(books[0], "A")
+            assert mock_open.call_count == 1
+
+    def test_invalid_content_not_cached(self):
+        with pytest.raises(Exception):  # noqa: B017
+            workbook.read_sheet(BytesIO(b"not an excel file"), "A")
+        assert workbook._workbooks == {}
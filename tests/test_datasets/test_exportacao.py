@@ -1,6 +1,6 @@
 """Testes específicos para o dataset exportacao (fetch com mock + prioridade)."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pandas as pd
 import pytest
@@ -72,3 +72,72 @@ class TestExportacaoFetch:
         assert meta.contract_version == "1.0"
         assert "comexstat" in meta.attempted_sources
         assert meta.records_count == len(df)
+
+
+class TestExportacaoIncremental:
+    @staticmethod
+    def _frame(ano: int) -> pd.DataFrame:
+        return pd.DataFrame(
+            [{"ano": ano, "mes": 1, "uf": "MT", "kg_liquido": 1000.0, "valor_fob_usd": 500.0}]
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_missing_years_are_fetched(self):
+        dataset = ExportacaoDataset()
+        fetch_fn = AsyncMock(side_effect=lambda _produto, **kw: (self._frame(kw["ano"]), None))
+        dataset.info.sources[0].fetch_fn = fetch_fn
+
+        await dataset.fetch("soja", ano=2022)
+        df, meta = await dataset.fetch("soja", ano=[2022, 2023], return_meta=True)
+
+        assert fetch_fn.await_args_list[1].kwargs["ano"] == 2023
+        assert sorted(df["ano"].tolist()) == [2022, 2023]
+        assert meta.from_cache is False
+
+    @pytest.mark.asyncio
+    async def test_closed_years_served_locally(self):
+        dataset = ExportacaoDataset()
+        fetch_fn = AsyncMock(return_value=(self._frame(2022), None))
+        dataset.info.sources[0].fetch_fn = fetch_fn
+
+        await dataset.fetch("soja", ano=2022)
+        df, meta = await dataset.fetch("soja", ano=2022, return_meta=True)
+
+        assert fetch_fn.await_count == 1
+        assert meta.from_cache is True
+        assert meta.selected_source == "local"
+        assert df.iloc[0]["produto"] == "soja"
+
+    @pytest.mark.asyncio
+    async def test_source_columns_kept_on_every_path(self):
+        dataset = ExportacaoDataset()
+        frame = self._frame(2021).assign(ncm="12019000")
+        dataset.info.sources[0].fetch_fn = AsyncMock(return_value=(frame, None))
+
+        fonte = await dataset.fetch("soja", ano=2021)
+        local = await dataset.fetch("soja", ano=2021)
+        direto = await dataset.fetch("soja", ano=2021, mes=1)
+        with patch("agrobr.cache.duckdb_store.get_store", side_effect=OSError("disco")):
+            sem_store = await dataset.fetch("soja", ano=2021)
+
+        assert dataset.info.sources[0].fetch_fn.await_count == 3
+        assert fonte["ncm"].tolist() == ["12019000"]
+        for df in (local, direto, sem_store):
+            pd.testing.assert_frame_equal(df, fonte)
+
+    @pytest.mark.asyncio
+    async def test_national_and_uf_scopes_kept_apart(self):
+        dataset = ExportacaoDataset()
+        fetch_fn = AsyncMock(
+            side_effect=lambda _produto, **kw: (self._frame(2019).assign(uf=kw["uf"]), None)
+        )
+        dataset.info.sources[0].fetch_fn = fetch_fn
+
+        await dataset.fetch("soja", ano=2019)
+        mt = await dataset.fetch("soja", ano=2019, uf="MT")
+        brasil = await dataset.fetch("soja", ano=2019)
+
+        assert fetch_fn.await_count == 2
+        assert mt["uf"].tolist() == ["MT"]
+        assert brasil["uf"].isna().all()
+        assert len(brasil) == 1
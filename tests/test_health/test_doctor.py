@@ -65,6 +65,25 @@ class TestCacheStats:
         assert stats.total_records == 1000
         assert "cepea" in stats.by_source
 
+    def test_get_cache_stats_counts_pending_hits(self, tmp_path):
+        from agrobr.cache.duckdb_store import DuckDBStore
+        from agrobr.constants import CacheSettings, Fonte
+        from agrobr.health.doctor import _get_cache_stats
+
+        store = DuckDBStore(CacheSettings(cache_dir=tmp_path, db_name="test.duckdb"))
+        store.cache_set("k1", b"data", Fonte.CEPEA, ttl_seconds=3600)
+        store.cache_get("k1")
+        store.cache_get("k1")
+
+        try:
+            with patch("agrobr.health.doctor.get_store", return_value=store):
+                stats = _get_cache_stats()
+        finally:
+            store.close()
+
+        assert stats.cache_entries == 1
+        assert stats.cache_hits == 2
+
 
 class TestDiagnosticsResult:
     def test_to_dict(self):
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import zlib
+
+import pytest
+
+from agrobr.constants import Fonte
+from agrobr.http import fanout
+from agrobr.http.fanout import fetch_all, fetch_pages, parse_all
+
+
+class TestFetchAll:
+    @pytest.mark.asyncio
+    async def test_preserves_order(self):
+        async def _fetch(n: int) -> int:
+            await asyncio.sleep(0.01 * (5 - n))
+            return n * 10
+
+        assert await fetch_all(Fonte.BCB, range(5), _fetch) == [0, 10, 20, 30, 40]
+
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        async def _fetch(n: int) -> int:
+            return n
+
+        assert await fetch_all(Fonte.BCB, [], _fetch) == []
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def _fetch(n: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return n
+
+        await fetch_all(Fonte.BCB, range(10), _fetch, max_concurrency=3)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_from_settings(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_MAX_CONCURRENCY", "2")
+        in_flight = 0
+        peak = 0
+
+        async def _fetch(n: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return n
+
+        await fetch_all(Fonte.BCB, range(6), _fetch)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending(self):
+        finished: list[int] = []
+
+        async def _fetch(n: int) -> int:
+            if n == 0:
+                raise ValueError("falhou")
+            await asyncio.sleep(0.2)
+            finished.append(n)
+            return n
+
+        with pytest.raises(ValueError, match="falhou"):
+            await fetch_all(Fonte.BCB, range(4), _fetch, max_concurrency=4)
+        await asyncio.sleep(0.3)
+        assert finished == []
+
+
+class TestFetchPages:
+    @pytest.mark.asyncio
+    async def test_known_total_in_order(self):
+        async def _fetch(page: int) -> int:
+            await asyncio.sleep(0.01 * (5 - page))
+            return page
+
+        result = [item async for item in fetch_pages(Fonte.SICAR, _fetch, total_pages=5)]
+        assert result == [(i, i) for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_pages_in_flight(self):
+        in_flight = 0
+        peak = 0
+
+        async def _fetch(page: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return page
+
+        async for _ in fetch_pages(Fonte.SICAR, _fetch, total_pages=10, max_concurrency=3):
+            pass
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_is_last_stops_and_cancels_speculative_pages(self):
+        started: list[int] = []
+        finished: list[int] = []
+
+        async def _fetch(page: int) -> list[int]:
+            started.append(page)
+            await asyncio.sleep(0.01 if page <= 2 else 0.2)
+            finished.append(page)
+            return [page] * (2 if page < 2 else 1)
+
+        pages = [
+            page
+            async for _, page in fetch_pages(
+                Fonte.BCB, _fetch, is_last=lambda p: len(p) < 2, max_concurrency=4
+            )
+        ]
+        assert pages == [[0, 0], [1, 1], [2]]
+        assert 3 in started
+        assert 3 not in finished
+
+    @pytest.mark.asyncio
+    async def test_start_resumes(self):
+        async def _fetch(page: int) -> int:
+            return page
+
+        result = [p async for _, p in fetch_pages(Fonte.SICAR, _fetch, total_pages=4, start=2)]
+        assert result == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_failed_page_raises_after_earlier_pages(self):
+        received: list[int] = []
+
+        async def _fetch(page: int) -> int:
+            if page == 2:
+                raise ValueError("pagina 2")
+            return page
+
+        with pytest.raises(ValueError, match="pagina 2"):
+            async for _, page in fetch_pages(Fonte.SICAR, _fetch, total_pages=5):
+                received.append(page)
+        assert received == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_requires_total_or_is_last(self):
+        async def _fetch(page: int) -> int:
+            return page
+
+        with pytest.raises(ValueError, match="total_pages"):
+            async for _ in fetch_pages(Fonte.BCB, _fetch):
+                pass
+
+
+class TestParseAll:
+    @pytest.mark.asyncio
+    async def test_small_payloads_parsed_inline(self):
+        pids: list[int] = []
+
+        def _parse(payload: bytes, sufixo: str) -> str:
+            pids.append(os.getpid())
+            return payload.decode() + sufixo
+
+        result = await parse_all(_parse, [b"a", b"b"], sufixo="!")
+        assert result == ["a!", "b!"]
+        assert pids == [os.getpid(), os.getpid()]
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_use_process_pool(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_PARSE_MIN_BYTES", "0")
+        monkeypatch.setenv("AGROBR_HTTP_PARSE_PROCESSES", "2")
+        payloads = [b"abc", b"def", b"ghi"]
+        try:
+            result = await parse_all(zlib.crc32, payloads)
+            assert fanout._executor is not None
+        finally:
+            fanout.shutdown_parse_pool()
+        assert result == [zlib.crc32(p) for p in payloads]
+
+    @pytest.mark.asyncio
+    async def test_single_payload_parsed_inline(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_PARSE_MIN_BYTES", "0")
+        result = await parse_all(zlib.crc32, [b"abc"])
+        assert result == [zlib.crc32(b"abc")]
+        assert fanout._executor is None
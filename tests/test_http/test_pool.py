@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agrobr.constants import Fonte
+from agrobr.http import pool
+from agrobr.http.pool import ClientPool
+from agrobr.sync import run_sync
+
+
+class TestClientPool:
+    @pytest.mark.asyncio
+    async def test_same_client_per_source(self):
+        a = ClientPool.get(Fonte.BCB)
+        b = ClientPool.get(Fonte.BCB)
+        assert a is b
+        await ClientPool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_distinct_sources_distinct_clients(self):
+        assert ClientPool.get(Fonte.BCB) is not ClientPool.get(Fonte.IMEA)
+        await ClientPool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_verify_splits_clients(self):
+        assert ClientPool.get(Fonte.B3) is not ClientPool.get(Fonte.B3, verify=False)
+        await ClientPool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_recreated(self):
+        client = ClientPool.get(Fonte.BCB)
+        await client.aclose()
+        assert ClientPool.get(Fonte.BCB) is not client
+        await ClientPool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_all(self):
+        clients = [ClientPool.get(Fonte.BCB), ClientPool.get(Fonte.IMEA)]
+        await ClientPool.aclose()
+        assert all(c.is_closed for c in clients)
+
+    @pytest.mark.asyncio
+    async def test_limits_from_settings(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_POOL_MAX_CONNECTIONS", "3")
+        client = ClientPool.get(Fonte.BCB)
+        assert client._transport._pool._max_connections == 3
+        assert client.follow_redirects is True
+        await ClientPool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_without_h2_falls_back(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_HTTP2", "true")
+        monkeypatch.setattr(pool, "_http2_available", lambda: False)
+        client = ClientPool.get(Fonte.BCB)
+        assert client._transport._pool._http2 is False
+        await ClientPool.aclose()
+
+    def test_clients_not_shared_across_loops(self):
+        async def _get():
+            return ClientPool.get(Fonte.BCB)
+
+        first = asyncio.run(_get())
+        second = asyncio.run(_get())
+        assert first is not second
+
+    def test_run_sync_closes_clients(self):
+        async def _get():
+            return ClientPool.get(Fonte.BCB)
+
+        client = run_sync(_get())
+        assert client.is_closed
@@ -92,3 +92,101 @@ class TestRateLimiter:
         for fonte in constants.Fonte:
             delay = RateLimiter._get_delay(fonte)
             assert delay > 0, f"{fonte} has no delay configured"
+
+    def test_every_source_mapped_to_its_setting(self):
+        settings = constants.HTTPSettings()
+        for fonte in constants.Fonte:
+            assert RateLimiter._get_delay(fonte) == getattr(settings, f"rate_limit_{fonte}")
+
+    @pytest.mark.asyncio
+    async def test_wait_paces_without_holding_slot(self):
+        await RateLimiter.wait(constants.Fonte.IBGE)
+
+        start = time.monotonic()
+        await RateLimiter.wait(constants.Fonte.IBGE)
+        elapsed = time.monotonic() - start
+
+        delay = RateLimiter._get_delay(constants.Fonte.IBGE)
+        assert elapsed >= delay * 0.8
+
+
+class TestTokenBucket:
+    """Burst, concorrência por fonte e adaptação a 429."""
+
+    @pytest.mark.asyncio
+    async def test_burst_allows_immediate_requests(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_RATE_LIMIT_SOURCE_BURST", '{"ibge": 3}')
+        start = time.monotonic()
+        for _ in range(3):
+            await RateLimiter.wait(constants.Fonte.IBGE)
+        assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_slow_request_does_not_block_other_slots(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_RATE_LIMIT_ANTAQ", "0.05")
+        peak = 0
+
+        async def task() -> None:
+            nonlocal peak
+            async with RateLimiter.acquire(constants.Fonte.ANTAQ):
+                peak = max(peak, RateLimiter.metrics()["antaq"].in_flight)
+                await asyncio.sleep(0.3)
+
+        start = time.monotonic()
+        await asyncio.gather(task(), task(), task())
+        assert peak == 3
+        assert time.monotonic() - start < 0.8
+
+    @pytest.mark.asyncio
+    async def test_source_concurrency_limit(self, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_RATE_LIMIT_ANTAQ", "0")
+        monkeypatch.setenv("AGROBR_HTTP_RATE_LIMIT_SOURCE_CONCURRENCY", '{"antaq": 1}')
+        peak = 0
+
+        async def task() -> None:
+            nonlocal peak
+            async with RateLimiter.acquire(constants.Fonte.ANTAQ):
+                peak = max(peak, RateLimiter.metrics()["antaq"].in_flight)
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(task(), task(), task())
+        assert peak == 1
+        assert RateLimiter.metrics()["antaq"].max_queue_depth >= 2
+
+    @pytest.mark.asyncio
+    async def test_wait_inside_acquire_not_charged_twice(self):
+        async with RateLimiter.acquire(constants.Fonte.IBGE):
+            start = time.monotonic()
+            await RateLimiter.wait(constants.Fonte.IBGE)
+            assert time.monotonic() - start < 0.5
+        assert RateLimiter.metrics()["ibge"].requests == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_blocks_source(self):
+        await RateLimiter.wait(constants.Fonte.BCB)
+        RateLimiter.throttle(constants.Fonte.BCB, retry_after=0.3)
+
+        start = time.monotonic()
+        await RateLimiter.wait(constants.Fonte.BCB)
+        elapsed = time.monotonic() - start
+        assert elapsed >= 0.25
+        assert RateLimiter.metrics()["bcb"].throttled == 1
+
+    def test_throttle_backs_off_and_success_recovers(self):
+        RateLimiter.throttle(constants.Fonte.BCB)
+        RateLimiter.throttle(constants.Fonte.BCB)
+        delay = RateLimiter._get_delay(constants.Fonte.BCB)
+        assert RateLimiter._buckets["bcb"].interval == delay * 4
+
+        RateLimiter.record_success(constants.Fonte.BCB)
+        assert RateLimiter._buckets["bcb"].interval == delay * 2
+
+    @pytest.mark.asyncio
+    async def test_metrics_track_wait_time(self):
+        await RateLimiter.wait(constants.Fonte.IBGE)
+        await RateLimiter.wait(constants.Fonte.IBGE)
+
+        metrics = RateLimiter.metrics()["ibge"]
+        assert metrics.requests == 2
+        assert metrics.max_wait_seconds >= RateLimiter._get_delay(constants.Fonte.IBGE) * 0.8
+        assert metrics.queue_depth == 0
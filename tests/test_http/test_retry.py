@@ -8,9 +8,11 @@ from unittest.mock import AsyncMock, patch
 import httpx
 import pytest
 
+from agrobr.http.rate_limiter import RateLimiter
 from agrobr.http.retry import (
     RETRIABLE_EXCEPTIONS,
     retry_async,
+    retry_on_status,
     should_retry_status,
     with_retry,
 )
@@ -183,3 +185,36 @@ class TestRetriableExceptions:
 
     def test_http_status_error_not_retriable_by_default(self):
         assert httpx.HTTPStatusError not in RETRIABLE_EXCEPTIONS
+
+
+class TestRetryOnStatusRateLimit:
+    """retry_on_status alimenta o RateLimiter com 429/Retry-After."""
+
+    @pytest.mark.asyncio
+    async def test_429_with_retry_after_throttles_source(self):
+        request = httpx.Request("GET", "https://example.com")
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}, request=request),
+            httpx.Response(200, request=request),
+        ]
+
+        async def _func() -> httpx.Response:
+            return responses.pop(0)
+
+        with patch("agrobr.http.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            response = await retry_on_status(_func, source="bcb")
+
+        assert response.status_code == 200
+        assert mock_sleep.call_args.args[0] == 7.0
+        metrics = RateLimiter.metrics()["bcb"]
+        assert metrics.throttled == 1
+        assert metrics.requests == 1
+        assert RateLimiter._buckets["bcb"].penalty == 0
+
+    @pytest.mark.asyncio
+    async def test_success_does_not_throttle(self):
+        async def _func() -> httpx.Response:
+            return httpx.Response(200)
+
+        await retry_on_status(_func, source="bcb")
+        assert RateLimiter.metrics()["bcb"].throttled == 0
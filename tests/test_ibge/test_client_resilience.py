@@ -1,80 +1,146 @@
-"""Testes de resiliência HTTP para agrobr.ibge.client (via sidrapy)."""
+"""Testes de resiliência HTTP para agrobr.ibge.client (API SIDRA nativa)."""
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pandas as pd
 import pytest
 
 from agrobr.ibge import client
 
 
+def _mock_response(status_code: int = 200, data: list | None = None, text: str = "") -> MagicMock:
+    resp = MagicMock(spec=httpx.Response)
+    resp.status_code = status_code
+    resp.is_success = 200 <= status_code < 300
+    resp.text = text
+    resp.json.return_value = data if data is not None else []
+    return resp
+
+
+def _mock_client(side_effect) -> AsyncMock:
+    mock = AsyncMock()
+    mock.get = AsyncMock(side_effect=side_effect)
+    return mock
+
+
+def _patch_client(mock: AsyncMock):
+    return patch("agrobr.ibge.client.httpx.AsyncClient", return_value=mock)
+
+
 class TestIbgeSidraTimeout:
     @pytest.mark.asyncio
-    async def test_sidrapy_timeout_propagates(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.side_effect = Exception("Connection timed out")
-            with pytest.raises(Exception, match="Connection timed out"):
-                await client.fetch_sidra(table_code="5457")
+    async def test_timeout_propagates(self):
+        mock = _mock_client(httpx.ReadTimeout("Connection timed out"))
+        with _patch_client(mock), pytest.raises(httpx.ReadTimeout, match="timed out"):
+            await client.fetch_sidra(table_code="5457")
 
     @pytest.mark.asyncio
-    async def test_sidrapy_timeout_retried(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.side_effect = [
-                Exception("timeout"),
-                pd.DataFrame({"V": ["100"]}),
+    async def test_timeout_retried(self):
+        mock = _mock_client(
+            [
+                httpx.ReadTimeout("timeout"),
+                _mock_response(200, [{"V": "Valor"}, {"V": "100"}]),
             ]
+        )
+        with _patch_client(mock):
             result = await client.fetch_sidra(table_code="5457")
-            assert len(result) > 0
+        assert len(result) > 0
 
 
 class TestIbgeSidraHTTPErrors:
     @pytest.mark.asyncio
     async def test_http_500_propagates(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.side_effect = Exception("Internal Server Error")
-            with pytest.raises(Exception, match="Internal Server Error"):
-                await client.fetch_sidra(table_code="5457")
+        mock = _mock_client(
+            lambda *_args, **_kwargs: _mock_response(500, text="Internal Server Error")
+        )
+        with _patch_client(mock), pytest.raises(ValueError, match="Internal Server Error"):
+            await client.fetch_sidra(table_code="5457")
 
     @pytest.mark.asyncio
-    async def test_http_403_propagates(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.side_effect = Exception("403 Forbidden")
-            with pytest.raises(Exception, match="403"):
-                await client.fetch_sidra(table_code="5457")
+    async def test_http_400_propagates(self):
+        mock = _mock_client(lambda *_args, **_kwargs: _mock_response(400, text="Tabela invalida"))
+        with _patch_client(mock), pytest.raises(ValueError, match="Tabela"):
+            await client.fetch_sidra(table_code="5457")
+
+    @pytest.mark.asyncio
+    async def test_connect_error_falls_back_to_sidrapy(self):
+        mock = _mock_client(httpx.ConnectError("handshake failure"))
+        with (
+            _patch_client(mock),
+            patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra,
+        ):
+            mock_sidra.return_value = pd.DataFrame({"V": ["Valor", "100"]})
+            result = await client.fetch_sidra(table_code="5457")
+
+        assert result["V"].tolist() == ["100"]
+        assert mock_sidra.call_args.kwargs["table_code"] == "5457"
 
 
 class TestIbgeSidraEmptyResponse:
     @pytest.mark.asyncio
     async def test_empty_dataframe(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.return_value = pd.DataFrame()
+        mock = _mock_client([_mock_response(200, [])])
+        with _patch_client(mock):
             result = await client.fetch_sidra(table_code="5457", header="y")
-            assert len(result) == 0
+        assert len(result) == 0
 
     @pytest.mark.asyncio
     async def test_header_n_removes_first_row(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.return_value = pd.DataFrame({"V": ["header", "100", "200"]})
+        mock = _mock_client([_mock_response(200, [{"V": "header"}, {"V": "100"}, {"V": "200"}])])
+        with _patch_client(mock):
             result = await client.fetch_sidra(table_code="5457", header="n")
-            assert len(result) == 2
-            assert result["V"].iloc[0] == "100"
+        assert len(result) == 2
+        assert result["V"].iloc[0] == "100"
 
 
-class TestIbgeSidraVariableHandling:
+class TestIbgeSidraUrl:
     @pytest.mark.asyncio
-    async def test_variable_as_list(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.return_value = pd.DataFrame({"V": ["header", "100"]})
-            await client.fetch_sidra(table_code="5457", variable=["214", "215"])
-            kwargs = mock_sidra.call_args[1]
-            assert kwargs["variable"] == "214,215"
-
+    async def test_variable_and_period_as_list(self):
+        mock = _mock_client([_mock_response(200, [{"V": "header"}, {"V": "100"}])])
+        with _patch_client(mock):
+            await client.fetch_sidra(
+                table_code="5457", variable=["214", "215"], period=["2022", "2023"]
+            )
+        url = mock.get.call_args.args[0]
+        assert "/v/214,215" in url
+        assert "/p/2022,2023" in url
+
+    def test_build_url_matches_sidrapy_layout(self):
+        url = client.build_sidra_url(
+            table_code="5457",
+            territorial_level="3",
+            ibge_territorial_code="51",
+            variable="214",
+            period="2023",
+            classifications={"782": ["40124", "40122"]},
+            header="n",
+        )
+        assert url == (
+            "https://apisidra.ibge.gov.br/values/t/5457/n3/51/h/n/p/2023/v/214/c782/40124,40122"
+        )
+
+
+class TestIbgeSidraEventLoop:
     @pytest.mark.asyncio
-    async def test_period_as_list(self):
-        with patch("agrobr.ibge.client.sidrapy.get_table") as mock_sidra:
-            mock_sidra.return_value = pd.DataFrame({"V": ["header", "100"]})
-            await client.fetch_sidra(table_code="5457", period=["2022", "2023"])
-            kwargs = mock_sidra.call_args[1]
-            assert kwargs["period"] == "2022,2023"
+    async def test_download_does_not_block_loop(self):
+        async def _slow_get(*_args, **_kwargs):
+            await asyncio.sleep(0.2)
+            return _mock_response(200, [{"V": "header"}, {"V": "100"}])
+
+        ticks = 0
+
+        async def _ticker():
+            nonlocal ticks
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        mock = _mock_client(_slow_get)
+        with _patch_client(mock):
+            await asyncio.gather(client.fetch_sidra(table_code="5457"), _ticker())
+
+        assert ticks == 10
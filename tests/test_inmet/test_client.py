@@ -179,12 +179,11 @@ class TestInmetToken:
 
         with (
             patch.dict("os.environ", {"AGROBR_INMET_TOKEN": "test-token"}),
-            patch("agrobr.inmet.client.httpx.AsyncClient", return_value=mock_client) as mock_cls,
+            patch("agrobr.inmet.client.httpx.AsyncClient", return_value=mock_client),
         ):
             await client._get_json("/estacoes/T")
 
-        call_kwargs = mock_cls.call_args
-        headers_used = call_kwargs.kwargs.get("headers") or call_kwargs[1].get("headers", {})
+        headers_used = mock_client.get.call_args.kwargs["headers"]
         assert headers_used.get("Authorization") == "Bearer test-token"
 
 
@@ -122,6 +122,21 @@ class TestSinistros:
         df = await api.sinistros(ano_inicio=2022, ano_fim=2023)
         assert all(df["ano_apolice"].between(2022, 2023))
 
+    @pytest.mark.asyncio
+    @patch.object(api.client, "fetch_periodos", new_callable=AsyncMock)
+    async def test_multiplos_periodos_em_processos(self, mock_fetch, monkeypatch):
+        from agrobr.http import fanout
+
+        monkeypatch.setenv("AGROBR_HTTP_PARSE_MIN_BYTES", "0")
+        monkeypatch.setenv("AGROBR_HTTP_PARSE_PROCESSES", "2")
+        mock_fetch.return_value = [_make_csv_bytes(), _make_csv_bytes()]
+        try:
+            df = await api.sinistros(uf="MT")
+        finally:
+            fanout.shutdown_parse_pool()
+        assert len(df) == 2
+        assert all(df["uf"] == "MT")
+
     @pytest.mark.asyncio
     @patch.object(api.client, "fetch_periodos", new_callable=AsyncMock)
     async def test_filtro_evento(self, mock_fetch):
@@ -82,7 +82,8 @@ class TestFetchPeriodo:
 class TestFetchPeriodos:
     @pytest.mark.asyncio
     @patch("agrobr.alt.mapa_psr.client.retry_on_status", new_callable=AsyncMock)
-    async def test_fetch_multiplos(self, mock_retry):
+    async def test_fetch_multiplos(self, mock_retry, monkeypatch):
+        monkeypatch.setenv("AGROBR_HTTP_RATE_LIMIT_MAPA_PSR", "0.01")
         mock_retry.return_value = _mock_response(200, FAKE_CSV_BYTES)
         result = await client.fetch_periodos(["2016-2024", "2025"])
         assert len(result) == 2
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 
 import pandas as pd
 
-from agrobr.models import MetaInfo
+from agrobr.constants import Fonte
+from agrobr.models import (
+    Indicador,
+    IndicadorRecord,
+    MetaInfo,
+    Safra,
+    SafraRecord,
+    indicador_records,
+    records_to_frame,
+    validate_indicador_columns,
+    validate_safra_columns,
+)
 
 
 class TestMetaInfo:
@@ -253,3 +265,116 @@ class TestMetaInfo:
         assert restored.attempted_sources == original.attempted_sources
         assert restored.selected_source == original.selected_source
         assert restored.fetch_timestamp == original.fetch_timestamp
+
+
+def _safra_record(**overrides) -> SafraRecord:
+    fields = {
+        "fonte": Fonte.CONAB,
+        "produto": "soja",
+        "safra": "2024/25",
+        "uf": "MT",
+        "area_plantada": 12000.5,
+        "producao": 45000.0,
+        "produtividade": 3750.0,
+        "levantamento": 3,
+        "data_publicacao": date(2025, 1, 10),
+    }
+    fields.update(overrides)
+    return SafraRecord(**fields)
+
+
+class TestIndicadorRecord:
+    def test_slots_without_instance_dict(self):
+        record = IndicadorRecord(Fonte.CEPEA, "soja", None, date(2024, 1, 1), 145.5, "BRL/sc60kg")
+
+        assert not hasattr(record, "__dict__")
+
+    def test_model_roundtrip(self):
+        ind = Indicador(
+            fonte=Fonte.CEPEA,
+            produto="Soja",
+            praca="paranagua",
+            data=date(2024, 1, 2),
+            valor=Decimal("145.50"),
+            unidade="BRL/sc60kg",
+            meta={"variacao_percentual": 1.2},
+        )
+
+        record = IndicadorRecord.from_model(ind)
+        back = record.to_model()
+
+        assert record.valor == 145.5
+        assert record.variacao_percentual == 1.2
+        assert back.valor == Decimal("145.5")
+        assert back.model_dump(exclude={"parsed_at"}) == ind.model_dump(exclude={"parsed_at"})
+
+    def test_validate_columns_mask(self):
+        df = pd.DataFrame(
+            {
+                "fonte": ["cepea", "cepea", "cepea", "desconhecida", "cepea"],
+                "produto": ["soja", "s", "soja", "soja", "soja"],
+                "data": pd.to_datetime(
+                    ["2024-01-01", "2024-01-02", None, "2024-01-04", "2024-01-05"]
+                ),
+                "valor": [145.5, 140.0, 141.0, 142.0, 0.0],
+                "unidade": ["BRL/sc60kg"] * 5,
+            }
+        )
+
+        assert validate_indicador_columns(df).tolist() == [True, False, False, False, False]
+
+    def test_records_from_frame(self):
+        df = pd.DataFrame(
+            {
+                "data": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                "produto": [" SOJA ", "soja"],
+                "praca": [None, "paranagua"],
+                "valor": [145.5, -1.0],
+                "unidade": ["BRL/sc60kg", "BRL/sc60kg"],
+                "fonte": ["cepea", "cepea"],
+                "variacao_percentual": [float("nan"), 0.5],
+                "anomalies": [None, None],
+            }
+        )
+
+        records = indicador_records(df)
+
+        assert records == [
+            IndicadorRecord(Fonte.CEPEA, "soja", None, date(2024, 1, 1), 145.5, "BRL/sc60kg")
+        ]
+
+    def test_records_from_empty_frame(self):
+        assert indicador_records(pd.DataFrame()) == []
+
+
+class TestSafraRecord:
+    def test_model_roundtrip(self):
+        record = _safra_record(producao=None)
+
+        model = record.to_model()
+
+        assert isinstance(model, Safra)
+        assert model.area_plantada == Decimal("12000.5")
+        assert model.producao is None
+        assert SafraRecord.from_model(model) == record
+
+    def test_records_to_frame_columns(self):
+        df = records_to_frame([_safra_record(), _safra_record(uf="PR")], SafraRecord)
+
+        assert df.columns[:4].tolist() == ["fonte", "produto", "safra", "uf"]
+        assert df["uf"].tolist() == ["MT", "PR"]
+        assert df["area_plantada"].dtype == "float64"
+
+    def test_validate_columns_mask(self):
+        records = [
+            _safra_record(),
+            _safra_record(uf=None),
+            _safra_record(safra="2024"),
+            _safra_record(uf="MTX"),
+            _safra_record(area_plantada=-1.0),
+            _safra_record(levantamento=13),
+        ]
+
+        mask = validate_safra_columns(records_to_frame(records, SafraRecord))
+
+        assert mask.tolist() == [True, True, False, False, False, False]
@@ -14,6 +14,7 @@ from agrobr.noticias_agricolas.parser import (
     _parse_valor,
     _parse_variacao,
     parse_indicador,
+    parse_indicador_frame,
 )
 
 
@@ -234,6 +235,39 @@ class TestParseIndicador:
             assert indicadores[0].produto == produto
             assert indicadores[0].unidade == UNIDADES[produto]
 
+    def test_parse_indicador_frame_matches_list(self, sample_html):
+        df = parse_indicador_frame(sample_html, "soja")
+
+        assert df["data"].dt.date.tolist() == [date(2026, 2, 3), date(2026, 2, 2)]
+        assert df["valor"].tolist() == [124.55, 124.88]
+        assert df["variacao_percentual"].tolist() == [-0.26, -0.02]
+        assert set(df["praca"]) == {"Paranaguá/PR"}
+        assert set(df["fonte"]) == {Fonte.NOTICIAS_AGRICOLAS.value}
+        assert df["anomalies"].isna().all()
+
+    def test_parse_indicador_frame_trigo_regiao(self, sample_html_trigo):
+        df = parse_indicador_frame(sample_html_trigo, "trigo")
+
+        assert df["praca"].tolist() == ["Paraná", "Rio Grande do Sul"]
+        assert df["valor"].tolist() == [1176.58, 1056.90]
+        assert set(df["unidade"]) == {"BRL/ton"}
+
+    def test_parse_indicador_frame_weekly(self):
+        html = """
+        <table><tr><th>Data</th><th>Valor R$</th></tr>
+        <tr><td>09 - 13/02/2026</td><td>R$ 124,55</td></tr>
+        <tr><td>sem data</td><td>124,00</td></tr></table>
+        """
+        df = parse_indicador_frame(html, "soja")
+
+        assert len(df) == 1
+        assert df["data"].dt.date.tolist() == [date(2026, 2, 13)]
+        assert df["anomalies"].tolist() == [["media_semanal"]]
+
+    def test_parse_indicador_frame_no_table(self):
+        with pytest.raises(ParseError, match="No tables found"):
+            parse_indicador_frame("<html><body><p>Sem tabela</p></body></html>", "soja")
+
 
 class TestConstants:
     """Testes para constantes do parser."""
@@ -20,6 +20,14 @@ def _load_golden_pages(name: str) -> list[bytes]:
     return [csv_path.read_bytes()]
 
 
+def _iter_pages(pages: list[bytes]):
+    async def _iter(*_args, **_kwargs):
+        for page in pages:
+            yield page
+
+    return _iter
+
+
 class TestBuildCqlFilter:
     def test_no_filters(self):
         assert _build_cql_filter() is None
@@ -92,9 +100,8 @@ class TestImoveis:
             ),
             patch.object(
                 api.client,
-                "fetch_imoveis",
-                new_callable=AsyncMock,
-                return_value=(pages, "https://test.url"),
+                "iter_imoveis",
+                side_effect=_iter_pages(pages),
             ),
         ):
             df = await imoveis("DF")
@@ -120,9 +127,8 @@ class TestImoveis:
             ),
             patch.object(
                 api.client,
-                "fetch_imoveis",
-                new_callable=AsyncMock,
-                return_value=(pages, "https://test.url"),
+                "iter_imoveis",
+                side_effect=_iter_pages(pages),
             ),
         ):
             df, meta = await imoveis("DF", return_meta=True)
@@ -143,9 +149,8 @@ class TestImoveis:
             ),
             patch.object(
                 api.client,
-                "fetch_imoveis",
-                new_callable=AsyncMock,
-                return_value=([], "https://test.url"),
+                "iter_imoveis",
+                side_effect=_iter_pages([]),
             ),
         ):
             df = await imoveis("DF")
@@ -164,9 +169,8 @@ class TestImoveis:
             ),
             patch.object(
                 api.client,
-                "fetch_imoveis",
-                new_callable=AsyncMock,
-                return_value=([], "https://test.url"),
+                "iter_imoveis",
+                side_effect=_iter_pages([]),
             ),
         ):
             df = await imoveis("df")  # lowercase
@@ -189,9 +193,8 @@ class TestImoveis:
             ),
             patch.object(
                 api.client,
-                "fetch_imoveis",
-                new_callable=AsyncMock,
-                return_value=(pages, "https://test.url"),
+                "iter_imoveis",
+                side_effect=_iter_pages(pages),
             ),
         ):
             df = await imoveis("DF")
@@ -233,9 +236,8 @@ class TestResumo:
         pages = _load_golden_pages("imoveis_mt_municipio")
         with patch.object(
             api.client,
-            "fetch_imoveis",
-            new_callable=AsyncMock,
-            return_value=(pages, "https://test.url"),
+            "iter_imoveis",
+            side_effect=_iter_pages(pages),
         ):
             df = await resumo("MT", municipio="SORRISO")
 
@@ -144,6 +144,41 @@ class TestFetchImoveis:
 
         assert len(pages) == 2
 
+    @pytest.mark.asyncio
+    async def test_pages_returned_in_order_when_fetched_concurrently(self):
+        import asyncio
+
+        xml_hits = b'<wfs:FeatureCollection numberMatched="40000"/>'
+
+        async def mock_fetch(url, *, base_delay=None):  # noqa: ARG001
+            if "resultType=hits" in url:
+                return xml_hits
+            start = int(url.split("startIndex=")[1].split("&")[0])
+            await asyncio.sleep(0.01 * (4 - start // PAGE_SIZE))
+            return f"cod_imovel\nP{start}\n".encode()
+
+        with patch.object(client, "_fetch_url", side_effect=mock_fetch):
+            pages, _url = await fetch_imoveis("MT")
+
+        assert pages == [f"cod_imovel\nP{i * PAGE_SIZE}\n".encode() for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_iter_imoveis_resumes_from_page(self):
+        xml_hits = b'<wfs:FeatureCollection numberMatched="30000"/>'
+        starts: list[int] = []
+
+        async def mock_fetch(url, *, base_delay=None):  # noqa: ARG001
+            if "resultType=hits" in url:
+                return xml_hits
+            starts.append(int(url.split("startIndex=")[1].split("&")[0]))
+            return b"cod_imovel\nX\n"
+
+        with patch.object(client, "_fetch_url", side_effect=mock_fetch):
+            pages = [p async for p in client.iter_imoveis("MT", start_page=2)]
+
+        assert len(pages) == 1
+        assert starts == [2 * PAGE_SIZE]
+
     @pytest.mark.asyncio
     async def test_progressive_delay_after_page_5(self):
         xml_hits = b'<wfs:FeatureCollection numberMatched="70000"/>'
@@ -5,15 +5,19 @@ from __future__ import annotations
 from datetime import date
 from decimal import Decimal
 
+import pandas as pd
 import pytest
 
 from agrobr.constants import Fonte
-from agrobr.models import Indicador, Safra
+from agrobr.models import Indicador, IndicadorRecord, Safra, SafraRecord
 from agrobr.validators.sanity import (
+    ANOMALY_COLUMNS,
     PRICE_RULES,
     validate_batch,
     validate_indicador,
+    validate_indicador_frame,
     validate_safra,
+    validate_safra_frame,
 )
 
 
@@ -280,3 +284,131 @@ class TestValidateBatch:
         ]
         sorted_inds, _ = await validate_batch(indicadores)
         assert sorted_inds[0].data < sorted_inds[1].data
+
+    @pytest.mark.asyncio
+    async def test_batch_accepts_records(self):
+        records = [
+            IndicadorRecord(Fonte.CEPEA, "soja", None, date(2024, 1, 2), 175.0, "BRL/sc60kg"),
+            IndicadorRecord(Fonte.CEPEA, "soja", None, date(2024, 1, 1), 145.0, "BRL/sc60kg"),
+        ]
+
+        sorted_recs, anomalies = await validate_batch(records)
+
+        assert [r.data.day for r in sorted_recs] == [1, 2]
+        assert [a.anomaly_type for a in anomalies] == ["excessive_change"]
+        assert anomalies[0].value == Decimal("175.0")
+        assert sorted_recs[1].anomalies == ["excessive_change: valor"]
+
+    def test_safra_record(self):
+        record = SafraRecord(
+            Fonte.CONAB, "soja", "2024/25", None, 10000.0, 160000.0, None, 1, date(2025, 1, 10)
+        )
+
+        anomalies = validate_safra(record)
+
+        assert [a.field for a in anomalies] == ["area_plantada"]
+
+
+class TestFrameSanity:
+    @staticmethod
+    def _frame(rows: list[tuple[str, str, float]]) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "data": pd.to_datetime([r[0] for r in rows]),
+                "produto": [r[1] for r in rows],
+                "valor": [r[2] for r in rows],
+                "fonte": "cepea",
+                "anomalies": None,
+            }
+        )
+
+    def test_clean_frame(self):
+        df = self._frame([("2024-01-01", "soja", 145.0), ("2024-01-02", "soja", 146.0)])
+
+        out, anomalies = validate_indicador_frame(df)
+
+        assert anomalies.empty
+        assert anomalies.columns.tolist() == list(ANOMALY_COLUMNS)
+        assert out["anomalies"].tolist() == [None, None]
+
+    def test_change_only_against_adjacent_row(self):
+        df = self._frame(
+            [
+                ("2024-01-01", "soja", 130.0),
+                ("2024-01-02", "milho", 60.0),
+                ("2024-01-03", "soja", 200.0),
+            ]
+        )
+
+        _, anomalies = validate_indicador_frame(df)
+
+        assert "excessive_change" not in anomalies["anomaly_type"].tolist()
+
+    def test_sorts_and_annotates(self):
+        df = self._frame(
+            [
+                ("2024-01-03", "soja", 10.0),
+                ("2024-01-01", "soja", 145.0),
+                ("2024-01-02", "soja", 175.0),
+            ]
+        )
+
+        out, anomalies = validate_indicador_frame(df)
+
+        assert out["data"].dt.day.tolist() == [1, 2, 3]
+        assert out["anomalies"].tolist() == [
+            None,
+            ["excessive_change: valor"],
+            ["out_of_range: valor", "excessive_change: valor"],
+        ]
+        assert anomalies["row"].tolist() == [1, 2, 2]
+        assert anomalies["severity"].tolist() == ["warning", "critical", "critical"]
+        assert anomalies["details"][0]["change_pct"] == pytest.approx(20.6896, rel=1e-4)
+
+    def test_daily_change_per_produto(self):
+        df = self._frame(
+            [
+                ("2024-01-01", "soja", 145.0),
+                ("2024-01-01", "milho", 60.0),
+                ("2024-01-02", "soja", 146.0),
+                ("2024-01-02", "milho", 61.0),
+            ]
+        )
+
+        _, anomalies = validate_indicador_frame(df)
+
+        assert anomalies.empty
+
+    def test_produto_without_rules(self):
+        df = self._frame([("2024-01-01", "leite", 1.0), ("2024-01-02", "leite", 9.0)])
+
+        out, anomalies = validate_indicador_frame(df)
+
+        assert anomalies.empty
+        assert len(out) == 2
+
+    def test_strict_raises_on_critical(self):
+        from agrobr.exceptions import ValidationError
+
+        df = self._frame([("2024-01-01", "soja", 145.0), ("2024-01-02", "soja", 500.0)])
+
+        with pytest.raises(ValidationError) as exc:
+            validate_indicador_frame(df, strict=True)
+
+        assert exc.value.source == "cepea"
+        assert exc.value.reason == "out_of_range"
+
+    def test_safra_frame(self):
+        df = pd.DataFrame(
+            {
+                "produto": ["soja", "milho", "trigo"],
+                "area_plantada": [10000.0, 20000.0, 1.0],
+                "producao": [160000.0, None, 1.0],
+            }
+        )
+
+        out, anomalies = validate_safra_frame(df)
+
+        assert anomalies[["row", "field"]].values.tolist() == [[0, "area_plantada"]]
+        assert anomalies["details"][0] == {"rule": "Área plantada soja Brasil (mil ha)"}
+        assert out["anomalies"].tolist() == [["out_of_range: area_plantada"], None, None]